@@ -1,3637 +1,12 @@
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../models/transcript.dart';
+import '../transcripts/transcripts.g.dart';
 
 /// Provider for transcript data
-/// In production, this would fetch from an API or local storage
+/// Transcripts are generated per drop by scripts/generate_transcript_dart.py
 final transcriptProvider = Provider.family<Transcript?, String>((ref, dropId) {
-  return _mockTranscripts[dropId];
+  return generatedTranscripts[dropId];
 });
 
 /// Helper to check if a drop has transcript available
-bool hasTranscript(String dropId) => _mockTranscripts.containsKey(dropId);
-
-/// Mock transcript data for demo purposes
-/// In production, this would be fetched from your backend/API
-final Map<String, Transcript> _mockTranscripts = {
-  // First Principles Thinking - drop_001
-  'drop_001': Transcript(
-    chapters: const [
-      AudioChapter(
-        title: 'The \$65M Challenge',
-        description: 'Why rockets cost what they do',
-        startTime: 0,
-        endTime: 180,
-      ),
-      AudioChapter(
-        title: 'Breaking Down First Principles',
-        description: 'Understanding the methodology',
-        startTime: 180,
-        endTime: 400,
-      ),
-      AudioChapter(
-        title: 'The SpaceX Approach',
-        description: 'How Elon Musk applied first principles',
-        startTime: 400,
-        endTime: 600,
-      ),
-      AudioChapter(
-        title: 'Applying to Your Life',
-        description: 'Using first principles in everyday decisions',
-        startTime: 600,
-        endTime: 750,
-      ),
-      AudioChapter(
-        title: 'Key Takeaways',
-        description: 'Summary and action items',
-        startTime: 750,
-        endTime: 845,
-      ),
-    ],
-    segments: const [
-      TranscriptSegment(
-        id: 'drop_001_1',
-        text:
-            'I want you to anchor yourself in two numbers right now. They really define the strategic challenge of our time. The first number is \$65 million.',
-        startTime: 0.0,
-        endTime: 10.26,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_2',
-        text:
-            'That is the conventional sort of accepted price tag for building a modern orbital class rocket. 65 million. The benchmark, you know, the number everyone just accepts is reality.',
-        startTime: 10.78,
-        endTime: 22.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_3',
-        text:
-            'Exactly. Now hold onto the second number, \$2 million. Okay. That figure represents the actual objective, theoretical minimum cost of the raw materials, the high grade aluminum, the titanium, copper, carbon fiber, all the stuff you need to build that exact same rocket.',
-        startTime: 23.2,
-        endTime: 40.52,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_4',
-        text:
-            'So wait, you\'re saying the fundamental material cost is just over 2% of the final price? Just over 2%. Wow. That massive, nearly 97% gap.',
-        startTime: 40.74,
-        endTime: 49.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_5',
-        text:
-            'Yeah. It\'s not filled by physics or necessary complexity. It\'s filled by something else. Yeah. That right there, that\'s the opportunity. That 97% gap, that\'s the whole ball game.',
-        startTime: 49.86,
-        endTime: 59.9,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_6',
-        text:
-            'It basically screams that the cost problem isn\'t a science problem, it\'s just a history problem. Right. So our mission in this deep dive is to explore the tool that world-class innovators use to attack that history.',
-        startTime: 60.16,
-        endTime: 72.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_7',
-        text:
-            'We\'re diving deep into what\'s called first principles thinking, or FPT. And really what we\'re exploring is the intellectual courage it takes to choose rigor over ease.',
-        startTime: 72.86,
-        endTime: 83.54,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_8',
-        text:
-            'I mean, most people and most companies, they reason by analogy. It\'s the default path, right? It\'s mentally easier. Totally. We look at the past and we just assume the future has to resemble it.',
-        startTime: 84.10000000000001,
-        endTime: 95.08,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_9',
-        text:
-            'We say, well, rockets cost 65 million because that\'s what rockets have always cost. So we have to build our business around that price. Exactly. And your vision is immediately constrained.',
-        startTime: 95.2,
-        endTime: 104.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_10',
-        text:
-            'You might make it 5% better, maybe 10% cheaper by tweaking your supply chain, but you are still completely trapped inside that conventional frame.',
-        startTime: 104.96,
-        endTime: 113.1,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_11',
-        text:
-            'FPT demands that we just ignore those conventions. We boil everything down to its foundational objective truths. And while this feels so modern, so revolutionary, it\'s actually not new at all, is it?',
-        startTime: 113.97999999999999,
-        endTime: 125.12,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_12',
-        text:
-            'Not at all. It\'s rooted in a philosophical tradition laid down by Aristotle. He was obsessed with moving past in doxa, the things known to us.',
-        startTime: 125.22,
-        endTime: 135.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_13',
-        text:
-            'So common beliefs, accepted theories. He wanted to move from that to things known by nature, the objective principles that actually govern the world.',
-        startTime: 136.38,
-        endTime: 145.08,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_14',
-        text:
-            'So this deep dive is basically the mental blueprint for mastering that shift. That\'s the goal. Okay, let\'s unpack this with a relatable story first because I think we all do this analogical thinking all the time.',
-        startTime: 145.46,
-        endTime: 155.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_15',
-        text:
-            'Think about that simple human tendency to just stop asking why. Oh, it starts so young. You see it with kids, right? That relentless questioning.',
-        startTime: 156.34,
-        endTime: 165.42,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_16',
-        text:
-            'Yes, why is the sky blue? Why is the sun hot? Why do I have to eat my vegetables? That sequence of whys is the purest form of first principles analysis.',
-        startTime: 165.7,
-        endTime: 175.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_17',
-        text:
-            'The child is literally trying to deconstruct the world. And what always happens, questioning goes on and on until the adult\'s answer finally becomes, because I said so. Or, and this is more telling, the adult realizes their own supposedly deep knowledge is actually pretty fragile.',
-        startTime: 175.62,
-        endTime: 191.62,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_18',
-        text:
-            'They don\'t know the full chain of cause and effect. Exactly. They stop asking why, right at the point where the answer demands real intellectual effort.',
-        startTime: 191.68,
-        endTime: 200.38,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_19',
-        text:
-            'And that fragility translates directly into corporate inertia. In business, reasoning by analogy is like a comfort blanket. You look at the market leaders, you look at your own history, and you just replicate them with slight adjustments.',
-        startTime: 201.22,
-        endTime: 215.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_20',
-        text:
-            'We saw this failure everywhere during the rise of digital disruption. Yeah, the sources get into this. When legacy companies saw these disruptors gaining traction, their response was often, oh, the competitor is digital, so we should launch an e-commerce platform and become digital too.',
-        startTime: 216.26,
-        endTime: 231.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_21',
-        text:
-            'That is such a superficial diagnosis. It\'s replicating the outward form, the website, without analyzing the underlying substance. They failed to ask the ultimate why.',
-        startTime: 231.46,
-        endTime: 240.98,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_22',
-        text:
-            'Right, why is the disruptor actually succeeding? It wasn\'t just because they had a website, it was because their unit economics, built from the ground up, were fundamentally different. Their cost structure was maybe 80% lower, because they didn\'t have to carry all that baggage.',
-        startTime: 241.1,
-        endTime: 253.04,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_23',
-        text:
-            'Like retail rents, massive legacy inventory systems. Geographical restrictions, all of it. They stopped the why game way too soon.',
-        startTime: 253.04,
-        endTime: 261.88,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_24',
-        text:
-            'So FPT is the antidote. It demands the courage to question the foundational beliefs of your entire industry. And to master it, you need a disciplined process.',
-        startTime: 262.44,
-        endTime: 272.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_25',
-        text:
-            'It\'s not just a general mindset, it\'s a systematic method. It really comes down to three core principles. Okay, so the first one is reduction. This is where you disassemble the problem, you break it down into its smallest, most foundational elements, the objective truths.',
-        startTime: 272.94,
-        endTime: 287.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_26',
-        text:
-            'The things that cannot be logically broken down any further. Then step two, and this is arguably the hardest one, challenging assumptions.',
-        startTime: 288.02,
-        endTime: 296.38,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_27',
-        text:
-            'This is where you have to consciously identify every framework, every convention, every piece of accepted wisdom that the industry has layered on top of those truths.',
-        startTime: 296.62,
-        endTime: 305.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_28',
-        text:
-            'You\'re hunting for things that are only true because we\'ve always done it that way. Right, and once you have your list of truths, and you\'ve swept away all those conventions, then comes step three. Rebuilding.',
-        startTime: 305.28,
-        endTime: 313.56,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_29',
-        text:
-            'You construct entirely new solutions based only on the objective facts you uncovered, completely ignoring the old way. I think the Lego block analogy here is perfect.',
-        startTime: 314.1,
-        endTime: 322.68,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_30',
-        text:
-            'It really captures it. It does. Most people approach a complex problem like rebuilding a pre-assembled Lego car. You might take it apart into its components, wheels, doors, a roof.',
-        startTime: 322.76,
-        endTime: 336.04,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_31',
-        text:
-            'And then you rebuild it into something a little different, maybe a truck. That\'s reasoning by analogy. You\'re limited by the original parts and their existing shapes.',
-        startTime: 336.18,
-        endTime: 344.96,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_32',
-        text:
-            'Exactly, but first principles thinking says, forget the car. You take the wheels, the doors, the roof, and you melt all that plastic down until you are left only with the raw material, the core plastic polymers.',
-        startTime: 345.66,
-        endTime: 357.76,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_33',
-        text:
-            'So you\'re not limited by the old shapes anymore. You\'re only limited by the material itself and, well, your imagination. Precisely. You are no longer building a slightly better car.',
-        startTime: 357.86,
-        endTime: 366.74,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_34',
-        text:
-            'You can build a space station, a sword, something the world has never even seen before, because you started from the foundational building blocks, not the previous assembly.',
-        startTime: 366.76,
-        endTime: 375.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_35',
-        text:
-            'The insight is that the rules of the old assembly were arbitrary, but the properties of the raw material are fundamental. But honestly, this sounds exhausting.',
-        startTime: 375.4,
-        endTime: 384.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_36',
-        text:
-            'You said challenging assumptions is the hardest part. How do you stop this from just becoming analysis for the sake of analysis? Doesn\'t a company risk losing all momentum?',
-        startTime: 384.72,
-        endTime: 393.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_37',
-        text:
-            'That\'s a critical question. And the rigor is the cost of entry. If you don\'t do it, you just default back to analogy. But the analysis isn\'t endless.',
-        startTime: 394.22,
-        endTime: 402.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_38',
-        text:
-            'It stops when you hit a wall you cannot melt down. We\'ll get to the formal stopping rules, but first, let\'s see this applied in the real world. Let\'s go back to SpaceX.',
-        startTime: 402.8,
-        endTime: 411.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_39',
-        text:
-            'When Elon Musk looked at that \$65 million price tag, he didn\'t start with the budget. He started with the elements. He performed the ultimate reduction. He asked, what is a rocket made of?',
-        startTime: 412.58,
-        endTime: 422.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_40',
-        text:
-            'Not, what does a supplier charge me for a valve? But what are the foundational materials? And the analysis was, I mean, it was shocking. The raw materials, the alloys, the carbon fiber, the fuel, had a theoretical minimum cost of just \$2 million.',
-        startTime: 422.94,
-        endTime: 435.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_41',
-        text:
-            'And that huge visible gap between the theoretical minimum cost, the TMC, and the current industry cost, the CIC, that is what revealed the strategic opportunity.',
-        startTime: 435.72,
-        endTime: 446.38,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_42',
-        text:
-            'This gives us a framework for the attack. The current industry cost isn\'t just TMC plus profit. It\'s TMC plus a massive convention margin, plus inefficiency, plus profit.',
-        startTime: 446.7,
-        endTime: 458.38,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_43',
-        text:
-            'And in aerospace, the sources show that 83% of the total cost structure was related to convention, not physics. 83%.',
-        startTime: 458.64,
-        endTime: 467.26,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_44',
-        text:
-            'The convention margin is where all those industry assumptions live. SpaceX realized that 20% of the cost was just supplier margins. Another 18% was manufacturing labor tied to old bespoke techniques.',
-        startTime: 467.26,
-        endTime: 479.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_45',
-        text:
-            'Another 8% was overhead baked into legacy operations. So the real job wasn\'t optimizing the 2% material cost. It was about radically deconstructing that 83% convention margin.',
-        startTime: 479.72,
-        endTime: 490.9,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_46',
-        text:
-            'And by vertically integrating, literally building their own components, their own alloys, and redesigning the whole process for reusability, they attacked the conventions, not the laws of nature.',
-        startTime: 491.14,
-        endTime: 501.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_47',
-        text:
-            'And that\'s the target. That brings up this idea of the Assumption to Principle Ratio, or APR. Right, the APR is basically the percentage of an industry\'s model that\'s based on convention versus objective facts.',
-        startTime: 501.2,
-        endTime: 511.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_48',
-        text:
-            'The higher that ratio, the more assumptions are driving the cost. And the riper the industry is for disruption. In aerospace, that ratio was just astronomical.',
-        startTime: 512.02,
-        endTime: 520.4,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_49',
-        text:
-            'You see the exact same pattern with PESLA and the electric car battery. For decades, the standard cost was set impossibly high, maybe \$600 or \$700 per kilowatt hour.',
-        startTime: 520.6,
-        endTime: 530.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_50',
-        text:
-            'That cost ceiling was a convention. It was imposed by legacy supply chains and old manufacturing methods. So the FPT approach was to ask, what is the battery?',
-        startTime: 530.56,
-        endTime: 540.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_51',
-        text:
-            'Not what does the supplier charge, but what are the raw materials? And by reducing it to its core components, the raw lithium, nickel, cobalt, aluminum, the analysis showed the theoretical minimum material cost was only about \$80 per kilowatt hour.',
-        startTime: 540.58,
-        endTime: 553.94,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_52',
-        text:
-            'Wow. That objective truth immediately redefined the boundary of what was possible. They knew the problem wasn\'t chemistry, it was convention. And they set a clear \$80 target.',
-        startTime: 554.0,
-        endTime: 563.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_53',
-        text:
-            'And this isn\'t just for heavy manufacturing. The XeroDah example from Stockbrokerage in India is perfect. Around 2010, that industry ran on some really fundamental assumptions.',
-        startTime: 563.56,
-        endTime: 572.68,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_54',
-        text:
-            'The legacy model was built on three core conventions. One, brokers need a physical high street presence. Two, they have to use a high commission model, especially for active traders.',
-        startTime: 573.06,
-        endTime: 583.28,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_55',
-        text:
-            'And three, trading platforms are expensive, complex infrastructure. So XeroDah applied FPT. They challenged the need for physical branches, realizing that for their target demographic, young tech savvy traders, it was just an unnecessary cost.',
-        startTime: 583.48,
-        endTime: 599.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_56',
-        text:
-            'They challenged the commission model too. They realized that volume enabled by near zero friction tech could completely replace high fees.',
-        startTime: 599.44,
-        endTime: 607.6,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_57',
-        text:
-            'So they rebuilt their whole model based only on foundational principles, regulatory compliance, secure settlement, and fast execution. And everything else was stripped away.',
-        startTime: 607.78,
-        endTime: 617.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_58',
-        text:
-            'By eliminating the conventional costs, the branch network, expensive relationship managers, they achieved a phenomenal 67% profit margin per customer.',
-        startTime: 617.44,
-        endTime: 625.76,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_59',
-        text:
-            'Not by charging more. Not at all. But by operating on an infrastructure built only upon irreducible costs. That\'s the power of it. It forces you to stop focusing on marginal gains inside the framework and start looking for radical cost elimination outside of it.',
-        startTime: 625.88,
-        endTime: 641.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_60',
-        text:
-            'It feels revolutionary, but as you said, it has this deep historical blueprint. Absolutely. This rigor connects us directly back to Aristotle\'s pursuit of first philosophy.',
-        startTime: 641.5,
-        endTime: 651.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_61',
-        text:
-            'His goal was to find the objective first principles of the world, the features that determine truth, independent of our own beliefs about them. He didn\'t just accept common sense.',
-        startTime: 652.14,
-        endTime: 661.88,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_62',
-        text:
-            'He used a method called dialectic. Right. It was a process of intense intellectual scrutiny. Dialectic required finding conflicting arguments and crucially demanding a vigorous defense for the truth of common beliefs, the endoxa, rather than just accepting them.',
-        startTime: 661.9,
-        endTime: 677.16,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_63',
-        text:
-            'It\'s like putting every conventional belief on trial. It is. And the core of FPT really echoes his primary goal, seeking the real essence of a thing, not its accidental features like the color of a car or the neighborhood of a brokerage.',
-        startTime: 677.28,
-        endTime: 690.3,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_64',
-        text:
-            'But the property it must retain to exist in the first place. That focus on defining true substance is the key to objective knowledge. So when we ask, what is a rocket or what is a battery, we\'re asking what essential properties must remain for it to function as that thing.',
-        startTime: 690.4,
-        endTime: 706.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_65',
-        text:
-            'The titanium is essential. The \$60 million supplier margin is incidental. Precisely. But let\'s bring this back to the practical application for you, the listener.',
-        startTime: 707.06,
-        endTime: 715.94,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_66',
-        text:
-            'How do we manage that risk we talked about, the risk of analysis paralysis, where you just break down assumptions forever without acting? That is the necessary limitation.',
-        startTime: 716.16,
-        endTime: 725.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_67',
-        text:
-            'FPT is a tool for better decisions, not a substitute for action. And the sources offer very clear stopping rules. Okay, so when do you stop the analysis?',
-        startTime: 726.04,
-        endTime: 734.98,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_68',
-        text:
-            'You stop when you hit one of two immovable constraints, physics or economics? Physics or economics. If the constraint is irreducible because of the immutable laws of the universe, the speed of light, the strength of a material, thermodynamics, the reduction is complete.',
-        startTime: 734.98,
-        endTime: 749.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_69',
-        text:
-            'That\'s your objective principle. And economics. You also stop if the economic cost of challenging the constraint or maybe the political cost of implementing the change outweighs the potential reward.',
-        startTime: 749.88,
-        endTime: 761.28,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_70',
-        text:
-            'FPT has to serve innovation, not just academic curiosity. So let\'s distill this. What does this whole process mean for you right now? Let\'s do three powerful takeaways.',
-        startTime: 761.98,
-        endTime: 771.62,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_71',
-        text:
-            'Okay, first, focus on the essence. FPT requires you to constantly answer that fundamental what is it question. Strip away all the layers of convention and identify only the properties essential for that thing\'s existence.',
-        startTime: 771.86,
-        endTime: 784.54,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_72',
-        text:
-            'Second, you now know where to hunt for massive opportunity. True disruption is found by analyzing that gap between the theoretical minimum cost and the current industry cost.',
-        startTime: 784.8,
-        endTime: 794.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_73',
-        text:
-            'Right, if the assumption to principle ratio, that amount of conventional baggage is high in your field, you\'re sitting on an industry that is fundamentally right for disruption.',
-        startTime: 795.16,
-        endTime: 803.44,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_74',
-        text:
-            'And the third takeaway. Third, recognize that FPT is a profound mental shift. It demands continuous rigor and above all, courage. You have to have the courage to ignore how things are usually done.',
-        startTime: 803.58,
-        endTime: 814.12,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_75',
-        text:
-            'I like that. In a world where most people just think by analogy. Those who commit to reasoning from first principles possess the unique power to reshape reality itself.',
-        startTime: 814.22,
-        endTime: 824.3,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_76',
-        text:
-            'So here\'s the challenge for you to take into your professional or your personal life this week. What cherished expensive assumption in your daily processes or your industry one that everyone just accepts as a given if you broke it down to its raw components is actually just waiting to be melted down and rebuilt into something fundamentally superior.',
-        startTime: 824.58,
-        endTime: 841.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_001_77',
-        text:
-            'Start asking why until the answer is either physics or economics.',
-        startTime: 842.32,
-        endTime: 845.64,
-      ),
-    ],
-  ),
-  // Inversion Mental Model - drop_002
-  'drop_002': Transcript(
-    chapters: const [
-      AudioChapter(
-        title: 'The Munger Philosophy',
-        description: 'Charlie Munger\'s approach to thinking',
-        startTime: 0,
-        endTime: 120,
-      ),
-      AudioChapter(
-        title: 'Avoiding Stupidity',
-        description: 'Why avoiding failure beats seeking success',
-        startTime: 120,
-        endTime: 280,
-      ),
-      AudioChapter(
-        title: 'Inversion in Practice',
-        description: 'Real-world applications of inversion',
-        startTime: 280,
-        endTime: 420,
-      ),
-      AudioChapter(
-        title: 'Common Mistakes to Avoid',
-        description: 'What guarantees failure',
-        startTime: 420,
-        endTime: 540,
-      ),
-      AudioChapter(
-        title: 'Building Better Decisions',
-        description: 'Putting it all together',
-        startTime: 540,
-        endTime: 651,
-      ),
-    ],
-    segments: const [
-      TranscriptSegment(
-        id: 'drop_002_1',
-        text:
-            'All I want to know is where I\'m going to die, so I\'ll never go there. That has to be one of the most paradoxical, but brilliant pieces of advice ever given. It really is. And it comes from, of course, the late Charlie Munger.',
-        startTime: 0.0,
-        endTime: 11.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_2',
-        text:
-            'That single sentence is pretty much the core of the mental model we\'re diving into today. Inversion. Right. Inversion is, well, it\'s a way of thinking that just flips the whole problem solving script on its head.',
-        startTime: 11.7,
-        endTime: 23.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_3',
-        text:
-            'So instead of asking, how do I succeed? Which is what everyone does. Which is what we all do naturally. You stop and you ask the reverse, what would guarantee I fail completely?',
-        startTime: 23.74,
-        endTime: 32.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_4',
-        text:
-            'And how do I make sure to avoid that? And our mission today is really to unpack this. This critical skill is used by some of the greatest thinkers, but it\'s so simple.',
-        startTime: 32.44,
-        endTime: 43.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_5',
-        text:
-            'We\'re hoping to give you a kind of shortcut to making better decisions, not by, you know, chasing genius, but by focusing on the power of subtraction.',
-        startTime: 43.98,
-        endTime: 52.1,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_6',
-        text:
-            'Systematically getting rid of the dumb mistakes that trip everyone else up. It\'s like finding the ultimate avoid stupidity filter. It makes everything clearer and safer.',
-        startTime: 53.260000000000005,
-        endTime: 61.28,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_7',
-        text:
-            'OK, so let\'s get into it. This whole idea of thinking backward. It\'s not new, right? This isn\'t some modern invention from finance bros.',
-        startTime: 61.64,
-        endTime: 70.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_8',
-        text:
-            'Not at all. It has incredibly deep historical roots. I mean, we\'re talking more than 2000 years ago with the ancient stoic philosophers.',
-        startTime: 70.5,
-        endTime: 78.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_9',
-        text:
-            'The stoics. Yeah. Like Marcus Aurelius and Seneca. Exactly. Those guys. They practice this daily ritual called premeditatio malorum.',
-        startTime: 78.7,
-        endTime: 87.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_10',
-        text:
-            'Which sounds intense. The premeditation of evils. It does. And we think of stoicism as being about, you know, staying calm. But this exercise was proactive.',
-        startTime: 87.6,
-        endTime: 98.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_11',
-        text:
-            'So what did they actually do? Before a big day, they\'d vividly imagine the worst case scenario. I mean, really picture it. Losing their job, being humiliated in public, getting thrown in jail.',
-        startTime: 98.36,
-        endTime: 109.12,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_12',
-        text:
-            'OK, but why? Why would you want to put yourself through that intentionally? Well, it wasn\'t about scaring yourself. It was about stealing fear\'s power. By walking through the disaster in your mind, a couple of things happen.',
-        startTime: 109.18,
-        endTime: 118.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_13',
-        text:
-            'First, you realize you could probably handle it emotionally. It\'s not a shock anymore. Right. You\'ve already lived it once in your head. And second, and this is the key part for inversion, it forces you to see the steps that could lead to that disaster.',
-        startTime: 118.98,
-        endTime: 130.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_14',
-        text:
-            'So you can actively plan to prevent them. The stoics knew that avoiding a terrible life was a more reliable path than just, you know, hoping for a perfect one.',
-        startTime: 130.96,
-        endTime: 140.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_15',
-        text:
-            'That\'s a huge shift in focus, preemptive prevention. But this ancient idea, it found a new home somewhere completely different.',
-        startTime: 140.06,
-        endTime: 148.52,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_16',
-        text:
-            'It did. Fast forward to the 19th century with a German mathematician, Carl Jacobi. In mathematics. Of all places. He took this concept and boiled it down to a simple motto, man muss immer umkehren, which basically means invert, always invert.',
-        startTime: 148.68,
-        endTime: 164.84,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_17',
-        text:
-            'So how does a mathematician use this? Well, when he was stuck on a really complex equation, instead of trying to force a solution forward, he just start at the end result and work backward.',
-        startTime: 165.26,
-        endTime: 174.04,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_18',
-        text:
-            'And he found that a lot of the time, the solution just revealed itself. So that\'s the through line from the stoics to Munger. The power is in figuring out how you might fail so you can build a system to avoid it.',
-        startTime: 174.3,
-        endTime: 186.04,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_19',
-        text:
-            'Exactly. It\'s about elimination, defining what you want by first figuring out everything you don\'t want and then just subtracting it. Okay, let\'s make this really concrete with a visual.',
-        startTime: 186.12,
-        endTime: 195.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_20',
-        text:
-            'I think this helps a lot. Imagine you\'re at the start of a massive complicated maze. You start walking forward, you hit a dead end, you turn back, you hit another one.',
-        startTime: 195.2,
-        endTime: 205.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_21',
-        text:
-            'It\'s frustrating, it\'s slow, it\'s just inefficient. We\'ve all been there. But if you use inversion, you just go to the end, you start at the exit and you solve it backward.',
-        startTime: 205.38,
-        endTime: 215.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_22',
-        text:
-            'Suddenly, all those dead ends don\'t matter, the path becomes obvious. The problem just gets so much easier to solve. You\'re not searching for the one right path, you\'re eliminating all the wrong ones.',
-        startTime: 215.7,
-        endTime: 226.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_23',
-        text:
-            'And it\'s that exact clarity that Charlie Munger brought into the chaotic world of finance. Munger took Jacobi\'s role and applied it to everything. And it led to his foundational principle, which is worth saying again.',
-        startTime: 226.22,
-        endTime: 237.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_24',
-        text:
-            'It is remarkable how much long-term advantage we have gotten by trying to be consistently not stupid instead of trying to be very intelligent. That quote is, it\'s so deceptively simple.',
-        startTime: 238.02,
-        endTime: 249.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_25',
-        text:
-            'Because the normal approach is, how do I find the next huge stock? Munger flips that completely, he inverts it. The problem for him isn\'t how do I get rich?',
-        startTime: 249.4,
-        endTime: 258.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_26',
-        text:
-            'It\'s how do I not lose money? If you solve for that, the getting rich part tends to take care of itself. But couldn\'t that lead to analysis paralysis?',
-        startTime: 258.58,
-        endTime: 268.54,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_27',
-        text:
-            'If you\'re only focused on avoiding failure, how do you ever actually take a risk and do something? That is a great question and it\'s a real risk. But the key is the kind of mistake you\'re trying to avoid.',
-        startTime: 268.76,
-        endTime: 279.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_28',
-        text:
-            'Munger\'s not worried about missing a small opportunity. He\'s worried about the big ones. The ones that take you out of the game for good. The permanent mistakes. So his inversion process isn\'t about avoiding every tiny risk.',
-        startTime: 280.38,
-        endTime: 292.28,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_29',
-        text:
-            'It\'s about avoiding the things that guarantee destruction. Like what? Like taking on way too much debt, investing in businesses you don\'t understand, or making emotional impulsive trades.',
-        startTime: 292.44,
-        endTime: 301.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_30',
-        text:
-            'Those are the things that cause catastrophic loss. That\'s the subtraction mindset. You focus on eliminating harm, which is way easier and more predictable than trying to engineer some brilliant success.',
-        startTime: 302.18,
-        endTime: 312.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_31',
-        text:
-            'Okay, so this is where it gets really useful for all of us. How do we take this philosophy and turn it into a tool we can use every day? Right. This is where it goes from an idea to a structured technique.',
-        startTime: 312.02,
-        endTime: 322.64,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_32',
-        text:
-            'When we start a new project, our default question is always aspirational. What do we need to do to succeed? But the inverted question is the opposite.',
-        startTime: 323.44,
-        endTime: 331.84,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_33',
-        text:
-            'It\'s what could happen that would absolutely stop us? Or maybe even how could this whole thing fail? And how would I personally be responsible for that failure?',
-        startTime: 332.64,
-        endTime: 341.74,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_34',
-        text:
-            'That inverted question is so powerful because it fights our own biases. We all have confirmation bias. We look for evidence that we\'re right and we have optimism bias.',
-        startTime: 341.74,
-        endTime: 350.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_35',
-        text:
-            'We just assume things will work out. So inversion forces you to actively look for the flaws to try to prove yourself wrong. Yes, it\'s a safety check on your own confidence.',
-        startTime: 350.46,
-        endTime: 360.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_36',
-        text:
-            'And the best, most structured way to do this is a technique called the failure premortem. The failure premortem. Okay, I love that name. It\'s a gold standard technique now.',
-        startTime: 360.5,
-        endTime: 369.14,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_37',
-        text:
-            'And it\'s so simple. Before you start a big project, you imagine it\'s six months in the future and it has failed. I mean, failed spectacularly. And then what? You hold a meeting.',
-        startTime: 369.56,
-        endTime: 378.52,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_38',
-        text:
-            'And everyone on the team has to write an obituary for the project. You tell the story of how it failed, what went wrong, was it a competitor, did the team fall apart, did we miss a deadline?',
-        startTime: 379.08,
-        endTime: 388.76,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_39',
-        text:
-            'That sounds incredibly uncomfortable. It is. But that discomfort is why it works. It overcomes what we call distance from the consequences.',
-        startTime: 389.52,
-        endTime: 398.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_40',
-        text:
-            'A small bad decision today might not seem like a big deal. Until six months later when it blows everything up. Exactly. The premortem makes those consequences feel immediate.',
-        startTime: 399.14,
-        endTime: 409.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_41',
-        text:
-            'And it also gives people permission to voice their doubts. It makes it safe to say, hey, I\'m worried about this without being seen as negative. You\'re basically harvesting all the negative intelligence up front and turning it into a positive action plan.',
-        startTime: 409.52,
-        endTime: 421.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_42',
-        text:
-            'That\'s it. And for anyone listening who wants to use this, there\'s a really clear five-step process. Okay, let\'s walk through it. Step one is, state your goal. Be specific.',
-        startTime: 421.86,
-        endTime: 430.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_43',
-        text:
-            'Write down exactly what success looks like. Then step two, invert the question. Immediately flip it. What does spectacular failure look like?',
-        startTime: 431.26,
-        endTime: 439.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_44',
-        text:
-            'Not just missing the goal, but the worst possible outcome. Step three, explore the causes of failure. Brainstorm every single thing that could lead to that disaster.',
-        startTime: 439.46,
-        endTime: 449.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_45',
-        text:
-            'Be ruthless. Bad marketing, a buggy product, a key person quitting. Right. Then step four is a bit different. Way pros and cons inverted.',
-        startTime: 450.18,
-        endTime: 458.82,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_46',
-        text:
-            'Usually we look at the upside of our options. Here you look at the downside. For each choice you have, you ask what weakness in this specific option could lead to one of those failures we just listed.',
-        startTime: 459.34,
-        endTime: 469.6,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_47',
-        text:
-            'So if I\'m choosing a supplier, I don\'t just look at the price. I ask which one\'s shaky logistics are more likely to kill my whole project six months from now. Precisely. You\'re stress testing your choices against failure.',
-        startTime: 469.88,
-        endTime: 479.96,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_48',
-        text:
-            'And then finally, step five, implement an action plan. You build a strategy specifically designed to avoid or fix every cause of failure you identified.',
-        startTime: 480.56,
-        endTime: 488.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_49',
-        text:
-            'You build guardrails around disaster. So this applies to, well, everything. It\'s not just for big corporate projects. The beauty here is how versatile it is.',
-        startTime: 488.96,
-        endTime: 498.14,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_50',
-        text:
-            'It\'s like anti-advice for your entire life. Absolutely. Think about leadership. Instead of asking, how can I be a great leader, invert it.',
-        startTime: 498.36,
-        endTime: 506.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_51',
-        text:
-            'What would I have to do every day to be the most demoralizing, parable leader imaginable? You\'d immediately think of things like micromanaging, taking credit for other people\'s work, never giving feedback.',
-        startTime: 506.98,
-        endTime: 518.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_52',
-        text:
-            'Exactly. Once you have that list, your leadership plan is simple. Just don\'t do those things. You spend all your energy eliminating harmful actions instead of chasing vague, good leader traits.',
-        startTime: 518.58,
-        endTime: 529.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_53',
-        text:
-            'Or what about just being productive? Instead of, how do I get more done, you could ask. What are the things that make us unproductive? What wastes the most time?',
-        startTime: 529.32,
-        endTime: 537.9,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_54',
-        text:
-            'The answer isn\'t a new app. It\'s probably too many meetings or a culture where people are afraid to admit mistakes early. You eliminate the friction. It even works for personal stuff.',
-        startTime: 538.34,
-        endTime: 547.0,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_55',
-        text:
-            'Right. Relationships. What behaviors would absolutely destroy this relationship? Lying, neglect, secrets. You know what they are, so you focus on avoiding those. It\'s a much surer path to a stable relationship than, you know, planning one big romantic gesture.',
-        startTime: 547.3,
-        endTime: 559.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_56',
-        text:
-            'So at its core, inversion is really a tool to fight our own wiring, our bias for action. We always want to do something. But sometimes the most powerful action is inaction, the discipline to avoid an obvious mistake.',
-        startTime: 560.16,
-        endTime: 573.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_57',
-        text:
-            'It\'s about constant self-criticism to prevent those big errors from piling up. Okay. To bring this all home, let\'s summarize the key takeaways from this deep dive.',
-        startTime: 573.52,
-        endTime: 581.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_58',
-        text:
-            'I think the first one is just, the goal is avoidance. Success usually comes from consistently not making dumb mistakes, not from one single brilliant move.',
-        startTime: 581.8,
-        endTime: 591.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_59',
-        text:
-            'Avoiding stupidity is easier and less risky than chasing brilliance. Second takeaway. Practice the pre-mortem. Seriously, use this technique.',
-        startTime: 591.96,
-        endTime: 600.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_60',
-        text:
-            'Before any big project, imagine it has failed. Write the story of why. It will save you so much pain later. Make it a mandatory step for your team or even just for yourself.',
-        startTime: 600.72,
-        endTime: 609.84,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_61',
-        text:
-            'And third, find the anti-advice. Invert your goals in your career, in your finances, in your relationships. Figure out what guaranteed failure looks like and then systematically eliminate those behaviors first.',
-        startTime: 609.98,
-        endTime: 620.82,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_62',
-        text:
-            'Build your success on a foundation of subtraction. And just remember, blindly chasing success is always high risk. But preventing failure using this disciplined approach, that carries very little risk.',
-        startTime: 621.16,
-        endTime: 633.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_63',
-        text:
-            'It\'s a much more reliable path to progress. So the next time you feel stuck, just remember Jacoby and Munger. Ask yourself, if this all goes horribly wrong in six months, what\'s the one obvious mistake I made today that caused it?',
-        startTime: 633.9,
-        endTime: 645.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_002_64',
-        text:
-            'And how can I fix that before the sun goes down? That answer, that might be the biggest breakthrough you have all week. What stands out to you?',
-        startTime: 645.24,
-        endTime: 651.5,
-      ),
-    ],
-  ),
-  // Second-Order Thinking - drop_003
-  'drop_003': Transcript(
-    chapters: const [
-      AudioChapter(
-        title: 'The Problem with AI Tools',
-        description: 'Why AI often fails us',
-        startTime: 0,
-        endTime: 80,
-      ),
-      AudioChapter(
-        title: 'Thinking Beyond First Effects',
-        description: 'Understanding cascading consequences',
-        startTime: 80,
-        endTime: 180,
-      ),
-      AudioChapter(
-        title: 'The Efficiency Paradox',
-        description: 'When optimization backfires',
-        startTime: 180,
-        endTime: 260,
-      ),
-      AudioChapter(
-        title: 'Strategic Implementation',
-        description: 'How to think ahead effectively',
-        startTime: 260,
-        endTime: 329,
-      ),
-    ],
-    segments: const [
-      TranscriptSegment(
-        id: 'drop_003_1',
-        text:
-            'You know, in the world of artificial intelligence, there\'s this massive, hidden dragon that every researcher, every company is desperately trying to slay. And it\'s not a lack of data or a shortage of brilliant minds. No, it\'s something way more fundamental than that. So what is this dragon?',
-        startTime: 0.0,
-        endTime: 17.38,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_2',
-        text:
-            'What\'s the one thing that\'s really holding back the next wave of AI breakthroughs? You know, the stuff that could cure diseases or help solve climate change? Believe it or not, The answer is kind of simple, almost mundane, really. It\'s inefficiency. The sheer amount of time and computational power it takes to teach an AI model anything, it\'s just staggering. It\'s like',
-        startTime: 17.88,
-        endTime: 37.16,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_3',
-        text:
-            'we\'re building these incredible superhighways, but forcing our AI to learn how to drive stuck in first gear. So we keep throwing all this amazing hardware at the problem, but what if the problem isn\'t the engine? What if it\'s the map we\'re using? The real breakthrough, it turns out, isn\'t just about',
-        startTime: 37.16,
-        endTime: 53.3,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_4',
-        text:
-            'training harder, it\'s about training smarter. And that brings us to this whole quest for something called optimization. I want you to think about it like this. Training an AI is like trying to find the absolute lowest point in a massive, complicated mountain range, but you have to do it in a super',
-        startTime: 53.3,
-        endTime: 69.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_5',
-        text:
-            'thick fog. So for years, the standard way we\'ve done this is with something called first order optimization. Okay, so you\'re in that foggy valley, you can\'t see a thing. All you can do is feel the right where you\'re standing. So you take a small step downhill, feel the slope again, take another',
-        startTime: 69.36,
-        endTime: 86.74,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_6',
-        text:
-            'step. It works eventually, but it\'s this slow plotting process. You might end up zigzagging down a gentle slope for hours, and you\'d completely miss a much steeper, way faster path that was just a few feet away. But what if the fog lifted just a little? That\'s what second order optimization is',
-        startTime: 86.74,
-        endTime: 105.44,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_7',
-        text:
-            'like. Instead of just feeling the slope right under your feet, you can now see the curvature of the valley around you. You don\'t just see which way is down, you see how quickly it goes down.',
-        startTime: 105.44,
-        endTime: 115.28,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_8',
-        text:
-            'You can see the whole shape of the terrain, which means you can aim directly for the bottom. It is a total game changer. And you can literally see the difference here. On the left, first order optimization sees the world in a straight line. It\'s looking at each piece of the puzzle on its own.',
-        startTime: 115.62,
-        endTime: 131.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_9',
-        text:
-            'But over on the right, second order sees the whole picture, every single connection, every relationship. It\'s the difference between looking at one single paving stone versus seeing the entire map. Now, for a long, long time, being able to see that full map was just way too computationally',
-        startTime: 131.2,
-        endTime: 148.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_10',
-        text:
-            'expensive. It was a beautiful idea in theory that just couldn\'t work in the real world with the enormous AI models we use today. Until a new algorithm came along, one with a, well, a pretty memorable name, to slay this dragon of inefficiency. It\'s called Shampoo. And its whole purpose is right',
-        startTime: 148.92,
-        endTime: 167.4,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_11',
-        text:
-            'there in what its creators said. Shampoo was designed to bridge the gap. It finds this really clever way to approximate that full map, all that second order information, but without the crippling computational cost. It makes the power of seeing the whole terrain accessible for the very first',
-        startTime: 167.4,
-        endTime: 184.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_12',
-        text:
-            'time at a massive scale. So how does it pull this off? Well, it\'s kind of like a brilliant orchestra conductor. You\'ve got the main GPU musicians playing the main melody, that\'s the AI training, but Shampoo notices the CPU percussion section is just sitting there not doing much.',
-        startTime: 184.02,
-        endTime: 199.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_13',
-        text:
-            'So it hands them a totally different piece of music, those complex map making calculations, and tells them to play it at the same time. Nothing stops, nobody has to wait. It\'s just a symphony of efficiency, using every part of the computer in perfect harmony. And all of this',
-        startTime: 199.58,
-        endTime: 219.12,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_14',
-        text:
-            'speed up. We\'re not talking about a theoretical improvement here. This is about getting results way faster. Researchers applied Shampoo to some of the largest, most complex models out there.',
-        startTime: 219.12,
-        endTime: 228.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_15',
-        text:
-            'You know, models for machine translation, language understanding, ad prediction, and the results? They were dramatic. And the results are just stunning. I mean, look at this. For a standard transformer model, the kind that powers things like Google Translate, they didn\'t just shave off a',
-        startTime: 228.86,
-        endTime: 244.82,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_16',
-        text:
-            'few minutes, they cut the training time nearly in half. And for the really big models, they saved over 17 hours. That\'s not just an improvement, that\'s a revolution. Let that sink in. What this means is that for some of the biggest, most important AI tasks in the world, we can now get',
-        startTime: 244.82,
-        endTime: 263.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_17',
-        text:
-            'to the answer almost twice as fast. Just imagine what that does to the speed of discovery. So this is way more than just a faster algorithm. This is about unlocking the future. When you can dramatically reduce the time it takes to experiment and to innovate, you fundamentally change what\'s',
-        startTime: 263.02,
-        endTime: 279.74,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_18',
-        text:
-            'even possible. So as we\'re emerging from that foggy valley, and we\'ve got this much clearer map in our hands, what are the key landmarks we should remember from this journey? Okay, first, remember that one of AI\'s biggest dragons is just simple inefficiency, the time and the cost of training.',
-        startTime: 279.74,
-        endTime: 296.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_19',
-        text:
-            'Second, the solution isn\'t always just more power. It\'s smarter methods like second order optimization that give us a bird\'s eye view of the problem. And third, and this is the most important part, making training faster means we accelerate the entire cycle of innovation, from a new idea to a real breakthrough. Because this isn\'t just about faster computers. It\'s about faster cures.',
-        startTime: 296.84,
-        endTime: 317.14,
-      ),
-      TranscriptSegment(
-        id: 'drop_003_20',
-        text:
-            'It\'s about getting to a cancer treatment or a climate solution or a scientific discovery in half the time. The real question isn\'t how much faster the AI can learn. It\'s how much faster we can build a better world for everyone.',
-        startTime: 317.48,
-        endTime: 329.42,
-      ),
-    ],
-  ),
-  // AI Exponential Growth & Policy - drop_004
-  'drop_004': Transcript(
-    chapters: const [
-      AudioChapter(
-        title: 'The Exponential Curve',
-        description: 'Understanding AI\'s growth trajectory',
-        startTime: 0,
-        endTime: 180,
-      ),
-      AudioChapter(
-        title: 'Global Competition',
-        description: 'The race between nations',
-        startTime: 180,
-        endTime: 400,
-      ),
-      AudioChapter(
-        title: 'Policy Responses',
-        description: 'How governments are reacting',
-        startTime: 400,
-        endTime: 580,
-      ),
-      AudioChapter(
-        title: 'Career Implications',
-        description: 'What this means for you',
-        startTime: 580,
-        endTime: 720,
-      ),
-      AudioChapter(
-        title: 'Looking Ahead',
-        description: 'Preparing for the future',
-        startTime: 720,
-        endTime: 848,
-      ),
-    ],
-    segments: const [
-      TranscriptSegment(
-        id: 'drop_004_1',
-        text:
-            'The pace of AI development feels less like a steady jog and more like a, I don\'t know, a rocket launch. It really does. If you, like us, feel like you\'re constantly scrambling to keep up, you are not wrong.',
-        startTime: 0.0,
-        endTime: 11.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_2',
-        text:
-            'Welcome to the Deep Dive. Today, we\'ve taken the comprehensive 2024 and 2025 AI index reports, plus a thick stack of global regulatory documents, and we\'ve distilled them.',
-        startTime: 12.48,
-        endTime: 24.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_3',
-        text:
-            'And our mission today is pretty simple, right? Yeah, to give you a clear, high-level map of this volatile landscape, we\'re tracking three major forces.',
-        startTime: 24.3,
-        endTime: 32.96,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_4',
-        text:
-            'The staggering velocity of AI capability growth. The serious documented challenges those advances are creating. And finally, the concrete global policy and technical solutions that are, frankly, racing to catch up.',
-        startTime: 33.26,
-        endTime: 45.04,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_5',
-        text:
-            'OK, let\'s unpack this. We have to start with velocity because the sheer speed is the foundation of every other problem and solution we\'re going to talk about. It really is. The biggest headline we pulled from those documents was about the shift in who is actually driving this rapid development.',
-        startTime: 45.12,
-        endTime: 59.04,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_6',
-        text:
-            'It\'s a clear power consolidation. If you look at the research output just from 2023, industry produced 51 notable machine learning models.',
-        startTime: 59.22,
-        endTime: 68.16,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_7',
-        text:
-            '51. And academia. Academia, which, you know, historically drove fundamental research, produced only 15. So the capital and the raw compute required to train these frontier models.',
-        startTime: 68.28,
-        endTime: 79.3,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_8',
-        text:
-            'Yeah. It\'s all centralized now. Almost entirely in the private sector, yes. And when you look at the compute required for this, the numbers just become truly dizzying.',
-        startTime: 79.34,
-        endTime: 88.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_9',
-        text:
-            'They do. The sources clearly show that the training compute needed for the most notable AI models is doubling approximately every five months.',
-        startTime: 88.34,
-        endTime: 97.16,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_10',
-        text:
-            'Doubling every five months. Just think about that pace. I mean, if your rent or your salary doubled that fast, the world would fundamentally change in a year. This is an exponential trend that utterly dwarfs older metrics like Moore\'s law.',
-        startTime: 97.48,
-        endTime: 109.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_11',
-        text:
-            'Which means the capability floor is constantly rising.  And critically, AI is achieving benchmarks that were previously strictly human domains.',
-        startTime: 109.18,
-        endTime: 117.46,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_12',
-        text:
-            'We\'re not talking about Go or chess anymore. No, not at all. We\'re talking about high stakes abstract reasoning. What\'s fascinating here is exactly where AI is conquering these traditional human benchmarks.',
-        startTime: 117.64,
-        endTime: 128.6,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_13',
-        text:
-            'So these are the things we thought were SACE, the things that made us uniquely human. For years, yeah. Tasks involving complex mathematical and abstract reasoning were considered strongholds for human expertise.',
-        startTime: 128.86,
-        endTime: 139.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_14',
-        text:
-            'But that barrier is breaking down fast. So give us the concrete scorecard. Where did the machine finally win? The documents pinpoint a few key conquests.',
-        startTime: 139.68,
-        endTime: 148.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_15',
-        text:
-            'In high level mathematics, the data is just astonishing. OpenAI\'s 03 mini model, which came out in January 2025, achieved 97.9% accuracy on the challenging math data set.',
-        startTime: 149.08,
-        endTime: 161.08,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_16',
-        text:
-            '97.9% and the human baseline is what? The human baseline is 90%. So it\'s officially surpassed us. That\'s competition level math proficiency. So we have an AI that can essentially pass advanced math exams better than the average top student.',
-        startTime: 161.08,
-        endTime: 174.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_17',
-        text:
-            'What about reasoning and knowledge application? Well, beyond CureMath, we saw major advances in visual and conceptual reasoning. In 2024, AI systems finally match the human baseline on visual common sense reasoning or VCR.',
-        startTime: 175.1,
-        endTime: 189.84,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_18',
-        text:
-            'And VCR is. That\'s about understanding subtle relationships and images, right? Not just identifying objects. Exactly. And for abstract pattern recognition, OpenAI\'s 03 model got a 75.7% on the previously difficult ARC-AGI benchmark.',
-        startTime: 189.84,
-        endTime: 205.62,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_19',
-        text:
-            'And this proficiency is translating directly into high stakes fields like medicine. Absolutely. Which is where mistakes have immediate life altering consequences. Clinical large language models are improving at a breathtaking pace.',
-        startTime: 205.86,
-        endTime: 217.04,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_20',
-        text:
-            'OK, so what are the numbers there? Take the MedQA benchmark. It\'s essentially the equivalent of a clinical licensing exam. In 2024, OpenAI\'s 01 model achieved a state of the art 96.0% accuracy on it.',
-        startTime: 217.14,
-        endTime: 230.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_21',
-        text:
-            '96%. Yes. And what makes that data point so compelling is that represents a stunning 28.4% point improvement since just late 2022.',
-        startTime: 231.02,
-        endTime: 239.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_22',
-        text:
-            'And just over a year. Yeah. This signals that MedQA, a key benchmark for clinical knowledge, may soon be saturated. We just need a harder test to even measure progress now.',
-        startTime: 239.74,
-        endTime: 248.08,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_23',
-        text:
-            'Which means we\'re going to need even harder challenges to track real capability. But here\'s the thing. The models aren\'t just getting better, are they?',
-        startTime: 248.08,
-        endTime: 256.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_24',
-        text:
-            'They\'re getting smarter and much, much more efficient. That\'s the perfect transition. The trend used to be scaling up. Just throw more parameters at the problem. Now the goal is scaling down without losing performance.',
-        startTime: 256.36,
-        endTime: 266.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_25',
-        text:
-            'So tell us about that size reduction. That was a huge headline. It was. The reports highlight the smallest model capable of surpassing 60% on the comprehensive MMLU benchmark.',
-        startTime: 266.82,
-        endTime: 276.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_26',
-        text:
-            'In 2022, that model was Google\'s Paul M, which had a massive 540 billion parameters. 540 billion.',
-        startTime: 276.86,
-        endTime: 285.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_27',
-        text:
-            'OK. Just two years later in 2024, that same threshold was met by Microsoft\'s Phi 3 Mini. It has just 3.8 billion parameters.',
-        startTime: 285.84,
-        endTime: 294.1,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_28',
-        text:
-            'That\'s a 142 fold reduction in model size. In two years. That isn\'t just a fun statistic. No, it\'s a huge shift in capability accessibility. Right. It means powerful, highly capable AI is now accessible outside of just five hyperscale labs.',
-        startTime: 294.18,
-        endTime: 307.62,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_29',
-        text:
-            'It changes the security calculus, the distribution of power, and frankly, who can afford to innovate? And that accessibility pushes us directly toward the urgent challenges these capabilities are creating.',
-        startTime: 308.12,
-        endTime: 318.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_30',
-        text:
-            'Precisely. But this lightning fast progress, as you said, it always comes with a wake of serious trouble. Let\'s pivot now to the urgent challenges, because the acceleration of capability has been mirrored by an explosion in risk.',
-        startTime: 318.3,
-        endTime: 331.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_31',
-        text:
-            'It really has. According to the AI Incidence Database, the number of reported AI-related incidents hit a record high of 233 in 2024 alone.',
-        startTime: 331.22,
-        endTime: 341.44,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_32',
-        text:
-            'And that\'s a... what was the percentage increase? A 56.4% increase over 2023. And we have to remember that\'s based only on reported incidents. The real number is likely much higher.',
-        startTime: 341.54,
-        endTime: 351.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_33',
-        text:
-            'A 56% increase in failures in a single year, even as models are getting demonstrably better at math and medicine. What\'s going on there? That dichotomy is the core of the problem.',
-        startTime: 351.4,
-        endTime: 360.4,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_34',
-        text:
-            'We lack standardized tools to even measure safety consistently. We know the risks are multiplying. But we lack standardized responsible AI or RAI benchmarks.',
-        startTime: 360.4,
-        endTime: 369.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_35',
-        text:
-            'So the developers OpenAI, Google, Anthropic, they\'re all testing against different internal standards. Largely, yes. They\'re using proprietary benchmarks.',
-        startTime: 370.1,
-        endTime: 378.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_36',
-        text:
-            'So if a model fails a safety test in one lab, we can\'t systematically compare that risk to a similar model from a competing lab. Which makes systematic risk comparison almost impossible.',
-        startTime: 378.98,
-        endTime: 389.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_37',
-        text:
-            'Exactly. And that\'s critical because these models are still highly vulnerable. They struggle acutely with factuality, what we all call hallucination.',
-        startTime: 389.78,
-        endTime: 398.98,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_38',
-        text:
-            'And they are highly susceptible to sophisticated adversarial attacks. You mean red teaming. Yes. Clever red teaming prompts that can get them to bypass their own safety protocols.',
-        startTime: 399.4,
-        endTime: 409.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_39',
-        text:
-            'What\'s the real world danger of these bypasses? What can happen? Well, the models can be manipulated into revealing sensitive data. For example, leaking what we call PII, personally identifiable information like phone numbers or private details they might have inadvertently stored from their training data.',
-        startTime: 409.38,
-        endTime: 424.74,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_40',
-        text:
-            'Or just generating harmful content. Beyond safety risks is a fundamental looming challenge to the model\'s fuel source data. We\'re seeing what the sources call a shrinking data commons.',
-        startTime: 425.24,
-        endTime: 435.64,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_41',
-        text:
-            'That\'s right. For years, models benefited from massive unrestricted web scraping. But the internet is getting wise to this. The reports show many major domains implemented protocols to curb data scraping.',
-        startTime: 435.94,
-        endTime: 448.98,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_42',
-        text:
-            'So what\'s the effect of that? The proportion of restricted tokens in the massive C4 data set jumped drastically. It went from around 5-7% to somewhere between 20-33%.',
-        startTime: 449.12,
-        endTime: 459.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_43',
-        text:
-            'So the well is starting to run dry. This isn\'t just an abstract problem. It\'s a signal that the fundamental resource models need is becoming scarce. Which is why that next hurdle model collapse is so alarming.',
-        startTime: 459.24,
-        endTime: 470.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_44',
-        text:
-            'Explain that for us. Model collapse is what happens when models have to train purely on synthetic or AI generated data for repeated cycles.',
-        startTime: 470.54,
-        endTime: 478.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_45',
-        text:
-            'It creates an echo chamber. And the result is a loss of diversity. A severe loss of diversity and ultimately degraded output quality. The models literally forget what reality looks like.',
-        startTime: 478.92,
-        endTime: 488.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_46',
-        text:
-            'Now the good news is that newer research suggests that if you carefully layer synthetic data on top of real human generated data, you can mitigate the degradation. But the pressure to find new high quality human data is immense.',
-        startTime: 489.22,
-        endTime: 500.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_47',
-        text:
-            'The technical challenges are huge, but the immediate societal and political risks. They remain front and center. Especially with major global elections underway.',
-        startTime: 501.32,
-        endTime: 510.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_48',
-        text:
-            'Oh absolutely. Deepfakes are now a tool of political conflict. We\'ve seen concrete examples like the use of contentious AI generated audio clips during Slovakia\'s 2023 election.',
-        startTime: 511.2,
-        endTime: 521.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_49',
-        text:
-            'Where the authenticity was immediately questioned and weaponized. Exactly. They\'re easy to generate and notoriously hard to detect reliably. And what\'s worse, the documents note that many popular detectors perform significantly worse when analyzing deepfakes of certain racial subgroups.',
-        startTime: 521.78,
-        endTime: 537.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_50',
-        text:
-            'And the risk isn\'t just external manipulation. There\'s the inherent bias found in the commercial models themselves. Researchers for instance found a significant political bias in chat GPT.',
-        startTime: 537.78,
-        endTime: 547.74,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_51',
-        text:
-            'A measurable leaning toward Democrats in the US and the Labour Party in the UK. So even seemingly neutral tools carry the biases from their training data.',
-        startTime: 547.82,
-        endTime: 556.74,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_52',
-        text:
-            'They do. And this all rolls up into this crucial ethical problem documented in the reports called the liars dividend. It\'s a concept that should genuinely worry everyone.',
-        startTime: 556.84,
-        endTime: 566.5,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_53',
-        text:
-            'It really should. Because deepfake technology exists and is widely known, individuals, especially public figures, can now deny genuine, verifiable evidence by falsely claiming it was AI generated.',
-        startTime: 566.92,
-        endTime: 579.26,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_54',
-        text:
-            'It erodes public trust in objective reality. It makes accountability nearly impossible to enforce. It\'s a truly corrosive problem for democracy.',
-        startTime: 579.44,
-        endTime: 588.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_55',
-        text:
-            'Okay, let\'s shift gears now. Let\'s talk about how the world is trying to govern this. Section 3. How are we trying to manage this and what positive applications are emerging despite the risks?',
-        startTime: 588.62,
-        endTime: 599.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_56',
-        text:
-            'Here\'s where it gets really interesting. It is. We are seeing a rapid acceleration of international coordination. People are recognizing that technical breakthroughs don\'t respect borders.',
-        startTime: 599.5,
-        endTime: 608.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_57',
-        text:
-            'So after that first AI safety summit in 2023, things started moving. Very quickly. In 2024, AI safety institutes were launched or pledged across the globe in the U.S., the U.K., Japan, France, Germany, Italy, Singapore, South Korea, Australia, Canada, and the EU.',
-        startTime: 608.44,
-        endTime: 624.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_58',
-        text:
-            'That is massive global coordination happening at speed. But how are these legislative efforts shaping up? Are they all converging on a single philosophy? Not exactly.',
-        startTime: 624.52,
-        endTime: 633.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_59',
-        text:
-            'Generally, the sources suggest a growing trend toward restrictive legislation focused on mitigating large-scale harm. The EU AI Act is the most famous example.',
-        startTime: 633.48,
-        endTime: 643.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_60',
-        text:
-            'Right. And it explicitly prohibits what it calls unacceptable risk systems. Yes. Things like behavioral manipulators. And it mandates stringent transparency for high-risk applications and generative AI.',
-        startTime: 643.6,
-        endTime: 655.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_61',
-        text:
-            'So how does that compare to the U.S. approach? I know harmonization is a big challenge right now. That\'s the core difference the G7 noted. The U.S. has focused on specific sector-targeted acts.',
-        startTime: 655.28,
-        endTime: 666.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_62',
-        text:
-            'For instance, the Artificial Intelligence and Biosecurity Risk Assessment Act, which looks at the threat of AI developing harmful agents. So things like bioweapons.',
-        startTime: 666.34,
-        endTime: 675.54,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_63',
-        text:
-            'Exactly. Or another one is the Jobs of the Future Act, which mandates studying AI\'s direct impact on occupations. So let me get this straight. The EU is prescriptive and broad-setting ground rules for all AI systems.',
-        startTime: 675.96,
-        endTime: 687.16,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_64',
-        text:
-            'Right. While the U.S. is more targeted and sector-specific, focusing on immediate threats and workforce impacts. Exactly. And the G7 report explicitly stated that these two differing philosophies, they\'re likely to challenge global harmonization efforts for years to come.',
-        startTime: 687.26,
-        endTime: 704.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_65',
-        text:
-            'It\'s going to be messy. It\'s a messy global rollout, for sure. But it\'s critical that we look at the immense positive applications, especially in high-stakes science and medicine.',
-        startTime: 704.3,
-        endTime: 713.76,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_66',
-        text:
-            'The whole story isn\'t about stopping the bad. It\'s also about boosting the good. Absolutely. AI is dramatically accelerating scientific discovery.',
-        startTime: 714.3,
-        endTime: 722.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_67',
-        text:
-            'This is where that compute power really shines. Google DeepMind\'s Genome Project, for example, used AI to discover 2.2 million new crystal structures.',
-        startTime: 722.78,
-        endTime: 732.76,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_68',
-        text:
-            '2.2 million. I mean, that\'s a game-changer for material science, potentially unlocking new superconductors or batteries that human researchers simply overlooked.',
-        startTime: 732.82,
-        endTime: 740.94,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_69',
-        text:
-            'And in life-critical fields like weather forecasting, time is literally measured in lives saved. That\'s a perfect example. Models like GraphCast and GenCast now provide highly accurate 15-day forecasts in minutes rather than the hours needed by traditional supercomputer simulations.',
-        startTime: 741.28,
-        endTime: 756.62,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_70',
-        text:
-            'Which is vital for disaster response. And climate resilience planning, where speed is everything. And in healthcare, AI is moving from being a novelty to a necessity.',
-        startTime: 756.78,
-        endTime: 766.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_71',
-        text:
-            'We\'ve seen an exponential increase in AI-enabled medical devices approved by the FDA. And critically, AI is also being deployed to integrate complex factors that affect treatment outcomes, like social determinants of health or SDOH.',
-        startTime: 766.94,
-        endTime: 779.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_72',
-        text:
-            'So that means things like a patient\'s housing situation, or transport or support systems. Exactly. In oncology, for example, AI tools are considering those factors to create personalized, feasible treatment plans.',
-        startTime: 779.7,
-        endTime: 791.4,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_73',
-        text:
-            'This is actively working toward improving health equity, not just faster diagnoses. So if we pull back, we are in a tight race. We have unprecedented capability acceleration on one track.',
-        startTime: 791.9,
-        endTime: 802.64,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_74',
-        text:
-            'Leading to massive societal upheaval and risk. And on the other, a scrambling effort to implement responsible governance and harness the beneficial outcomes. The stakes could not be higher.',
-        startTime: 802.86,
-        endTime: 812.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_75',
-        text:
-            'This raises an important question, you know. Given that AI is now outperforming humans on high-level coding, math, and clinical knowledge benchmarks, yet still struggles with reliable planning and social reasoning.',
-        startTime: 813.06,
-        endTime: 823.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_76',
-        text:
-            'Things like PlanBench. What fundamentally human skill beyond technical ability must society prioritize and cultivate in future education and workforce development to ensure we guide, rather than simply deploy, this powerful technology.',
-        startTime: 823.8,
-        endTime: 838.96,
-      ),
-      TranscriptSegment(
-        id: 'drop_004_77',
-        text:
-            'It\'s not about being a better calculator than the machine. Not anymore. It\'s about mastering those uniquely human skills. Knowing what to calculate next and why it matters to the collective good.',
-        startTime: 839.1,
-        endTime: 848.88,
-      ),
-    ],
-  ),
-  // The Art of Asking Questions - drop_007
-  'drop_007': Transcript(
-    chapters: const [
-      AudioChapter(
-        title: 'The Power of Questions',
-        description: 'Why questions matter more than answers',
-        startTime: 0,
-        endTime: 90,
-      ),
-      AudioChapter(
-        title: 'The Socratic Method',
-        description: 'Ancient wisdom for modern inquiry',
-        startTime: 90,
-        endTime: 180,
-      ),
-      AudioChapter(
-        title: 'Types of Powerful Questions',
-        description: 'Different questions for different purposes',
-        startTime: 180,
-        endTime: 280,
-      ),
-      AudioChapter(
-        title: 'Mastering the Art',
-        description: 'Practical techniques to improve',
-        startTime: 280,
-        endTime: 363,
-      ),
-    ],
-    segments: const [
-      TranscriptSegment(
-        id: 'drop_007_1',
-        text:
-            'Did you know that over the course of your life, you\'re probably gonna ask something like 20,000 questions? 20,000, but what if I told you that most of them are actually the wrong ones?',
-        startTime: 0.0,
-        endTime: 9.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_2',
-        text:
-            'Today, we\'re gonna get into the art of asking questions that don\'t just get us answers, they change everything. Just let that one sink in for a second. This isn\'t just some nice sounding idea, it\'s a real, practical truth.',
-        startTime: 10.42,
-        endTime: 22.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_3',
-        text:
-            'Think about it. The quality of your career, your relationships, even how happy you feel. So much of that hinges on the kinds of questions you\'re asking yourself and others.',
-        startTime: 23.28,
-        endTime: 32.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_4',
-        text:
-            'So if our questions are that important, it\'s absolutely crucial that we\'re not just asking any old question, right? We need to be asking the right one, the one that really unlocks the door to whatever comes next.',
-        startTime: 33.44,
-        endTime: 43.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_5',
-        text:
-            'So let\'s start right here. I want you to think of questions as the engine of your mind. Seriously, without a question, your thinking just sits there. It has no fuel, no direction.',
-        startTime: 44.72,
-        endTime: 54.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_6',
-        text:
-            'It\'s the question that\'s the spark that gets the whole thing moving. But here\'s the trap that so many of us fall into, pretty much every day. The questions we ask by default, they\'re often like trying to open a door with the totally wrong key.',
-        startTime: 54.64,
-        endTime: 67.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_7',
-        text:
-            'They\'re just dead ends, and they keep us running around in circles wondering why we\'re not getting anywhere. Now, check this out. This is a perfect example.',
-        startTime: 67.96,
-        endTime: 76.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_8',
-        text:
-            'A tiny little change in wording completely changes the world of possibilities. Asking, can we meet the deadline? That\'s a closed door. It\'s a yes or a no.',
-        startTime: 76.44,
-        endTime: 84.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_9',
-        text:
-            'It kind of invites fear and limitations. But how might we meet the deadline? See the difference? That\'s an invitation. It just assumes it\'s possible and gets your brain to start looking for a way.',
-        startTime: 84.92,
-        endTime: 96.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_10',
-        text:
-            'So how do we get better at this? How do we start asking these powerful questions more consistently? Well, one of the best models I\'ve ever seen is something called the question pyramid.',
-        startTime: 97.24,
-        endTime: 106.44,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_11',
-        text:
-            'Let\'s break it down. It all starts with these familiar faces, doesn\'t it? Kipling\'s six honest serving men. I mean, these are the fundamental tools in our question toolkit.',
-        startTime: 106.92,
-        endTime: 117.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_12',
-        text:
-            'The words that kick off any search for an answer. So let\'s picture these words on a pyramid. The whole goal is to move up, to climb from that wide fact gathering base all the way to the sharp insight generating peak.',
-        startTime: 117.76,
-        endTime: 129.56,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_13',
-        text:
-            'You ready? Let\'s start climbing. Okay, at the bottom, we\'ve got the foundation. Who, what, when, and where. These are absolutely essential.',
-        startTime: 130.18,
-        endTime: 138.68,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_14',
-        text:
-            'They give us the facts, they map out the landscape. You can\'t build a house without a foundation, right? But you can\'t live in just the foundation either. Now, one level up, we find how and what if.',
-        startTime: 138.8,
-        endTime: 149.38,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_15',
-        text:
-            'Okay, now things are starting to get interesting. We\'re moving beyond just collecting data and we\'re starting to explore processes and possibilities.',
-        startTime: 150.1,
-        endTime: 159.04,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_16',
-        text:
-            'This is where creativity really starts to kick in. And right here at the very peak, we find the single most powerful question of them all.',
-        startTime: 159.76,
-        endTime: 167.84,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_17',
-        text:
-            'Why? You see, how tells us the process? What gives us the facts? But why gets to the absolute heart of the matter? The purpose, the motivation, the reason any of it is important.',
-        startTime: 168.28,
-        endTime: 179.1,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_18',
-        text:
-            'This is where real insight lives. So that pyramid is a really powerful framework. But you know, to truly master this whole thing, we need to look at two hidden dimensions that are always working behind the scenes, scope and assumptions.',
-        startTime: 179.46,
-        endTime: 192.98,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_19',
-        text:
-            'First up is scope. The easiest way to think about this is like the zoom lens on your camera, asking how can I be more productive? That\'s a narrow scope.',
-        startTime: 193.72,
-        endTime: 202.4,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_20',
-        text:
-            'But asking how can our team be more productive? Boom, you just widen the lens. Instantly, you\'re thinking about more people, more resources, more angles. The most powerful questions almost always have a wider scope.',
-        startTime: 202.66,
-        endTime: 213.94,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_21',
-        text:
-            'Now, this second hidden dimension is even sneakier. Assumptions. Every single question you ask is built on a pile of assumptions. The question, how can we increase sales?',
-        startTime: 214.78,
-        endTime: 224.54,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_22',
-        text:
-            'It just assumes that increasing sales is the right goal. But what if the real goal is to increase profitability? If you question that assumption, you might realize you should be focusing on cutting costs instead.',
-        startTime: 224.96,
-        endTime: 235.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_23',
-        text:
-            'Until you find these hidden beliefs, you risk solving the wrong problem perfectly. So when you combine this idea of the pyramid with an awareness of scope and assumptions, you start to move beyond just a simple technique.',
-        startTime: 235.74,
-        endTime: 247.2,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_24',
-        text:
-            'You actually start to adopt a whole new mindset, a different way of being in the world. And that brings us to the master himself, Socrates. You know, for him, asking questions wasn\'t some tool to use in a meeting.',
-        startTime: 247.54,
-        endTime: 259.0,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_25',
-        text:
-            'It was the entire point of living a meaningful life. It was about constant, humble inquiry. So how do we actually practice this? Well, the Socratic method can be broken down into these four key directions.',
-        startTime: 259.32,
-        endTime: 270.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_26',
-        text:
-            'The next time you have a strong belief, don\'t just state it, pursue it. Ask yourself, where did that belief come from? What evidence is supporting it? Who might disagree with me?',
-        startTime: 271.1,
-        endTime: 280.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_27',
-        text:
-            'And what are the consequences if I follow this belief all the way to the end? This is how you really start to examine your own thinking. Okay, I know that was a lot to take in.',
-        startTime: 280.44,
-        endTime: 289.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_28',
-        text:
-            'So let\'s boil it all down to three really practical keys you can start using the moment this is over. First, climb the pyramid. It\'s simple. The next time you\'re about to ask a what or a when question, just pause for a second.',
-        startTime: 290.02,
-        endTime: 301.88,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_29',
-        text:
-            'See if you can rephrase it as a how or even better, a why. It\'s a tiny shift, but it makes a huge difference. Second key, widen your scope.',
-        startTime: 302.2,
-        endTime: 311.3,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_30',
-        text:
-            'Before you ask your question, consciously zoom out. Instead of just asking about your little piece of the puzzle, ask about the whole picture. Ask about what this means next month or even next year.',
-        startTime: 311.94,
-        endTime: 322.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_31',
-        text:
-            'And third, and this one might be the most powerful of all, challenge your assumptions. Make it a habit to just ask yourself this one simple question, what am I taking for granted right now?',
-        startTime: 323.68,
-        endTime: 333.62,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_32',
-        text:
-            'That is the master key that unlocks the invisible chains on your thinking. Because ultimately, this is why all of this matters so much. Asking effective questions isn\'t just about finding some piece of information.',
-        startTime: 334.14,
-        endTime: 345.5,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_33',
-        text:
-            'It\'s a creative act. Questions are the tools we use to imagine and then literally build a better reality for ourselves, for our teams, and for our communities.',
-        startTime: 345.84,
-        endTime: 354.76,
-      ),
-      TranscriptSegment(
-        id: 'drop_007_34',
-        text:
-            'So I\'ll leave you with this one last question. Based on everything we\'ve just talked about, what powerful question will you go out and ask today?',
-        startTime: 356.02,
-        endTime: 363.86,
-      ),
-    ],
-  ),
-  // Reversible vs Irreversible Decisions - drop_009
-  'drop_009': Transcript(
-    chapters: const [
-      AudioChapter(
-        title: 'The Bezos Framework',
-        description: 'Type 1 vs Type 2 decisions',
-        startTime: 0,
-        endTime: 200,
-      ),
-      AudioChapter(
-        title: 'Identifying Decision Types',
-        description: 'How to categorize your choices',
-        startTime: 200,
-        endTime: 400,
-      ),
-      AudioChapter(
-        title: 'When to Move Fast',
-        description: 'Embracing reversible decisions',
-        startTime: 400,
-        endTime: 580,
-      ),
-      AudioChapter(
-        title: 'When to Slow Down',
-        description: 'Handling irreversible choices',
-        startTime: 580,
-        endTime: 720,
-      ),
-      AudioChapter(
-        title: 'Decision Hygiene',
-        description: 'Building better decision habits',
-        startTime: 720,
-        endTime: 813,
-      ),
-    ],
-    segments: const [
-      TranscriptSegment(
-        id: 'drop_009_1',
-        text:
-            'OK, let\'s unpack this. Think about the biggest decision you\'re facing right now. Maybe it\'s a career shift, a huge investment, maybe a commitment that changes your whole life.',
-        startTime: 0.0,
-        endTime: 9.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_2',
-        text:
-            'When the pressure is on, what\'s the advice we always hear? Trust your gut. Be decisive. We celebrate that quick flash judgment. But here\'s the pension we need to explore.',
-        startTime: 9.46,
-        endTime: 18.94,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_3',
-        text:
-            'What if the most important choices, the ones that last for years, are the ones your gut is least equipped to handle? That is the absolute center of our deep dive today.',
-        startTime: 19.58,
-        endTime: 30.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_4',
-        text:
-            'Our mission here is to understand the craft of making what we\'ll call farsighted choices. We\'re talking about decisions whose consequences might not be felt for a decade or maybe even a century.',
-        startTime: 30.68,
-        endTime: 41.4,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_5',
-        text:
-            'We\'re pulling from Steven Johnson\'s work in Farsighted, some executive frameworks from Amazon. And then we\'re going to ground it all in some fascinating experimental data on how time pressure just completely warps our sense of risk.',
-        startTime: 41.68,
-        endTime: 52.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_6',
-        text:
-            'So you have these two forces pulling against each other. On one side, you\'ve got the slow, deliberate, heavy lifting kind of analysis, what people call system two thinking.',
-        startTime: 52.5,
-        endTime: 61.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_7',
-        text:
-            'And on the other, you have those automatic system one flash judgments that are so, so celebrated in business culture. Johnson\'s argument is that making a truly hard decision is this strangely underappreciated skill.',
-        startTime: 61.98,
-        endTime: 74.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_8',
-        text:
-            'And we almost always make the same mistake. We apply the wrong speed to the wrong problem. Exactly. We live in a world that just valorizes speed. But speed is only useful if the decision is reversible.',
-        startTime: 74.54,
-        endTime: 84.94,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_9',
-        text:
-            'And if we connect this to the bigger picture, the goal isn\'t to find some perfect, infallible algorithm for making choices. That doesn\'t exist. The goal is to get a set of tools that keeps us from making what Johnson calls stupid choices, those catastrophic long-term blunders that are born from rushing and just having a bad process.',
-        startTime: 85.44,
-        endTime: 101.56,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_10',
-        text:
-            'And step one is just classification. Which brings us right to this beautifully simple framework from Jeff Bezos at Amazon. And to get it, I just want you to visualize walking into a building, maybe your own office, and seeing that every single door is labeled either type one or type two.',
-        startTime: 101.94,
-        endTime: 116.88,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_11',
-        text:
-            'And that distinction is just so powerful because it immediately tells you the speed and the resources, the sheer amount of brainpower you should use before you even start looking at the data.',
-        startTime: 117.12,
-        endTime: 127.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_12',
-        text:
-            'It\'s a triage tool. Let\'s start with the easy ones then. Type two decisions, the two way doors. Right. The definition is simple. They are low consequence. And this is the key.',
-        startTime: 127.86,
-        endTime: 136.64,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_13',
-        text:
-            'They\'re reversible. If you walk through that door, you make the decision. And you realize you don\'t like what\'s on the other side. You can just turn around and walk back out. Minimal recoverable damage.',
-        startTime: 136.98,
-        endTime: 146.82,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_14',
-        text:
-            'And the advice Bezos gave on these is so clear. Make them fast. Push the authority down to junior teams. And I love this part, except that you only need about 70% of the information you wish you had.',
-        startTime: 147.24,
-        endTime: 158.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_15',
-        text:
-            'Yes. Because for these reversible decisions, the cost of being slow, of waiting for that 100% certainty, is so much higher than the risk of being slightly wrong.',
-        startTime: 158.92,
-        endTime: 168.82,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_16',
-        text:
-            'If you\'re wrong, you just correct it. You pivot. But big organizations struggle with this. Oh, it\'s a monumental challenge. They get into this bureaucratic habit of applying these heavyweight consensus driven processes to every single decision, even the type two ones.',
-        startTime: 169.5,
-        endTime: 183.68,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_17',
-        text:
-            'And the result is what Bezos called diminished invention. They\'re treating a small recoverable problem like it\'s a global catastrophe. And they just grind to a halt.',
-        startTime: 184.14,
-        endTime: 193.0,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_18',
-        text:
-            'OK, but then we get to the other door. And the stakes here get a lot higher. These are the type one decisions. The one way doors. Exactly. These are the high consequence, irreversible decisions.',
-        startTime: 193.42,
-        endTime: 202.64,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_19',
-        text:
-            'Once you walk through this door, that\'s it. The landscape has changed forever. There is no going back to the way things were. And these demand a totally different approach. Slow, careful, deliberate.',
-        startTime: 202.7,
-        endTime: 212.88,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_20',
-        text:
-            'Bezos even joked that his job was to be the chief slow down officer for these big type one choices. What\'s really interesting to me, though, is that even with this rigid framework, Bezos said that for the truly unprecedented type one choices, things that have never been done before, your gut, your intuition still plays a huge role.',
-        startTime: 213.38,
-        endTime: 230.16,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_21',
-        text:
-            'It\'s not just a spreadsheet problem. Absolutely. Think about the decision to green light Amazon Prime. Bezos has said that at the beginning, there wasn\'t a single person with a financial background who supported it.',
-        startTime: 230.4,
-        endTime: 242.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_22',
-        text:
-            'Every single spreadsheet showed it would be a complete disaster for their profits. That decision couldn\'t be made just analytically. It was made with heart and a guiding principle.',
-        startTime: 242.8,
-        endTime: 251.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_23',
-        text:
-            'Customer obsession. Customer obsession. But, and this is the critical distinction, that reliance on gut only works after you\'ve done the slow, painstaking work.',
-        startTime: 252.2,
-        endTime: 261.64,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_24',
-        text:
-            'Which leads us to the next question. What is that slow work? So, OK, we\'ve identified a problem as a type one, one way door decision. What now? This is where Stephen Johnson\'s three steps come in.',
-        startTime: 261.76,
-        endTime: 271.82,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_25',
-        text:
-            'Yeah, this is the full spectrum process that helps you override those destructive snap judgments from system one. It all starts with step one, mapping.',
-        startTime: 271.94,
-        endTime: 280.16,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_26',
-        text:
-            'This is the divergence phase. I find the analogy he uses of being a cartographer so helpful here. A farsighted decision maker doesn\'t start with an answer they want to prove.',
-        startTime: 280.58,
-        endTime: 289.46,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_27',
-        text:
-            'They act like a map maker. They\'re trying to see the terrain for what it actually is, not what they want it to be. The goal of mapping is pure expansion. You\'re just trying to broaden your view.',
-        startTime: 289.82,
-        endTime: 298.98,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_28',
-        text:
-            'You take an inventory of every force at play, financial, cultural, political, whatever. You sketch out what you know, but crucially, you actively hunt for your blind spots.',
-        startTime: 299.32,
-        endTime: 308.08,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_29',
-        text:
-            'You chart all the potential paths, even the ones that seem really unlikely. You have to resist that mental gravity that pulls you toward what Johnson calls narrow-band interpretations.',
-        startTime: 308.36,
-        endTime: 319.0,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_30',
-        text:
-            'And this demands that you go out and find people who disagree with you to challenge your assumptions. Johnson uses this brilliant historical example, the decision in the 1800s to fill in Manhattan\'s Collect Pond.',
-        startTime: 319.3,
-        endTime: 331.14,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_31',
-        text:
-            'Yes. On the surface, it looked like a type two decision. Fill in a pond, get more real estate, but it was a catastrophic type one choice. They didn\'t map the terrain properly.',
-        startTime: 331.28,
-        endTime: 340.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_32',
-        text:
-            'They filled this deep spring-fed pond with contaminated garbage. They failed to account for the fact that you can\'t just pave over a natural water source.',
-        startTime: 340.36,
-        endTime: 348.46,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_33',
-        text:
-            'And the result, the area became a swamp. The land kept sinking, causing structural problems in buildings for, well, for the next century. It\'s a perfect example of a failure to map the situation as it truly was.',
-        startTime: 348.92,
-        endTime: 360.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_34',
-        text:
-            'So once you\'ve mapped the field and the divergence phase is done, you move on to step two, predicting. You have to get a better-than-chance understanding of where all these paths might actually lead you.',
-        startTime: 360.7,
-        endTime: 371.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_35',
-        text:
-            'Right, this is where you simulate the future. It\'s not just wishful thinking. You use tools like war games, scenario planning. But for anyone listening for a personal or a professional choice, the most powerful and accessible technique is probably the premortem, which was popularized by Gary Klein.',
-        startTime: 371.88,
-        endTime: 387.08,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_36',
-        text:
-            'I love the premortem. It\'s just such a direct attack on our cognitive biases, like overconfidence and confirmation bias. Instead of asking what might go wrong, you completely flip the script.',
-        startTime: 387.28,
-        endTime: 398.28,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_37',
-        text:
-            'You do. You imagine it\'s a year from now, the decision was made, and it failed, spectacularly. Then you work backward and explain in detail why it failed.',
-        startTime: 398.54,
-        endTime: 408.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_38',
-        text:
-            'What was the flaw in our thinking? What external shock did we not see coming? It forces you to actually engage with uncertainty instead of ignoring it. And these kinds of simulations are critical for huge government decisions.',
-        startTime: 409.3,
-        endTime: 420.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_39',
-        text:
-            'I\'m thinking about the planning for the US raid on Abbottabad. Precisely. They couldn\'t know exactly what they\'d find, so they used extensive modeling and red teams to define the uncertainties, like a helicopter failing or an unexpected response from the enemy.',
-        startTime: 420.44,
-        endTime: 433.28,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_40',
-        text:
-            'They assigned probabilities to those risks. And it reduced the emotional fear of the unknown by defining it, which allowed them to make a choice based on calculated odds, not on blind hope.',
-        startTime: 433.58,
-        endTime: 443.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_41',
-        text:
-            'Okay, so after all that expansion and forecasting, we finally get to step three, deciding the convergence phase. This is where you narrow the options, and as Johnson says, you start keeping score.',
-        startTime: 444.2,
-        endTime: 453.84,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_42',
-        text:
-            'And when we think about scoring, we usually think about maximizing value, the biggest potential win. But for these big type one divisions, the much smarter approach is often to focus on minimizing harm.',
-        startTime: 454.02,
-        endTime: 464.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_43',
-        text:
-            'Why is that a better default for irreversible choices? Because maximizing value usually relies on a lot of optimistic assumptions working out.',
-        startTime: 464.58,
-        endTime: 473.42,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_44',
-        text:
-            'Minimizing harm, on the other hand, forces you to look at something we instinctively want to ignore, the highly unlikely catastrophe. If there\'s a 1% chance of an outcome that would bankrupt your company or destroy your reputation forever, that path should just be eliminated instantly.',
-        startTime: 473.88,
-        endTime: 489.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_45',
-        text:
-            'Doesn\'t matter what the potential upside is, it\'s about building resilience. So the final choice might still have some art to it, but the process has forced you to pick a path that\'s more resilient, one that has a lower chance of total catastrophic failure.',
-        startTime: 489.8,
-        endTime: 502.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_46',
-        text:
-            'Johnson also says that if you have two paths with similar risk, pick the one that you can modify or adapt later on. The whole point is that hard choices demand you override that first quick snap judgment.',
-        startTime: 503.64,
-        endTime: 514.16,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_47',
-        text:
-            'You keep your mind open and you use this map, predict, decide framework, to bring discipline to the process. That slow methodical analysis is key, but now we can shift to the hard data, the psychological science, that explains why rushing is so dangerous, especially for type one decisions involving potential losses.',
-        startTime: 514.16,
-        endTime: 531.68,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_48',
-        text:
-            'Right, we\'re grounding this in those dual process models from Daniel Kahneman. System one is fast, intuitive, emotional. System two is slow, effortful, and deliberate.',
-        startTime: 532.2,
-        endTime: 542.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_49',
-        text:
-            'Researchers wanted to test how time pressure affects our risk profile when we make financial choices. So they ran an experiment, right, with over 1,700 people comparing choices made under a tight time limit, less than seven seconds, versus people who were forced to wait',
-        startTime: 543.12,
-        endTime: 558.84,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_50',
-        text:
-            'and delay their response. Yes, and the findings were incredible. They didn\'t just confirm that rushing changes our decisions. They went right to the heart of prospect theory to an idea called the reflection effect.',
-        startTime: 558.84,
-        endTime: 569.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_51',
-        text:
-            'Okay, wait, let\'s define that really quickly. What\'s the reflection effect in simple terms? It\'s the observation that we\'re generally risk averse when we\'re dealing with potential gains, but we become risk seeking when we\'re faced with potential losses.',
-        startTime: 569.46,
-        endTime: 581.38,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_52',
-        text:
-            'So if I offer you a guaranteed \$100 versus a coin flip for \$200 or nothing, most people take the guaranteed money, risk aversion.',
-        startTime: 582.0,
-        endTime: 590.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_53',
-        text:
-            'But if you face a guaranteed \$100 loss versus a coin flip for a \$200 loss or nothing, most people, they choose the coin flip.',
-        startTime: 591.4,
-        endTime: 599.64,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_54',
-        text:
-            'They gamble to avoid the pain. That makes perfect sense. We hate losing way more than we enjoy winning. So how did time pressure change that? The data showed that time pressure massively increased this reflection effect.',
-        startTime: 599.64,
-        endTime: 611.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_55',
-        text:
-            'It pushed people toward that more instinctive system one behavior. So for decisions about gains, time pressure made people even more risk averse. They were even less willing to gamble.',
-        startTime: 611.86,
-        endTime: 621.5,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_56',
-        text:
-            'They just grabbed the sure thing. But the crucial and honestly kind of terrifying finding was on the other side, on the lost side. Absolutely. The effect was stronger and more robust in the loss domain across all four experiments they ran.',
-        startTime: 621.56,
-        endTime: 635.6,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_57',
-        text:
-            'For decisions involving losses, time pressure led to a significant increase in risk taking. Your automatic intuitive response when you\'re facing a potential loss is to gamble more recklessly than you would if you had time to sit back and think it through.',
-        startTime: 636.24,
-        endTime: 650.94,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_58',
-        text:
-            'This is the scientific proof for why we have to slow down on type one decisions. The very situations where you can least afford to be reckless, high consequence, irreversible negative outcomes are the exact same situations where time pressure makes us most reckless.',
-        startTime: 651.26,
-        endTime: 665.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_59',
-        text:
-            'It pushes us toward a desperate gamble. And there was another key finding. The study noted that time pressure increased what they call measurement noise, which just means people gave inconsistent erratic answers.',
-        startTime: 666.12,
-        endTime: 676.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_60',
-        text:
-            'Forcing a time delay was an extremely effective way to reduce that noise and get higher quality, more consistent choices. So when the stakes are high and losses are on the table, which by definition is what most type one decisions are.',
-        startTime: 676.46,
-        endTime: 688.46,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_61',
-        text:
-            'Slowing down isn\'t just a nice idea. It\'s a necessity confirmed by science. Slowness protects you from that primal urge to gamble your way out of trouble.',
-        startTime: 688.52,
-        endTime: 697.66,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_62',
-        text:
-            'Exactly right. So we\'ve covered Bezos\' framework for classification, Johnson\'s three-step process for execution, and it\'s all grounded in data showing that slowness protects us from disastrous risk taking when losses are looming.',
-        startTime: 698.08,
-        endTime: 711.1,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_63',
-        text:
-            'The goal of all this is to instill discipline. Okay, let\'s pull it all together. Here are three concrete takeaways for you to apply to the next big decision you face.',
-        startTime: 711.26,
-        endTime: 719.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_64',
-        text:
-            'First, classify your door first. Before you even touch a spreadsheet, just ask those two simple questions. What are the consequences and is it reversible?',
-        startTime: 719.82,
-        endTime: 728.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_65',
-        text:
-            'That binary choice tells you your speed. Treat a type two with 70% info and get it done. Treat a type one like a crisis that demands your full, deliberate attention.',
-        startTime: 728.54,
-        endTime: 737.02,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_66',
-        text:
-            'Second, slow down for losses. If your decision involves potential losses, financial, relational, reputational, whatever, you have to actively fight the urge to rush.',
-        startTime: 737.3,
-        endTime: 746.88,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_67',
-        text:
-            'The experimental data is just so clear on this. Time pressure makes us reckless in the loss domain. So build in a mandatory delay. Require a cooling off period before you commit.',
-        startTime: 747.36,
-        endTime: 755.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_68',
-        text:
-            'And third, map your blind spots. For those irreversible one-way door choices, you have to invest heavily in that divergence phase, the mapping stage.',
-        startTime: 756.26,
-        endTime: 765.1,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_69',
-        text:
-            'Actively seek out people who disagree with you. Define every uncertainty you can find and force yourself to confront the worst case scenario with a premortem. You\'re not optimizing for the best possible outcome.',
-        startTime: 765.54,
-        endTime: 775.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_70',
-        text:
-            'You\'re protecting yourself from the highly unlikely catastrophe. And that brings us to the final thought. We know Bezos launched Amazon Prime, even when the data told him not to.',
-        startTime: 776.02,
-        endTime: 785.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_71',
-        text:
-            'He relied on his gut. But that gut feeling wasn\'t an impulse. It was an intuition that had been trained by years of deep system two thinking about his industry.',
-        startTime: 785.54,
-        endTime: 794.38,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_72',
-        text:
-            'The highest craft of decision-making isn\'t just trusting your gut. It\'s training your intuition by refusing to rely on it too soon. When you consistently force your system two to see the situation clearly, to map and to predict, then your gut instinct when you finally need it for those truly unprecedented choices becomes an instrument of real wisdom,',
-        startTime: 795.24,
-        endTime: 812.08,
-      ),
-      TranscriptSegment(
-        id: 'drop_009_73',
-        text: 'not just a random gamble.',
-        startTime: 812.32,
-        endTime: 813.22,
-      ),
-    ],
-  ),
-  // 2024 AI Index: Progress & Peril - drop_010
-  'drop_010': Transcript(
-    chapters: const [
-      AudioChapter(
-        title: 'Introduction: The State of AI',
-        description: 'Overview of Stanford\'s 2024 AI Index Report',
-        startTime: 0,
-        endTime: 67,
-      ),
-      AudioChapter(
-        title: 'Unprecedented Speed',
-        description: 'The explosive pace of AI development',
-        startTime: 67,
-        endTime: 150,
-      ),
-      AudioChapter(
-        title: 'Multimodal AI Breakthroughs',
-        description: 'New capabilities in vision, text, and audio',
-        startTime: 150,
-        endTime: 218,
-      ),
-      AudioChapter(
-        title: 'The Dark Side: Model Collapse',
-        description: 'Risks of AI training on AI-generated data',
-        startTime: 218,
-        endTime: 298,
-      ),
-      AudioChapter(
-        title: 'Safety & Bias Concerns',
-        description: 'AI safety vulnerabilities and cultural biases',
-        startTime: 298,
-        endTime: 390,
-      ),
-      AudioChapter(
-        title: 'Key Takeaways',
-        description: 'The dual nature of AI and our responsibility',
-        startTime: 390,
-        endTime: 451,
-      ),
-    ],
-    segments: const [
-      TranscriptSegment(
-        id: 'drop_010_1',
-        text:
-            'All right, so Stanford\'s big annual AI index report just dropped, and it\'s pretty much our best look at where we stand with artificial intelligence. The 2024 edition really paints a picture of two things happening at once.',
-        startTime: 0.0,
-        endTime: 11.46,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_2',
-        text:
-            'AI is moving forward at a dizzying speed, but it\'s also creating some really serious new problems. So let\'s dive in and break down what that actually means. Okay, let\'s just kick things off with one number from the report that really jumps out.',
-        startTime: 11.9,
-        endTime: 24.48,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_3',
-        text:
-            'Since 2013, the number of recorded AI incidents, we\'re talking about things like deep fakes, big privacy breaches, major accidents.',
-        startTime: 24.48,
-        endTime: 33.14,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_4',
-        text:
-            'That number has grown by more than 20 times. That is not a small jump, you guys. That is an absolute explosion. And that number, it really gets to the core of this entire report.',
-        startTime: 33.64,
-        endTime: 45.9,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_5',
-        text:
-            'AI is just developing so incredibly fast that we\'re all struggling to keep up with the consequences. The story of AI in 2024 is kind of like two stories happening at the same time.',
-        startTime: 46.5,
-        endTime: 58.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_6',
-        text:
-            'On one hand, you have these incredible, unprecedented breakthroughs, and on the other, you have these unprecedented risks popping up right alongside them.',
-        startTime: 58.8,
-        endTime: 67.1,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_7',
-        text:
-            'So first up, let\'s talk about the speed. I mean, the sheer pace of AI development right now is, it\'s just mind boggling. It\'s really unlike anything we\'ve ever seen before.',
-        startTime: 67.78,
-        endTime: 77.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_8',
-        text:
-            'And look, this isn\'t just a gut feeling, right? The data absolutely backs this up. What we\'re looking at here is the raw output from the research community. The number of papers getting published at AI conferences has more than doubled since 2010.',
-        startTime: 78.06,
-        endTime: 90.68,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_9',
-        text:
-            'And just in the last year, it jumped over 30%. The engine of AI innovation is just firing on all cylinders. And all that research, it\'s leading to some truly wild new abilities.',
-        startTime: 91.0,
-        endTime: 102.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_10',
-        text:
-            'We\'re talking stuff that honestly would have sounded like straight up science fiction just a couple of years ago. So a huge reason for this leap is something called multimodal AI.',
-        startTime: 103.2,
-        endTime: 114.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_11',
-        text:
-            'Now what does that mean? Well in simple terms, AI isn\'t just a one-trick pony anymore. It\'s not just about text or just about images. Now the heavy hitters can see, read, and listen all at the same time.',
-        startTime: 114.72,
-        endTime: 128.18,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_12',
-        text:
-            'And that combination is unlocking some incredible new skills. For example, check this out. There\'s this model called MV Dream. You can just type in a few words, like a bulldog wearing a black pirate hat, and boom, it spits out a whole 3D model.',
-        startTime: 128.64,
-        endTime: 143.54,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_13',
-        text:
-            'We\'re not just talking about flat images anymore. This is AI creating entire virtual objects from scratch, just from a little bit of text. But it\'s not just about creating stuff.',
-        startTime: 144.1,
-        endTime: 154.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_14',
-        text:
-            'It\'s also about understanding it. Take Meta\'s Segments Anything model. It can look at a busy, complicated photo, and with this almost superhuman accuracy, it can pick out every single object.',
-        startTime: 154.32,
-        endTime: 166.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_15',
-        text:
-            'It knows that\'s the emu, that\'s its beak, that\'s the backpack, that\'s the person\'s hand on the bottle. It\'s incredible. And this is where it gets really serious.',
-        startTime: 167.08,
-        endTime: 175.92,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_16',
-        text:
-            'In a good way. These new abilities have some profound, potentially life-saving uses. A new model, Panda, can look at CT scans and find early signs of pancreatic cancer, which is notoriously hard for even human doctors to spot.',
-        startTime: 176.24,
-        endTime: 190.58,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_17',
-        text:
-            'So this isn\'t just a cool tech demo. This could be a huge leap forward for science, and it could literally save lives. Okay, so we\'ve seen the amazing side of the coin.',
-        startTime: 191.0,
-        endTime: 201.74,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_18',
-        text:
-            'But all this incredible progress has a flip side. The report also points a huge spotlight on some deep, pretty worrying cracks that are starting to show up in the very foundation of this tech.',
-        startTime: 202.0,
-        endTime: 214.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_19',
-        text:
-            'And that leads us to this kind of weird, but super important question. You know how AI is creating so much stuff online now? Well, what happens when it starts training on its own creations?',
-        startTime: 215.0,
-        endTime: 225.52,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_20',
-        text:
-            'Is it kind of eating its own tail? This is a real thing, and it has a name. Model collapse. The best way to think about it is like making a photocopy of a photocopy.',
-        startTime: 226.0,
-        endTime: 237.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_21',
-        text:
-            'You know how each new copy gets a little fuzzier, a little more degraded? That\'s basically what\'s happening here. When AI models are trained on other AI-generated data, they can start to lose touch with reality, getting, well, blander and less accurate over time.',
-        startTime: 237.48,
-        endTime: 252.34,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_22',
-        text:
-            'And you can literally see it happening right here. So on the left, you\'ve got the numbers from the original model trained on real stuff. But watch what happens as it gets retrained on its own output, over and over.',
-        startTime: 252.96,
-        endTime: 263.14,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_23',
-        text:
-            'All the variety just disappears. By the time you get to the 20th generation, it\'s just this washed-out, repetitive mess, a poor imitation of the original.',
-        startTime: 263.5,
-        endTime: 271.78,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_24',
-        text:
-            'And you know what makes this whole thing even trinkier? A serious lack of transparency. This chart, it basically shows that most of the big-name AI models are closed source.',
-        startTime: 272.54,
-        endTime: 283.7,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_25',
-        text:
-            'That means we have no idea what data they were trained on. So how are researchers supposed to spot problems like model collapse if they can\'t even look under the hood?',
-        startTime: 284.16,
-        endTime: 292.56,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_26',
-        text:
-            'So okay, these technical problems are a big deal. But the report doesn\'t stop there. It goes deeper. And it looks at how AI is already having a direct and sometimes pretty troubling impact on all of us, on our society.',
-        startTime: 293.5,
-        endTime: 306.24,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_27',
-        text:
-            'Let\'s talk about safety for a second. We usually think of AI safety as just, you know, blocking it from answering obviously bad questions. But it turns out it\'s way more complicated than that.',
-        startTime: 306.82,
-        endTime: 316.72,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_28',
-        text:
-            'Researchers found that you can feed a model a really long, gibberish prompt, and it can actually trick the AI into bypassing its own safety filters. It\'s a pretty stark reminder that these things don\'t really understand what they\'re doing like a person does.',
-        startTime: 317.32,
-        endTime: 329.22,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_29',
-        text:
-            'And that lack of real understanding can have some pretty dangerous results. I mean, look at this. When researchers asked leading chatbots about medicine and race, the models often just repeated old debunked myths, like false ideas about skin thickness differences between races.',
-        startTime: 330.06,
-        endTime: 345.5,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_30',
-        text:
-            'It\'s a perfect and frankly scary example of how biases in the training data can lead to the AI spitting out harmful misinformation. And this bias isn\'t just about facts.',
-        startTime: 346.14,
-        endTime: 355.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_31',
-        text:
-            'It\'s cultural, too. Check this out. When an LLM was asked to pick between a good democracy and a strong economy, it overwhelmingly chose democracy. Now that lines up pretty well with opinions in the US and Europe.',
-        startTime: 355.9,
-        endTime: 366.9,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_32',
-        text:
-            'But it doesn\'t match what people in many other parts of the world would say. It just goes to show how these models are soaking up the cultural values of the people who build them.',
-        startTime: 367.26,
-        endTime: 375.32,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_33',
-        text:
-            'And that has huge implications for technology that\'s supposed to be for everyone all over the globe. So, with all of that, where do we go from here? The report really paints a complicated, nuanced picture of what our future with AI looks like.',
-        startTime: 375.52,
-        endTime: 389.96,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_34',
-        text:
-            'When you boil it all down, the 2024 AI index is telling us that AI isn\'t just one thing. It\'s really two. It\'s this amazing engine for progress and discovery.',
-        startTime: 390.68,
-        endTime: 400.36,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_35',
-        text:
-            'And at the exact same time, it\'s a mirror. A mirror that reflects all of our own biases, our weaknesses, and our societal flaws right back in our faces. And this two-sided nature of AI is forcing a much-needed global conversation about, you know, how do we make sure these things are safe?',
-        startTime: 400.74,
-        endTime: 416.52,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_36',
-        text:
-            'How do we trust them? The report really highlights this growing demand for more transparency, for more responsibility, from everyone. Policymakers, the public.',
-        startTime: 416.9,
-        endTime: 426.1,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_37',
-        text:
-            'We\'re all starting to ask for more accountability. And that really brings us to the big takeaway here. The tech itself, it\'s not good or bad.',
-        startTime: 426.6,
-        endTime: 434.8,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_38',
-        text:
-            'It\'s a tool. It\'s a reflection. So, the ultimate question this report leaves us with isn\'t, will AI be good or bad? The real question is, will we be?',
-        startTime: 435.2,
-        endTime: 444.64,
-      ),
-      TranscriptSegment(
-        id: 'drop_010_39',
-        text:
-            'It all comes down to the choices we make, the values we build into these systems, and the kind of future we decide to create with it.',
-        startTime: 445.14,
-        endTime: 451.24,
-      ),
-    ],
-  ),
-  // Risk Budgeting & Institutional Finance - drop_011
-  'drop_011': Transcript(
-    chapters: const [
-      AudioChapter(
-        title: 'Introduction to Risk Budgeting',
-        description: 'What institutional investors know',
-        startTime: 0,
-        endTime: 200,
-      ),
-      AudioChapter(
-        title: 'Risk vs Return',
-        description: 'Reframing the investment equation',
-        startTime: 200,
-        endTime: 400,
-      ),
-      AudioChapter(
-        title: 'Portfolio Construction',
-        description: 'Building robust allocations',
-        startTime: 400,
-        endTime: 620,
-      ),
-      AudioChapter(
-        title: 'Behavioral Traps',
-        description: 'Psychology of market panics',
-        startTime: 620,
-        endTime: 820,
-      ),
-      AudioChapter(
-        title: 'Practical Applications',
-        description: 'Applying these principles',
-        startTime: 820,
-        endTime: 1030,
-      ),
-    ],
-    segments: const [
-      TranscriptSegment(
-        id: 'drop_011_1',
-        text:
-            'All right, let\'s unpack this. We are diving deep into institutional finance today, and we are skipping right past the entry-level stuff about simply diversifying your assets.',
-        startTime: 0.0,
-        endTime: 11.26,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_2',
-        text:
-            'The biggest pools of capital, we\'re talking massive pension funds, endowments, they\'ve already moved on. They really have. The sources you\'ve given us, they highlight this cutting-edge shift.',
-        startTime: 11.52,
-        endTime: 21.86,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_3',
-        text:
-            'It\'s no longer just about what assets you hold. It\'s about what risk you own and how you precisely budget for it. We\'re going to be exploring the sophisticated methodologies that move way beyond basic asset allocation, things like the risk budgeting approach and the comprehensive risk allocation',
-        startTime: 22.32,
-        endTime: 40.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_4',
-        text:
-            'framework. And our mission here is to figure out how these giants manage the truly complex, the illiquid parts of their portfolios, private equity, infrastructure.',
-        startTime: 40.06,
-        endTime: 49.06,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_5',
-        text:
-            'Really tricky stuff. Exactly. And why they\'re focusing less on chasing returns and much more on building financial robustness, on ensuring capital preservation.',
-        startTime: 49.34,
-        endTime: 57.68,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_6',
-        text:
-            'We want to find those the surprising facts that show why these complex methods are just objectively better than the old ones. Well, we have to start with the fundamental realization that, you know, that drove this change.',
-        startTime: 58.32,
-        endTime: 68.46,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_7',
-        text:
-            'The major economic crises of the past generation, they profoundly exposed just how fragile traditional asset management was.',
-        startTime: 69.34,
-        endTime: 78.08,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_8',
-        text:
-            'Oh, absolutely. When the world melts down, relying on uncertain return forecasts, which are, I mean, they\'re to the older models. That\'s a recipe for disaster.',
-        startTime: 78.12,
-        endTime: 87.63,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_9',
-        text:
-            'So the market effectively forced a migration. Risk management had to become the absolute center of the investment process. You had to prioritize models that just didn\'t require you to guess what returns would be next year.',
-        startTime: 87.93,
-        endTime: 99.07,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_10',
-        text:
-            'And that\'s where the theory of risk budgeting or RB really found its footing. Everyone knows the concept of an equal weight portfolio, right? Where every asset gets the same dollar amount.',
-        startTime: 99.45,
-        endTime: 108.35,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_11',
-        text:
-            ' RB is a generalization of the equal risk contribution or ERC portfolio. Which means it\'s... In an ERC, every asset contributes the same amount of risk to the total portfolio volatility.',
-        startTime: 108.85,
-        endTime: 120.01,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_12',
-        text:
-            'OK, the same amount of risk. But in the more general risk budgeting approach, the manager defines a specific budget of risk for each component.',
-        startTime: 120.03,
-        endTime: 128.47,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_13',
-        text:
-            'So maybe the budget for emerging market debt is 10% of total risk and the budget for stable infrastructure is 5%. The portfolio is then built so the actual risk contribution matches that defined budget.',
-        startTime: 128.77,
-        endTime: 139.13,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_14',
-        text:
-            'And here\'s where it gets really interesting because this just blows up the major failure of the older gold standard. Mean Variance Optimization, MVO. If RB works by defining risk contribution, what was MVO doing wrong?',
-        startTime: 139.57,
-        endTime: 152.61,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_15',
-        text:
-            'MVO, for all its theoretical elegance, is practically brittle. It operates beautifully on a whiteboard. But when you implement it in the real world, its tendency is to maximize the effects of errors in your input assumptions.',
-        startTime: 153.05,
-        endTime: 166.03,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_16',
-        text:
-            'Think of it like trying to perfectly hit a tiny dartboard from a mile away. If your return forecasts are even slightly off, and they always are, MVO pushes the portfolio weights into these wild, extreme, and inefficient corners.',
-        startTime: 166.29,
-        endTime: 177.93,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_17',
-        text:
-            'Wait, so MVO is? It\'s theoretically optimal, but in practice it\'s just brittle. It sounds like we\'re punishing ourselves for trying to be a little too precise when our inputs are just fundamentally unreliable.',
-        startTime: 178.17,
-        endTime: 191.59,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_18',
-        text:
-            'That\'s the trade-off. Precisely. So the quest for the perfect allocation actually leads to massive instability. That\'s it. RB portfolios are just significantly more robust.',
-        startTime: 191.63,
-        endTime: 201.31,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_19',
-        text:
-            'They\'re far less sensitive to those changes in input parameters. And that stability is actually a huge operational win, right? It translates directly into much lower turnover.',
-        startTime: 201.79,
-        endTime: 211.07,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_20',
-        text:
-            'So you\'re not paying transaction costs and chasing performance every time the market data wiggles. Exactly. It\'s a construction method that values consistency and real-world stability over trying to nail an uncertain forecast.',
-        startTime: 211.27,
-        endTime: 222.81,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_21',
-        text:
-            'And the math, it backs this up so elegantly. You don\'t even need a complicated formula. Not at all. When academics look at this, they found that the volatility of an RB portfolio is mathematically guaranteed to be safely nestled somewhere between the absolute lowest possible risk',
-        startTime: 223.21,
-        endTime: 238.35,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_22',
-        text:
-            'portfolio, the minimum variance one, and the simple equally weighted approach. So you get the benefit of optimization without the inherent fragility of the MVO system.',
-        startTime: 238.35,
-        endTime: 247.49,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_23',
-        text:
-            'That\'s it. That\'s powerful proof of concept. But the applications go far beyond typical stock and bond portfolios.',
-        startTime: 247.53,
-        endTime: 255.81,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_24',
-        text:
-            'You highlighted a pretty surprising use in sovereign bond indexation. This is a fantastic illustration of the need for risk-based thinking.',
-        startTime: 255.81,
-        endTime: 265.35,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_25',
-        text:
-            'Traditional sovereign bond indexes are weighted by debt. What\'s the massive paradox here? You end up giving the highest index weightings to the most indebted country.',
-        startTime: 266.31,
-        endTime: 274.49,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_26',
-        text:
-            'Exactly. Regardless of their capacity to actually service that debt. So you\'re rewarding poor fiscal management. If you\'re a passive investor tracking that index, you are effectively taking on the most exposure to the weakest hands.',
-        startTime: 274.91,
-        endTime: 286.51,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_27',
-        text:
-            'You are indexing to the highest risk. And that creates an inherent ongoing risk of index collapse if one of those highly weighted, heavily indebted nations just hits a wall.',
-        startTime: 286.69,
-        endTime: 296.27,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_28',
-        text:
-            'The risk budgeting solution completely sidesteps this. Instead of basing the budget on the country\'s liability, its debt, you base the risk budget on a more stable metric like its GDP.',
-        startTime: 296.27,
-        endTime: 306.13,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_29',
-        text:
-            'So the stability of the economy rather than the amount it owes, that becomes the anchor of your risk exposure. It\'s a complete philosophical reversal.',
-        startTime: 306.37,
-        endTime: 314.57,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_30',
-        text:
-            'So risk budgeting handles the relative risk contribution of portfolio components brilliantly. But let\'s zoom out a bit to the entire portfolio construction process.',
-        startTime: 314.57,
-        endTime: 324.85,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_31',
-        text:
-            'We\'re now talking about the full shift from asset allocation or AA to the risk allocation framework, RAF. Why is traditional AA obsolete for these large institutions?',
-        startTime: 325.43,
-        endTime: 336.01,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_32',
-        text:
-            'Traditional asset allocation, simply sorting investments into these broad categories like fixed income, equity, commodities. It creates what we call a false sense of security.',
-        startTime: 336.63,
-        endTime: 345.83,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_33',
-        text:
-            'A false sense of security. When markets are calm, those buckets, they look diverse, but they mask common underlying risk factors that all pop up when stress hits.',
-        startTime: 345.83,
-        endTime: 355.59,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_34',
-        text:
-            'Like 2008, when everything correlated to one, you thought that high yield bonds were fixed income, but when the economy contracted, they behaved exactly like equities. Exactly like equities.',
-        startTime: 355.93,
-        endTime: 364.83,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_35',
-        text:
-            'Yes. Because they share the same credit risk exposure. And the risk allocation framework acknowledges this systemic reality. It shifts the focus from what asset you own to what risk you own.',
-        startTime: 364.83,
-        endTime: 376.29,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_36',
-        text:
-            'It requires the manager to explicitly consider how investments contribute to or mitigate risks like equity beta exposure, foreign currency fluctuations, or exposure to illiquidity.',
-        startTime: 376.87,
-        endTime: 387.47,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_37',
-        text:
-            'So once you\'re operating under this RAF, how do institutions determine their policy goals and measure success? I mean, how do they avoid moving the goalposts?',
-        startTime: 387.87,
-        endTime: 396.31,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_38',
-        text:
-            'The standard for success is raised significantly. Policy goals have to be compared to a volatility equivalent simple stock bond portfolio.',
-        startTime: 396.31,
-        endTime: 405.59,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_39',
-        text:
-            'OK. What does that mean? It means if your complicated, highly researched strategy has, say, a 10% expected volatility, the objective is to add return over and above what you could have earned simply by investing in a basic two asset stock bond portfolio that also has 10% volatility.',
-        startTime: 405.75,
-        endTime: 420.27,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_40',
-        text:
-            'That forces massive transparency. You can\'t just claim success because you made money. You have to prove you added genuine alpha, not just compensated beta risk that was easily achievable somewhere else.',
-        startTime: 420.49,
-        endTime: 430.33,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_41',
-        text:
-            'And that framework requires dynamic monitoring to catch changes fast. To spot spikes in risk sooner than conventional methods, they use this really interesting solution called exponential weighting on historical data.',
-        startTime: 430.75,
-        endTime: 443.77,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_42',
-        text:
-            'That\'s a fascinating technical detail. Can you break down that system for us, the 24 monthly points with a 12-month half-life? Sure.',
-        startTime: 444.25,
-        endTime: 452.63,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_43',
-        text:
-            'Conventional methods treat data points from, say, 20 months ago and last month equally. That\'s just slow to react.  Existential weighting is like driving a car.',
-        startTime: 453.19,
-        endTime: 461.89,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_44',
-        text:
-            'Yeah. You care far more about the pothole you hit three seconds ago than the one you hit five minutes ago. The 12-month half-life means that data from a year ago is weighted only half as much as the most recent data.',
-        startTime: 462.25,
-        endTime: 472.01,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_45',
-        text:
-            'So it accelerates the decay of old information\'s relevance. It lets the system capture current risk and volatility spikes much sooner. If a manager starts quietly taking on more risk, this system flags that change in volatility almost immediately.',
-        startTime: 472.41,
-        endTime: 486.05,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_46',
-        text:
-            'And this focus on agility, on precise risk measurement, it becomes exponentially more vital when we step into these complex illiquid asset classes where valuations aren\'t so transparent.',
-        startTime: 486.51,
-        endTime: 496.47,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_47',
-        text:
-            'Let\'s look at private equity, specifically the secondary market, which is now a massive institutional segment. We see three distinct structural strategies that really showcase a clear risk-return tradeoff.',
-        startTime: 496.89,
-        endTime: 509.87,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_48',
-        text:
-            'It\'s a beautiful masterclass in customizing risk exposure. At the top of the risk curve, you have traditional secondaries. They are simply buying old fund stakes, taking full equity risk.',
-        startTime: 510.19,
-        endTime: 520.11,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_49',
-        text:
-            'They have the highest potential return but also the highest volatility. They\'re just fully exposed to the economic cycle. Then we move down the curve to preferred capital strategies, which are becoming much more common.',
-        startTime: 520.31,
-        endTime: 531.91,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_50',
-        text:
-            'How does that preferred equity structure actually mitigate the risk? They trade some of that massive upside for explicit downside protection. They use a preferred equity layer that gets paid out ahead of the general partners.',
-        startTime: 531.91,
-        endTime: 543.05,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_51',
-        text:
-            'I see. They aim for returns in the mid-teens, say, an IRR of 1.4x to 1.5x, but with significantly lower volatility than traditional equity.',
-        startTime: 543.05,
-        endTime: 552.85,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_52',
-        text:
-            'Their due diligence, it focuses heavily on metrics like low leverage and stable performance in the underlying portfolio companies. They need confidence in the quality of the cash flow.',
-        startTime: 553.49,
-        endTime: 561.53,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_53',
-        text:
-            'Okay, so they sacrifice a little potential alpha for structural safety. But at the absolute bottom of the risk spectrum, you have debt financing strategies in the secondary market.',
-        startTime: 561.53,
-        endTime: 572.67,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_54',
-        text:
-            'You call this the lowest risk structure, but aren\'t they just trade in market risk for credit risk? That\'s a great critical question, but their structure is designed to mitigate that credit risk so aggressively.',
-        startTime: 573.21,
-        endTime: 585.15,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_55',
-        text:
-            'These debt providers are focused solely on capital repayment. They secure their investment with extreme downside protection tools like financial covenants and demanding a very high asset cover, something like 5.0x asset cover.',
-        startTime: 585.75,
-        endTime: 600.63,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_56',
-        text:
-            'Five times. Yeah, five times. So that level of safety essentially means repayment is guaranteed regardless of whether the portfolio companies hit their growth targets or not.',
-        startTime: 600.93,
-        endTime: 609.11,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_57',
-        text:
-            'Precisely. They\'ve effectively ring-fenced their capital. The cost of this certainty is the lowest return. They\'re targeting only a small multiple, maybe 1.1x with virtually no expected volatility.',
-        startTime: 609.27,
-        endTime: 619.15,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_58',
-        text:
-            'It\'s a perfect spectrum. It shows that institutional investors are using these complex structures to buy precisely the risk profile they need, whether it\'s full equity exposure or pure capital preservation.',
-        startTime: 619.33,
-        endTime: 630.41,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_59',
-        text:
-            'Okay, let\'s pivot to infrastructure and clean energy infrastructure, CEI. These are long-term utility-like assets. What are the unique risks here and the corresponding mitigation solutions?',
-        startTime: 630.77,
-        endTime: 642.99,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_60',
-        text:
-            'For traditional regulated infrastructure, the primary risk is, well, regulatory risk. Since the regulator sets the allowable return on equity, the utility\'s profitability is tied to that third-party decision.',
-        startTime: 643.95,
-        endTime: 655.39,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_61',
-        text:
-            'The mitigation solution is largely qualitative and surprisingly relationship-driven. You foster a strong long-term relationship with the regulator by consistently demonstrating maximized operational efficiency and superb service quality.',
-        startTime: 656.13,
-        endTime: 668.95,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_62',
-        text:
-            'You want to be the least objectionable partner possible. That makes perfect sense. You manage the risk by managing the relationship, proving you\'re a good corporate citizen. What about assets where usage volume is the risk, like a toll road?',
-        startTime: 669.43,
-        endTime: 680.07,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_63',
-        text:
-            'That\'s pure volume or patronage risk. And here, the mitigation is fiercely quantitative. On acquisition, managers have to conduct robust sensitivity analysis.',
-        startTime: 680.41,
-        endTime: 690.83,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_64',
-        text:
-            'The key detail here is that the analysis must allow for downside scenarios that are larger than have historically been experienced. You can\'t just rely on the past.',
-        startTime: 691.71,
-        endTime: 700.33,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_65',
-        text:
-            'You cannot rely on the past 20 years of traffic data to predict the next big economic shock. That echoes the philosophical point we\'re saving for the end.',
-        startTime: 700.33,
-        endTime: 708.99,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_66',
-        text:
-            'Now, what about CEI, solar, wind? Their risk is whether the sun shines or the wind blows. That is production risk, yeah. And wind power is notably more volatile than solar PV, which is relatively predictable.',
-        startTime: 709.45,
-        endTime: 721.09,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_67',
-        text:
-            'To mitigate this, managers use extremely conservative planning assumptions. Instead of assuming the P50 mean output, the expected average, they use the P90 production level.',
-        startTime: 721.63,
-        endTime: 729.89,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_68',
-        text:
-            'The P90 level. So that means they only assume a level of output that is 90% likely to be exceeded. They\'re dramatically under-promising. Exactly. This drastically reduces the revenue assumption in the model, building in a huge buffer.',
-        startTime: 729.89,
-        endTime: 741.97,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_69',
-        text:
-            'But the most important capital protection, it comes from the dual revenue stream. Even if policy incentives like renewable energy credits or RECs are completely abolished, an extreme adverse scenario, the ongoing revenues from the actual energy sales still provide',
-        startTime: 742.43,
-        endTime: 759.57,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_70',
-        text:
-            'substantial capital protection. They underwrite the invested capital. The ability to sell electrons guarantees a floor under the investment. We\'ve covered market risk, we\'ve covered asset risk, but let\'s look internally.',
-        startTime: 759.57,
-        endTime: 771.35,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_71',
-        text:
-            'For large investors, a manager\'s operational failure, I mean, internal fraud, conflicts of interest, that can be just as catastrophic as a market crash.',
-        startTime: 771.83,
-        endTime: 780.35,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_72',
-        text:
-            'How do LPs protect themselves from the risk inherent in the people managing the money? This is where rigorous operational due diligence or ODD comes in. LPs use ODD to mitigate risks related to valuation practices, potential conflicts of interest, for instance.',
-        startTime: 780.83,
-        endTime: 793.99,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_73',
-        text:
-            'If a manager has a private undisclosed stake in a portfolio company, they are investing client money into. Oh, wow. And crucial compliance issues like trading on material on public information, MMPI.',
-        startTime: 794.07,
-        endTime: 804.11,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_74',
-        text:
-            'So ODD is essentially due diligence on the manager\'s character in their process, not just their investment track record. You need to know that the firm running your money has the internal integrity and the controls to handle massive amounts of capital ethically.',
-        startTime: 804.35,
-        endTime: 818.53,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_75',
-        text:
-            'It requires deep, structured investigation. That includes a comprehensive background check covering the criminal, litigation, regulatory, and media history of all key personnel.',
-        startTime: 818.53,
-        endTime: 828.25,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_76',
-        text:
-            'The firm\'s entire organizational structure becomes as important as its portfolio construction strategy. Okay, switching gears to measurement. With all these complex, bespoke strategies in private markets, comparing performance across managers must be a statistical nightmare without a standard.',
-        startTime: 829.03,
-        endTime: 844.95,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_77',
-        text:
-            'Standardization is absolutely critical. Yeah. And GIPs, the Global Investment Performance Standards, is the solution. GPS provides rigorous guidelines specifically to ensure equitable and commensurate comparisons.',
-        startTime: 845.97,
-        endTime: 856.69,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_78',
-        text:
-            'What are the key rules GIPs mandates? Crucially, returns must be calculated net of fees. And because the internal rate of return, the IRR, can be easily manipulated or misunderstood, GIPs demands performance be presented using both IRR and the essential cash flow multiples.',
-        startTime: 857.01,
-        endTime: 871.83,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_79',
-        text:
-            'Like DPI. Exactly. DPI, which is Distributions to Paid in Capital, TVPI, Total Value to Paid in, and RVPI, Residual Value.',
-        startTime: 872.17,
-        endTime: 880.63,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_80',
-        text:
-            'You need to know how much cash has actually been returned to you, which is what DPI tells you, not just some theoretical rate of return. And valuations must be on a fair value basis, which eliminates the old tricks of managers holding assets that cost for way too long.',
-        startTime: 881.35,
-        endTime: 895.01,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_81',
-        text:
-            'Precisely. It forces honesty and comparability. We\'ve spent this entire deep dive discussing sophisticated quantitative models, frameworks, due diligence processes.',
-        startTime: 895.35,
-        endTime: 904.37,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_82',
-        text:
-            'We\'ve been incredibly analytical. But let\'s just step back for a final philosophical observation about the limitations of all of these solutions. This is, for me, the most profound lesson from the source material.',
-        startTime: 904.87,
-        endTime: 915.43,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_83',
-        text:
-            'It\'s an acknowledgement that models, the CAPM, MVO, value at risk, or even the exponential weighting we talked about, are merely abstractions removed from reality. Just abstractions.',
-        startTime: 916.03,
-        endTime: 924.81,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_84',
-        text:
-            'They\'re useful directional tools. They help test conclusions. But they are inherently structurally flawed because they rely on past data. They cannot possibly account for never before seen events.',
-        startTime: 924.93,
-        endTime: 935.93,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_85',
-        text:
-            'They give us a clear view of the road behind us, but no guarantee about the road ahead. So true risk of management, therefore, must be forward looking. It requires qualitative theory.',
-        startTime: 936.37,
-        endTime: 945.27,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_86',
-        text:
-            'It requires the imagination to conceive of how the world may sentimentally change, like a global pandemic or a new financial structure, and then taking proactive action accordingly without waiting for the model to register a change.',
-        startTime: 945.69,
-        endTime: 958.99,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_87',
-        text:
-            'So what does this all mean for you, our listener? We\'ve seen institutional finance move from simple asset buckets to these highly defined actively managed risk budgets.',
-        startTime: 959.39,
-        endTime: 967.75,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_88',
-        text:
-            'And it\'s driven by the absolute necessity of robustness when dealing with complex illiquid assets. We cover the theoretical stability of risk budgeting, the need for the risk allocation framework to expose hidden risks like equity beta, and the practical downside protections',
-        startTime: 968.61,
-        endTime: 983.95,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_89',
-        text:
-            'employed everywhere from secondary private equity funds to the conservative P90 output assumptions in a solar farm. And we end on that powerful grounding realization.',
-        startTime: 983.95,
-        endTime: 993.11,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_90',
-        text:
-            'The core message here is not to trust the math, but to trust your judgment. The sources state, reliance on models and extrapolation of the past into the future is not risk management.',
-        startTime: 993.77,
-        endTime: 1004.71,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_91',
-        text:
-            'Understanding the limitations of past patterns and taking action accordingly, that is risk management. That is the ultimate challenge. If you manage a complex portfolio, or even if you\'re just making large life decisions, where are you relying too heavily on the predictable patterns of the past instead of actively using',
-        startTime: 1005.27,
-        endTime: 1022.43,
-      ),
-      TranscriptSegment(
-        id: 'drop_011_92',
-        text:
-            'your imagination to prepare for an unprecedented future? Something critical for you to mull over until our next deep dive. Thanks for guiding us through all this. Always a pleasure.',
-        startTime: 1022.43,
-        endTime: 1030.45,
-      ),
-    ],
-  ),
-};
+bool hasTranscript(String dropId) => generatedTranscripts.containsKey(dropId);
@@ -0,0 +1,581 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py from transcripts/Rethinking Rockets Cost 65 Million Dollars.json
+// source-hash: ba994b35f9372bd3b531ab46480e5585cab67b088d0d02f9c85b7f7bd3fec470
+
+import '../models/transcript.dart';
+
+/// First Principles Thinking - drop_001
+const drop001Transcript = Transcript(
+  chapters: [
+    AudioChapter(
+      title: 'The \$65M Challenge',
+      description: 'Why rockets cost what they do',
+      startTime: 0,
+      endTime: 180,
+    ),
+    AudioChapter(
+      title: 'Breaking Down First Principles',
+      description: 'Understanding the methodology',
+      startTime: 180,
+      endTime: 400,
+    ),
+    AudioChapter(
+      title: 'The SpaceX Approach',
+      description: 'How Elon Musk applied first principles',
+      startTime: 400,
+      endTime: 600,
+    ),
+    AudioChapter(
+      title: 'Applying to Your Life',
+      description: 'Using first principles in everyday decisions',
+      startTime: 600,
+      endTime: 750,
+    ),
+    AudioChapter(
+      title: 'Key Takeaways',
+      description: 'Summary and action items',
+      startTime: 750,
+      endTime: 845,
+    ),
+  ],
+  segments: [
+    TranscriptSegment(
+      id: 'drop_001_1',
+      text:
+          'I want you to anchor yourself in two numbers right now. They really define the strategic challenge of our time. The first number is \$65 million.',
+      startTime: 0.0,
+      endTime: 10.26,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_2',
+      text:
+          'That is the conventional sort of accepted price tag for building a modern orbital class rocket. 65 million. The benchmark, you know, the number everyone just accepts is reality.',
+      startTime: 10.78,
+      endTime: 22.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_3',
+      text:
+          'Exactly. Now hold onto the second number, \$2 million. Okay. That figure represents the actual objective, theoretical minimum cost of the raw materials, the high grade aluminum, the titanium, copper, carbon fiber, all the stuff you need to build that exact same rocket.',
+      startTime: 23.2,
+      endTime: 40.52,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_4',
+      text:
+          'So wait, you\'re saying the fundamental material cost is just over 2% of the final price? Just over 2%. Wow. That massive, nearly 97% gap.',
+      startTime: 40.74,
+      endTime: 49.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_5',
+      text:
+          'Yeah. It\'s not filled by physics or necessary complexity. It\'s filled by something else. Yeah. That right there, that\'s the opportunity. That 97% gap, that\'s the whole ball game.',
+      startTime: 49.86,
+      endTime: 59.9,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_6',
+      text:
+          'It basically screams that the cost problem isn\'t a science problem, it\'s just a history problem. Right. So our mission in this deep dive is to explore the tool that world-class innovators use to attack that history.',
+      startTime: 60.16,
+      endTime: 72.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_7',
+      text:
+          'We\'re diving deep into what\'s called first principles thinking, or FPT. And really what we\'re exploring is the intellectual courage it takes to choose rigor over ease.',
+      startTime: 72.86,
+      endTime: 83.54,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_8',
+      text:
+          'I mean, most people and most companies, they reason by analogy. It\'s the default path, right? It\'s mentally easier. Totally. We look at the past and we just assume the future has to resemble it.',
+      startTime: 84.10000000000001,
+      endTime: 95.08,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_9',
+      text:
+          'We say, well, rockets cost 65 million because that\'s what rockets have always cost. So we have to build our business around that price. Exactly. And your vision is immediately constrained.',
+      startTime: 95.2,
+      endTime: 104.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_10',
+      text:
+          'You might make it 5% better, maybe 10% cheaper by tweaking your supply chain, but you are still completely trapped inside that conventional frame.',
+      startTime: 104.96,
+      endTime: 113.1,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_11',
+      text:
+          'FPT demands that we just ignore those conventions. We boil everything down to its foundational objective truths. And while this feels so modern, so revolutionary, it\'s actually not new at all, is it?',
+      startTime: 113.97999999999999,
+      endTime: 125.12,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_12',
+      text:
+          'Not at all. It\'s rooted in a philosophical tradition laid down by Aristotle. He was obsessed with moving past in doxa, the things known to us.',
+      startTime: 125.22,
+      endTime: 135.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_13',
+      text:
+          'So common beliefs, accepted theories. He wanted to move from that to things known by nature, the objective principles that actually govern the world.',
+      startTime: 136.38,
+      endTime: 145.08,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_14',
+      text:
+          'So this deep dive is basically the mental blueprint for mastering that shift. That\'s the goal. Okay, let\'s unpack this with a relatable story first because I think we all do this analogical thinking all the time.',
+      startTime: 145.46,
+      endTime: 155.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_15',
+      text:
+          'Think about that simple human tendency to just stop asking why. Oh, it starts so young. You see it with kids, right? That relentless questioning.',
+      startTime: 156.34,
+      endTime: 165.42,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_16',
+      text:
+          'Yes, why is the sky blue? Why is the sun hot? Why do I have to eat my vegetables? That sequence of whys is the purest form of first principles analysis.',
+      startTime: 165.7,
+      endTime: 175.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_17',
+      text:
+          'The child is literally trying to deconstruct the world. And what always happens, questioning goes on and on until the adult\'s answer finally becomes, because I said so. Or, and this is more telling, the adult realizes their own supposedly deep knowledge is actually pretty fragile.',
+      startTime: 175.62,
+      endTime: 191.62,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_18',
+      text:
+          'They don\'t know the full chain of cause and effect. Exactly. They stop asking why, right at the point where the answer demands real intellectual effort.',
+      startTime: 191.68,
+      endTime: 200.38,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_19',
+      text:
+          'And that fragility translates directly into corporate inertia. In business, reasoning by analogy is like a comfort blanket. You look at the market leaders, you look at your own history, and you just replicate them with slight adjustments.',
+      startTime: 201.22,
+      endTime: 215.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_20',
+      text:
+          'We saw this failure everywhere during the rise of digital disruption. Yeah, the sources get into this. When legacy companies saw these disruptors gaining traction, their response was often, oh, the competitor is digital, so we should launch an e-commerce platform and become digital too.',
+      startTime: 216.26,
+      endTime: 231.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_21',
+      text:
+          'That is such a superficial diagnosis. It\'s replicating the outward form, the website, without analyzing the underlying substance. They failed to ask the ultimate why.',
+      startTime: 231.46,
+      endTime: 240.98,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_22',
+      text:
+          'Right, why is the disruptor actually succeeding? It wasn\'t just because they had a website, it was because their unit economics, built from the ground up, were fundamentally different. Their cost structure was maybe 80% lower, because they didn\'t have to carry all that baggage.',
+      startTime: 241.1,
+      endTime: 253.04,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_23',
+      text:
+          'Like retail rents, massive legacy inventory systems. Geographical restrictions, all of it. They stopped the why game way too soon.',
+      startTime: 253.04,
+      endTime: 261.88,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_24',
+      text:
+          'So FPT is the antidote. It demands the courage to question the foundational beliefs of your entire industry. And to master it, you need a disciplined process.',
+      startTime: 262.44,
+      endTime: 272.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_25',
+      text:
+          'It\'s not just a general mindset, it\'s a systematic method. It really comes down to three core principles. Okay, so the first one is reduction. This is where you disassemble the problem, you break it down into its smallest, most foundational elements, the objective truths.',
+      startTime: 272.94,
+      endTime: 287.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_26',
+      text:
+          'The things that cannot be logically broken down any further. Then step two, and this is arguably the hardest one, challenging assumptions.',
+      startTime: 288.02,
+      endTime: 296.38,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_27',
+      text:
+          'This is where you have to consciously identify every framework, every convention, every piece of accepted wisdom that the industry has layered on top of those truths.',
+      startTime: 296.62,
+      endTime: 305.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_28',
+      text:
+          'You\'re hunting for things that are only true because we\'ve always done it that way. Right, and once you have your list of truths, and you\'ve swept away all those conventions, then comes step three. Rebuilding.',
+      startTime: 305.28,
+      endTime: 313.56,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_29',
+      text:
+          'You construct entirely new solutions based only on the objective facts you uncovered, completely ignoring the old way. I think the Lego block analogy here is perfect.',
+      startTime: 314.1,
+      endTime: 322.68,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_30',
+      text:
+          'It really captures it. It does. Most people approach a complex problem like rebuilding a pre-assembled Lego car. You might take it apart into its components, wheels, doors, a roof.',
+      startTime: 322.76,
+      endTime: 336.04,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_31',
+      text:
+          'And then you rebuild it into something a little different, maybe a truck. That\'s reasoning by analogy. You\'re limited by the original parts and their existing shapes.',
+      startTime: 336.18,
+      endTime: 344.96,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_32',
+      text:
+          'Exactly, but first principles thinking says, forget the car. You take the wheels, the doors, the roof, and you melt all that plastic down until you are left only with the raw material, the core plastic polymers.',
+      startTime: 345.66,
+      endTime: 357.76,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_33',
+      text:
+          'So you\'re not limited by the old shapes anymore. You\'re only limited by the material itself and, well, your imagination. Precisely. You are no longer building a slightly better car.',
+      startTime: 357.86,
+      endTime: 366.74,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_34',
+      text:
+          'You can build a space station, a sword, something the world has never even seen before, because you started from the foundational building blocks, not the previous assembly.',
+      startTime: 366.76,
+      endTime: 375.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_35',
+      text:
+          'The insight is that the rules of the old assembly were arbitrary, but the properties of the raw material are fundamental. But honestly, this sounds exhausting.',
+      startTime: 375.4,
+      endTime: 384.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_36',
+      text:
+          'You said challenging assumptions is the hardest part. How do you stop this from just becoming analysis for the sake of analysis? Doesn\'t a company risk losing all momentum?',
+      startTime: 384.72,
+      endTime: 393.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_37',
+      text:
+          'That\'s a critical question. And the rigor is the cost of entry. If you don\'t do it, you just default back to analogy. But the analysis isn\'t endless.',
+      startTime: 394.22,
+      endTime: 402.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_38',
+      text:
+          'It stops when you hit a wall you cannot melt down. We\'ll get to the formal stopping rules, but first, let\'s see this applied in the real world. Let\'s go back to SpaceX.',
+      startTime: 402.8,
+      endTime: 411.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_39',
+      text:
+          'When Elon Musk looked at that \$65 million price tag, he didn\'t start with the budget. He started with the elements. He performed the ultimate reduction. He asked, what is a rocket made of?',
+      startTime: 412.58,
+      endTime: 422.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_40',
+      text:
+          'Not, what does a supplier charge me for a valve? But what are the foundational materials? And the analysis was, I mean, it was shocking. The raw materials, the alloys, the carbon fiber, the fuel, had a theoretical minimum cost of just \$2 million.',
+      startTime: 422.94,
+      endTime: 435.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_41',
+      text:
+          'And that huge visible gap between the theoretical minimum cost, the TMC, and the current industry cost, the CIC, that is what revealed the strategic opportunity.',
+      startTime: 435.72,
+      endTime: 446.38,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_42',
+      text:
+          'This gives us a framework for the attack. The current industry cost isn\'t just TMC plus profit. It\'s TMC plus a massive convention margin, plus inefficiency, plus profit.',
+      startTime: 446.7,
+      endTime: 458.38,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_43',
+      text:
+          'And in aerospace, the sources show that 83% of the total cost structure was related to convention, not physics. 83%.',
+      startTime: 458.64,
+      endTime: 467.26,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_44',
+      text:
+          'The convention margin is where all those industry assumptions live. SpaceX realized that 20% of the cost was just supplier margins. Another 18% was manufacturing labor tied to old bespoke techniques.',
+      startTime: 467.26,
+      endTime: 479.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_45',
+      text:
+          'Another 8% was overhead baked into legacy operations. So the real job wasn\'t optimizing the 2% material cost. It was about radically deconstructing that 83% convention margin.',
+      startTime: 479.72,
+      endTime: 490.9,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_46',
+      text:
+          'And by vertically integrating, literally building their own components, their own alloys, and redesigning the whole process for reusability, they attacked the conventions, not the laws of nature.',
+      startTime: 491.14,
+      endTime: 501.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_47',
+      text:
+          'And that\'s the target. That brings up this idea of the Assumption to Principle Ratio, or APR. Right, the APR is basically the percentage of an industry\'s model that\'s based on convention versus objective facts.',
+      startTime: 501.2,
+      endTime: 511.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_48',
+      text:
+          'The higher that ratio, the more assumptions are driving the cost. And the riper the industry is for disruption. In aerospace, that ratio was just astronomical.',
+      startTime: 512.02,
+      endTime: 520.4,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_49',
+      text:
+          'You see the exact same pattern with PESLA and the electric car battery. For decades, the standard cost was set impossibly high, maybe \$600 or \$700 per kilowatt hour.',
+      startTime: 520.6,
+      endTime: 530.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_50',
+      text:
+          'That cost ceiling was a convention. It was imposed by legacy supply chains and old manufacturing methods. So the FPT approach was to ask, what is the battery?',
+      startTime: 530.56,
+      endTime: 540.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_51',
+      text:
+          'Not what does the supplier charge, but what are the raw materials? And by reducing it to its core components, the raw lithium, nickel, cobalt, aluminum, the analysis showed the theoretical minimum material cost was only about \$80 per kilowatt hour.',
+      startTime: 540.58,
+      endTime: 553.94,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_52',
+      text:
+          'Wow. That objective truth immediately redefined the boundary of what was possible. They knew the problem wasn\'t chemistry, it was convention. And they set a clear \$80 target.',
+      startTime: 554.0,
+      endTime: 563.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_53',
+      text:
+          'And this isn\'t just for heavy manufacturing. The XeroDah example from Stockbrokerage in India is perfect. Around 2010, that industry ran on some really fundamental assumptions.',
+      startTime: 563.56,
+      endTime: 572.68,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_54',
+      text:
+          'The legacy model was built on three core conventions. One, brokers need a physical high street presence. Two, they have to use a high commission model, especially for active traders.',
+      startTime: 573.06,
+      endTime: 583.28,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_55',
+      text:
+          'And three, trading platforms are expensive, complex infrastructure. So XeroDah applied FPT. They challenged the need for physical branches, realizing that for their target demographic, young tech savvy traders, it was just an unnecessary cost.',
+      startTime: 583.48,
+      endTime: 599.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_56',
+      text:
+          'They challenged the commission model too. They realized that volume enabled by near zero friction tech could completely replace high fees.',
+      startTime: 599.44,
+      endTime: 607.6,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_57',
+      text:
+          'So they rebuilt their whole model based only on foundational principles, regulatory compliance, secure settlement, and fast execution. And everything else was stripped away.',
+      startTime: 607.78,
+      endTime: 617.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_58',
+      text:
+          'By eliminating the conventional costs, the branch network, expensive relationship managers, they achieved a phenomenal 67% profit margin per customer.',
+      startTime: 617.44,
+      endTime: 625.76,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_59',
+      text:
+          'Not by charging more. Not at all. But by operating on an infrastructure built only upon irreducible costs. That\'s the power of it. It forces you to stop focusing on marginal gains inside the framework and start looking for radical cost elimination outside of it.',
+      startTime: 625.88,
+      endTime: 641.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_60',
+      text:
+          'It feels revolutionary, but as you said, it has this deep historical blueprint. Absolutely. This rigor connects us directly back to Aristotle\'s pursuit of first philosophy.',
+      startTime: 641.5,
+      endTime: 651.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_61',
+      text:
+          'His goal was to find the objective first principles of the world, the features that determine truth, independent of our own beliefs about them. He didn\'t just accept common sense.',
+      startTime: 652.14,
+      endTime: 661.88,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_62',
+      text:
+          'He used a method called dialectic. Right. It was a process of intense intellectual scrutiny. Dialectic required finding conflicting arguments and crucially demanding a vigorous defense for the truth of common beliefs, the endoxa, rather than just accepting them.',
+      startTime: 661.9,
+      endTime: 677.16,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_63',
+      text:
+          'It\'s like putting every conventional belief on trial. It is. And the core of FPT really echoes his primary goal, seeking the real essence of a thing, not its accidental features like the color of a car or the neighborhood of a brokerage.',
+      startTime: 677.28,
+      endTime: 690.3,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_64',
+      text:
+          'But the property it must retain to exist in the first place. That focus on defining true substance is the key to objective knowledge. So when we ask, what is a rocket or what is a battery, we\'re asking what essential properties must remain for it to function as that thing.',
+      startTime: 690.4,
+      endTime: 706.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_65',
+      text:
+          'The titanium is essential. The \$60 million supplier margin is incidental. Precisely. But let\'s bring this back to the practical application for you, the listener.',
+      startTime: 707.06,
+      endTime: 715.94,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_66',
+      text:
+          'How do we manage that risk we talked about, the risk of analysis paralysis, where you just break down assumptions forever without acting? That is the necessary limitation.',
+      startTime: 716.16,
+      endTime: 725.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_67',
+      text:
+          'FPT is a tool for better decisions, not a substitute for action. And the sources offer very clear stopping rules. Okay, so when do you stop the analysis?',
+      startTime: 726.04,
+      endTime: 734.98,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_68',
+      text:
+          'You stop when you hit one of two immovable constraints, physics or economics? Physics or economics. If the constraint is irreducible because of the immutable laws of the universe, the speed of light, the strength of a material, thermodynamics, the reduction is complete.',
+      startTime: 734.98,
+      endTime: 749.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_69',
+      text:
+          'That\'s your objective principle. And economics. You also stop if the economic cost of challenging the constraint or maybe the political cost of implementing the change outweighs the potential reward.',
+      startTime: 749.88,
+      endTime: 761.28,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_70',
+      text:
+          'FPT has to serve innovation, not just academic curiosity. So let\'s distill this. What does this whole process mean for you right now? Let\'s do three powerful takeaways.',
+      startTime: 761.98,
+      endTime: 771.62,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_71',
+      text:
+          'Okay, first, focus on the essence. FPT requires you to constantly answer that fundamental what is it question. Strip away all the layers of convention and identify only the properties essential for that thing\'s existence.',
+      startTime: 771.86,
+      endTime: 784.54,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_72',
+      text:
+          'Second, you now know where to hunt for massive opportunity. True disruption is found by analyzing that gap between the theoretical minimum cost and the current industry cost.',
+      startTime: 784.8,
+      endTime: 794.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_73',
+      text:
+          'Right, if the assumption to principle ratio, that amount of conventional baggage is high in your field, you\'re sitting on an industry that is fundamentally right for disruption.',
+      startTime: 795.16,
+      endTime: 803.44,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_74',
+      text:
+          'And the third takeaway. Third, recognize that FPT is a profound mental shift. It demands continuous rigor and above all, courage. You have to have the courage to ignore how things are usually done.',
+      startTime: 803.58,
+      endTime: 814.12,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_75',
+      text:
+          'I like that. In a world where most people just think by analogy. Those who commit to reasoning from first principles possess the unique power to reshape reality itself.',
+      startTime: 814.22,
+      endTime: 824.3,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_76',
+      text:
+          'So here\'s the challenge for you to take into your professional or your personal life this week. What cherished expensive assumption in your daily processes or your industry one that everyone just accepts as a given if you broke it down to its raw components is actually just waiting to be melted down and rebuilt into something fundamentally superior.',
+      startTime: 824.58,
+      endTime: 841.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_001_77',
+      text: 'Start asking why until the answer is either physics or economics.',
+      startTime: 842.32,
+      endTime: 845.64,
+    ),
+  ],
+);
@@ -0,0 +1,491 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py from transcripts/Charlie Munger Power of Inversion Thinking.json
+// source-hash: 1a1019a39a414de0f8f55482e25e570fb97aee50b6d3e552661ad04c9c3c6fa5
+
+import '../models/transcript.dart';
+
+/// Inversion Mental Model - drop_002
+const drop002Transcript = Transcript(
+  chapters: [
+    AudioChapter(
+      title: 'The Munger Philosophy',
+      description: 'Charlie Munger\'s approach to thinking',
+      startTime: 0,
+      endTime: 120,
+    ),
+    AudioChapter(
+      title: 'Avoiding Stupidity',
+      description: 'Why avoiding failure beats seeking success',
+      startTime: 120,
+      endTime: 280,
+    ),
+    AudioChapter(
+      title: 'Inversion in Practice',
+      description: 'Real-world applications of inversion',
+      startTime: 280,
+      endTime: 420,
+    ),
+    AudioChapter(
+      title: 'Common Mistakes to Avoid',
+      description: 'What guarantees failure',
+      startTime: 420,
+      endTime: 540,
+    ),
+    AudioChapter(
+      title: 'Building Better Decisions',
+      description: 'Putting it all together',
+      startTime: 540,
+      endTime: 651,
+    ),
+  ],
+  segments: [
+    TranscriptSegment(
+      id: 'drop_002_1',
+      text:
+          'All I want to know is where I\'m going to die, so I\'ll never go there. That has to be one of the most paradoxical, but brilliant pieces of advice ever given. It really is. And it comes from, of course, the late Charlie Munger.',
+      startTime: 0.0,
+      endTime: 11.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_2',
+      text:
+          'That single sentence is pretty much the core of the mental model we\'re diving into today. Inversion. Right. Inversion is, well, it\'s a way of thinking that just flips the whole problem solving script on its head.',
+      startTime: 11.7,
+      endTime: 23.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_3',
+      text:
+          'So instead of asking, how do I succeed? Which is what everyone does. Which is what we all do naturally. You stop and you ask the reverse, what would guarantee I fail completely?',
+      startTime: 23.74,
+      endTime: 32.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_4',
+      text:
+          'And how do I make sure to avoid that? And our mission today is really to unpack this. This critical skill is used by some of the greatest thinkers, but it\'s so simple.',
+      startTime: 32.44,
+      endTime: 43.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_5',
+      text:
+          'We\'re hoping to give you a kind of shortcut to making better decisions, not by, you know, chasing genius, but by focusing on the power of subtraction.',
+      startTime: 43.98,
+      endTime: 52.1,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_6',
+      text:
+          'Systematically getting rid of the dumb mistakes that trip everyone else up. It\'s like finding the ultimate avoid stupidity filter. It makes everything clearer and safer.',
+      startTime: 53.260000000000005,
+      endTime: 61.28,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_7',
+      text:
+          'OK, so let\'s get into it. This whole idea of thinking backward. It\'s not new, right? This isn\'t some modern invention from finance bros.',
+      startTime: 61.64,
+      endTime: 70.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_8',
+      text:
+          'Not at all. It has incredibly deep historical roots. I mean, we\'re talking more than 2000 years ago with the ancient stoic philosophers.',
+      startTime: 70.5,
+      endTime: 78.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_9',
+      text:
+          'The stoics. Yeah. Like Marcus Aurelius and Seneca. Exactly. Those guys. They practice this daily ritual called premeditatio malorum.',
+      startTime: 78.7,
+      endTime: 87.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_10',
+      text:
+          'Which sounds intense. The premeditation of evils. It does. And we think of stoicism as being about, you know, staying calm. But this exercise was proactive.',
+      startTime: 87.6,
+      endTime: 98.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_11',
+      text:
+          'So what did they actually do? Before a big day, they\'d vividly imagine the worst case scenario. I mean, really picture it. Losing their job, being humiliated in public, getting thrown in jail.',
+      startTime: 98.36,
+      endTime: 109.12,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_12',
+      text:
+          'OK, but why? Why would you want to put yourself through that intentionally? Well, it wasn\'t about scaring yourself. It was about stealing fear\'s power. By walking through the disaster in your mind, a couple of things happen.',
+      startTime: 109.18,
+      endTime: 118.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_13',
+      text:
+          'First, you realize you could probably handle it emotionally. It\'s not a shock anymore. Right. You\'ve already lived it once in your head. And second, and this is the key part for inversion, it forces you to see the steps that could lead to that disaster.',
+      startTime: 118.98,
+      endTime: 130.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_14',
+      text:
+          'So you can actively plan to prevent them. The stoics knew that avoiding a terrible life was a more reliable path than just, you know, hoping for a perfect one.',
+      startTime: 130.96,
+      endTime: 140.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_15',
+      text:
+          'That\'s a huge shift in focus, preemptive prevention. But this ancient idea, it found a new home somewhere completely different.',
+      startTime: 140.06,
+      endTime: 148.52,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_16',
+      text:
+          'It did. Fast forward to the 19th century with a German mathematician, Carl Jacobi. In mathematics. Of all places. He took this concept and boiled it down to a simple motto, man muss immer umkehren, which basically means invert, always invert.',
+      startTime: 148.68,
+      endTime: 164.84,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_17',
+      text:
+          'So how does a mathematician use this? Well, when he was stuck on a really complex equation, instead of trying to force a solution forward, he just start at the end result and work backward.',
+      startTime: 165.26,
+      endTime: 174.04,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_18',
+      text:
+          'And he found that a lot of the time, the solution just revealed itself. So that\'s the through line from the stoics to Munger. The power is in figuring out how you might fail so you can build a system to avoid it.',
+      startTime: 174.3,
+      endTime: 186.04,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_19',
+      text:
+          'Exactly. It\'s about elimination, defining what you want by first figuring out everything you don\'t want and then just subtracting it. Okay, let\'s make this really concrete with a visual.',
+      startTime: 186.12,
+      endTime: 195.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_20',
+      text:
+          'I think this helps a lot. Imagine you\'re at the start of a massive complicated maze. You start walking forward, you hit a dead end, you turn back, you hit another one.',
+      startTime: 195.2,
+      endTime: 205.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_21',
+      text:
+          'It\'s frustrating, it\'s slow, it\'s just inefficient. We\'ve all been there. But if you use inversion, you just go to the end, you start at the exit and you solve it backward.',
+      startTime: 205.38,
+      endTime: 215.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_22',
+      text:
+          'Suddenly, all those dead ends don\'t matter, the path becomes obvious. The problem just gets so much easier to solve. You\'re not searching for the one right path, you\'re eliminating all the wrong ones.',
+      startTime: 215.7,
+      endTime: 226.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_23',
+      text:
+          'And it\'s that exact clarity that Charlie Munger brought into the chaotic world of finance. Munger took Jacobi\'s role and applied it to everything. And it led to his foundational principle, which is worth saying again.',
+      startTime: 226.22,
+      endTime: 237.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_24',
+      text:
+          'It is remarkable how much long-term advantage we have gotten by trying to be consistently not stupid instead of trying to be very intelligent. That quote is, it\'s so deceptively simple.',
+      startTime: 238.02,
+      endTime: 249.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_25',
+      text:
+          'Because the normal approach is, how do I find the next huge stock? Munger flips that completely, he inverts it. The problem for him isn\'t how do I get rich?',
+      startTime: 249.4,
+      endTime: 258.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_26',
+      text:
+          'It\'s how do I not lose money? If you solve for that, the getting rich part tends to take care of itself. But couldn\'t that lead to analysis paralysis?',
+      startTime: 258.58,
+      endTime: 268.54,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_27',
+      text:
+          'If you\'re only focused on avoiding failure, how do you ever actually take a risk and do something? That is a great question and it\'s a real risk. But the key is the kind of mistake you\'re trying to avoid.',
+      startTime: 268.76,
+      endTime: 279.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_28',
+      text:
+          'Munger\'s not worried about missing a small opportunity. He\'s worried about the big ones. The ones that take you out of the game for good. The permanent mistakes. So his inversion process isn\'t about avoiding every tiny risk.',
+      startTime: 280.38,
+      endTime: 292.28,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_29',
+      text:
+          'It\'s about avoiding the things that guarantee destruction. Like what? Like taking on way too much debt, investing in businesses you don\'t understand, or making emotional impulsive trades.',
+      startTime: 292.44,
+      endTime: 301.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_30',
+      text:
+          'Those are the things that cause catastrophic loss. That\'s the subtraction mindset. You focus on eliminating harm, which is way easier and more predictable than trying to engineer some brilliant success.',
+      startTime: 302.18,
+      endTime: 312.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_31',
+      text:
+          'Okay, so this is where it gets really useful for all of us. How do we take this philosophy and turn it into a tool we can use every day? Right. This is where it goes from an idea to a structured technique.',
+      startTime: 312.02,
+      endTime: 322.64,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_32',
+      text:
+          'When we start a new project, our default question is always aspirational. What do we need to do to succeed? But the inverted question is the opposite.',
+      startTime: 323.44,
+      endTime: 331.84,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_33',
+      text:
+          'It\'s what could happen that would absolutely stop us? Or maybe even how could this whole thing fail? And how would I personally be responsible for that failure?',
+      startTime: 332.64,
+      endTime: 341.74,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_34',
+      text:
+          'That inverted question is so powerful because it fights our own biases. We all have confirmation bias. We look for evidence that we\'re right and we have optimism bias.',
+      startTime: 341.74,
+      endTime: 350.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_35',
+      text:
+          'We just assume things will work out. So inversion forces you to actively look for the flaws to try to prove yourself wrong. Yes, it\'s a safety check on your own confidence.',
+      startTime: 350.46,
+      endTime: 360.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_36',
+      text:
+          'And the best, most structured way to do this is a technique called the failure premortem. The failure premortem. Okay, I love that name. It\'s a gold standard technique now.',
+      startTime: 360.5,
+      endTime: 369.14,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_37',
+      text:
+          'And it\'s so simple. Before you start a big project, you imagine it\'s six months in the future and it has failed. I mean, failed spectacularly. And then what? You hold a meeting.',
+      startTime: 369.56,
+      endTime: 378.52,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_38',
+      text:
+          'And everyone on the team has to write an obituary for the project. You tell the story of how it failed, what went wrong, was it a competitor, did the team fall apart, did we miss a deadline?',
+      startTime: 379.08,
+      endTime: 388.76,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_39',
+      text:
+          'That sounds incredibly uncomfortable. It is. But that discomfort is why it works. It overcomes what we call distance from the consequences.',
+      startTime: 389.52,
+      endTime: 398.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_40',
+      text:
+          'A small bad decision today might not seem like a big deal. Until six months later when it blows everything up. Exactly. The premortem makes those consequences feel immediate.',
+      startTime: 399.14,
+      endTime: 409.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_41',
+      text:
+          'And it also gives people permission to voice their doubts. It makes it safe to say, hey, I\'m worried about this without being seen as negative. You\'re basically harvesting all the negative intelligence up front and turning it into a positive action plan.',
+      startTime: 409.52,
+      endTime: 421.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_42',
+      text:
+          'That\'s it. And for anyone listening who wants to use this, there\'s a really clear five-step process. Okay, let\'s walk through it. Step one is, state your goal. Be specific.',
+      startTime: 421.86,
+      endTime: 430.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_43',
+      text:
+          'Write down exactly what success looks like. Then step two, invert the question. Immediately flip it. What does spectacular failure look like?',
+      startTime: 431.26,
+      endTime: 439.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_44',
+      text:
+          'Not just missing the goal, but the worst possible outcome. Step three, explore the causes of failure. Brainstorm every single thing that could lead to that disaster.',
+      startTime: 439.46,
+      endTime: 449.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_45',
+      text:
+          'Be ruthless. Bad marketing, a buggy product, a key person quitting. Right. Then step four is a bit different. Way pros and cons inverted.',
+      startTime: 450.18,
+      endTime: 458.82,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_46',
+      text:
+          'Usually we look at the upside of our options. Here you look at the downside. For each choice you have, you ask what weakness in this specific option could lead to one of those failures we just listed.',
+      startTime: 459.34,
+      endTime: 469.6,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_47',
+      text:
+          'So if I\'m choosing a supplier, I don\'t just look at the price. I ask which one\'s shaky logistics are more likely to kill my whole project six months from now. Precisely. You\'re stress testing your choices against failure.',
+      startTime: 469.88,
+      endTime: 479.96,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_48',
+      text:
+          'And then finally, step five, implement an action plan. You build a strategy specifically designed to avoid or fix every cause of failure you identified.',
+      startTime: 480.56,
+      endTime: 488.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_49',
+      text:
+          'You build guardrails around disaster. So this applies to, well, everything. It\'s not just for big corporate projects. The beauty here is how versatile it is.',
+      startTime: 488.96,
+      endTime: 498.14,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_50',
+      text:
+          'It\'s like anti-advice for your entire life. Absolutely. Think about leadership. Instead of asking, how can I be a great leader, invert it.',
+      startTime: 498.36,
+      endTime: 506.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_51',
+      text:
+          'What would I have to do every day to be the most demoralizing, parable leader imaginable? You\'d immediately think of things like micromanaging, taking credit for other people\'s work, never giving feedback.',
+      startTime: 506.98,
+      endTime: 518.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_52',
+      text:
+          'Exactly. Once you have that list, your leadership plan is simple. Just don\'t do those things. You spend all your energy eliminating harmful actions instead of chasing vague, good leader traits.',
+      startTime: 518.58,
+      endTime: 529.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_53',
+      text:
+          'Or what about just being productive? Instead of, how do I get more done, you could ask. What are the things that make us unproductive? What wastes the most time?',
+      startTime: 529.32,
+      endTime: 537.9,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_54',
+      text:
+          'The answer isn\'t a new app. It\'s probably too many meetings or a culture where people are afraid to admit mistakes early. You eliminate the friction. It even works for personal stuff.',
+      startTime: 538.34,
+      endTime: 547.0,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_55',
+      text:
+          'Right. Relationships. What behaviors would absolutely destroy this relationship? Lying, neglect, secrets. You know what they are, so you focus on avoiding those. It\'s a much surer path to a stable relationship than, you know, planning one big romantic gesture.',
+      startTime: 547.3,
+      endTime: 559.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_56',
+      text:
+          'So at its core, inversion is really a tool to fight our own wiring, our bias for action. We always want to do something. But sometimes the most powerful action is inaction, the discipline to avoid an obvious mistake.',
+      startTime: 560.16,
+      endTime: 573.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_57',
+      text:
+          'It\'s about constant self-criticism to prevent those big errors from piling up. Okay. To bring this all home, let\'s summarize the key takeaways from this deep dive.',
+      startTime: 573.52,
+      endTime: 581.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_58',
+      text:
+          'I think the first one is just, the goal is avoidance. Success usually comes from consistently not making dumb mistakes, not from one single brilliant move.',
+      startTime: 581.8,
+      endTime: 591.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_59',
+      text:
+          'Avoiding stupidity is easier and less risky than chasing brilliance. Second takeaway. Practice the pre-mortem. Seriously, use this technique.',
+      startTime: 591.96,
+      endTime: 600.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_60',
+      text:
+          'Before any big project, imagine it has failed. Write the story of why. It will save you so much pain later. Make it a mandatory step for your team or even just for yourself.',
+      startTime: 600.72,
+      endTime: 609.84,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_61',
+      text:
+          'And third, find the anti-advice. Invert your goals in your career, in your finances, in your relationships. Figure out what guaranteed failure looks like and then systematically eliminate those behaviors first.',
+      startTime: 609.98,
+      endTime: 620.82,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_62',
+      text:
+          'Build your success on a foundation of subtraction. And just remember, blindly chasing success is always high risk. But preventing failure using this disciplined approach, that carries very little risk.',
+      startTime: 621.16,
+      endTime: 633.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_63',
+      text:
+          'It\'s a much more reliable path to progress. So the next time you feel stuck, just remember Jacoby and Munger. Ask yourself, if this all goes horribly wrong in six months, what\'s the one obvious mistake I made today that caused it?',
+      startTime: 633.9,
+      endTime: 645.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_002_64',
+      text:
+          'And how can I fix that before the sun goes down? That answer, that might be the biggest breakthrough you have all week. What stands out to you?',
+      startTime: 645.24,
+      endTime: 651.5,
+    ),
+  ],
+);
@@ -0,0 +1,177 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py from transcripts/Slaying AI Inefficiency.json
+// source-hash: 682876cfd8a003a837a76473c427df78b6a613acaed8df2fce21f083e33ac815
+
+import '../models/transcript.dart';
+
+/// Second-Order Thinking - drop_003
+const drop003Transcript = Transcript(
+  chapters: [
+    AudioChapter(
+      title: 'The Problem with AI Tools',
+      description: 'Why AI often fails us',
+      startTime: 0,
+      endTime: 80,
+    ),
+    AudioChapter(
+      title: 'Thinking Beyond First Effects',
+      description: 'Understanding cascading consequences',
+      startTime: 80,
+      endTime: 180,
+    ),
+    AudioChapter(
+      title: 'The Efficiency Paradox',
+      description: 'When optimization backfires',
+      startTime: 180,
+      endTime: 260,
+    ),
+    AudioChapter(
+      title: 'Strategic Implementation',
+      description: 'How to think ahead effectively',
+      startTime: 260,
+      endTime: 329,
+    ),
+  ],
+  segments: [
+    TranscriptSegment(
+      id: 'drop_003_1',
+      text:
+          'You know, in the world of artificial intelligence, there\'s this massive, hidden dragon that every researcher, every company is desperately trying to slay. And it\'s not a lack of data or a shortage of brilliant minds. No, it\'s something way more fundamental than that. So what is this dragon?',
+      startTime: 0.0,
+      endTime: 17.38,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_2',
+      text:
+          'What\'s the one thing that\'s really holding back the next wave of AI breakthroughs? You know, the stuff that could cure diseases or help solve climate change? Believe it or not, The answer is kind of simple, almost mundane, really. It\'s inefficiency. The sheer amount of time and computational power it takes to teach an AI model anything, it\'s just staggering. It\'s like',
+      startTime: 17.88,
+      endTime: 37.16,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_3',
+      text:
+          'we\'re building these incredible superhighways, but forcing our AI to learn how to drive stuck in first gear. So we keep throwing all this amazing hardware at the problem, but what if the problem isn\'t the engine? What if it\'s the map we\'re using? The real breakthrough, it turns out, isn\'t just about',
+      startTime: 37.16,
+      endTime: 53.3,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_4',
+      text:
+          'training harder, it\'s about training smarter. And that brings us to this whole quest for something called optimization. I want you to think about it like this. Training an AI is like trying to find the absolute lowest point in a massive, complicated mountain range, but you have to do it in a super',
+      startTime: 53.3,
+      endTime: 69.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_5',
+      text:
+          'thick fog. So for years, the standard way we\'ve done this is with something called first order optimization. Okay, so you\'re in that foggy valley, you can\'t see a thing. All you can do is feel the right where you\'re standing. So you take a small step downhill, feel the slope again, take another',
+      startTime: 69.36,
+      endTime: 86.74,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_6',
+      text:
+          'step. It works eventually, but it\'s this slow plotting process. You might end up zigzagging down a gentle slope for hours, and you\'d completely miss a much steeper, way faster path that was just a few feet away. But what if the fog lifted just a little? That\'s what second order optimization is',
+      startTime: 86.74,
+      endTime: 105.44,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_7',
+      text:
+          'like. Instead of just feeling the slope right under your feet, you can now see the curvature of the valley around you. You don\'t just see which way is down, you see how quickly it goes down.',
+      startTime: 105.44,
+      endTime: 115.28,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_8',
+      text:
+          'You can see the whole shape of the terrain, which means you can aim directly for the bottom. It is a total game changer. And you can literally see the difference here. On the left, first order optimization sees the world in a straight line. It\'s looking at each piece of the puzzle on its own.',
+      startTime: 115.62,
+      endTime: 131.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_9',
+      text:
+          'But over on the right, second order sees the whole picture, every single connection, every relationship. It\'s the difference between looking at one single paving stone versus seeing the entire map. Now, for a long, long time, being able to see that full map was just way too computationally',
+      startTime: 131.2,
+      endTime: 148.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_10',
+      text:
+          'expensive. It was a beautiful idea in theory that just couldn\'t work in the real world with the enormous AI models we use today. Until a new algorithm came along, one with a, well, a pretty memorable name, to slay this dragon of inefficiency. It\'s called Shampoo. And its whole purpose is right',
+      startTime: 148.92,
+      endTime: 167.4,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_11',
+      text:
+          'there in what its creators said. Shampoo was designed to bridge the gap. It finds this really clever way to approximate that full map, all that second order information, but without the crippling computational cost. It makes the power of seeing the whole terrain accessible for the very first',
+      startTime: 167.4,
+      endTime: 184.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_12',
+      text:
+          'time at a massive scale. So how does it pull this off? Well, it\'s kind of like a brilliant orchestra conductor. You\'ve got the main GPU musicians playing the main melody, that\'s the AI training, but Shampoo notices the CPU percussion section is just sitting there not doing much.',
+      startTime: 184.02,
+      endTime: 199.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_13',
+      text:
+          'So it hands them a totally different piece of music, those complex map making calculations, and tells them to play it at the same time. Nothing stops, nobody has to wait. It\'s just a symphony of efficiency, using every part of the computer in perfect harmony. And all of this',
+      startTime: 199.58,
+      endTime: 219.12,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_14',
+      text:
+          'speed up. We\'re not talking about a theoretical improvement here. This is about getting results way faster. Researchers applied Shampoo to some of the largest, most complex models out there.',
+      startTime: 219.12,
+      endTime: 228.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_15',
+      text:
+          'You know, models for machine translation, language understanding, ad prediction, and the results? They were dramatic. And the results are just stunning. I mean, look at this. For a standard transformer model, the kind that powers things like Google Translate, they didn\'t just shave off a',
+      startTime: 228.86,
+      endTime: 244.82,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_16',
+      text:
+          'few minutes, they cut the training time nearly in half. And for the really big models, they saved over 17 hours. That\'s not just an improvement, that\'s a revolution. Let that sink in. What this means is that for some of the biggest, most important AI tasks in the world, we can now get',
+      startTime: 244.82,
+      endTime: 263.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_17',
+      text:
+          'to the answer almost twice as fast. Just imagine what that does to the speed of discovery. So this is way more than just a faster algorithm. This is about unlocking the future. When you can dramatically reduce the time it takes to experiment and to innovate, you fundamentally change what\'s',
+      startTime: 263.02,
+      endTime: 279.74,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_18',
+      text:
+          'even possible. So as we\'re emerging from that foggy valley, and we\'ve got this much clearer map in our hands, what are the key landmarks we should remember from this journey? Okay, first, remember that one of AI\'s biggest dragons is just simple inefficiency, the time and the cost of training.',
+      startTime: 279.74,
+      endTime: 296.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_19',
+      text:
+          'Second, the solution isn\'t always just more power. It\'s smarter methods like second order optimization that give us a bird\'s eye view of the problem. And third, and this is the most important part, making training faster means we accelerate the entire cycle of innovation, from a new idea to a real breakthrough. Because this isn\'t just about faster computers. It\'s about faster cures.',
+      startTime: 296.84,
+      endTime: 317.14,
+    ),
+    TranscriptSegment(
+      id: 'drop_003_20',
+      text:
+          'It\'s about getting to a cancer treatment or a climate solution or a scientific discovery in half the time. The real question isn\'t how much faster the AI can learn. It\'s how much faster we can build a better world for everyone.',
+      startTime: 317.48,
+      endTime: 329.42,
+    ),
+  ],
+);
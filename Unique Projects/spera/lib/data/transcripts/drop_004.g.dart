@@ -0,0 +1,582 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py from transcripts/AI Exponential Growth and Global Policy Race.json
+// source-hash: 9895155caad851e08705813b4eae177dbd60bffce2d887a23fd6a23e3f72c8ef
+
+import '../models/transcript.dart';
+
+/// AI Exponential Growth & Policy - drop_004
+const drop004Transcript = Transcript(
+  chapters: [
+    AudioChapter(
+      title: 'The Exponential Curve',
+      description: 'Understanding AI\'s growth trajectory',
+      startTime: 0,
+      endTime: 180,
+    ),
+    AudioChapter(
+      title: 'Global Competition',
+      description: 'The race between nations',
+      startTime: 180,
+      endTime: 400,
+    ),
+    AudioChapter(
+      title: 'Policy Responses',
+      description: 'How governments are reacting',
+      startTime: 400,
+      endTime: 580,
+    ),
+    AudioChapter(
+      title: 'Career Implications',
+      description: 'What this means for you',
+      startTime: 580,
+      endTime: 720,
+    ),
+    AudioChapter(
+      title: 'Looking Ahead',
+      description: 'Preparing for the future',
+      startTime: 720,
+      endTime: 848,
+    ),
+  ],
+  segments: [
+    TranscriptSegment(
+      id: 'drop_004_1',
+      text:
+          'The pace of AI development feels less like a steady jog and more like a, I don\'t know, a rocket launch. It really does. If you, like us, feel like you\'re constantly scrambling to keep up, you are not wrong.',
+      startTime: 0.0,
+      endTime: 11.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_2',
+      text:
+          'Welcome to the Deep Dive. Today, we\'ve taken the comprehensive 2024 and 2025 AI index reports, plus a thick stack of global regulatory documents, and we\'ve distilled them.',
+      startTime: 12.48,
+      endTime: 24.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_3',
+      text:
+          'And our mission today is pretty simple, right? Yeah, to give you a clear, high-level map of this volatile landscape, we\'re tracking three major forces.',
+      startTime: 24.3,
+      endTime: 32.96,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_4',
+      text:
+          'The staggering velocity of AI capability growth. The serious documented challenges those advances are creating. And finally, the concrete global policy and technical solutions that are, frankly, racing to catch up.',
+      startTime: 33.26,
+      endTime: 45.04,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_5',
+      text:
+          'OK, let\'s unpack this. We have to start with velocity because the sheer speed is the foundation of every other problem and solution we\'re going to talk about. It really is. The biggest headline we pulled from those documents was about the shift in who is actually driving this rapid development.',
+      startTime: 45.12,
+      endTime: 59.04,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_6',
+      text:
+          'It\'s a clear power consolidation. If you look at the research output just from 2023, industry produced 51 notable machine learning models.',
+      startTime: 59.22,
+      endTime: 68.16,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_7',
+      text:
+          '51. And academia. Academia, which, you know, historically drove fundamental research, produced only 15. So the capital and the raw compute required to train these frontier models.',
+      startTime: 68.28,
+      endTime: 79.3,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_8',
+      text:
+          'Yeah. It\'s all centralized now. Almost entirely in the private sector, yes. And when you look at the compute required for this, the numbers just become truly dizzying.',
+      startTime: 79.34,
+      endTime: 88.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_9',
+      text:
+          'They do. The sources clearly show that the training compute needed for the most notable AI models is doubling approximately every five months.',
+      startTime: 88.34,
+      endTime: 97.16,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_10',
+      text:
+          'Doubling every five months. Just think about that pace. I mean, if your rent or your salary doubled that fast, the world would fundamentally change in a year. This is an exponential trend that utterly dwarfs older metrics like Moore\'s law.',
+      startTime: 97.48,
+      endTime: 109.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_11',
+      text:
+          'Which means the capability floor is constantly rising.  And critically, AI is achieving benchmarks that were previously strictly human domains.',
+      startTime: 109.18,
+      endTime: 117.46,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_12',
+      text:
+          'We\'re not talking about Go or chess anymore. No, not at all. We\'re talking about high stakes abstract reasoning. What\'s fascinating here is exactly where AI is conquering these traditional human benchmarks.',
+      startTime: 117.64,
+      endTime: 128.6,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_13',
+      text:
+          'So these are the things we thought were SACE, the things that made us uniquely human. For years, yeah. Tasks involving complex mathematical and abstract reasoning were considered strongholds for human expertise.',
+      startTime: 128.86,
+      endTime: 139.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_14',
+      text:
+          'But that barrier is breaking down fast. So give us the concrete scorecard. Where did the machine finally win? The documents pinpoint a few key conquests.',
+      startTime: 139.68,
+      endTime: 148.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_15',
+      text:
+          'In high level mathematics, the data is just astonishing. OpenAI\'s 03 mini model, which came out in January 2025, achieved 97.9% accuracy on the challenging math data set.',
+      startTime: 149.08,
+      endTime: 161.08,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_16',
+      text:
+          '97.9% and the human baseline is what? The human baseline is 90%. So it\'s officially surpassed us. That\'s competition level math proficiency. So we have an AI that can essentially pass advanced math exams better than the average top student.',
+      startTime: 161.08,
+      endTime: 174.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_17',
+      text:
+          'What about reasoning and knowledge application? Well, beyond CureMath, we saw major advances in visual and conceptual reasoning. In 2024, AI systems finally match the human baseline on visual common sense reasoning or VCR.',
+      startTime: 175.1,
+      endTime: 189.84,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_18',
+      text:
+          'And VCR is. That\'s about understanding subtle relationships and images, right? Not just identifying objects. Exactly. And for abstract pattern recognition, OpenAI\'s 03 model got a 75.7% on the previously difficult ARC-AGI benchmark.',
+      startTime: 189.84,
+      endTime: 205.62,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_19',
+      text:
+          'And this proficiency is translating directly into high stakes fields like medicine. Absolutely. Which is where mistakes have immediate life altering consequences. Clinical large language models are improving at a breathtaking pace.',
+      startTime: 205.86,
+      endTime: 217.04,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_20',
+      text:
+          'OK, so what are the numbers there? Take the MedQA benchmark. It\'s essentially the equivalent of a clinical licensing exam. In 2024, OpenAI\'s 01 model achieved a state of the art 96.0% accuracy on it.',
+      startTime: 217.14,
+      endTime: 230.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_21',
+      text:
+          '96%. Yes. And what makes that data point so compelling is that represents a stunning 28.4% point improvement since just late 2022.',
+      startTime: 231.02,
+      endTime: 239.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_22',
+      text:
+          'And just over a year. Yeah. This signals that MedQA, a key benchmark for clinical knowledge, may soon be saturated. We just need a harder test to even measure progress now.',
+      startTime: 239.74,
+      endTime: 248.08,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_23',
+      text:
+          'Which means we\'re going to need even harder challenges to track real capability. But here\'s the thing. The models aren\'t just getting better, are they?',
+      startTime: 248.08,
+      endTime: 256.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_24',
+      text:
+          'They\'re getting smarter and much, much more efficient. That\'s the perfect transition. The trend used to be scaling up. Just throw more parameters at the problem. Now the goal is scaling down without losing performance.',
+      startTime: 256.36,
+      endTime: 266.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_25',
+      text:
+          'So tell us about that size reduction. That was a huge headline. It was. The reports highlight the smallest model capable of surpassing 60% on the comprehensive MMLU benchmark.',
+      startTime: 266.82,
+      endTime: 276.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_26',
+      text:
+          'In 2022, that model was Google\'s Paul M, which had a massive 540 billion parameters. 540 billion.',
+      startTime: 276.86,
+      endTime: 285.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_27',
+      text:
+          'OK. Just two years later in 2024, that same threshold was met by Microsoft\'s Phi 3 Mini. It has just 3.8 billion parameters.',
+      startTime: 285.84,
+      endTime: 294.1,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_28',
+      text:
+          'That\'s a 142 fold reduction in model size. In two years. That isn\'t just a fun statistic. No, it\'s a huge shift in capability accessibility. Right. It means powerful, highly capable AI is now accessible outside of just five hyperscale labs.',
+      startTime: 294.18,
+      endTime: 307.62,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_29',
+      text:
+          'It changes the security calculus, the distribution of power, and frankly, who can afford to innovate? And that accessibility pushes us directly toward the urgent challenges these capabilities are creating.',
+      startTime: 308.12,
+      endTime: 318.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_30',
+      text:
+          'Precisely. But this lightning fast progress, as you said, it always comes with a wake of serious trouble. Let\'s pivot now to the urgent challenges, because the acceleration of capability has been mirrored by an explosion in risk.',
+      startTime: 318.3,
+      endTime: 331.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_31',
+      text:
+          'It really has. According to the AI Incidence Database, the number of reported AI-related incidents hit a record high of 233 in 2024 alone.',
+      startTime: 331.22,
+      endTime: 341.44,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_32',
+      text:
+          'And that\'s a... what was the percentage increase? A 56.4% increase over 2023. And we have to remember that\'s based only on reported incidents. The real number is likely much higher.',
+      startTime: 341.54,
+      endTime: 351.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_33',
+      text:
+          'A 56% increase in failures in a single year, even as models are getting demonstrably better at math and medicine. What\'s going on there? That dichotomy is the core of the problem.',
+      startTime: 351.4,
+      endTime: 360.4,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_34',
+      text:
+          'We lack standardized tools to even measure safety consistently. We know the risks are multiplying. But we lack standardized responsible AI or RAI benchmarks.',
+      startTime: 360.4,
+      endTime: 369.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_35',
+      text:
+          'So the developers OpenAI, Google, Anthropic, they\'re all testing against different internal standards. Largely, yes. They\'re using proprietary benchmarks.',
+      startTime: 370.1,
+      endTime: 378.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_36',
+      text:
+          'So if a model fails a safety test in one lab, we can\'t systematically compare that risk to a similar model from a competing lab. Which makes systematic risk comparison almost impossible.',
+      startTime: 378.98,
+      endTime: 389.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_37',
+      text:
+          'Exactly. And that\'s critical because these models are still highly vulnerable. They struggle acutely with factuality, what we all call hallucination.',
+      startTime: 389.78,
+      endTime: 398.98,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_38',
+      text:
+          'And they are highly susceptible to sophisticated adversarial attacks. You mean red teaming. Yes. Clever red teaming prompts that can get them to bypass their own safety protocols.',
+      startTime: 399.4,
+      endTime: 409.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_39',
+      text:
+          'What\'s the real world danger of these bypasses? What can happen? Well, the models can be manipulated into revealing sensitive data. For example, leaking what we call PII, personally identifiable information like phone numbers or private details they might have inadvertently stored from their training data.',
+      startTime: 409.38,
+      endTime: 424.74,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_40',
+      text:
+          'Or just generating harmful content. Beyond safety risks is a fundamental looming challenge to the model\'s fuel source data. We\'re seeing what the sources call a shrinking data commons.',
+      startTime: 425.24,
+      endTime: 435.64,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_41',
+      text:
+          'That\'s right. For years, models benefited from massive unrestricted web scraping. But the internet is getting wise to this. The reports show many major domains implemented protocols to curb data scraping.',
+      startTime: 435.94,
+      endTime: 448.98,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_42',
+      text:
+          'So what\'s the effect of that? The proportion of restricted tokens in the massive C4 data set jumped drastically. It went from around 5-7% to somewhere between 20-33%.',
+      startTime: 449.12,
+      endTime: 459.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_43',
+      text:
+          'So the well is starting to run dry. This isn\'t just an abstract problem. It\'s a signal that the fundamental resource models need is becoming scarce. Which is why that next hurdle model collapse is so alarming.',
+      startTime: 459.24,
+      endTime: 470.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_44',
+      text:
+          'Explain that for us. Model collapse is what happens when models have to train purely on synthetic or AI generated data for repeated cycles.',
+      startTime: 470.54,
+      endTime: 478.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_45',
+      text:
+          'It creates an echo chamber. And the result is a loss of diversity. A severe loss of diversity and ultimately degraded output quality. The models literally forget what reality looks like.',
+      startTime: 478.92,
+      endTime: 488.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_46',
+      text:
+          'Now the good news is that newer research suggests that if you carefully layer synthetic data on top of real human generated data, you can mitigate the degradation. But the pressure to find new high quality human data is immense.',
+      startTime: 489.22,
+      endTime: 500.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_47',
+      text:
+          'The technical challenges are huge, but the immediate societal and political risks. They remain front and center. Especially with major global elections underway.',
+      startTime: 501.32,
+      endTime: 510.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_48',
+      text:
+          'Oh absolutely. Deepfakes are now a tool of political conflict. We\'ve seen concrete examples like the use of contentious AI generated audio clips during Slovakia\'s 2023 election.',
+      startTime: 511.2,
+      endTime: 521.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_49',
+      text:
+          'Where the authenticity was immediately questioned and weaponized. Exactly. They\'re easy to generate and notoriously hard to detect reliably. And what\'s worse, the documents note that many popular detectors perform significantly worse when analyzing deepfakes of certain racial subgroups.',
+      startTime: 521.78,
+      endTime: 537.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_50',
+      text:
+          'And the risk isn\'t just external manipulation. There\'s the inherent bias found in the commercial models themselves. Researchers for instance found a significant political bias in chat GPT.',
+      startTime: 537.78,
+      endTime: 547.74,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_51',
+      text:
+          'A measurable leaning toward Democrats in the US and the Labour Party in the UK. So even seemingly neutral tools carry the biases from their training data.',
+      startTime: 547.82,
+      endTime: 556.74,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_52',
+      text:
+          'They do. And this all rolls up into this crucial ethical problem documented in the reports called the liars dividend. It\'s a concept that should genuinely worry everyone.',
+      startTime: 556.84,
+      endTime: 566.5,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_53',
+      text:
+          'It really should. Because deepfake technology exists and is widely known, individuals, especially public figures, can now deny genuine, verifiable evidence by falsely claiming it was AI generated.',
+      startTime: 566.92,
+      endTime: 579.26,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_54',
+      text:
+          'It erodes public trust in objective reality. It makes accountability nearly impossible to enforce. It\'s a truly corrosive problem for democracy.',
+      startTime: 579.44,
+      endTime: 588.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_55',
+      text:
+          'Okay, let\'s shift gears now. Let\'s talk about how the world is trying to govern this. Section 3. How are we trying to manage this and what positive applications are emerging despite the risks?',
+      startTime: 588.62,
+      endTime: 599.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_56',
+      text:
+          'Here\'s where it gets really interesting. It is. We are seeing a rapid acceleration of international coordination. People are recognizing that technical breakthroughs don\'t respect borders.',
+      startTime: 599.5,
+      endTime: 608.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_57',
+      text:
+          'So after that first AI safety summit in 2023, things started moving. Very quickly. In 2024, AI safety institutes were launched or pledged across the globe in the U.S., the U.K., Japan, France, Germany, Italy, Singapore, South Korea, Australia, Canada, and the EU.',
+      startTime: 608.44,
+      endTime: 624.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_58',
+      text:
+          'That is massive global coordination happening at speed. But how are these legislative efforts shaping up? Are they all converging on a single philosophy? Not exactly.',
+      startTime: 624.52,
+      endTime: 633.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_59',
+      text:
+          'Generally, the sources suggest a growing trend toward restrictive legislation focused on mitigating large-scale harm. The EU AI Act is the most famous example.',
+      startTime: 633.48,
+      endTime: 643.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_60',
+      text:
+          'Right. And it explicitly prohibits what it calls unacceptable risk systems. Yes. Things like behavioral manipulators. And it mandates stringent transparency for high-risk applications and generative AI.',
+      startTime: 643.6,
+      endTime: 655.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_61',
+      text:
+          'So how does that compare to the U.S. approach? I know harmonization is a big challenge right now. That\'s the core difference the G7 noted. The U.S. has focused on specific sector-targeted acts.',
+      startTime: 655.28,
+      endTime: 666.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_62',
+      text:
+          'For instance, the Artificial Intelligence and Biosecurity Risk Assessment Act, which looks at the threat of AI developing harmful agents. So things like bioweapons.',
+      startTime: 666.34,
+      endTime: 675.54,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_63',
+      text:
+          'Exactly. Or another one is the Jobs of the Future Act, which mandates studying AI\'s direct impact on occupations. So let me get this straight. The EU is prescriptive and broad-setting ground rules for all AI systems.',
+      startTime: 675.96,
+      endTime: 687.16,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_64',
+      text:
+          'Right. While the U.S. is more targeted and sector-specific, focusing on immediate threats and workforce impacts. Exactly. And the G7 report explicitly stated that these two differing philosophies, they\'re likely to challenge global harmonization efforts for years to come.',
+      startTime: 687.26,
+      endTime: 704.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_65',
+      text:
+          'It\'s going to be messy. It\'s a messy global rollout, for sure. But it\'s critical that we look at the immense positive applications, especially in high-stakes science and medicine.',
+      startTime: 704.3,
+      endTime: 713.76,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_66',
+      text:
+          'The whole story isn\'t about stopping the bad. It\'s also about boosting the good. Absolutely. AI is dramatically accelerating scientific discovery.',
+      startTime: 714.3,
+      endTime: 722.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_67',
+      text:
+          'This is where that compute power really shines. Google DeepMind\'s Genome Project, for example, used AI to discover 2.2 million new crystal structures.',
+      startTime: 722.78,
+      endTime: 732.76,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_68',
+      text:
+          '2.2 million. I mean, that\'s a game-changer for material science, potentially unlocking new superconductors or batteries that human researchers simply overlooked.',
+      startTime: 732.82,
+      endTime: 740.94,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_69',
+      text:
+          'And in life-critical fields like weather forecasting, time is literally measured in lives saved. That\'s a perfect example. Models like GraphCast and GenCast now provide highly accurate 15-day forecasts in minutes rather than the hours needed by traditional supercomputer simulations.',
+      startTime: 741.28,
+      endTime: 756.62,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_70',
+      text:
+          'Which is vital for disaster response. And climate resilience planning, where speed is everything. And in healthcare, AI is moving from being a novelty to a necessity.',
+      startTime: 756.78,
+      endTime: 766.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_71',
+      text:
+          'We\'ve seen an exponential increase in AI-enabled medical devices approved by the FDA. And critically, AI is also being deployed to integrate complex factors that affect treatment outcomes, like social determinants of health or SDOH.',
+      startTime: 766.94,
+      endTime: 779.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_72',
+      text:
+          'So that means things like a patient\'s housing situation, or transport or support systems. Exactly. In oncology, for example, AI tools are considering those factors to create personalized, feasible treatment plans.',
+      startTime: 779.7,
+      endTime: 791.4,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_73',
+      text:
+          'This is actively working toward improving health equity, not just faster diagnoses. So if we pull back, we are in a tight race. We have unprecedented capability acceleration on one track.',
+      startTime: 791.9,
+      endTime: 802.64,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_74',
+      text:
+          'Leading to massive societal upheaval and risk. And on the other, a scrambling effort to implement responsible governance and harness the beneficial outcomes. The stakes could not be higher.',
+      startTime: 802.86,
+      endTime: 812.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_75',
+      text:
+          'This raises an important question, you know. Given that AI is now outperforming humans on high-level coding, math, and clinical knowledge benchmarks, yet still struggles with reliable planning and social reasoning.',
+      startTime: 813.06,
+      endTime: 823.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_76',
+      text:
+          'Things like PlanBench. What fundamentally human skill beyond technical ability must society prioritize and cultivate in future education and workforce development to ensure we guide, rather than simply deploy, this powerful technology.',
+      startTime: 823.8,
+      endTime: 838.96,
+    ),
+    TranscriptSegment(
+      id: 'drop_004_77',
+      text:
+          'It\'s not about being a better calculator than the machine. Not anymore. It\'s about mastering those uniquely human skills. Knowing what to calculate next and why it matters to the collective good.',
+      startTime: 839.1,
+      endTime: 848.88,
+    ),
+  ],
+);
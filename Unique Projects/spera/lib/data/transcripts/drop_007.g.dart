@@ -0,0 +1,275 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py from transcripts/Art of Effective Questions.json
+// source-hash: 37e65626fc78b9888b9d58102b7afd733b072a573a7df1bf00e39249725877f9
+
+import '../models/transcript.dart';
+
+/// The Art of Asking Questions - drop_007
+const drop007Transcript = Transcript(
+  chapters: [
+    AudioChapter(
+      title: 'The Power of Questions',
+      description: 'Why questions matter more than answers',
+      startTime: 0,
+      endTime: 90,
+    ),
+    AudioChapter(
+      title: 'The Socratic Method',
+      description: 'Ancient wisdom for modern inquiry',
+      startTime: 90,
+      endTime: 180,
+    ),
+    AudioChapter(
+      title: 'Types of Powerful Questions',
+      description: 'Different questions for different purposes',
+      startTime: 180,
+      endTime: 280,
+    ),
+    AudioChapter(
+      title: 'Mastering the Art',
+      description: 'Practical techniques to improve',
+      startTime: 280,
+      endTime: 363,
+    ),
+  ],
+  segments: [
+    TranscriptSegment(
+      id: 'drop_007_1',
+      text:
+          'Did you know that over the course of your life, you\'re probably gonna ask something like 20,000 questions? 20,000, but what if I told you that most of them are actually the wrong ones?',
+      startTime: 0.0,
+      endTime: 9.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_2',
+      text:
+          'Today, we\'re gonna get into the art of asking questions that don\'t just get us answers, they change everything. Just let that one sink in for a second. This isn\'t just some nice sounding idea, it\'s a real, practical truth.',
+      startTime: 10.42,
+      endTime: 22.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_3',
+      text:
+          'Think about it. The quality of your career, your relationships, even how happy you feel. So much of that hinges on the kinds of questions you\'re asking yourself and others.',
+      startTime: 23.28,
+      endTime: 32.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_4',
+      text:
+          'So if our questions are that important, it\'s absolutely crucial that we\'re not just asking any old question, right? We need to be asking the right one, the one that really unlocks the door to whatever comes next.',
+      startTime: 33.44,
+      endTime: 43.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_5',
+      text:
+          'So let\'s start right here. I want you to think of questions as the engine of your mind. Seriously, without a question, your thinking just sits there. It has no fuel, no direction.',
+      startTime: 44.72,
+      endTime: 54.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_6',
+      text:
+          'It\'s the question that\'s the spark that gets the whole thing moving. But here\'s the trap that so many of us fall into, pretty much every day. The questions we ask by default, they\'re often like trying to open a door with the totally wrong key.',
+      startTime: 54.64,
+      endTime: 67.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_7',
+      text:
+          'They\'re just dead ends, and they keep us running around in circles wondering why we\'re not getting anywhere. Now, check this out. This is a perfect example.',
+      startTime: 67.96,
+      endTime: 76.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_8',
+      text:
+          'A tiny little change in wording completely changes the world of possibilities. Asking, can we meet the deadline? That\'s a closed door. It\'s a yes or a no.',
+      startTime: 76.44,
+      endTime: 84.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_9',
+      text:
+          'It kind of invites fear and limitations. But how might we meet the deadline? See the difference? That\'s an invitation. It just assumes it\'s possible and gets your brain to start looking for a way.',
+      startTime: 84.92,
+      endTime: 96.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_10',
+      text:
+          'So how do we get better at this? How do we start asking these powerful questions more consistently? Well, one of the best models I\'ve ever seen is something called the question pyramid.',
+      startTime: 97.24,
+      endTime: 106.44,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_11',
+      text:
+          'Let\'s break it down. It all starts with these familiar faces, doesn\'t it? Kipling\'s six honest serving men. I mean, these are the fundamental tools in our question toolkit.',
+      startTime: 106.92,
+      endTime: 117.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_12',
+      text:
+          'The words that kick off any search for an answer. So let\'s picture these words on a pyramid. The whole goal is to move up, to climb from that wide fact gathering base all the way to the sharp insight generating peak.',
+      startTime: 117.76,
+      endTime: 129.56,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_13',
+      text:
+          'You ready? Let\'s start climbing. Okay, at the bottom, we\'ve got the foundation. Who, what, when, and where. These are absolutely essential.',
+      startTime: 130.18,
+      endTime: 138.68,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_14',
+      text:
+          'They give us the facts, they map out the landscape. You can\'t build a house without a foundation, right? But you can\'t live in just the foundation either. Now, one level up, we find how and what if.',
+      startTime: 138.8,
+      endTime: 149.38,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_15',
+      text:
+          'Okay, now things are starting to get interesting. We\'re moving beyond just collecting data and we\'re starting to explore processes and possibilities.',
+      startTime: 150.1,
+      endTime: 159.04,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_16',
+      text:
+          'This is where creativity really starts to kick in. And right here at the very peak, we find the single most powerful question of them all.',
+      startTime: 159.76,
+      endTime: 167.84,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_17',
+      text:
+          'Why? You see, how tells us the process? What gives us the facts? But why gets to the absolute heart of the matter? The purpose, the motivation, the reason any of it is important.',
+      startTime: 168.28,
+      endTime: 179.1,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_18',
+      text:
+          'This is where real insight lives. So that pyramid is a really powerful framework. But you know, to truly master this whole thing, we need to look at two hidden dimensions that are always working behind the scenes, scope and assumptions.',
+      startTime: 179.46,
+      endTime: 192.98,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_19',
+      text:
+          'First up is scope. The easiest way to think about this is like the zoom lens on your camera, asking how can I be more productive? That\'s a narrow scope.',
+      startTime: 193.72,
+      endTime: 202.4,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_20',
+      text:
+          'But asking how can our team be more productive? Boom, you just widen the lens. Instantly, you\'re thinking about more people, more resources, more angles. The most powerful questions almost always have a wider scope.',
+      startTime: 202.66,
+      endTime: 213.94,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_21',
+      text:
+          'Now, this second hidden dimension is even sneakier. Assumptions. Every single question you ask is built on a pile of assumptions. The question, how can we increase sales?',
+      startTime: 214.78,
+      endTime: 224.54,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_22',
+      text:
+          'It just assumes that increasing sales is the right goal. But what if the real goal is to increase profitability? If you question that assumption, you might realize you should be focusing on cutting costs instead.',
+      startTime: 224.96,
+      endTime: 235.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_23',
+      text:
+          'Until you find these hidden beliefs, you risk solving the wrong problem perfectly. So when you combine this idea of the pyramid with an awareness of scope and assumptions, you start to move beyond just a simple technique.',
+      startTime: 235.74,
+      endTime: 247.2,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_24',
+      text:
+          'You actually start to adopt a whole new mindset, a different way of being in the world. And that brings us to the master himself, Socrates. You know, for him, asking questions wasn\'t some tool to use in a meeting.',
+      startTime: 247.54,
+      endTime: 259.0,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_25',
+      text:
+          'It was the entire point of living a meaningful life. It was about constant, humble inquiry. So how do we actually practice this? Well, the Socratic method can be broken down into these four key directions.',
+      startTime: 259.32,
+      endTime: 270.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_26',
+      text:
+          'The next time you have a strong belief, don\'t just state it, pursue it. Ask yourself, where did that belief come from? What evidence is supporting it? Who might disagree with me?',
+      startTime: 271.1,
+      endTime: 280.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_27',
+      text:
+          'And what are the consequences if I follow this belief all the way to the end? This is how you really start to examine your own thinking. Okay, I know that was a lot to take in.',
+      startTime: 280.44,
+      endTime: 289.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_28',
+      text:
+          'So let\'s boil it all down to three really practical keys you can start using the moment this is over. First, climb the pyramid. It\'s simple. The next time you\'re about to ask a what or a when question, just pause for a second.',
+      startTime: 290.02,
+      endTime: 301.88,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_29',
+      text:
+          'See if you can rephrase it as a how or even better, a why. It\'s a tiny shift, but it makes a huge difference. Second key, widen your scope.',
+      startTime: 302.2,
+      endTime: 311.3,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_30',
+      text:
+          'Before you ask your question, consciously zoom out. Instead of just asking about your little piece of the puzzle, ask about the whole picture. Ask about what this means next month or even next year.',
+      startTime: 311.94,
+      endTime: 322.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_31',
+      text:
+          'And third, and this one might be the most powerful of all, challenge your assumptions. Make it a habit to just ask yourself this one simple question, what am I taking for granted right now?',
+      startTime: 323.68,
+      endTime: 333.62,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_32',
+      text:
+          'That is the master key that unlocks the invisible chains on your thinking. Because ultimately, this is why all of this matters so much. Asking effective questions isn\'t just about finding some piece of information.',
+      startTime: 334.14,
+      endTime: 345.5,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_33',
+      text:
+          'It\'s a creative act. Questions are the tools we use to imagine and then literally build a better reality for ourselves, for our teams, and for our communities.',
+      startTime: 345.84,
+      endTime: 354.76,
+    ),
+    TranscriptSegment(
+      id: 'drop_007_34',
+      text:
+          'So I\'ll leave you with this one last question. Based on everything we\'ve just talked about, what powerful question will you go out and ask today?',
+      startTime: 356.02,
+      endTime: 363.86,
+    ),
+  ],
+);
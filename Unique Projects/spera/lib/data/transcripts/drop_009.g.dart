@@ -0,0 +1,553 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py from transcripts/How to Master Irreversible Life Decisions.json
+// source-hash: 8f955eb6d522b9033253e8ec8ae7918d22e907c662d7faa08d7abc4cf3094933
+
+import '../models/transcript.dart';
+
+/// Reversible vs Irreversible Decisions - drop_009
+const drop009Transcript = Transcript(
+  chapters: [
+    AudioChapter(
+      title: 'The Bezos Framework',
+      description: 'Type 1 vs Type 2 decisions',
+      startTime: 0,
+      endTime: 200,
+    ),
+    AudioChapter(
+      title: 'Identifying Decision Types',
+      description: 'How to categorize your choices',
+      startTime: 200,
+      endTime: 400,
+    ),
+    AudioChapter(
+      title: 'When to Move Fast',
+      description: 'Embracing reversible decisions',
+      startTime: 400,
+      endTime: 580,
+    ),
+    AudioChapter(
+      title: 'When to Slow Down',
+      description: 'Handling irreversible choices',
+      startTime: 580,
+      endTime: 720,
+    ),
+    AudioChapter(
+      title: 'Decision Hygiene',
+      description: 'Building better decision habits',
+      startTime: 720,
+      endTime: 813,
+    ),
+  ],
+  segments: [
+    TranscriptSegment(
+      id: 'drop_009_1',
+      text:
+          'OK, let\'s unpack this. Think about the biggest decision you\'re facing right now. Maybe it\'s a career shift, a huge investment, maybe a commitment that changes your whole life.',
+      startTime: 0.0,
+      endTime: 9.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_2',
+      text:
+          'When the pressure is on, what\'s the advice we always hear? Trust your gut. Be decisive. We celebrate that quick flash judgment. But here\'s the pension we need to explore.',
+      startTime: 9.46,
+      endTime: 18.94,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_3',
+      text:
+          'What if the most important choices, the ones that last for years, are the ones your gut is least equipped to handle? That is the absolute center of our deep dive today.',
+      startTime: 19.58,
+      endTime: 30.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_4',
+      text:
+          'Our mission here is to understand the craft of making what we\'ll call farsighted choices. We\'re talking about decisions whose consequences might not be felt for a decade or maybe even a century.',
+      startTime: 30.68,
+      endTime: 41.4,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_5',
+      text:
+          'We\'re pulling from Steven Johnson\'s work in Farsighted, some executive frameworks from Amazon. And then we\'re going to ground it all in some fascinating experimental data on how time pressure just completely warps our sense of risk.',
+      startTime: 41.68,
+      endTime: 52.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_6',
+      text:
+          'So you have these two forces pulling against each other. On one side, you\'ve got the slow, deliberate, heavy lifting kind of analysis, what people call system two thinking.',
+      startTime: 52.5,
+      endTime: 61.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_7',
+      text:
+          'And on the other, you have those automatic system one flash judgments that are so, so celebrated in business culture. Johnson\'s argument is that making a truly hard decision is this strangely underappreciated skill.',
+      startTime: 61.98,
+      endTime: 74.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_8',
+      text:
+          'And we almost always make the same mistake. We apply the wrong speed to the wrong problem. Exactly. We live in a world that just valorizes speed. But speed is only useful if the decision is reversible.',
+      startTime: 74.54,
+      endTime: 84.94,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_9',
+      text:
+          'And if we connect this to the bigger picture, the goal isn\'t to find some perfect, infallible algorithm for making choices. That doesn\'t exist. The goal is to get a set of tools that keeps us from making what Johnson calls stupid choices, those catastrophic long-term blunders that are born from rushing and just having a bad process.',
+      startTime: 85.44,
+      endTime: 101.56,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_10',
+      text:
+          'And step one is just classification. Which brings us right to this beautifully simple framework from Jeff Bezos at Amazon. And to get it, I just want you to visualize walking into a building, maybe your own office, and seeing that every single door is labeled either type one or type two.',
+      startTime: 101.94,
+      endTime: 116.88,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_11',
+      text:
+          'And that distinction is just so powerful because it immediately tells you the speed and the resources, the sheer amount of brainpower you should use before you even start looking at the data.',
+      startTime: 117.12,
+      endTime: 127.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_12',
+      text:
+          'It\'s a triage tool. Let\'s start with the easy ones then. Type two decisions, the two way doors. Right. The definition is simple. They are low consequence. And this is the key.',
+      startTime: 127.86,
+      endTime: 136.64,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_13',
+      text:
+          'They\'re reversible. If you walk through that door, you make the decision. And you realize you don\'t like what\'s on the other side. You can just turn around and walk back out. Minimal recoverable damage.',
+      startTime: 136.98,
+      endTime: 146.82,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_14',
+      text:
+          'And the advice Bezos gave on these is so clear. Make them fast. Push the authority down to junior teams. And I love this part, except that you only need about 70% of the information you wish you had.',
+      startTime: 147.24,
+      endTime: 158.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_15',
+      text:
+          'Yes. Because for these reversible decisions, the cost of being slow, of waiting for that 100% certainty, is so much higher than the risk of being slightly wrong.',
+      startTime: 158.92,
+      endTime: 168.82,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_16',
+      text:
+          'If you\'re wrong, you just correct it. You pivot. But big organizations struggle with this. Oh, it\'s a monumental challenge. They get into this bureaucratic habit of applying these heavyweight consensus driven processes to every single decision, even the type two ones.',
+      startTime: 169.5,
+      endTime: 183.68,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_17',
+      text:
+          'And the result is what Bezos called diminished invention. They\'re treating a small recoverable problem like it\'s a global catastrophe. And they just grind to a halt.',
+      startTime: 184.14,
+      endTime: 193.0,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_18',
+      text:
+          'OK, but then we get to the other door. And the stakes here get a lot higher. These are the type one decisions. The one way doors. Exactly. These are the high consequence, irreversible decisions.',
+      startTime: 193.42,
+      endTime: 202.64,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_19',
+      text:
+          'Once you walk through this door, that\'s it. The landscape has changed forever. There is no going back to the way things were. And these demand a totally different approach. Slow, careful, deliberate.',
+      startTime: 202.7,
+      endTime: 212.88,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_20',
+      text:
+          'Bezos even joked that his job was to be the chief slow down officer for these big type one choices. What\'s really interesting to me, though, is that even with this rigid framework, Bezos said that for the truly unprecedented type one choices, things that have never been done before, your gut, your intuition still plays a huge role.',
+      startTime: 213.38,
+      endTime: 230.16,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_21',
+      text:
+          'It\'s not just a spreadsheet problem. Absolutely. Think about the decision to green light Amazon Prime. Bezos has said that at the beginning, there wasn\'t a single person with a financial background who supported it.',
+      startTime: 230.4,
+      endTime: 242.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_22',
+      text:
+          'Every single spreadsheet showed it would be a complete disaster for their profits. That decision couldn\'t be made just analytically. It was made with heart and a guiding principle.',
+      startTime: 242.8,
+      endTime: 251.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_23',
+      text:
+          'Customer obsession. Customer obsession. But, and this is the critical distinction, that reliance on gut only works after you\'ve done the slow, painstaking work.',
+      startTime: 252.2,
+      endTime: 261.64,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_24',
+      text:
+          'Which leads us to the next question. What is that slow work? So, OK, we\'ve identified a problem as a type one, one way door decision. What now? This is where Stephen Johnson\'s three steps come in.',
+      startTime: 261.76,
+      endTime: 271.82,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_25',
+      text:
+          'Yeah, this is the full spectrum process that helps you override those destructive snap judgments from system one. It all starts with step one, mapping.',
+      startTime: 271.94,
+      endTime: 280.16,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_26',
+      text:
+          'This is the divergence phase. I find the analogy he uses of being a cartographer so helpful here. A farsighted decision maker doesn\'t start with an answer they want to prove.',
+      startTime: 280.58,
+      endTime: 289.46,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_27',
+      text:
+          'They act like a map maker. They\'re trying to see the terrain for what it actually is, not what they want it to be. The goal of mapping is pure expansion. You\'re just trying to broaden your view.',
+      startTime: 289.82,
+      endTime: 298.98,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_28',
+      text:
+          'You take an inventory of every force at play, financial, cultural, political, whatever. You sketch out what you know, but crucially, you actively hunt for your blind spots.',
+      startTime: 299.32,
+      endTime: 308.08,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_29',
+      text:
+          'You chart all the potential paths, even the ones that seem really unlikely. You have to resist that mental gravity that pulls you toward what Johnson calls narrow-band interpretations.',
+      startTime: 308.36,
+      endTime: 319.0,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_30',
+      text:
+          'And this demands that you go out and find people who disagree with you to challenge your assumptions. Johnson uses this brilliant historical example, the decision in the 1800s to fill in Manhattan\'s Collect Pond.',
+      startTime: 319.3,
+      endTime: 331.14,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_31',
+      text:
+          'Yes. On the surface, it looked like a type two decision. Fill in a pond, get more real estate, but it was a catastrophic type one choice. They didn\'t map the terrain properly.',
+      startTime: 331.28,
+      endTime: 340.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_32',
+      text:
+          'They filled this deep spring-fed pond with contaminated garbage. They failed to account for the fact that you can\'t just pave over a natural water source.',
+      startTime: 340.36,
+      endTime: 348.46,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_33',
+      text:
+          'And the result, the area became a swamp. The land kept sinking, causing structural problems in buildings for, well, for the next century. It\'s a perfect example of a failure to map the situation as it truly was.',
+      startTime: 348.92,
+      endTime: 360.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_34',
+      text:
+          'So once you\'ve mapped the field and the divergence phase is done, you move on to step two, predicting. You have to get a better-than-chance understanding of where all these paths might actually lead you.',
+      startTime: 360.7,
+      endTime: 371.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_35',
+      text:
+          'Right, this is where you simulate the future. It\'s not just wishful thinking. You use tools like war games, scenario planning. But for anyone listening for a personal or a professional choice, the most powerful and accessible technique is probably the premortem, which was popularized by Gary Klein.',
+      startTime: 371.88,
+      endTime: 387.08,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_36',
+      text:
+          'I love the premortem. It\'s just such a direct attack on our cognitive biases, like overconfidence and confirmation bias. Instead of asking what might go wrong, you completely flip the script.',
+      startTime: 387.28,
+      endTime: 398.28,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_37',
+      text:
+          'You do. You imagine it\'s a year from now, the decision was made, and it failed, spectacularly. Then you work backward and explain in detail why it failed.',
+      startTime: 398.54,
+      endTime: 408.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_38',
+      text:
+          'What was the flaw in our thinking? What external shock did we not see coming? It forces you to actually engage with uncertainty instead of ignoring it. And these kinds of simulations are critical for huge government decisions.',
+      startTime: 409.3,
+      endTime: 420.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_39',
+      text:
+          'I\'m thinking about the planning for the US raid on Abbottabad. Precisely. They couldn\'t know exactly what they\'d find, so they used extensive modeling and red teams to define the uncertainties, like a helicopter failing or an unexpected response from the enemy.',
+      startTime: 420.44,
+      endTime: 433.28,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_40',
+      text:
+          'They assigned probabilities to those risks. And it reduced the emotional fear of the unknown by defining it, which allowed them to make a choice based on calculated odds, not on blind hope.',
+      startTime: 433.58,
+      endTime: 443.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_41',
+      text:
+          'Okay, so after all that expansion and forecasting, we finally get to step three, deciding the convergence phase. This is where you narrow the options, and as Johnson says, you start keeping score.',
+      startTime: 444.2,
+      endTime: 453.84,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_42',
+      text:
+          'And when we think about scoring, we usually think about maximizing value, the biggest potential win. But for these big type one divisions, the much smarter approach is often to focus on minimizing harm.',
+      startTime: 454.02,
+      endTime: 464.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_43',
+      text:
+          'Why is that a better default for irreversible choices? Because maximizing value usually relies on a lot of optimistic assumptions working out.',
+      startTime: 464.58,
+      endTime: 473.42,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_44',
+      text:
+          'Minimizing harm, on the other hand, forces you to look at something we instinctively want to ignore, the highly unlikely catastrophe. If there\'s a 1% chance of an outcome that would bankrupt your company or destroy your reputation forever, that path should just be eliminated instantly.',
+      startTime: 473.88,
+      endTime: 489.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_45',
+      text:
+          'Doesn\'t matter what the potential upside is, it\'s about building resilience. So the final choice might still have some art to it, but the process has forced you to pick a path that\'s more resilient, one that has a lower chance of total catastrophic failure.',
+      startTime: 489.8,
+      endTime: 502.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_46',
+      text:
+          'Johnson also says that if you have two paths with similar risk, pick the one that you can modify or adapt later on. The whole point is that hard choices demand you override that first quick snap judgment.',
+      startTime: 503.64,
+      endTime: 514.16,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_47',
+      text:
+          'You keep your mind open and you use this map, predict, decide framework, to bring discipline to the process. That slow methodical analysis is key, but now we can shift to the hard data, the psychological science, that explains why rushing is so dangerous, especially for type one decisions involving potential losses.',
+      startTime: 514.16,
+      endTime: 531.68,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_48',
+      text:
+          'Right, we\'re grounding this in those dual process models from Daniel Kahneman. System one is fast, intuitive, emotional. System two is slow, effortful, and deliberate.',
+      startTime: 532.2,
+      endTime: 542.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_49',
+      text:
+          'Researchers wanted to test how time pressure affects our risk profile when we make financial choices. So they ran an experiment, right, with over 1,700 people comparing choices made under a tight time limit, less than seven seconds, versus people who were forced to wait',
+      startTime: 543.12,
+      endTime: 558.84,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_50',
+      text:
+          'and delay their response. Yes, and the findings were incredible. They didn\'t just confirm that rushing changes our decisions. They went right to the heart of prospect theory to an idea called the reflection effect.',
+      startTime: 558.84,
+      endTime: 569.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_51',
+      text:
+          'Okay, wait, let\'s define that really quickly. What\'s the reflection effect in simple terms? It\'s the observation that we\'re generally risk averse when we\'re dealing with potential gains, but we become risk seeking when we\'re faced with potential losses.',
+      startTime: 569.46,
+      endTime: 581.38,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_52',
+      text:
+          'So if I offer you a guaranteed \$100 versus a coin flip for \$200 or nothing, most people take the guaranteed money, risk aversion.',
+      startTime: 582.0,
+      endTime: 590.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_53',
+      text:
+          'But if you face a guaranteed \$100 loss versus a coin flip for a \$200 loss or nothing, most people, they choose the coin flip.',
+      startTime: 591.4,
+      endTime: 599.64,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_54',
+      text:
+          'They gamble to avoid the pain. That makes perfect sense. We hate losing way more than we enjoy winning. So how did time pressure change that? The data showed that time pressure massively increased this reflection effect.',
+      startTime: 599.64,
+      endTime: 611.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_55',
+      text:
+          'It pushed people toward that more instinctive system one behavior. So for decisions about gains, time pressure made people even more risk averse. They were even less willing to gamble.',
+      startTime: 611.86,
+      endTime: 621.5,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_56',
+      text:
+          'They just grabbed the sure thing. But the crucial and honestly kind of terrifying finding was on the other side, on the lost side. Absolutely. The effect was stronger and more robust in the loss domain across all four experiments they ran.',
+      startTime: 621.56,
+      endTime: 635.6,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_57',
+      text:
+          'For decisions involving losses, time pressure led to a significant increase in risk taking. Your automatic intuitive response when you\'re facing a potential loss is to gamble more recklessly than you would if you had time to sit back and think it through.',
+      startTime: 636.24,
+      endTime: 650.94,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_58',
+      text:
+          'This is the scientific proof for why we have to slow down on type one decisions. The very situations where you can least afford to be reckless, high consequence, irreversible negative outcomes are the exact same situations where time pressure makes us most reckless.',
+      startTime: 651.26,
+      endTime: 665.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_59',
+      text:
+          'It pushes us toward a desperate gamble. And there was another key finding. The study noted that time pressure increased what they call measurement noise, which just means people gave inconsistent erratic answers.',
+      startTime: 666.12,
+      endTime: 676.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_60',
+      text:
+          'Forcing a time delay was an extremely effective way to reduce that noise and get higher quality, more consistent choices. So when the stakes are high and losses are on the table, which by definition is what most type one decisions are.',
+      startTime: 676.46,
+      endTime: 688.46,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_61',
+      text:
+          'Slowing down isn\'t just a nice idea. It\'s a necessity confirmed by science. Slowness protects you from that primal urge to gamble your way out of trouble.',
+      startTime: 688.52,
+      endTime: 697.66,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_62',
+      text:
+          'Exactly right. So we\'ve covered Bezos\' framework for classification, Johnson\'s three-step process for execution, and it\'s all grounded in data showing that slowness protects us from disastrous risk taking when losses are looming.',
+      startTime: 698.08,
+      endTime: 711.1,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_63',
+      text:
+          'The goal of all this is to instill discipline. Okay, let\'s pull it all together. Here are three concrete takeaways for you to apply to the next big decision you face.',
+      startTime: 711.26,
+      endTime: 719.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_64',
+      text:
+          'First, classify your door first. Before you even touch a spreadsheet, just ask those two simple questions. What are the consequences and is it reversible?',
+      startTime: 719.82,
+      endTime: 728.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_65',
+      text:
+          'That binary choice tells you your speed. Treat a type two with 70% info and get it done. Treat a type one like a crisis that demands your full, deliberate attention.',
+      startTime: 728.54,
+      endTime: 737.02,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_66',
+      text:
+          'Second, slow down for losses. If your decision involves potential losses, financial, relational, reputational, whatever, you have to actively fight the urge to rush.',
+      startTime: 737.3,
+      endTime: 746.88,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_67',
+      text:
+          'The experimental data is just so clear on this. Time pressure makes us reckless in the loss domain. So build in a mandatory delay. Require a cooling off period before you commit.',
+      startTime: 747.36,
+      endTime: 755.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_68',
+      text:
+          'And third, map your blind spots. For those irreversible one-way door choices, you have to invest heavily in that divergence phase, the mapping stage.',
+      startTime: 756.26,
+      endTime: 765.1,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_69',
+      text:
+          'Actively seek out people who disagree with you. Define every uncertainty you can find and force yourself to confront the worst case scenario with a premortem. You\'re not optimizing for the best possible outcome.',
+      startTime: 765.54,
+      endTime: 775.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_70',
+      text:
+          'You\'re protecting yourself from the highly unlikely catastrophe. And that brings us to the final thought. We know Bezos launched Amazon Prime, even when the data told him not to.',
+      startTime: 776.02,
+      endTime: 785.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_71',
+      text:
+          'He relied on his gut. But that gut feeling wasn\'t an impulse. It was an intuition that had been trained by years of deep system two thinking about his industry.',
+      startTime: 785.54,
+      endTime: 794.38,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_72',
+      text:
+          'The highest craft of decision-making isn\'t just trusting your gut. It\'s training your intuition by refusing to rely on it too soon. When you consistently force your system two to see the situation clearly, to map and to predict, then your gut instinct when you finally need it for those truly unprecedented choices becomes an instrument of real wisdom,',
+      startTime: 795.24,
+      endTime: 812.08,
+    ),
+    TranscriptSegment(
+      id: 'drop_009_73',
+      text: 'not just a random gamble.',
+      startTime: 812.32,
+      endTime: 813.22,
+    ),
+  ],
+);
@@ -0,0 +1,322 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py from transcripts/2024 AI Index Progress & Peril.json
+// source-hash: ced58f3261b3245770b56b9c221c34df20f70e9b87aa18eaeafee7ecd7e9c77f
+
+import '../models/transcript.dart';
+
+/// 2024 AI Index: Progress & Peril - drop_010
+const drop010Transcript = Transcript(
+  chapters: [
+    AudioChapter(
+      title: 'Introduction: The State of AI',
+      description: 'Overview of Stanford\'s 2024 AI Index Report',
+      startTime: 0,
+      endTime: 67,
+    ),
+    AudioChapter(
+      title: 'Unprecedented Speed',
+      description: 'The explosive pace of AI development',
+      startTime: 67,
+      endTime: 150,
+    ),
+    AudioChapter(
+      title: 'Multimodal AI Breakthroughs',
+      description: 'New capabilities in vision, text, and audio',
+      startTime: 150,
+      endTime: 218,
+    ),
+    AudioChapter(
+      title: 'The Dark Side: Model Collapse',
+      description: 'Risks of AI training on AI-generated data',
+      startTime: 218,
+      endTime: 298,
+    ),
+    AudioChapter(
+      title: 'Safety & Bias Concerns',
+      description: 'AI safety vulnerabilities and cultural biases',
+      startTime: 298,
+      endTime: 390,
+    ),
+    AudioChapter(
+      title: 'Key Takeaways',
+      description: 'The dual nature of AI and our responsibility',
+      startTime: 390,
+      endTime: 451,
+    ),
+  ],
+  segments: [
+    TranscriptSegment(
+      id: 'drop_010_1',
+      text:
+          'All right, so Stanford\'s big annual AI index report just dropped, and it\'s pretty much our best look at where we stand with artificial intelligence. The 2024 edition really paints a picture of two things happening at once.',
+      startTime: 0.0,
+      endTime: 11.46,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_2',
+      text:
+          'AI is moving forward at a dizzying speed, but it\'s also creating some really serious new problems. So let\'s dive in and break down what that actually means. Okay, let\'s just kick things off with one number from the report that really jumps out.',
+      startTime: 11.9,
+      endTime: 24.48,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_3',
+      text:
+          'Since 2013, the number of recorded AI incidents, we\'re talking about things like deep fakes, big privacy breaches, major accidents.',
+      startTime: 24.48,
+      endTime: 33.14,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_4',
+      text:
+          'That number has grown by more than 20 times. That is not a small jump, you guys. That is an absolute explosion. And that number, it really gets to the core of this entire report.',
+      startTime: 33.64,
+      endTime: 45.9,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_5',
+      text:
+          'AI is just developing so incredibly fast that we\'re all struggling to keep up with the consequences. The story of AI in 2024 is kind of like two stories happening at the same time.',
+      startTime: 46.5,
+      endTime: 58.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_6',
+      text:
+          'On one hand, you have these incredible, unprecedented breakthroughs, and on the other, you have these unprecedented risks popping up right alongside them.',
+      startTime: 58.8,
+      endTime: 67.1,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_7',
+      text:
+          'So first up, let\'s talk about the speed. I mean, the sheer pace of AI development right now is, it\'s just mind boggling. It\'s really unlike anything we\'ve ever seen before.',
+      startTime: 67.78,
+      endTime: 77.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_8',
+      text:
+          'And look, this isn\'t just a gut feeling, right? The data absolutely backs this up. What we\'re looking at here is the raw output from the research community. The number of papers getting published at AI conferences has more than doubled since 2010.',
+      startTime: 78.06,
+      endTime: 90.68,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_9',
+      text:
+          'And just in the last year, it jumped over 30%. The engine of AI innovation is just firing on all cylinders. And all that research, it\'s leading to some truly wild new abilities.',
+      startTime: 91.0,
+      endTime: 102.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_10',
+      text:
+          'We\'re talking stuff that honestly would have sounded like straight up science fiction just a couple of years ago. So a huge reason for this leap is something called multimodal AI.',
+      startTime: 103.2,
+      endTime: 114.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_11',
+      text:
+          'Now what does that mean? Well in simple terms, AI isn\'t just a one-trick pony anymore. It\'s not just about text or just about images. Now the heavy hitters can see, read, and listen all at the same time.',
+      startTime: 114.72,
+      endTime: 128.18,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_12',
+      text:
+          'And that combination is unlocking some incredible new skills. For example, check this out. There\'s this model called MV Dream. You can just type in a few words, like a bulldog wearing a black pirate hat, and boom, it spits out a whole 3D model.',
+      startTime: 128.64,
+      endTime: 143.54,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_13',
+      text:
+          'We\'re not just talking about flat images anymore. This is AI creating entire virtual objects from scratch, just from a little bit of text. But it\'s not just about creating stuff.',
+      startTime: 144.1,
+      endTime: 154.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_14',
+      text:
+          'It\'s also about understanding it. Take Meta\'s Segments Anything model. It can look at a busy, complicated photo, and with this almost superhuman accuracy, it can pick out every single object.',
+      startTime: 154.32,
+      endTime: 166.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_15',
+      text:
+          'It knows that\'s the emu, that\'s its beak, that\'s the backpack, that\'s the person\'s hand on the bottle. It\'s incredible. And this is where it gets really serious.',
+      startTime: 167.08,
+      endTime: 175.92,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_16',
+      text:
+          'In a good way. These new abilities have some profound, potentially life-saving uses. A new model, Panda, can look at CT scans and find early signs of pancreatic cancer, which is notoriously hard for even human doctors to spot.',
+      startTime: 176.24,
+      endTime: 190.58,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_17',
+      text:
+          'So this isn\'t just a cool tech demo. This could be a huge leap forward for science, and it could literally save lives. Okay, so we\'ve seen the amazing side of the coin.',
+      startTime: 191.0,
+      endTime: 201.74,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_18',
+      text:
+          'But all this incredible progress has a flip side. The report also points a huge spotlight on some deep, pretty worrying cracks that are starting to show up in the very foundation of this tech.',
+      startTime: 202.0,
+      endTime: 214.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_19',
+      text:
+          'And that leads us to this kind of weird, but super important question. You know how AI is creating so much stuff online now? Well, what happens when it starts training on its own creations?',
+      startTime: 215.0,
+      endTime: 225.52,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_20',
+      text:
+          'Is it kind of eating its own tail? This is a real thing, and it has a name. Model collapse. The best way to think about it is like making a photocopy of a photocopy.',
+      startTime: 226.0,
+      endTime: 237.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_21',
+      text:
+          'You know how each new copy gets a little fuzzier, a little more degraded? That\'s basically what\'s happening here. When AI models are trained on other AI-generated data, they can start to lose touch with reality, getting, well, blander and less accurate over time.',
+      startTime: 237.48,
+      endTime: 252.34,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_22',
+      text:
+          'And you can literally see it happening right here. So on the left, you\'ve got the numbers from the original model trained on real stuff. But watch what happens as it gets retrained on its own output, over and over.',
+      startTime: 252.96,
+      endTime: 263.14,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_23',
+      text:
+          'All the variety just disappears. By the time you get to the 20th generation, it\'s just this washed-out, repetitive mess, a poor imitation of the original.',
+      startTime: 263.5,
+      endTime: 271.78,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_24',
+      text:
+          'And you know what makes this whole thing even trinkier? A serious lack of transparency. This chart, it basically shows that most of the big-name AI models are closed source.',
+      startTime: 272.54,
+      endTime: 283.7,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_25',
+      text:
+          'That means we have no idea what data they were trained on. So how are researchers supposed to spot problems like model collapse if they can\'t even look under the hood?',
+      startTime: 284.16,
+      endTime: 292.56,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_26',
+      text:
+          'So okay, these technical problems are a big deal. But the report doesn\'t stop there. It goes deeper. And it looks at how AI is already having a direct and sometimes pretty troubling impact on all of us, on our society.',
+      startTime: 293.5,
+      endTime: 306.24,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_27',
+      text:
+          'Let\'s talk about safety for a second. We usually think of AI safety as just, you know, blocking it from answering obviously bad questions. But it turns out it\'s way more complicated than that.',
+      startTime: 306.82,
+      endTime: 316.72,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_28',
+      text:
+          'Researchers found that you can feed a model a really long, gibberish prompt, and it can actually trick the AI into bypassing its own safety filters. It\'s a pretty stark reminder that these things don\'t really understand what they\'re doing like a person does.',
+      startTime: 317.32,
+      endTime: 329.22,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_29',
+      text:
+          'And that lack of real understanding can have some pretty dangerous results. I mean, look at this. When researchers asked leading chatbots about medicine and race, the models often just repeated old debunked myths, like false ideas about skin thickness differences between races.',
+      startTime: 330.06,
+      endTime: 345.5,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_30',
+      text:
+          'It\'s a perfect and frankly scary example of how biases in the training data can lead to the AI spitting out harmful misinformation. And this bias isn\'t just about facts.',
+      startTime: 346.14,
+      endTime: 355.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_31',
+      text:
+          'It\'s cultural, too. Check this out. When an LLM was asked to pick between a good democracy and a strong economy, it overwhelmingly chose democracy. Now that lines up pretty well with opinions in the US and Europe.',
+      startTime: 355.9,
+      endTime: 366.9,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_32',
+      text:
+          'But it doesn\'t match what people in many other parts of the world would say. It just goes to show how these models are soaking up the cultural values of the people who build them.',
+      startTime: 367.26,
+      endTime: 375.32,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_33',
+      text:
+          'And that has huge implications for technology that\'s supposed to be for everyone all over the globe. So, with all of that, where do we go from here? The report really paints a complicated, nuanced picture of what our future with AI looks like.',
+      startTime: 375.52,
+      endTime: 389.96,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_34',
+      text:
+          'When you boil it all down, the 2024 AI index is telling us that AI isn\'t just one thing. It\'s really two. It\'s this amazing engine for progress and discovery.',
+      startTime: 390.68,
+      endTime: 400.36,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_35',
+      text:
+          'And at the exact same time, it\'s a mirror. A mirror that reflects all of our own biases, our weaknesses, and our societal flaws right back in our faces. And this two-sided nature of AI is forcing a much-needed global conversation about, you know, how do we make sure these things are safe?',
+      startTime: 400.74,
+      endTime: 416.52,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_36',
+      text:
+          'How do we trust them? The report really highlights this growing demand for more transparency, for more responsibility, from everyone. Policymakers, the public.',
+      startTime: 416.9,
+      endTime: 426.1,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_37',
+      text:
+          'We\'re all starting to ask for more accountability. And that really brings us to the big takeaway here. The tech itself, it\'s not good or bad.',
+      startTime: 426.6,
+      endTime: 434.8,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_38',
+      text:
+          'It\'s a tool. It\'s a reflection. So, the ultimate question this report leaves us with isn\'t, will AI be good or bad? The real question is, will we be?',
+      startTime: 435.2,
+      endTime: 444.64,
+    ),
+    TranscriptSegment(
+      id: 'drop_010_39',
+      text:
+          'It all comes down to the choices we make, the values we build into these systems, and the kind of future we decide to create with it.',
+      startTime: 445.14,
+      endTime: 451.24,
+    ),
+  ],
+);
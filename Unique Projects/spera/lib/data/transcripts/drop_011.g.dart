@@ -0,0 +1,687 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py from transcripts/Risk Budgeting and Robust Institutional Finance.json
+// source-hash: 6a8cf44fdcf86ccbd890fd14ee372a9e1934c62c58fab517715f96099ebdd97f
+
+import '../models/transcript.dart';
+
+/// Risk Budgeting & Institutional Finance - drop_011
+const drop011Transcript = Transcript(
+  chapters: [
+    AudioChapter(
+      title: 'Introduction to Risk Budgeting',
+      description: 'What institutional investors know',
+      startTime: 0,
+      endTime: 200,
+    ),
+    AudioChapter(
+      title: 'Risk vs Return',
+      description: 'Reframing the investment equation',
+      startTime: 200,
+      endTime: 400,
+    ),
+    AudioChapter(
+      title: 'Portfolio Construction',
+      description: 'Building robust allocations',
+      startTime: 400,
+      endTime: 620,
+    ),
+    AudioChapter(
+      title: 'Behavioral Traps',
+      description: 'Psychology of market panics',
+      startTime: 620,
+      endTime: 820,
+    ),
+    AudioChapter(
+      title: 'Practical Applications',
+      description: 'Applying these principles',
+      startTime: 820,
+      endTime: 1030,
+    ),
+  ],
+  segments: [
+    TranscriptSegment(
+      id: 'drop_011_1',
+      text:
+          'All right, let\'s unpack this. We are diving deep into institutional finance today, and we are skipping right past the entry-level stuff about simply diversifying your assets.',
+      startTime: 0.0,
+      endTime: 11.26,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_2',
+      text:
+          'The biggest pools of capital, we\'re talking massive pension funds, endowments, they\'ve already moved on. They really have. The sources you\'ve given us, they highlight this cutting-edge shift.',
+      startTime: 11.52,
+      endTime: 21.86,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_3',
+      text:
+          'It\'s no longer just about what assets you hold. It\'s about what risk you own and how you precisely budget for it. We\'re going to be exploring the sophisticated methodologies that move way beyond basic asset allocation, things like the risk budgeting approach and the comprehensive risk allocation',
+      startTime: 22.32,
+      endTime: 40.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_4',
+      text:
+          'framework. And our mission here is to figure out how these giants manage the truly complex, the illiquid parts of their portfolios, private equity, infrastructure.',
+      startTime: 40.06,
+      endTime: 49.06,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_5',
+      text:
+          'Really tricky stuff. Exactly. And why they\'re focusing less on chasing returns and much more on building financial robustness, on ensuring capital preservation.',
+      startTime: 49.34,
+      endTime: 57.68,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_6',
+      text:
+          'We want to find those the surprising facts that show why these complex methods are just objectively better than the old ones. Well, we have to start with the fundamental realization that, you know, that drove this change.',
+      startTime: 58.32,
+      endTime: 68.46,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_7',
+      text:
+          'The major economic crises of the past generation, they profoundly exposed just how fragile traditional asset management was.',
+      startTime: 69.34,
+      endTime: 78.08,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_8',
+      text:
+          'Oh, absolutely. When the world melts down, relying on uncertain return forecasts, which are, I mean, they\'re to the older models. That\'s a recipe for disaster.',
+      startTime: 78.12,
+      endTime: 87.63,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_9',
+      text:
+          'So the market effectively forced a migration. Risk management had to become the absolute center of the investment process. You had to prioritize models that just didn\'t require you to guess what returns would be next year.',
+      startTime: 87.93,
+      endTime: 99.07,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_10',
+      text:
+          'And that\'s where the theory of risk budgeting or RB really found its footing. Everyone knows the concept of an equal weight portfolio, right? Where every asset gets the same dollar amount.',
+      startTime: 99.45,
+      endTime: 108.35,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_11',
+      text:
+          ' RB is a generalization of the equal risk contribution or ERC portfolio. Which means it\'s... In an ERC, every asset contributes the same amount of risk to the total portfolio volatility.',
+      startTime: 108.85,
+      endTime: 120.01,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_12',
+      text:
+          'OK, the same amount of risk. But in the more general risk budgeting approach, the manager defines a specific budget of risk for each component.',
+      startTime: 120.03,
+      endTime: 128.47,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_13',
+      text:
+          'So maybe the budget for emerging market debt is 10% of total risk and the budget for stable infrastructure is 5%. The portfolio is then built so the actual risk contribution matches that defined budget.',
+      startTime: 128.77,
+      endTime: 139.13,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_14',
+      text:
+          'And here\'s where it gets really interesting because this just blows up the major failure of the older gold standard. Mean Variance Optimization, MVO. If RB works by defining risk contribution, what was MVO doing wrong?',
+      startTime: 139.57,
+      endTime: 152.61,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_15',
+      text:
+          'MVO, for all its theoretical elegance, is practically brittle. It operates beautifully on a whiteboard. But when you implement it in the real world, its tendency is to maximize the effects of errors in your input assumptions.',
+      startTime: 153.05,
+      endTime: 166.03,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_16',
+      text:
+          'Think of it like trying to perfectly hit a tiny dartboard from a mile away. If your return forecasts are even slightly off, and they always are, MVO pushes the portfolio weights into these wild, extreme, and inefficient corners.',
+      startTime: 166.29,
+      endTime: 177.93,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_17',
+      text:
+          'Wait, so MVO is? It\'s theoretically optimal, but in practice it\'s just brittle. It sounds like we\'re punishing ourselves for trying to be a little too precise when our inputs are just fundamentally unreliable.',
+      startTime: 178.17,
+      endTime: 191.59,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_18',
+      text:
+          'That\'s the trade-off. Precisely. So the quest for the perfect allocation actually leads to massive instability. That\'s it. RB portfolios are just significantly more robust.',
+      startTime: 191.63,
+      endTime: 201.31,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_19',
+      text:
+          'They\'re far less sensitive to those changes in input parameters. And that stability is actually a huge operational win, right? It translates directly into much lower turnover.',
+      startTime: 201.79,
+      endTime: 211.07,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_20',
+      text:
+          'So you\'re not paying transaction costs and chasing performance every time the market data wiggles. Exactly. It\'s a construction method that values consistency and real-world stability over trying to nail an uncertain forecast.',
+      startTime: 211.27,
+      endTime: 222.81,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_21',
+      text:
+          'And the math, it backs this up so elegantly. You don\'t even need a complicated formula. Not at all. When academics look at this, they found that the volatility of an RB portfolio is mathematically guaranteed to be safely nestled somewhere between the absolute lowest possible risk',
+      startTime: 223.21,
+      endTime: 238.35,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_22',
+      text:
+          'portfolio, the minimum variance one, and the simple equally weighted approach. So you get the benefit of optimization without the inherent fragility of the MVO system.',
+      startTime: 238.35,
+      endTime: 247.49,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_23',
+      text:
+          'That\'s it. That\'s powerful proof of concept. But the applications go far beyond typical stock and bond portfolios.',
+      startTime: 247.53,
+      endTime: 255.81,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_24',
+      text:
+          'You highlighted a pretty surprising use in sovereign bond indexation. This is a fantastic illustration of the need for risk-based thinking.',
+      startTime: 255.81,
+      endTime: 265.35,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_25',
+      text:
+          'Traditional sovereign bond indexes are weighted by debt. What\'s the massive paradox here? You end up giving the highest index weightings to the most indebted country.',
+      startTime: 266.31,
+      endTime: 274.49,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_26',
+      text:
+          'Exactly. Regardless of their capacity to actually service that debt. So you\'re rewarding poor fiscal management. If you\'re a passive investor tracking that index, you are effectively taking on the most exposure to the weakest hands.',
+      startTime: 274.91,
+      endTime: 286.51,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_27',
+      text:
+          'You are indexing to the highest risk. And that creates an inherent ongoing risk of index collapse if one of those highly weighted, heavily indebted nations just hits a wall.',
+      startTime: 286.69,
+      endTime: 296.27,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_28',
+      text:
+          'The risk budgeting solution completely sidesteps this. Instead of basing the budget on the country\'s liability, its debt, you base the risk budget on a more stable metric like its GDP.',
+      startTime: 296.27,
+      endTime: 306.13,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_29',
+      text:
+          'So the stability of the economy rather than the amount it owes, that becomes the anchor of your risk exposure. It\'s a complete philosophical reversal.',
+      startTime: 306.37,
+      endTime: 314.57,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_30',
+      text:
+          'So risk budgeting handles the relative risk contribution of portfolio components brilliantly. But let\'s zoom out a bit to the entire portfolio construction process.',
+      startTime: 314.57,
+      endTime: 324.85,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_31',
+      text:
+          'We\'re now talking about the full shift from asset allocation or AA to the risk allocation framework, RAF. Why is traditional AA obsolete for these large institutions?',
+      startTime: 325.43,
+      endTime: 336.01,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_32',
+      text:
+          'Traditional asset allocation, simply sorting investments into these broad categories like fixed income, equity, commodities. It creates what we call a false sense of security.',
+      startTime: 336.63,
+      endTime: 345.83,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_33',
+      text:
+          'A false sense of security. When markets are calm, those buckets, they look diverse, but they mask common underlying risk factors that all pop up when stress hits.',
+      startTime: 345.83,
+      endTime: 355.59,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_34',
+      text:
+          'Like 2008, when everything correlated to one, you thought that high yield bonds were fixed income, but when the economy contracted, they behaved exactly like equities. Exactly like equities.',
+      startTime: 355.93,
+      endTime: 364.83,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_35',
+      text:
+          'Yes. Because they share the same credit risk exposure. And the risk allocation framework acknowledges this systemic reality. It shifts the focus from what asset you own to what risk you own.',
+      startTime: 364.83,
+      endTime: 376.29,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_36',
+      text:
+          'It requires the manager to explicitly consider how investments contribute to or mitigate risks like equity beta exposure, foreign currency fluctuations, or exposure to illiquidity.',
+      startTime: 376.87,
+      endTime: 387.47,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_37',
+      text:
+          'So once you\'re operating under this RAF, how do institutions determine their policy goals and measure success? I mean, how do they avoid moving the goalposts?',
+      startTime: 387.87,
+      endTime: 396.31,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_38',
+      text:
+          'The standard for success is raised significantly. Policy goals have to be compared to a volatility equivalent simple stock bond portfolio.',
+      startTime: 396.31,
+      endTime: 405.59,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_39',
+      text:
+          'OK. What does that mean? It means if your complicated, highly researched strategy has, say, a 10% expected volatility, the objective is to add return over and above what you could have earned simply by investing in a basic two asset stock bond portfolio that also has 10% volatility.',
+      startTime: 405.75,
+      endTime: 420.27,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_40',
+      text:
+          'That forces massive transparency. You can\'t just claim success because you made money. You have to prove you added genuine alpha, not just compensated beta risk that was easily achievable somewhere else.',
+      startTime: 420.49,
+      endTime: 430.33,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_41',
+      text:
+          'And that framework requires dynamic monitoring to catch changes fast. To spot spikes in risk sooner than conventional methods, they use this really interesting solution called exponential weighting on historical data.',
+      startTime: 430.75,
+      endTime: 443.77,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_42',
+      text:
+          'That\'s a fascinating technical detail. Can you break down that system for us, the 24 monthly points with a 12-month half-life? Sure.',
+      startTime: 444.25,
+      endTime: 452.63,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_43',
+      text:
+          'Conventional methods treat data points from, say, 20 months ago and last month equally. That\'s just slow to react.  Existential weighting is like driving a car.',
+      startTime: 453.19,
+      endTime: 461.89,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_44',
+      text:
+          'Yeah. You care far more about the pothole you hit three seconds ago than the one you hit five minutes ago. The 12-month half-life means that data from a year ago is weighted only half as much as the most recent data.',
+      startTime: 462.25,
+      endTime: 472.01,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_45',
+      text:
+          'So it accelerates the decay of old information\'s relevance. It lets the system capture current risk and volatility spikes much sooner. If a manager starts quietly taking on more risk, this system flags that change in volatility almost immediately.',
+      startTime: 472.41,
+      endTime: 486.05,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_46',
+      text:
+          'And this focus on agility, on precise risk measurement, it becomes exponentially more vital when we step into these complex illiquid asset classes where valuations aren\'t so transparent.',
+      startTime: 486.51,
+      endTime: 496.47,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_47',
+      text:
+          'Let\'s look at private equity, specifically the secondary market, which is now a massive institutional segment. We see three distinct structural strategies that really showcase a clear risk-return tradeoff.',
+      startTime: 496.89,
+      endTime: 509.87,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_48',
+      text:
+          'It\'s a beautiful masterclass in customizing risk exposure. At the top of the risk curve, you have traditional secondaries. They are simply buying old fund stakes, taking full equity risk.',
+      startTime: 510.19,
+      endTime: 520.11,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_49',
+      text:
+          'They have the highest potential return but also the highest volatility. They\'re just fully exposed to the economic cycle. Then we move down the curve to preferred capital strategies, which are becoming much more common.',
+      startTime: 520.31,
+      endTime: 531.91,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_50',
+      text:
+          'How does that preferred equity structure actually mitigate the risk? They trade some of that massive upside for explicit downside protection. They use a preferred equity layer that gets paid out ahead of the general partners.',
+      startTime: 531.91,
+      endTime: 543.05,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_51',
+      text:
+          'I see. They aim for returns in the mid-teens, say, an IRR of 1.4x to 1.5x, but with significantly lower volatility than traditional equity.',
+      startTime: 543.05,
+      endTime: 552.85,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_52',
+      text:
+          'Their due diligence, it focuses heavily on metrics like low leverage and stable performance in the underlying portfolio companies. They need confidence in the quality of the cash flow.',
+      startTime: 553.49,
+      endTime: 561.53,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_53',
+      text:
+          'Okay, so they sacrifice a little potential alpha for structural safety. But at the absolute bottom of the risk spectrum, you have debt financing strategies in the secondary market.',
+      startTime: 561.53,
+      endTime: 572.67,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_54',
+      text:
+          'You call this the lowest risk structure, but aren\'t they just trade in market risk for credit risk? That\'s a great critical question, but their structure is designed to mitigate that credit risk so aggressively.',
+      startTime: 573.21,
+      endTime: 585.15,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_55',
+      text:
+          'These debt providers are focused solely on capital repayment. They secure their investment with extreme downside protection tools like financial covenants and demanding a very high asset cover, something like 5.0x asset cover.',
+      startTime: 585.75,
+      endTime: 600.63,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_56',
+      text:
+          'Five times. Yeah, five times. So that level of safety essentially means repayment is guaranteed regardless of whether the portfolio companies hit their growth targets or not.',
+      startTime: 600.93,
+      endTime: 609.11,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_57',
+      text:
+          'Precisely. They\'ve effectively ring-fenced their capital. The cost of this certainty is the lowest return. They\'re targeting only a small multiple, maybe 1.1x with virtually no expected volatility.',
+      startTime: 609.27,
+      endTime: 619.15,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_58',
+      text:
+          'It\'s a perfect spectrum. It shows that institutional investors are using these complex structures to buy precisely the risk profile they need, whether it\'s full equity exposure or pure capital preservation.',
+      startTime: 619.33,
+      endTime: 630.41,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_59',
+      text:
+          'Okay, let\'s pivot to infrastructure and clean energy infrastructure, CEI. These are long-term utility-like assets. What are the unique risks here and the corresponding mitigation solutions?',
+      startTime: 630.77,
+      endTime: 642.99,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_60',
+      text:
+          'For traditional regulated infrastructure, the primary risk is, well, regulatory risk. Since the regulator sets the allowable return on equity, the utility\'s profitability is tied to that third-party decision.',
+      startTime: 643.95,
+      endTime: 655.39,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_61',
+      text:
+          'The mitigation solution is largely qualitative and surprisingly relationship-driven. You foster a strong long-term relationship with the regulator by consistently demonstrating maximized operational efficiency and superb service quality.',
+      startTime: 656.13,
+      endTime: 668.95,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_62',
+      text:
+          'You want to be the least objectionable partner possible. That makes perfect sense. You manage the risk by managing the relationship, proving you\'re a good corporate citizen. What about assets where usage volume is the risk, like a toll road?',
+      startTime: 669.43,
+      endTime: 680.07,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_63',
+      text:
+          'That\'s pure volume or patronage risk. And here, the mitigation is fiercely quantitative. On acquisition, managers have to conduct robust sensitivity analysis.',
+      startTime: 680.41,
+      endTime: 690.83,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_64',
+      text:
+          'The key detail here is that the analysis must allow for downside scenarios that are larger than have historically been experienced. You can\'t just rely on the past.',
+      startTime: 691.71,
+      endTime: 700.33,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_65',
+      text:
+          'You cannot rely on the past 20 years of traffic data to predict the next big economic shock. That echoes the philosophical point we\'re saving for the end.',
+      startTime: 700.33,
+      endTime: 708.99,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_66',
+      text:
+          'Now, what about CEI, solar, wind? Their risk is whether the sun shines or the wind blows. That is production risk, yeah. And wind power is notably more volatile than solar PV, which is relatively predictable.',
+      startTime: 709.45,
+      endTime: 721.09,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_67',
+      text:
+          'To mitigate this, managers use extremely conservative planning assumptions. Instead of assuming the P50 mean output, the expected average, they use the P90 production level.',
+      startTime: 721.63,
+      endTime: 729.89,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_68',
+      text:
+          'The P90 level. So that means they only assume a level of output that is 90% likely to be exceeded. They\'re dramatically under-promising. Exactly. This drastically reduces the revenue assumption in the model, building in a huge buffer.',
+      startTime: 729.89,
+      endTime: 741.97,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_69',
+      text:
+          'But the most important capital protection, it comes from the dual revenue stream. Even if policy incentives like renewable energy credits or RECs are completely abolished, an extreme adverse scenario, the ongoing revenues from the actual energy sales still provide',
+      startTime: 742.43,
+      endTime: 759.57,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_70',
+      text:
+          'substantial capital protection. They underwrite the invested capital. The ability to sell electrons guarantees a floor under the investment. We\'ve covered market risk, we\'ve covered asset risk, but let\'s look internally.',
+      startTime: 759.57,
+      endTime: 771.35,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_71',
+      text:
+          'For large investors, a manager\'s operational failure, I mean, internal fraud, conflicts of interest, that can be just as catastrophic as a market crash.',
+      startTime: 771.83,
+      endTime: 780.35,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_72',
+      text:
+          'How do LPs protect themselves from the risk inherent in the people managing the money? This is where rigorous operational due diligence or ODD comes in. LPs use ODD to mitigate risks related to valuation practices, potential conflicts of interest, for instance.',
+      startTime: 780.83,
+      endTime: 793.99,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_73',
+      text:
+          'If a manager has a private undisclosed stake in a portfolio company, they are investing client money into. Oh, wow. And crucial compliance issues like trading on material on public information, MMPI.',
+      startTime: 794.07,
+      endTime: 804.11,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_74',
+      text:
+          'So ODD is essentially due diligence on the manager\'s character in their process, not just their investment track record. You need to know that the firm running your money has the internal integrity and the controls to handle massive amounts of capital ethically.',
+      startTime: 804.35,
+      endTime: 818.53,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_75',
+      text:
+          'It requires deep, structured investigation. That includes a comprehensive background check covering the criminal, litigation, regulatory, and media history of all key personnel.',
+      startTime: 818.53,
+      endTime: 828.25,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_76',
+      text:
+          'The firm\'s entire organizational structure becomes as important as its portfolio construction strategy. Okay, switching gears to measurement. With all these complex, bespoke strategies in private markets, comparing performance across managers must be a statistical nightmare without a standard.',
+      startTime: 829.03,
+      endTime: 844.95,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_77',
+      text:
+          'Standardization is absolutely critical. Yeah. And GIPs, the Global Investment Performance Standards, is the solution. GPS provides rigorous guidelines specifically to ensure equitable and commensurate comparisons.',
+      startTime: 845.97,
+      endTime: 856.69,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_78',
+      text:
+          'What are the key rules GIPs mandates? Crucially, returns must be calculated net of fees. And because the internal rate of return, the IRR, can be easily manipulated or misunderstood, GIPs demands performance be presented using both IRR and the essential cash flow multiples.',
+      startTime: 857.01,
+      endTime: 871.83,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_79',
+      text:
+          'Like DPI. Exactly. DPI, which is Distributions to Paid in Capital, TVPI, Total Value to Paid in, and RVPI, Residual Value.',
+      startTime: 872.17,
+      endTime: 880.63,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_80',
+      text:
+          'You need to know how much cash has actually been returned to you, which is what DPI tells you, not just some theoretical rate of return. And valuations must be on a fair value basis, which eliminates the old tricks of managers holding assets that cost for way too long.',
+      startTime: 881.35,
+      endTime: 895.01,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_81',
+      text:
+          'Precisely. It forces honesty and comparability. We\'ve spent this entire deep dive discussing sophisticated quantitative models, frameworks, due diligence processes.',
+      startTime: 895.35,
+      endTime: 904.37,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_82',
+      text:
+          'We\'ve been incredibly analytical. But let\'s just step back for a final philosophical observation about the limitations of all of these solutions. This is, for me, the most profound lesson from the source material.',
+      startTime: 904.87,
+      endTime: 915.43,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_83',
+      text:
+          'It\'s an acknowledgement that models, the CAPM, MVO, value at risk, or even the exponential weighting we talked about, are merely abstractions removed from reality. Just abstractions.',
+      startTime: 916.03,
+      endTime: 924.81,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_84',
+      text:
+          'They\'re useful directional tools. They help test conclusions. But they are inherently structurally flawed because they rely on past data. They cannot possibly account for never before seen events.',
+      startTime: 924.93,
+      endTime: 935.93,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_85',
+      text:
+          'They give us a clear view of the road behind us, but no guarantee about the road ahead. So true risk of management, therefore, must be forward looking. It requires qualitative theory.',
+      startTime: 936.37,
+      endTime: 945.27,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_86',
+      text:
+          'It requires the imagination to conceive of how the world may sentimentally change, like a global pandemic or a new financial structure, and then taking proactive action accordingly without waiting for the model to register a change.',
+      startTime: 945.69,
+      endTime: 958.99,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_87',
+      text:
+          'So what does this all mean for you, our listener? We\'ve seen institutional finance move from simple asset buckets to these highly defined actively managed risk budgets.',
+      startTime: 959.39,
+      endTime: 967.75,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_88',
+      text:
+          'And it\'s driven by the absolute necessity of robustness when dealing with complex illiquid assets. We cover the theoretical stability of risk budgeting, the need for the risk allocation framework to expose hidden risks like equity beta, and the practical downside protections',
+      startTime: 968.61,
+      endTime: 983.95,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_89',
+      text:
+          'employed everywhere from secondary private equity funds to the conservative P90 output assumptions in a solar farm. And we end on that powerful grounding realization.',
+      startTime: 983.95,
+      endTime: 993.11,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_90',
+      text:
+          'The core message here is not to trust the math, but to trust your judgment. The sources state, reliance on models and extrapolation of the past into the future is not risk management.',
+      startTime: 993.77,
+      endTime: 1004.71,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_91',
+      text:
+          'Understanding the limitations of past patterns and taking action accordingly, that is risk management. That is the ultimate challenge. If you manage a complex portfolio, or even if you\'re just making large life decisions, where are you relying too heavily on the predictable patterns of the past instead of actively using',
+      startTime: 1005.27,
+      endTime: 1022.43,
+    ),
+    TranscriptSegment(
+      id: 'drop_011_92',
+      text:
+          'your imagination to prepare for an unprecedented future? Something critical for you to mull over until our next deep dive. Thanks for guiding us through all this. Always a pleasure.',
+      startTime: 1022.43,
+      endTime: 1030.45,
+    ),
+  ],
+);
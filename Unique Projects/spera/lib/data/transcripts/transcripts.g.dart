@@ -0,0 +1,24 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by scripts/generate_transcript_dart.py
+
+import '../models/transcript.dart';
+import 'drop_001.g.dart';
+import 'drop_002.g.dart';
+import 'drop_003.g.dart';
+import 'drop_004.g.dart';
+import 'drop_007.g.dart';
+import 'drop_009.g.dart';
+import 'drop_010.g.dart';
+import 'drop_011.g.dart';
+
+/// Transcripts generated from transcripts/*.json, by drop ID
+const Map<String, Transcript> generatedTranscripts = {
+  'drop_001': drop001Transcript,
+  'drop_002': drop002Transcript,
+  'drop_003': drop003Transcript,
+  'drop_004': drop004Transcript,
+  'drop_007': drop007Transcript,
+  'drop_009': drop009Transcript,
+  'drop_010': drop010Transcript,
+  'drop_011': drop011Transcript,
+};
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Audio fingerprints for spotting re-uploaded or re-edited episodes.
+
+Every 16 ms hop gets a 32-bit sub-fingerprint (Haitsma & Kalker): the audio
+is split into 128 ms Hann-windowed frames, energies are taken in 33
+log-spaced bands between 300 and 2000 Hz, and bit m is set when the energy
+difference between bands m and m + 1 grew since the previous frame. The
+bits survive re-encoding, resampling and volume changes. Frames are
+transformed a block at a time, so memory stays flat however long the
+episode.
+
+Fingerprints are compared in 8 s chunks: each chunk of one episode is
+aligned to the other by voting on the offsets of identical sub-fingerprints
+and counts as found when under 35% of its bits differ there. The share of
+chunks found is ~1 for a re-upload, in between for a re-edit (cuts, a new
+intro) and ~0 for different episodes.
+
+  header (24 bytes, little-endian)
+    magic "SPFP", version u16, reserved u16,
+    sample_rate u32, hop u32, n_frames u32, reserved u32
+  bits             uint32[n_frames]
+
+Usage:
+  write_fingerprint(compute_fingerprint(audio), "transcripts/talk.fp.bin")
+  python3 scripts/audio_fingerprint.py transcripts/*.fp.bin    # report duplicates
+"""
+
+import argparse
+import struct
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b"SPFP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIII")
+
+SAMPLE_RATE = 16000
+FRAME = 2048
+HOP = 256
+N_BANDS = 33
+MIN_HZ, MAX_HZ = 300.0, 2000.0
+BLOCK_FRAMES = 2048
+
+CHUNK_FRAMES = 500
+MAX_BIT_ERROR = 0.35
+# Sub-fingerprints this common (silence, tones) say nothing about alignment
+MAX_REPEATS = 8
+
+
+def band_matrix(sample_rate: int = SAMPLE_RATE, frame: int = FRAME) -> np.ndarray:
+    """(frame // 2 + 1, N_BANDS) matrix summing FFT bins into log-spaced bands."""
+    edges = np.geomspace(MIN_HZ, MAX_HZ, N_BANDS + 1)
+    freqs = np.fft.rfftfreq(frame, 1 / sample_rate)
+    band = np.searchsorted(edges, freqs, side="right") - 1
+    matrix = np.zeros((len(freqs), N_BANDS), dtype=np.float32)
+    inside = (band >= 0) & (band < N_BANDS)
+    matrix[np.flatnonzero(inside), band[inside]] = 1.0
+    return matrix
+
+
+def compute_fingerprint(audio: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                        frame: int = FRAME, hop: int = HOP) -> dict:
+    """
+    Sub-fingerprints of float samples.
+
+    Returns:
+        Dict with sample_rate, hop and bits (uint32 per hop)
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    n_frames = max(0, (len(audio) - frame) // hop + 1)
+    window = np.hanning(frame).astype(np.float32)
+    bands = band_matrix(sample_rate, frame)
+    weights = np.uint32(1) << np.arange(N_BANDS - 1, dtype=np.uint32)
+
+    bits = np.zeros(n_frames, dtype=np.uint32)
+    if not n_frames:
+        return {"sample_rate": sample_rate, "hop": hop, "bits": bits}
+    frames = np.lib.stride_tricks.sliding_window_view(audio, frame)[::hop]
+    previous = None
+    for lo in range(0, n_frames, BLOCK_FRAMES):
+        spectrum = np.fft.rfft(frames[lo:lo + BLOCK_FRAMES] * window, axis=1)
+        energy = (spectrum.real ** 2 + spectrum.imag ** 2).astype(np.float32) @ bands
+        slope = energy[:, :-1] - energy[:, 1:]
+        before = np.concatenate(([slope[0] if previous is None else previous], slope[:-1]))
+        bits[lo:lo + len(slope)] = ((slope - before) > 0) @ weights
+        previous = slope[-1]
+    # The first frame has nothing to compare with
+    bits[0] = 0
+    return {"sample_rate": sample_rate, "hop": hop, "bits": bits}
+
+
+def write_fingerprint(fingerprint: dict, output_path: str):
+    """Write compute_fingerprint() output in the sidecar format."""
+    bits = fingerprint["bits"]
+    with open(output_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, fingerprint["sample_rate"], fingerprint["hop"],
+                            len(bits), 0))
+        f.write(bits.astype("<u4").tobytes())
+
+
+def load_fingerprint(path) -> dict:
+    """Read a fingerprint sidecar written by write_fingerprint()."""
+    data = Path(path).read_bytes()
+    magic, version, _, sample_rate, hop, n_frames, _ = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a fingerprint sidecar")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported sidecar version {version}")
+    bits = np.frombuffer(data, dtype="<u4", count=n_frames, offset=HEADER.size)
+    return {"sample_rate": sample_rate, "hop": hop, "bits": bits}
+
+
+def _bit_errors(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Differing bits between paired uint32s."""
+    return np.unpackbits(np.bitwise_xor(a, b).view(np.uint8).reshape(-1, 4), axis=1).sum(axis=1)
+
+
+def compare(a: dict, b: dict, chunk_frames: int = CHUNK_FRAMES,
+            max_bit_error: float = MAX_BIT_ERROR) -> dict:
+    """
+    How much of fingerprint a appears in fingerprint b.
+
+    Returns:
+        Dict with found (share of a's chunks found in b), offset_seconds
+        (most common shift of a's chunks within b) and bit_error (mean
+        over the chunks found)
+    """
+    bits_a, bits_b = a["bits"], b["bits"]
+    n_chunks = -(-len(bits_a) // chunk_frames)
+    empty = {"found": 0.0, "offset_seconds": None, "bit_error": None}
+    if n_chunks == 0 or len(bits_b) == 0:
+        return empty
+
+    # Every (i, j) with bits_a[i] == bits_b[j], skipping over-common values
+    order = np.argsort(bits_b, kind="stable")
+    sorted_b = bits_b[order]
+    lo = np.searchsorted(sorted_b, bits_a, side="left")
+    hi = np.searchsorted(sorted_b, bits_a, side="right")
+    hits = hi - lo
+    usable = (hits > 0) & (hits <= MAX_REPEATS) & (bits_a != 0)
+    i = np.repeat(np.flatnonzero(usable), hits[usable])
+    starts = np.repeat(lo[usable], hits[usable])
+    within = np.arange(len(i)) - np.repeat(np.cumsum(hits[usable]) - hits[usable], hits[usable])
+    j = order[starts + within]
+    if len(i) == 0:
+        return empty
+
+    # Most voted offset per chunk of a
+    chunk = i // chunk_frames
+    offset = j - i + len(bits_a)
+    keys, votes = np.unique(chunk * (len(bits_a) + len(bits_b)) + offset, return_counts=True)
+    key_chunk = keys // (len(bits_a) + len(bits_b))
+    best = np.lexsort((-votes, key_chunk))
+    first = np.concatenate(([True], key_chunk[best][1:] != key_chunk[best][:-1]))
+    chunks = key_chunk[best][first]
+    offsets = keys[best][first] % (len(bits_a) + len(bits_b)) - len(bits_a)
+
+    # Bit error of each voted chunk at its offset
+    index_a = chunks[:, None] * chunk_frames + np.arange(chunk_frames)
+    index_b = index_a + offsets[:, None]
+    valid = (index_a < len(bits_a)) & (index_b >= 0) & (index_b < len(bits_b))
+    errors = np.zeros(index_a.shape)
+    errors[valid] = _bit_errors(bits_a[index_a[valid]], bits_b[index_b[valid]])
+    rate = errors.sum(axis=1) / np.maximum(valid.sum(axis=1) * 32, 1)
+    matched = (rate < max_bit_error) & (valid.sum(axis=1) >= chunk_frames // 4)
+
+    if not matched.any():
+        return empty
+    shifts, counts = np.unique(offsets[matched], return_counts=True)
+    return {
+        "found": float(matched.sum() / n_chunks),
+        "offset_seconds": float(shifts[np.argmax(counts)] * a["hop"] / a["sample_rate"]),
+        "bit_error": float(rate[matched].mean()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find re-uploaded or re-edited episodes by fingerprint")
+    parser.add_argument("fingerprints", nargs="+", help="Fingerprint sidecars (.fp.bin)")
+    parser.add_argument("--threshold", "-t", type=float, default=0.5,
+                        help="Share of one episode found in another to report (default: 0.5)")
+
+    args = parser.parse_args()
+
+    fingerprints = {Path(path).name: load_fingerprint(path) for path in args.fingerprints}
+    duplicates = 0
+    for (name_a, a), (name_b, b) in combinations(fingerprints.items(), 2):
+        # Report the direction with more overlap (a clip is mostly found in its source)
+        match = max(compare(a, b), compare(b, a), key=lambda m: m["found"])
+        if match["found"] >= args.threshold:
+            duplicates += 1
+            print(f"🔁 {name_a} ≈ {name_b}: {match['found']:.0%} matched, "
+                  f"offset {match['offset_seconds']:+.1f}s, {match['bit_error']:.0%} bit error")
+    print(f"\n✨ {duplicates} likely duplicates among {len(fingerprints)} episodes")
+    if duplicates:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
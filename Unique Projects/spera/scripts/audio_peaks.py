@@ -0,0 +1,140 @@
+"""
+Multi-resolution waveform peaks for scrubbers, as a compact binary sidecar.
+
+The finest level holds the min and max sample of every 512 samples (32 ms at
+16 kHz) as int8; each coarser level merges 4 buckets of the one below, down
+to a few hundred buckets for the whole episode. A client picks the level
+closest to its width in pixels and draws it without decoding any audio. A
+15-minute episode takes about 75 KB.
+
+  header (24 bytes, little-endian)
+    magic "SPPK", version u16, reserved u16,
+    sample_rate u32, n_samples u32, n_levels u32, reserved u32
+  levels           (samples_per_bucket u32, n_buckets u32)[n_levels]
+  peaks            int8[n_buckets][2] per level, finest first (min, max),
+                   each level padded to 4 bytes
+
+Levels are computed from the decoded samples with one vectorized pass
+(np.minimum/maximum.reduceat) and then from each other.
+
+Usage:
+  write_peaks(compute_peaks(audio), "transcripts/talk.peaks.bin")
+  with load_peaks("transcripts/talk.peaks.bin") as peaks:
+      buckets = peaks.level_for(width=400)     # (n, 2) int8 view
+"""
+
+import mmap
+import struct
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b"SPPK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIII")
+LEVEL = struct.Struct("<II")
+
+SAMPLE_RATE = 16000
+BASE_BUCKET = 512
+LEVEL_FACTOR = 4
+MIN_BUCKETS = 256
+
+
+def _to_int8(values: np.ndarray) -> np.ndarray:
+    return np.round(np.clip(values, -1.0, 1.0) * 127).astype(np.int8)
+
+
+def compute_peaks(audio: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                  base_bucket: int = BASE_BUCKET, factor: int = LEVEL_FACTOR,
+                  min_buckets: int = MIN_BUCKETS) -> dict:
+    """
+    Min/max pyramid of float samples in [-1, 1].
+
+    Returns:
+        Dict with sample_rate, n_samples and levels, a list of
+        (samples_per_bucket, (n, 2) int8 array), finest first
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    levels = []
+    if len(audio):
+        starts = np.arange(0, len(audio), base_bucket)
+        lows = np.minimum.reduceat(audio, starts)
+        highs = np.maximum.reduceat(audio, starts)
+        bucket = base_bucket
+        while True:
+            levels.append((bucket, np.stack((_to_int8(lows), _to_int8(highs)), axis=1)))
+            if len(lows) <= min_buckets:
+                break
+            starts = np.arange(0, len(lows), factor)
+            lows = np.minimum.reduceat(lows, starts)
+            highs = np.maximum.reduceat(highs, starts)
+            bucket *= factor
+    return {"sample_rate": sample_rate, "n_samples": len(audio), "levels": levels}
+
+
+def write_peaks(peaks: dict, output_path: str):
+    """Write compute_peaks() output in the sidecar format."""
+    levels = peaks["levels"]
+    with open(output_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, peaks["sample_rate"], peaks["n_samples"],
+                            len(levels), 0))
+        for bucket, values in levels:
+            f.write(LEVEL.pack(bucket, len(values)))
+        for _, values in levels:
+            data = values.tobytes()
+            f.write(data + b"\0" * (-len(data) % 4))
+
+
+class Peaks:
+    """Memory-mapped view of a peaks sidecar file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, sample_rate, n_samples, n_levels, _ = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a peaks sidecar")
+        if version != VERSION:
+            raise ValueError(f"{self.path}: unsupported sidecar version {version}")
+        self.sample_rate = sample_rate
+        self.n_samples = n_samples
+
+        table = [LEVEL.unpack_from(self._mmap, HEADER.size + i * LEVEL.size) for i in range(n_levels)]
+        offset = HEADER.size + n_levels * LEVEL.size
+        self.buckets = []
+        self.levels = []
+        for bucket, count in table:
+            self.buckets.append(bucket)
+            self.levels.append(np.frombuffer(self._mmap, dtype=np.int8, count=count * 2,
+                                             offset=offset).reshape(count, 2))
+            offset += count * 2 + (-count * 2 % 4)
+
+    @property
+    def duration(self) -> float:
+        return self.n_samples / self.sample_rate
+
+    def level_for(self, width: int) -> np.ndarray:
+        """The coarsest level with at least `width` buckets (or the finest there is)."""
+        for values in reversed(self.levels):
+            if len(values) >= width:
+                return values
+        return self.levels[0]
+
+    def close(self):
+        # Drop the NumPy views first; an mmap cannot close with exports alive
+        self.levels = []
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_peaks(path) -> Peaks:
+    """Open a peaks sidecar written by write_peaks()."""
+    return Peaks(path)
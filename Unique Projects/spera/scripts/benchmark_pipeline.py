@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Benchmark the transcription and codegen scripts.
+
+Each case runs in a fresh process (so peak RSS is its own) at several input
+sizes, and reports wall time (best and median of --repeat runs), real-time
+factor (wall time / seconds of media processed) and peak RSS:
+
+  generate_chapters, generate_semantic_chapters, combine_segments,
+  generate_dart_transcript, output_json, output_srt, output_txt
+      run over every transcripts/*.json fixture, tiled --scale times to
+      simulate longer episodes (dart cases only for mapped drops)
+  transcribe, transcribe_vad
+      run on synthetic speech-like audio of --minutes length with a mock
+      model that replays fixture segments (sleeping --mock-rtf seconds per
+      second of audio), or a real one with --model
+
+Results are saved as <results-dir>/<UTC time>.json (default
+~/.cache/spera/benchmarks) and compared with the latest saved run made with
+the same options (fixture contents, model, backend, --mock-rtf, --repeat),
+or with --baseline; cases more than --threshold slower are flagged, and
+--fail-on-regression makes them fail the run.
+
+Usage:
+  python3 scripts/benchmark_pipeline.py                    # everything, mock model
+  python3 scripts/benchmark_pipeline.py -k chapters -k combine
+  python3 scripts/benchmark_pipeline.py -k transcribe --model tiny --minutes 1 5
+  python3 scripts/benchmark_pipeline.py --fail-on-regression --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+SPERA_DIR = Path(__file__).parent.parent
+TRANSCRIPTS_DIR = SPERA_DIR / "transcripts"
+RESULTS_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "spera" / "benchmarks"
+
+SAMPLE_RATE = 16000
+
+TRANSCRIPT_CASES = [
+    "generate_chapters",
+    "generate_semantic_chapters",
+    "combine_segments",
+    "generate_dart_transcript",
+    "output_json",
+    "output_srt",
+    "output_txt",
+]
+AUDIO_CASES = ["transcribe", "transcribe_vad"]
+CASES = TRANSCRIPT_CASES + AUDIO_CASES
+
+
+def load_fixture(path: Path, scale: int = 1) -> dict:
+    """
+    A transcript JSON as raw Whisper output, repeated `scale` times end to end.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    segments = []
+    offset = 0.0
+    for _ in range(scale):
+        for seg in data["segments"]:
+            segments.append({
+                "id": len(segments),
+                "start": seg["start"] + offset,
+                "end": seg["end"] + offset,
+                "text": " " + seg["text"],
+            })
+        offset = segments[-1]["end"] + 1.0 if segments else 0.0
+
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": data.get("language", "en"),
+    }
+
+
+def synthetic_audio(seconds: float, seed: int = 0):
+    """
+    Speech-like 16 kHz mono audio: 2-8 s bursts of modulated noise with a
+    pitch, separated by 0.3-3 s of near silence.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE)
+    audio = rng.normal(0.0, 0.001, n).astype(np.float32)
+    t = 0.0
+    while t < seconds:
+        length = rng.uniform(2.0, 8.0)
+        lo, hi = int(t * SAMPLE_RATE), min(n, int((t + length) * SAMPLE_RATE))
+        time_axis = np.arange(hi - lo, dtype=np.float32) / SAMPLE_RATE
+        syllables = 0.5 + 0.5 * np.sin(2 * np.pi * 4.0 * time_axis)
+        voice = np.sin(2 * np.pi * rng.uniform(100, 220) * time_axis)
+        audio[lo:hi] += (0.2 * syllables * (voice + 0.3 * rng.normal(size=hi - lo))).astype(np.float32)
+        t += length + rng.uniform(0.3, 3.0)
+    return audio
+
+
+class MockModel:
+    """
+    Stand-in for a transcribe_backends model that replays fixture segments.
+
+    Segments are tiled to cover the audio it is given, and each call sleeps
+    rtf seconds per second of audio to simulate inference speed.
+    """
+
+    def __init__(self, template: dict, rtf: float = 0.0):
+        self.template = template["segments"]
+        self.language = template["language"]
+        self.rtf = rtf
+
+    def transcribe(self, audio, language=None, **options) -> dict:
+        duration = len(audio) / SAMPLE_RATE
+        period = self.template[-1]["end"] + 1.0
+        segments = []
+        offset = 0.0
+        while offset < duration:
+            for seg in self.template:
+                if seg["start"] + offset >= duration:
+                    break
+                segments.append(dict(seg, id=len(segments), start=seg["start"] + offset,
+                                     end=min(seg["end"] + offset, duration)))
+            offset += period
+        time.sleep(duration * self.rtf)
+        return {
+            "text": "".join(seg["text"] for seg in segments),
+            "segments": segments,
+            "language": language or self.language,
+        }
+
+
+def peak_rss_mb() -> float:
+    """High-water resident set size of this process, in MB."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def prepare_transcript_case(case: str, fixtures: list, scale: int, output_dir: Path) -> tuple:
+    """Inputs of a transcript case: a function of one input, the inputs, and media seconds."""
+    import generate_transcript_dart as codegen
+    import transcribe as transcriber
+
+    codegen.merge_drops_config()
+    raws = [(path, load_fixture(path, scale)) for path in fixtures]
+    media_seconds = sum(raw["segments"][-1]["end"] for _, raw in raws if raw["segments"])
+
+    if case == "generate_chapters":
+        return transcriber.generate_chapters, [raw["segments"] for _, raw in raws], media_seconds
+    if case == "generate_semantic_chapters":
+        return transcriber.generate_semantic_chapters, [raw["segments"] for _, raw in raws], media_seconds
+    if case == "combine_segments":
+        return codegen.combine_segments, [raw["segments"] for _, raw in raws], media_seconds
+    if case == "generate_dart_transcript":
+        mapped = [(codegen.TRANSCRIPT_MAPPING[path.name], raw) for path, raw in raws
+                  if path.name in codegen.TRANSCRIPT_MAPPING]
+        inputs = []
+        for drop_id, raw in mapped:
+            info = codegen.drop_info(drop_id)
+            inputs.append((drop_id, codegen.combine_segments(raw["segments"]),
+                           info["chapters"], info["title"]))
+        media_seconds = sum(raw["segments"][-1]["end"] for _, raw in mapped if raw["segments"])
+        return (lambda args: codegen.generate_dart_transcript(*args)), inputs, media_seconds
+
+    writer = getattr(transcriber, case)
+    results = [transcriber.build_result(raw, "pauses") for _, raw in raws]
+    suffix = case.split("_", 1)[1]
+    return (lambda result: writer(result, output_dir / f"bench.{suffix}")), results, media_seconds
+
+
+def prepare_audio_case(case: str, fixtures: list, minutes: float, model_name, backend: str,
+                       mock_rtf: float) -> tuple:
+    """Inputs of a transcribe case: a function of one input, the inputs, and media seconds."""
+    import transcribe as transcriber
+
+    audio = synthetic_audio(minutes * 60)
+    if model_name:
+        model = transcriber.load_model(model_name, backend)
+    else:
+        # The longest fixture gives the most realistic segment lengths
+        longest = max(fixtures, key=lambda path: path.stat().st_size)
+        model = MockModel(load_fixture(longest), mock_rtf)
+
+    def run(samples):
+        return transcriber.transcribe("synthetic.wav", model_name or "mock", model=model,
+                                      audio=samples, vad=case == "transcribe_vad",
+                                      backend=backend)
+    return run, [audio], len(audio) / SAMPLE_RATE
+
+
+def run_case(case: str, size: float, fixtures: list, repeat: int, model_name=None,
+             backend: str = "whisper", mock_rtf: float = 0.0) -> dict:
+    """Time one case at one size (runs in its own process)."""
+    fixtures = [Path(path) for path in fixtures]
+    # Script output is not part of the measurement
+    with contextlib.redirect_stdout(io.StringIO()), \
+            tempfile.TemporaryDirectory(prefix="spera-bench-") as output_dir:
+        if case in AUDIO_CASES:
+            fn, inputs, media_seconds = prepare_audio_case(case, fixtures, size, model_name,
+                                                           backend, mock_rtf)
+        else:
+            fn, inputs, media_seconds = prepare_transcript_case(case, fixtures, int(size),
+                                                                Path(output_dir))
+        setup_rss = peak_rss_mb()
+
+        walls = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for item in inputs:
+                fn(item)
+            walls.append(time.perf_counter() - started)
+
+    return {
+        "case": case,
+        "size": size,
+        "unit": "minutes" if case in AUDIO_CASES else "x",
+        "inputs": len(inputs),
+        "media_seconds": round(media_seconds, 3),
+        "wall_min": min(walls),
+        "wall_median": statistics.median(walls),
+        "rtf": min(walls) / media_seconds if media_seconds else None,
+        "setup_rss_mb": round(setup_rss, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SPERA_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def fixtures_digest(fixtures: list) -> str:
+    """Hash of the fixtures' contents, so edited transcripts are not compared."""
+    digest = hashlib.sha256()
+    for path in fixtures:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def load_previous(results_dir: Path, options: dict, baseline=None):
+    """
+    The baseline run, or the latest saved run with the same options.
+
+    Returns None if there is none; timings under other options (another
+    model, other fixtures) are not comparable.
+    """
+    if baseline:
+        path = Path(baseline)
+        with open(path, "r", encoding="utf-8") as f:
+            run = json.load(f)
+        if run.get("options") != options:
+            print(f"⚠️  Baseline {path} was run with other options; comparing anyway")
+        run["path"] = str(path)
+        return run
+
+    for path in sorted(results_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                run = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if run.get("options") == options:
+            run["path"] = str(path)
+            return run
+    return None
+
+
+def format_size(row: dict) -> str:
+    return f"{row['size']:g} min" if row["unit"] == "minutes" else f"{row['size']:g}x"
+
+
+def print_table(rows: list, previous, threshold: float) -> list:
+    """Print results next to the previous run's; return the rows that regressed."""
+    before = {}
+    if previous:
+        before = {(row["case"], row["size"]): row for row in previous["results"]}
+        print(f"\n📊 Compared with {previous['path']} ({previous.get('commit') or 'unknown commit'})")
+
+    print(f"\n{'case':<28} {'size':>8} {'best':>10} {'median':>10} {'RTF':>10} {'peak RSS':>10}  change")
+    regressions = []
+    for row in rows:
+        change = ""
+        old = before.get((row["case"], row["size"]))
+        if old and old["wall_min"] > 0:
+            ratio = row["wall_min"] / old["wall_min"]
+            change = f"{ratio - 1:+.0%}"
+            if ratio > 1 + threshold:
+                change += " ⚠️"
+                regressions.append(row)
+        rtf = f"{row['rtf']:.2e}" if row["rtf"] is not None else "-"
+        print(f"{row['case']:<28} {format_size(row):>8} {row['wall_min'] * 1000:>8.1f}ms "
+              f"{row['wall_median'] * 1000:>8.1f}ms {rtf:>10} {row['peak_rss_mb']:>8.1f}MB  {change}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the transcription and codegen scripts")
+    parser.add_argument("-k", "--case", action="append", default=[],
+                        help="Run cases whose name contains this (repeatable; default: all)")
+    parser.add_argument("--fixtures", nargs="+",
+                        help=f"Transcript JSON fixtures (default: {TRANSCRIPTS_DIR}/*.json)")
+    parser.add_argument("--scale", nargs="+", type=int, default=[1, 4, 16],
+                        help="Times each fixture is tiled for transcript cases (default: 1 4 16)")
+    parser.add_argument("--minutes", nargs="+", type=float, default=[1, 5, 15],
+                        help="Synthetic audio lengths for transcribe cases (default: 1 5 15)")
+    parser.add_argument("--repeat", "-r", type=int, default=5,
+                        help="Timed runs per case and size (default: 5)")
+    parser.add_argument("--model", "-m", choices=["tiny", "base", "small", "medium", "large"],
+                        help="Benchmark transcribe cases with a real Whisper model (default: mock)")
+    parser.add_argument("--backend", "-b", default="whisper",
+                        help="Inference engine with --model (see transcribe.py --backend)")
+    parser.add_argument("--mock-rtf", type=float, default=0.0,
+                        help="Seconds the mock model sleeps per second of audio (default: 0)")
+    parser.add_argument("--results-dir", default=str(RESULTS_DIR),
+                        help=f"Where runs are saved (default: {RESULTS_DIR})")
+    parser.add_argument("--baseline", help="Saved run to compare with (default: the latest)")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Slowdown, as a fraction, flagged as a regression (default: 0.10)")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit with status 1 if any case regressed")
+    parser.add_argument("--no-save", action="store_true", help="Don't save this run")
+
+    args = parser.parse_args()
+
+    fixtures = [Path(path) for path in args.fixtures] if args.fixtures else sorted(TRANSCRIPTS_DIR.glob("*.json"))
+    if not fixtures:
+        parser.error(f"no fixtures in {TRANSCRIPTS_DIR}")
+    cases = [case for case in CASES if not args.case or any(k in case for k in args.case)]
+    if not cases:
+        parser.error(f"no case matches {args.case} (cases: {', '.join(CASES)})")
+
+    options = {
+        "fixtures": [path.name for path in fixtures],
+        "fixtures_sha256": fixtures_digest(fixtures),
+        "repeat": args.repeat,
+        "model": args.model or "mock",
+        "backend": args.backend,
+        "mock_rtf": args.mock_rtf,
+    }
+    results_dir = Path(args.results_dir).expanduser()
+    previous = load_previous(results_dir, options, args.baseline)
+
+    jobs = [(case, size) for case in cases
+            for size in (args.minutes if case in AUDIO_CASES else args.scale)]
+    print(f"⏱️  {len(jobs)} benchmarks over {len(fixtures)} fixtures, {args.repeat} runs each")
+
+    rows = []
+    # A fresh process per case keeps peak RSS (and imports) from leaking between cases
+    context = multiprocessing.get_context("spawn")
+    for case, size in jobs:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            future = pool.submit(run_case, case, size, [str(path) for path in fixtures], args.repeat,
+                                 args.model, args.backend, args.mock_rtf)
+            try:
+                rows.append(future.result())
+            except Exception as e:
+                print(f"❌ {case} ({size:g}): {e}")
+
+    regressions = print_table(rows, previous, args.threshold)
+
+    if not args.no_save and rows:
+        results_dir.mkdir(parents=True, exist_ok=True)
+        created = datetime.now(timezone.utc)
+        run = {
+            "created": created.isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "options": options,
+            "results": rows,
+        }
+        path = results_dir / f"{created.strftime('%Y%m%dT%H%M%SZ')}.json"
+        for n in range(2, 100):
+            if not path.exists():
+                break
+            path = results_dir / f"{created.strftime('%Y%m%dT%H%M%SZ')}-{n}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        print(f"\n💾 Saved: {path}")
+
+    if regressions:
+        print(f"\n⚠️  {len(regressions)} cases more than {args.threshold:.0%} slower than before")
+        if args.fail_on_regression:
+            sys.exit(1)
+    print("\n✨ Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Drop tables shared by the transcript scripts.
+
+TRANSCRIPT_MAPPING maps transcript JSON file names to drop IDs and
+CHAPTER_INFO gives each drop's title and chapters. Drops declared in
+drops.json (written by scripts/publish_drops.py) are merged over these
+tables by merge_drops_config(); importing this module changes nothing.
+
+Kept apart from generate_transcript_dart.py so that scripts which only need
+the mapping (search_transcripts.py) load neither numpy nor the code
+generator.
+"""
+
+import json
+from pathlib import Path
+
+SPERA_DIR = Path(__file__).parent.parent
+DROPS_CONFIG = SPERA_DIR / "drops.json"
+
+# Mapping of transcript files to drop IDs
+TRANSCRIPT_MAPPING = {
+    "Rethinking Rockets Cost 65 Million Dollars.json": "drop_001",
+    "Charlie Munger Power of Inversion Thinking.json": "drop_002",
+    "Slaying AI Inefficiency.json": "drop_003",
+    "AI Exponential Growth and Global Policy Race.json": "drop_004",
+    "Art of Effective Questions.json": "drop_007",
+    "How to Master Irreversible Life Decisions.json": "drop_009",
+    "2024 AI Index Progress & Peril.json": "drop_010",
+    "Risk Budgeting and Robust Institutional Finance.json": "drop_011",
+}
+
+# Chapter titles and approximate timestamps for each drop
+CHAPTER_INFO = {
+    "drop_001": {
+        "title": "First Principles Thinking",
+        "chapters": [
+            {"title": "The $65M Challenge", "start": 0, "desc": "Why rockets cost what they do"},
+            {"title": "Breaking Down First Principles", "start": 180, "desc": "Understanding the methodology"},
+            {"title": "The SpaceX Approach", "start": 400, "desc": "How Elon Musk applied first principles"},
+            {"title": "Applying to Your Life", "start": 600, "desc": "Using first principles in everyday decisions"},
+            {"title": "Key Takeaways", "start": 750, "desc": "Summary and action items"},
+        ]
+    },
+    "drop_002": {
+        "title": "Inversion Mental Model",
+        "chapters": [
+            {"title": "The Munger Philosophy", "start": 0, "desc": "Charlie Munger's approach to thinking"},
+            {"title": "Avoiding Stupidity", "start": 120, "desc": "Why avoiding failure beats seeking success"},
+            {"title": "Inversion in Practice", "start": 280, "desc": "Real-world applications of inversion"},
+            {"title": "Common Mistakes to Avoid", "start": 420, "desc": "What guarantees failure"},
+            {"title": "Building Better Decisions", "start": 540, "desc": "Putting it all together"},
+        ]
+    },
+    "drop_003": {
+        "title": "Second-Order Thinking",
+        "chapters": [
+            {"title": "The Problem with AI Tools", "start": 0, "desc": "Why AI often fails us"},
+            {"title": "Thinking Beyond First Effects", "start": 80, "desc": "Understanding cascading consequences"},
+            {"title": "The Efficiency Paradox", "start": 180, "desc": "When optimization backfires"},
+            {"title": "Strategic Implementation", "start": 260, "desc": "How to think ahead effectively"},
+        ]
+    },
+    "drop_004": {
+        "title": "AI Exponential Growth & Policy",
+        "chapters": [
+            {"title": "The Exponential Curve", "start": 0, "desc": "Understanding AI's growth trajectory"},
+            {"title": "Global Competition", "start": 180, "desc": "The race between nations"},
+            {"title": "Policy Responses", "start": 400, "desc": "How governments are reacting"},
+            {"title": "Career Implications", "start": 580, "desc": "What this means for you"},
+            {"title": "Looking Ahead", "start": 720, "desc": "Preparing for the future"},
+        ]
+    },
+    "drop_007": {
+        "title": "The Art of Asking Questions",
+        "chapters": [
+            {"title": "The Power of Questions", "start": 0, "desc": "Why questions matter more than answers"},
+            {"title": "The Socratic Method", "start": 90, "desc": "Ancient wisdom for modern inquiry"},
+            {"title": "Types of Powerful Questions", "start": 180, "desc": "Different questions for different purposes"},
+            {"title": "Mastering the Art", "start": 280, "desc": "Practical techniques to improve"},
+        ]
+    },
+    "drop_009": {
+        "title": "Reversible vs Irreversible Decisions",
+        "chapters": [
+            {"title": "The Bezos Framework", "start": 0, "desc": "Type 1 vs Type 2 decisions"},
+            {"title": "Identifying Decision Types", "start": 200, "desc": "How to categorize your choices"},
+            {"title": "When to Move Fast", "start": 400, "desc": "Embracing reversible decisions"},
+            {"title": "When to Slow Down", "start": 580, "desc": "Handling irreversible choices"},
+            {"title": "Decision Hygiene", "start": 720, "desc": "Building better decision habits"},
+        ]
+    },
+    "drop_010": {
+        "title": "2024 AI Index: Progress & Peril",
+        "chapters": [
+            {"title": "Introduction: The State of AI", "start": 0, "desc": "Overview of Stanford's 2024 AI Index Report"},
+            {"title": "Unprecedented Speed", "start": 67, "desc": "The explosive pace of AI development"},
+            {"title": "Multimodal AI Breakthroughs", "start": 150, "desc": "New capabilities in vision, text, and audio"},
+            {"title": "The Dark Side: Model Collapse", "start": 218, "desc": "Risks of AI training on AI-generated data"},
+            {"title": "Safety & Bias Concerns", "start": 298, "desc": "AI safety vulnerabilities and cultural biases"},
+            {"title": "Key Takeaways", "start": 390, "desc": "The dual nature of AI and our responsibility"},
+        ]
+    },
+    "drop_011": {
+        "title": "Risk Budgeting & Institutional Finance",
+        "chapters": [
+            {"title": "Introduction to Risk Budgeting", "start": 0, "desc": "What institutional investors know"},
+            {"title": "Risk vs Return", "start": 200, "desc": "Reframing the investment equation"},
+            {"title": "Portfolio Construction", "start": 400, "desc": "Building robust allocations"},
+            {"title": "Behavioral Traps", "start": 620, "desc": "Psychology of market panics"},
+            {"title": "Practical Applications", "start": 820, "desc": "Applying these principles"},
+        ]
+    },
+}
+
+
+def merge_drops_config(config_path=DROPS_CONFIG):
+    """
+    Merge drops declared in drops.json into TRANSCRIPT_MAPPING and CHAPTER_INFO.
+
+    Each entry under "drops" may give "transcript" (JSON file name in
+    transcripts/), "title" and "chapters"; entries without a transcript
+    name are skipped.
+    """
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            drops = json.load(f).get('drops', {})
+    except (OSError, ValueError):
+        return
+    
+    for drop_id, drop in drops.items():
+        if not drop.get('transcript'):
+            continue
+        TRANSCRIPT_MAPPING[drop['transcript']] = drop_id
+        CHAPTER_INFO[drop_id] = {
+            "title": drop.get('title', drop_id),
+            "chapters": drop.get('chapters', []),
+        }
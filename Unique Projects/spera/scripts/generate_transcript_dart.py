@@ -2,107 +2,72 @@
 """
 Generate Dart code for transcript_provider.dart from Whisper JSON outputs.
 Combines small segments into larger meaningful chunks and generates chapters.
+
+Each drop is written to its own file, lib/data/transcripts/<drop_id>.g.dart,
+and lib/data/transcripts/transcripts.g.dart maps drop IDs to them. Every
+generated file records a hash of its inputs (source JSON, chapter config and
+generator version); drops whose hash is unchanged are skipped, and the rest
+are generated in parallel.
+
+With --format bundle or all, each drop is also written as a compact binary
+bundle, assets/transcripts/<drop_id>.sptb, for loading on demand instead of
+compiling the transcript into the binary. The app still reads the Dart
+files, so bundles are not generated (or shipped as assets) by default:
+
+  header (52 bytes, little-endian)
+    magic "SPTB", version u16, flags u16,
+    n_segments u32, n_chapters u32, strings_len u32, source_hash[32]
+  segment_start_ms  uint32[n_segments]
+  segment_end_ms    uint32[n_segments]
+  chapter_start_ms  uint32[n_chapters]
+  chapter_end_ms    uint32[n_chapters]
+  string_offsets    uint32[n_strings + 1]
+  strings           utf-8[strings_len]
+
+Strings are, in order: drop ID, drop title, (title, description) for each
+chapter, then each segment's text. Segment IDs are <drop_id>_<n>, as in the
+generated Dart.
+
+The drop tables, TRANSCRIPT_MAPPING and CHAPTER_INFO, live in
+drop_catalog.py and are re-exported here. Drops can also be declared in
+drops.json (written by scripts/publish_drops.py) instead of editing them by
+hand; its entries are merged over the tables by merge_drops_config(), which
+main() and the scripts that read the mapping call (importing this module
+changes nothing).
+
+Usage:
+  python3 scripts/generate_transcript_dart.py            # regenerate changed drops
+  python3 scripts/generate_transcript_dart.py --force    # regenerate everything
+  python3 scripts/generate_transcript_dart.py --print    # old behaviour: print one blob
+  python3 scripts/generate_transcript_dart.py --format all      # Dart files and binary bundles
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
+import struct
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Mapping of transcript files to drop IDs
-TRANSCRIPT_MAPPING = {
-    "Rethinking Rockets Cost 65 Million Dollars.json": "drop_001",
-    "Charlie Munger Power of Inversion Thinking.json": "drop_002",
-    "Slaying AI Inefficiency.json": "drop_003",
-    "AI Exponential Growth and Global Policy Race.json": "drop_004",
-    "Art of Effective Questions.json": "drop_007",
-    "How to Master Irreversible Life Decisions.json": "drop_009",
-    "2024 AI Index Progress & Peril.json": "drop_010",
-    "Risk Budgeting and Robust Institutional Finance.json": "drop_011",
-}
-
-# Chapter titles and approximate timestamps for each drop
-CHAPTER_INFO = {
-    "drop_001": {
-        "title": "First Principles Thinking",
-        "chapters": [
-            {"title": "The $65M Challenge", "start": 0, "desc": "Why rockets cost what they do"},
-            {"title": "Breaking Down First Principles", "start": 180, "desc": "Understanding the methodology"},
-            {"title": "The SpaceX Approach", "start": 400, "desc": "How Elon Musk applied first principles"},
-            {"title": "Applying to Your Life", "start": 600, "desc": "Using first principles in everyday decisions"},
-            {"title": "Key Takeaways", "start": 750, "desc": "Summary and action items"},
-        ]
-    },
-    "drop_002": {
-        "title": "Inversion Mental Model",
-        "chapters": [
-            {"title": "The Munger Philosophy", "start": 0, "desc": "Charlie Munger's approach to thinking"},
-            {"title": "Avoiding Stupidity", "start": 120, "desc": "Why avoiding failure beats seeking success"},
-            {"title": "Inversion in Practice", "start": 280, "desc": "Real-world applications of inversion"},
-            {"title": "Common Mistakes to Avoid", "start": 420, "desc": "What guarantees failure"},
-            {"title": "Building Better Decisions", "start": 540, "desc": "Putting it all together"},
-        ]
-    },
-    "drop_003": {
-        "title": "Second-Order Thinking",
-        "chapters": [
-            {"title": "The Problem with AI Tools", "start": 0, "desc": "Why AI often fails us"},
-            {"title": "Thinking Beyond First Effects", "start": 80, "desc": "Understanding cascading consequences"},
-            {"title": "The Efficiency Paradox", "start": 180, "desc": "When optimization backfires"},
-            {"title": "Strategic Implementation", "start": 260, "desc": "How to think ahead effectively"},
-        ]
-    },
-    "drop_004": {
-        "title": "AI Exponential Growth & Policy",
-        "chapters": [
-            {"title": "The Exponential Curve", "start": 0, "desc": "Understanding AI's growth trajectory"},
-            {"title": "Global Competition", "start": 180, "desc": "The race between nations"},
-            {"title": "Policy Responses", "start": 400, "desc": "How governments are reacting"},
-            {"title": "Career Implications", "start": 580, "desc": "What this means for you"},
-            {"title": "Looking Ahead", "start": 720, "desc": "Preparing for the future"},
-        ]
-    },
-    "drop_007": {
-        "title": "The Art of Asking Questions",
-        "chapters": [
-            {"title": "The Power of Questions", "start": 0, "desc": "Why questions matter more than answers"},
-            {"title": "The Socratic Method", "start": 90, "desc": "Ancient wisdom for modern inquiry"},
-            {"title": "Types of Powerful Questions", "start": 180, "desc": "Different questions for different purposes"},
-            {"title": "Mastering the Art", "start": 280, "desc": "Practical techniques to improve"},
-        ]
-    },
-    "drop_009": {
-        "title": "Reversible vs Irreversible Decisions",
-        "chapters": [
-            {"title": "The Bezos Framework", "start": 0, "desc": "Type 1 vs Type 2 decisions"},
-            {"title": "Identifying Decision Types", "start": 200, "desc": "How to categorize your choices"},
-            {"title": "When to Move Fast", "start": 400, "desc": "Embracing reversible decisions"},
-            {"title": "When to Slow Down", "start": 580, "desc": "Handling irreversible choices"},
-            {"title": "Decision Hygiene", "start": 720, "desc": "Building better decision habits"},
-        ]
-    },
-    "drop_010": {
-        "title": "2024 AI Index: Progress & Peril",
-        "chapters": [
-            {"title": "Introduction: The State of AI", "start": 0, "desc": "Overview of Stanford's 2024 AI Index Report"},
-            {"title": "Unprecedented Speed", "start": 67, "desc": "The explosive pace of AI development"},
-            {"title": "Multimodal AI Breakthroughs", "start": 150, "desc": "New capabilities in vision, text, and audio"},
-            {"title": "The Dark Side: Model Collapse", "start": 218, "desc": "Risks of AI training on AI-generated data"},
-            {"title": "Safety & Bias Concerns", "start": 298, "desc": "AI safety vulnerabilities and cultural biases"},
-            {"title": "Key Takeaways", "start": 390, "desc": "The dual nature of AI and our responsibility"},
-        ]
-    },
-    "drop_011": {
-        "title": "Risk Budgeting & Institutional Finance",
-        "chapters": [
-            {"title": "Introduction to Risk Budgeting", "start": 0, "desc": "What institutional investors know"},
-            {"title": "Risk vs Return", "start": 200, "desc": "Reframing the investment equation"},
-            {"title": "Portfolio Construction", "start": 400, "desc": "Building robust allocations"},
-            {"title": "Behavioral Traps", "start": 620, "desc": "Psychology of market panics"},
-            {"title": "Practical Applications", "start": 820, "desc": "Applying these principles"},
-        ]
-    },
-}
+from drop_catalog import CHAPTER_INFO, TRANSCRIPT_MAPPING, merge_drops_config
+
+SPERA_DIR = Path(__file__).parent.parent
+TRANSCRIPTS_DIR = SPERA_DIR / "transcripts"
+GENERATED_DIR = SPERA_DIR / "lib" / "data" / "transcripts"
+BUNDLE_DIR = SPERA_DIR / "assets" / "transcripts"
+INDEX_FILE = "transcripts.g.dart"
+
+BUNDLE_MAGIC = b"SPTB"
+BUNDLE_VERSION = 1
+BUNDLE_HEADER = struct.Struct("<4sHHIII32s")
+
+# Bump when the generated Dart changes shape, to invalidate every drop
+GENERATOR_VERSION = 1
+
+GENERATED_HEADER = "// GENERATED CODE - DO NOT MODIFY BY HAND"
+SOURCE_HASH_PREFIX = "// source-hash: "
 
 
 def combine_segments(segments, target_duration=15):
@@ -147,10 +112,10 @@ def escape_dart_string(s):
     return s.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n").replace("$", "\\$")
 
 
-def generate_dart_transcript(drop_id, segments, chapters):
+def generate_dart_transcript(drop_id, segments, chapters, title):
     """Generate Dart code for a single transcript."""
     lines = []
-    lines.append(f"  // {CHAPTER_INFO[drop_id]['title']} - {drop_id}")
+    lines.append(f"  // {title} - {drop_id}")
     lines.append(f"  '{drop_id}': Transcript(")
     lines.append("    chapters: const [")
     
@@ -182,25 +147,211 @@ def generate_dart_transcript(drop_id, segments, chapters):
     return "\n".join(lines)
 
 
-def main():
-    transcripts_dir = Path(__file__).parent.parent / "transcripts"
+def dart_identifier(drop_id):
+    """Top-level Dart constant name for a drop, e.g. drop_001 -> drop001Transcript."""
+    parts = re.split(r"[^0-9A-Za-z]+", drop_id)
+    return parts[0] + "".join(part[:1].upper() + part[1:] for part in parts[1:]) + "Transcript"
+
+
+def dart_string_field(name, value, indent):
+    """A string named argument, wrapped the way dart format does past 80 columns."""
+    line = f"{indent}{name}: '{escape_dart_string(value)}',"
+    if len(line) <= 80:
+        return [line]
+    return [f"{indent}{name}:", f"{indent}    '{escape_dart_string(value)}',"]
+
+
+def source_hash(filepath, drop_id):
+    """Hash of everything a drop's generated file depends on."""
+    digest = hashlib.sha256()
+    digest.update(f"{GENERATOR_VERSION}\n".encode())
+    digest.update(json.dumps(CHAPTER_INFO.get(drop_id, {}), sort_keys=True).encode())
+    with open(filepath, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def generated_hash(output_path):
+    """Source hash recorded in an existing generated file, if any."""
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            for _ in range(5):
+                line = f.readline()
+                if line.startswith(SOURCE_HASH_PREFIX):
+                    return line[len(SOURCE_HASH_PREFIX):].strip()
+    except OSError:
+        pass
+    return None
+
+
+def generate_dart_file(drop_id, title, segments, chapters, source_name, digest):
+    """Generate a standalone Dart library holding one drop's transcript."""
+    lines = [
+        GENERATED_HEADER,
+        f"// Generated by scripts/generate_transcript_dart.py from transcripts/{source_name}",
+        f"{SOURCE_HASH_PREFIX}{digest}",
+        "",
+        "import '../models/transcript.dart';",
+        "",
+        f"/// {title} - {drop_id}",
+        f"const {dart_identifier(drop_id)} = Transcript(",
+        "  chapters: [",
+    ]
+    
+    for ch, end_time in zip(chapters, chapter_end_times(chapters, segments)):
+        lines.append("    AudioChapter(")
+        lines.extend(dart_string_field("title", ch['title'], "      "))
+        lines.extend(dart_string_field("description", ch['desc'], "      "))
+        lines.append(f"      startTime: {ch['start']},")
+        lines.append(f"      endTime: {int(end_time)},")
+        lines.append("    ),")
+    
+    lines.append("  ],")
+    lines.append("  segments: [")
+    
+    for i, seg in enumerate(segments):
+        lines.append("    TranscriptSegment(")
+        lines.append(f"      id: '{drop_id}_{i+1}',")
+        lines.extend(dart_string_field("text", seg['text'], "      "))
+        lines.append(f"      startTime: {seg['start']},")
+        lines.append(f"      endTime: {seg['end']},")
+        lines.append("    ),")
+    
+    lines.append("  ],")
+    lines.append(");")
+    
+    return "\n".join(lines) + "\n"
+
+
+def chapter_end_times(chapters, segments):
+    """End of each chapter: the next chapter's start, or the end of the audio."""
+    return [
+        chapters[i + 1]['start'] if i + 1 < len(chapters) else segments[-1]['end']
+        for i in range(len(chapters))
+    ]
+
+
+def generate_bundle(drop_id, title, segments, chapters, digest):
+    """Encode one drop as a binary transcript bundle (see module docstring)."""
+    def millis(values):
+        return struct.pack(f"<{len(values)}I", *(int(round(v * 1000)) for v in values))
+    
+    strings = [drop_id, title]
+    for ch in chapters:
+        strings.extend([ch['title'], ch['desc']])
+    strings.extend(seg['text'] for seg in segments)
+    
+    encoded = [string.encode('utf-8') for string in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    
+    chapter_ends = [int(end) for end in chapter_end_times(chapters, segments)]
+    
+    return b"".join([
+        BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0, len(segments), len(chapters),
+                           offsets[-1], bytes.fromhex(digest)),
+        millis([seg['start'] for seg in segments]),
+        millis([seg['end'] for seg in segments]),
+        millis([ch['start'] for ch in chapters]),
+        millis(chapter_ends),
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        b"".join(encoded),
+    ])
+
+
+def bundle_hash(bundle_path):
+    """Source hash recorded in an existing bundle's header, if any."""
+    try:
+        with open(bundle_path, 'rb') as f:
+            header = f.read(BUNDLE_HEADER.size)
+        magic, version, _, _, _, _, digest = BUNDLE_HEADER.unpack(header)
+    except (OSError, struct.error):
+        return None
+    if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+        return None
+    return digest.hex()
+
+
+def generate_index_file(drop_ids):
+    """Generate the library that maps drop IDs to their generated transcripts."""
+    lines = [
+        GENERATED_HEADER,
+        "// Generated by scripts/generate_transcript_dart.py",
+        "",
+        "import '../models/transcript.dart';",
+    ]
+    lines.extend(f"import '{drop_id}.g.dart';" for drop_id in drop_ids)
+    lines.append("")
+    lines.append("/// Transcripts generated from transcripts/*.json, by drop ID")
+    lines.append("const Map<String, Transcript> generatedTranscripts = {")
+    lines.extend(f"  '{drop_id}': {dart_identifier(drop_id)}," for drop_id in drop_ids)
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def write_if_changed(path, content):
+    """Write a file only when its content differs, so untouched drops keep their mtime."""
+    mode = 'b' if isinstance(content, bytes) else ''
+    encoding = None if mode else 'utf-8'
+    try:
+        with open(path, 'r' + mode, encoding=encoding) as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w' + mode, encoding=encoding) as f:
+        f.write(content)
+    return True
+
+
+def drop_info(drop_id):
+    """A drop's title and chapters from CHAPTER_INFO (after merge_drops_config())."""
+    info = CHAPTER_INFO.get(drop_id, {})
+    return {"title": info.get('title', drop_id), "chapters": info.get('chapters', [])}
+
+
+def load_drop(filepath):
+    """Read one transcript JSON and return its combined segments."""
+    with open(filepath, 'r') as f:
+        data = json.load(f)
+    return combine_segments(data.get('segments', []))
+
+
+def build_drop(filepath, drop_id, info, digest, output_dir, bundle_dir):
+    """
+    Generate and write one drop's Dart file and/or bundle (runs in a worker process).
     
+    Everything the drop depends on is passed in, info being its drop_info(),
+    because a spawned worker only has the built-in tables, not drops.json.
+    """
+    filepath = Path(filepath)
+    combined = load_drop(filepath)
+    chapters = info['chapters']
+    if output_dir:
+        dart_code = generate_dart_file(drop_id, info['title'], combined, chapters, filepath.name, digest)
+        write_if_changed(Path(output_dir) / f"{drop_id}.g.dart", dart_code)
+    if bundle_dir:
+        bundle = generate_bundle(drop_id, info['title'], combined, chapters, digest)
+        write_if_changed(Path(bundle_dir) / f"{drop_id}.sptb", bundle)
+    return drop_id, len(combined), len(chapters)
+
+
+def print_blob():
+    """Print every transcript as one map-literal blob (the original workflow)."""
     all_dart_code = []
     
     for filename, drop_id in TRANSCRIPT_MAPPING.items():
-        filepath = transcripts_dir / filename
+        filepath = TRANSCRIPTS_DIR / filename
         if not filepath.exists():
             print(f"Warning: {filename} not found")
             continue
         
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        combined = load_drop(filepath)
+        info = drop_info(drop_id)
+        chapters = info['chapters']
         
-        segments = data.get('segments', [])
-        combined = combine_segments(segments)
-        chapters = CHAPTER_INFO.get(drop_id, {}).get('chapters', [])
-        
-        dart_code = generate_dart_transcript(drop_id, combined, chapters)
+        dart_code = generate_dart_transcript(drop_id, combined, chapters, info['title'])
         all_dart_code.append(dart_code)
         
         print(f"✅ {drop_id}: {len(combined)} segments, {len(chapters)} chapters")
@@ -212,5 +363,108 @@ def main():
     print("\n".join(all_dart_code))
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Generate Dart transcripts from Whisper JSON")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="Regenerate every drop, even if unchanged")
+    parser.add_argument("--print", "-p", action="store_true", dest="print_blob",
+                        help="Print one Dart blob to stdout instead of writing files")
+    parser.add_argument("--output-dir", "-d", default=str(GENERATED_DIR),
+                        help=f"Directory for generated Dart files (default: {GENERATED_DIR})")
+    parser.add_argument("--bundle-dir", "-b", default=str(BUNDLE_DIR),
+                        help=f"Directory for binary transcript bundles (default: {BUNDLE_DIR})")
+    parser.add_argument("--format", choices=["dart", "bundle", "all"], default="dart",
+                        help="Generate Dart sources, binary bundles or both (default: dart)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count(),
+                        help="Parallel worker processes (default: CPU count)")
+    
+    args = parser.parse_args()
+    
+    merge_drops_config()
+    
+    if args.print_blob:
+        print_blob()
+        return
+    
+    output_dir = Path(args.output_dir) if args.format in ["dart", "all"] else None
+    bundle_dir = Path(args.bundle_dir) if args.format in ["bundle", "all"] else None
+    generate_all(output_dir, bundle_dir, args.force, args.jobs)
+
+
+def generate_all(output_dir=GENERATED_DIR, bundle_dir=None, force=False, jobs=os.cpu_count()):
+    """
+    Regenerate the Dart files and/or bundles of every mapped drop whose inputs changed.
+    
+    Args:
+        output_dir: Directory for generated Dart files (None to skip Dart)
+        bundle_dir: Directory for binary bundles (None to skip bundles)
+        force: Regenerate every drop, even if unchanged
+        jobs: Parallel worker processes
+    
+    Returns:
+        List of (drop_id, n_segments, n_chapters) for regenerated drops
+    """
+    for directory in (output_dir, bundle_dir):
+        if directory:
+            directory.mkdir(parents=True, exist_ok=True)
+    
+    drop_ids = []
+    stale = []
+    missing = 0
+    for filename, drop_id in TRANSCRIPT_MAPPING.items():
+        filepath = TRANSCRIPTS_DIR / filename
+        if not filepath.exists():
+            # Keep what was generated before (and its index entry) rather than drop shipped data
+            print(f"Warning: {filename} not found, keeping {drop_id}'s existing files")
+            missing += 1
+            if output_dir and (output_dir / f"{drop_id}.g.dart").exists():
+                drop_ids.append(drop_id)
+            continue
+        
+        drop_ids.append(drop_id)
+        digest = source_hash(filepath, drop_id)
+        up_to_date = (
+            (not output_dir or generated_hash(output_dir / f"{drop_id}.g.dart") == digest) and
+            (not bundle_dir or bundle_hash(bundle_dir / f"{drop_id}.sptb") == digest)
+        )
+        if force or not up_to_date:
+            stale.append((str(filepath), drop_id, drop_info(drop_id), digest))
+        else:
+            print(f"⏭️  {drop_id}: up to date")
+    
+    # A pool only pays off when several drops need regenerating
+    if len(stale) > 1 and jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(stale))) as pool:
+            futures = [pool.submit(build_drop, *job, output_dir and str(output_dir),
+                                   bundle_dir and str(bundle_dir)) for job in stale]
+            results = [future.result() for future in futures]
+    else:
+        results = [build_drop(*job, output_dir and str(output_dir), bundle_dir and str(bundle_dir))
+                   for job in stale]
+    
+    for drop_id, n_segments, n_chapters in results:
+        print(f"✅ {drop_id}: {n_segments} segments, {n_chapters} chapters")
+    
+    # Remove files this script generated for drops that are no longer mapped
+    mapped = set(TRANSCRIPT_MAPPING.values())
+    for directory, suffix, recorded_hash in ((output_dir, ".g.dart", generated_hash),
+                                             (bundle_dir, ".sptb", bundle_hash)):
+        if not directory:
+            continue
+        for path in directory.glob(f"*{suffix}"):
+            if (path.name != INDEX_FILE and path.name[:-len(suffix)] not in mapped
+                    and recorded_hash(path) is not None):
+                path.unlink()
+                print(f"🗑️  Removed {path.name}")
+    
+    if output_dir and write_if_changed(output_dir / INDEX_FILE, generate_index_file(drop_ids)):
+        print(f"✅ {INDEX_FILE}: {len(drop_ids)} drops")
+    
+    destinations = " and ".join(str(d) for d in (output_dir, bundle_dir) if d)
+    unchanged = len(TRANSCRIPT_MAPPING) - missing - len(results)
+    print(f"\n✨ {len(results)} regenerated, {unchanged} unchanged, {missing} missing → {destinations}")
+    return results
+
+
 if __name__ == "__main__":
     main()
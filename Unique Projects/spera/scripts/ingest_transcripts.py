@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Load transcript segments into the Supabase `transcripts` table.
+
+Every mapped drop in generate_transcript_dart.py (including drops.json) has
+its transcripts/*.json segments combined the same way as the generated Dart
+and written in one transaction per drop. Rows get deterministic IDs,
+<drop_id>_<n>, matching the segment IDs in the Dart files, so re-running is
+idempotent:
+
+  replace (default)   delete the drop's rows, then COPY the new ones in
+  --changed-only      COPY into a temporary table, upsert only the rows
+                      whose text or times differ, and delete the rows
+                      that are gone; unchanged rows are not rewritten
+
+Either way a drop costs a handful of round trips however many segments it
+has. Requires psycopg 3 (pip3 install "psycopg[binary]") and a Postgres
+connection string in SUPABASE_DB_URL or --database-url (Supabase: Settings
+→ Database → Connection string), so it works the same against a local
+Postgres with supabase/migrations applied.
+
+Usage:
+  python3 scripts/ingest_transcripts.py                        # every mapped drop
+  python3 scripts/ingest_transcripts.py drop_001 drop_004 --changed-only
+  python3 scripts/ingest_transcripts.py --file out/talk.json --id drop_012
+  python3 scripts/ingest_transcripts.py --raw --dry-run        # Whisper segments, no writes
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import generate_transcript_dart as codegen
+
+DATABASE_URL = os.environ.get("SUPABASE_DB_URL", "")
+
+COPY_SQL = "COPY {table} (id, drop_id, text, start_time, end_time) FROM STDIN"
+
+UPSERT_CHANGED_SQL = """
+INSERT INTO transcripts (id, drop_id, text, start_time, end_time)
+SELECT id, drop_id, text, start_time, end_time FROM transcripts_incoming
+ON CONFLICT (id) DO UPDATE SET
+    drop_id = EXCLUDED.drop_id,
+    text = EXCLUDED.text,
+    start_time = EXCLUDED.start_time,
+    end_time = EXCLUDED.end_time
+WHERE (transcripts.drop_id, transcripts.text, transcripts.start_time, transcripts.end_time)
+    IS DISTINCT FROM (EXCLUDED.drop_id, EXCLUDED.text, EXCLUDED.start_time, EXCLUDED.end_time)
+RETURNING (xmax = 0) AS inserted
+"""
+
+DELETE_MISSING_SQL = """
+DELETE FROM transcripts AS t
+WHERE t.drop_id = %s
+  AND NOT EXISTS (SELECT 1 FROM transcripts_incoming AS i WHERE i.id = t.id)
+"""
+
+
+class IngestError(Exception):
+    """The database can't be reached or psycopg is missing."""
+
+
+def segment_rows(drop_id: str, segments: list) -> list:
+    """Table rows for a drop's segments, with IDs as in the generated Dart."""
+    return [
+        (f"{drop_id}_{i}", drop_id, seg["text"].strip(), round(seg["start"], 3), round(seg["end"], 3))
+        for i, seg in enumerate(segments, 1)
+    ]
+
+
+def read_segments(json_path: Path, raw: bool = False) -> list:
+    """Segments of a transcript JSON (or transcribe() output), combined unless raw."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        segments = json.load(f).get("segments", [])
+    return segments if raw else codegen.combine_segments(segments)
+
+
+def connect(database_url: str):
+    """Open an autocommit connection, so each drop's transaction is explicit."""
+    if importlib.util.find_spec("psycopg") is None:
+        raise IngestError('psycopg not installed. Run: pip3 install "psycopg[binary]"')
+    if not database_url:
+        raise IngestError("No database URL. Set SUPABASE_DB_URL or pass --database-url")
+    import psycopg
+
+    try:
+        return psycopg.connect(database_url, autocommit=True)
+    except psycopg.OperationalError as e:
+        raise IngestError(f"Could not connect: {e}") from e
+
+
+def copy_rows(cursor, table: str, rows: list):
+    with cursor.copy(COPY_SQL.format(table=table)) as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
+def replace_drop(conn, drop_id: str, rows: list) -> dict:
+    """Replace all of a drop's rows in one transaction."""
+    with conn.transaction(), conn.cursor() as cursor:
+        cursor.execute("DELETE FROM transcripts WHERE drop_id = %s", (drop_id,))
+        deleted = cursor.rowcount
+        copy_rows(cursor, "transcripts", rows)
+    return {"inserted": len(rows), "updated": 0, "deleted": deleted, "unchanged": 0}
+
+
+def sync_drop(conn, drop_id: str, rows: list) -> dict:
+    """Write only the rows of a drop that changed, in one transaction."""
+    with conn.transaction(), conn.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE transcripts_incoming "
+            "(LIKE transcripts INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        copy_rows(cursor, "transcripts_incoming", rows)
+        cursor.execute(UPSERT_CHANGED_SQL)
+        written = [inserted for (inserted,) in cursor.fetchall()]
+        cursor.execute(DELETE_MISSING_SQL, (drop_id,))
+        deleted = cursor.rowcount
+    inserted = sum(written)
+    updated = len(written) - inserted
+    return {"inserted": inserted, "updated": updated, "deleted": deleted,
+            "unchanged": len(rows) - len(written)}
+
+
+def ingest_segments(conn, drop_id: str, segments: list, changed_only: bool = False) -> dict:
+    """
+    Write one drop's segments to the transcripts table.
+
+    Args:
+        conn: Connection from connect()
+        drop_id: knowledge_drops ID the rows belong to
+        segments: Segments with start/end/text (combined or raw)
+        changed_only: Upsert changed rows instead of replacing them all
+
+    Returns:
+        Counts of inserted, updated, deleted and unchanged rows
+    """
+    rows = segment_rows(drop_id, segments)
+    return (sync_drop if changed_only else replace_drop)(conn, drop_id, rows)
+
+
+def describe(counts: dict) -> str:
+    return ", ".join(f"{value} {key}" for key, value in counts.items() if value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load transcript segments into the Supabase transcripts table")
+    parser.add_argument("drops", nargs="*", help="Drop IDs to ingest (default: every mapped drop)")
+    parser.add_argument("--file", help="Ingest this transcript JSON (requires --id)")
+    parser.add_argument("--id", dest="drop_id", help="Drop ID for --file")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="Only rewrite segments that changed (default: replace each drop's rows)")
+    parser.add_argument("--raw", action="store_true",
+                        help="Store Whisper's segments as-is instead of the combined ones the app shows")
+    parser.add_argument("--database-url", default=DATABASE_URL,
+                        help="Postgres connection string (default: $SUPABASE_DB_URL)")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be written")
+
+    args = parser.parse_args()
+
+    codegen.merge_drops_config()
+    if args.file:
+        if not args.drop_id:
+            parser.error("--file requires --id")
+        sources = [(args.drop_id, Path(args.file))]
+    else:
+        mapping = {drop_id: codegen.TRANSCRIPTS_DIR / filename
+                   for filename, drop_id in codegen.TRANSCRIPT_MAPPING.items()}
+        unknown = [drop_id for drop_id in args.drops if drop_id not in mapping]
+        if unknown:
+            parser.error(f"no transcript mapped for: {', '.join(unknown)}")
+        sources = [(drop_id, mapping[drop_id]) for drop_id in args.drops or mapping]
+
+    conn = None
+    if not args.dry_run:
+        try:
+            conn = connect(args.database_url)
+        except IngestError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+    mode = "changed segments" if args.changed_only else "replace"
+    print(f"🗄️  Ingesting {len(sources)} transcripts ({mode})")
+    started = time.perf_counter()
+    failed = []
+    total = 0
+    try:
+        for drop_id, json_path in sources:
+            try:
+                segments = read_segments(json_path, args.raw)
+            except (OSError, ValueError) as e:
+                print(f"❌ {drop_id}: {e}")
+                failed.append(drop_id)
+                continue
+            total += len(segments)
+            if args.dry_run:
+                print(f"📝 {drop_id}: {len(segments)} segments from {json_path.name}")
+                continue
+            try:
+                counts = ingest_segments(conn, drop_id, segments, args.changed_only)
+            except Exception as e:
+                # The drop's transaction was rolled back; carry on with the rest
+                print(f"❌ {drop_id}: {e}")
+                failed.append(drop_id)
+                continue
+            print(f"✅ {drop_id}: {describe(counts) or 'no segments'}")
+    finally:
+        if conn is not None:
+            conn.close()
+
+    print(f"\n✨ {len(sources) - len(failed)}/{len(sources)} drops, {total} segments "
+          f"in {time.perf_counter() - started:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Confidence-driven model cascade for Whisper transcripts.
+
+A small draft model transcribes the whole file; its segments are scored with
+the statistics Whisper reports for each one, and only the weak ones are
+transcribed again by the larger model. A segment is weak when
+
+  avg_logprob < -0.8         the decoder was unsure of its tokens
+  compression_ratio > 2.4    repetitive text, Whisper's looping failure
+  no_speech_prob > 0.6       text decoded where the model heard no speech
+
+(the last two are Whisper's own fallback thresholds; the log-probability
+one is stricter than its -1.0 because here a retry is cheap). Weak segments
+closer than merge_gap are merged into regions, each re-decoded with padding
+seconds of context on both sides. Splicing keeps a segment by midpoint, as
+transcribe_chunked() does for its overlaps: inside a region only the larger
+model's segments survive, outside it only the draft's.
+
+On clean narration most segments pass, so a file costs about one draft pass
+plus a few seconds of the larger model.
+
+Usage:
+  draft = small.transcribe(audio)
+  regions = weak_regions(draft["segments"], len(audio) / SAMPLE_RATE)
+  redone = [large.transcribe(audio[int(s * SAMPLE_RATE):int(e * SAMPLE_RATE)]) ...]
+  result = splice(draft, regions, redone)
+"""
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+LOGPROB_THRESHOLD = -0.8
+COMPRESSION_RATIO_THRESHOLD = 2.4
+NO_SPEECH_THRESHOLD = 0.6
+
+# Above this share of weak audio, one pass of the larger model is cheaper
+MAX_ESCALATED_SHARE = 0.5
+
+
+def weak_segments(segments: list, logprob_threshold: float = LOGPROB_THRESHOLD) -> np.ndarray:
+    """Boolean mask of the segments to re-transcribe."""
+    if not segments:
+        return np.zeros(0, dtype=bool)
+    logprob = np.array([seg.get("avg_logprob", 0.0) for seg in segments])
+    compression = np.array([seg.get("compression_ratio", 0.0) for seg in segments])
+    no_speech = np.array([seg.get("no_speech_prob", 0.0) for seg in segments])
+    has_text = np.array([bool(seg["text"].strip()) for seg in segments])
+    return ((logprob < logprob_threshold)
+            | (compression > COMPRESSION_RATIO_THRESHOLD)
+            | ((no_speech > NO_SPEECH_THRESHOLD) & has_text))
+
+
+def weak_regions(segments: list, duration: float, merge_gap: float = 2.0,
+                 logprob_threshold: float = LOGPROB_THRESHOLD) -> np.ndarray:
+    """
+    (n, 2) array of regions, in seconds, covering the weak segments.
+
+    Weak segments separated by less than merge_gap seconds share a region.
+    """
+    weak = weak_segments(segments, logprob_threshold)
+    if not weak.any():
+        return np.zeros((0, 2))
+    starts = np.array([seg["start"] for seg in segments])[weak]
+    ends = np.array([seg["end"] for seg in segments])[weak]
+    # Running maximum, so a long segment swallowing the next one keeps its end
+    ends = np.maximum.accumulate(ends)
+    new_region = np.concatenate(([True], starts[1:] - ends[:-1] >= merge_gap))
+    first = np.flatnonzero(new_region)
+    last = np.concatenate((first[1:] - 1, [len(starts) - 1]))
+    return np.clip(np.stack((starts[first], ends[last]), axis=1), 0.0, duration)
+
+
+def context_window(region, duration: float, padding: float = 1.0) -> tuple:
+    """Audio span, in seconds, to re-decode for a region."""
+    start, end = (float(t) for t in region)
+    return max(0.0, start - padding), min(duration, end + padding)
+
+
+def splice(draft: dict, regions: np.ndarray, redone: list) -> dict:
+    """
+    Replace the draft segments inside each region with the re-decoded ones.
+
+    Args:
+        draft: Result of the draft model (model.transcribe() shape)
+        regions: Regions from weak_regions()
+        redone: One result per region, timestamps already on the file's
+                timeline
+
+    Returns:
+        Dict shaped like model.transcribe() output, segments renumbered
+    """
+    def owner(seg) -> int:
+        # Index of the region holding the segment's midpoint, or -1
+        midpoint = (seg["start"] + seg["end"]) / 2
+        i = int(np.searchsorted(regions[:, 1], midpoint, side="right"))
+        return i if i < len(regions) and regions[i, 0] <= midpoint else -1
+
+    kept = [seg for seg in draft["segments"] if owner(seg) < 0]
+    for i, result in enumerate(redone):
+        kept.extend(seg for seg in result["segments"] if owner(seg) == i)
+    segments = sorted(kept, key=lambda seg: seg["start"])
+    for i, seg in enumerate(segments):
+        seg["id"] = i
+
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": draft.get("language"),
+    }
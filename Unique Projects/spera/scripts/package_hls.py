@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Package a drop's media as HLS with a small bitrate ladder.
+
+Each rendition is transcoded by its own ffmpeg process, up to --workers at
+a time, and cut into MPEG-TS fragments of about --segment seconds. Every chapter start is
+also a cut, and for video a forced keyframe, so jumping to a chapter only
+fetches fragments from that chapter on. Output layout:
+
+  <output>/master.m3u8              one EXT-X-STREAM-INF per rendition
+  <output>/<rendition>/index.m3u8   media playlist
+  <output>/<rendition>/00001.ts     fragments
+
+  audio   64k and 128k AAC
+  video   360p and 720p H.264 (never above the source height), with AAC
+          when the source has audio
+
+BANDWIDTH in the master playlist is measured from the fragments written, and
+CODECS lists only the streams the source actually has.
+upload_media.py --hls and publish_drops.py --hls call this before
+uploading the tree.
+
+Usage:
+  python3 scripts/package_hls.py talk.mp4 out/hls --chapters transcripts/talk.json
+  python3 scripts/package_hls.py talk.m4a out/hls --segment 4
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_SEGMENT_SECONDS = 6.0
+MASTER_PLAYLIST = "master.m3u8"
+MEDIA_PLAYLIST = "index.m3u8"
+
+# Bump when the ladder or encoder settings change, to repackage every drop
+PACKAGER_VERSION = 2
+
+# height is None for audio-only renditions; bitrates in kbit/s
+Rendition = namedtuple("Rendition", ["name", "height", "video_kbps", "audio_kbps"])
+
+AUDIO_LADDER = [
+    Rendition("audio_64k", None, 0, 64),
+    Rendition("audio_128k", None, 0, 128),
+]
+VIDEO_LADDER = [
+    Rendition("360p", 360, 800, 96),
+    Rendition("720p", 720, 2500, 128),
+]
+
+# H.264 Main@3.1 and AAC-LC, matching the encoder settings below
+VIDEO_CODEC = "avc1.4d401f"
+AUDIO_CODEC = "mp4a.40.2"
+
+
+class PackagingError(RuntimeError):
+    """ffmpeg/ffprobe is missing or failed."""
+
+
+def run_tool(cmd: list) -> str:
+    try:
+        return subprocess.run(cmd, capture_output=True, check=True, text=True).stdout
+    except FileNotFoundError:
+        raise PackagingError(f"{cmd[0]} not found. Install ffmpeg (e.g. brew install ffmpeg)")
+    except subprocess.CalledProcessError as e:
+        raise PackagingError(f"{cmd[0]} failed: {e.stderr.strip()[-500:]}") from e
+
+
+def probe(media_path: Path) -> dict:
+    """
+    Duration in seconds, video size (None for audio-only media) and whether
+    there is an audio stream.
+    """
+    out = run_tool(["ffprobe", "-v", "error", "-print_format", "json",
+                    "-show_format", "-show_streams", str(media_path)])
+    info = json.loads(out)
+    streams = info.get("streams", [])
+    video = [s for s in streams
+             if s.get("codec_type") == "video" and not s.get("disposition", {}).get("attached_pic")]
+    has_audio = any(s.get("codec_type") == "audio" for s in streams)
+    if not video and not has_audio:
+        raise PackagingError(f"{media_path} has no audio or video stream")
+    return {
+        "duration": float(info["format"]["duration"]),
+        "height": int(video[0]["height"]) if video else None,
+        "width": int(video[0]["width"]) if video else None,
+        "has_audio": has_audio,
+    }
+
+
+def ladder_for(height) -> list:
+    """Renditions for a source: audio-only, or the video rungs it can fill."""
+    if height is None:
+        return AUDIO_LADDER
+    rungs = [r for r in VIDEO_LADDER if r.height <= height]
+    # A source below the lowest rung still gets one rendition at its own size
+    even = height - height % 2
+    return rungs or [VIDEO_LADDER[0]._replace(name=f"{even}p", height=even)]
+
+
+def cut_times(duration: float, chapter_starts: list,
+              segment_seconds: float = DEFAULT_SEGMENT_SECONDS) -> list:
+    """
+    Fragment boundaries: every chapter start, then every segment_seconds
+    within each chapter. A chapter's last fragment is merged into the one
+    before it when it would be shorter than half a segment.
+    """
+    starts = sorted({0.0, *(float(s) for s in chapter_starts if 0 < s < duration)})
+    cuts = []
+    for start, end in zip(starts, starts[1:] + [duration]):
+        if start > 0:
+            cuts.append(start)
+        t = start + segment_seconds
+        while t < end - segment_seconds / 2:
+            cuts.append(t)
+            t += segment_seconds
+    return [round(t, 3) for t in cuts]
+
+
+def transcode_cmd(media_path: Path, rendition: Rendition, cuts: list, output_dir: Path,
+                  segment_seconds: float) -> list:
+    """ffmpeg command writing one rendition's fragments and media playlist."""
+    times = ",".join(f"{t:g}" for t in cuts)
+    cmd = ["ffmpeg", "-nostdin", "-v", "error", "-y", "-i", str(media_path)]
+    if rendition.height:
+        kbps = rendition.video_kbps
+        cmd += ["-map", "0:v:0", "-c:v", "libx264", "-preset", "veryfast",
+                "-profile:v", "main", "-level", "3.1", "-pix_fmt", "yuv420p",
+                "-vf", f"scale=-2:{rendition.height}",
+                "-b:v", f"{kbps}k", "-maxrate", f"{int(kbps * 1.07)}k", "-bufsize", f"{int(kbps * 1.5)}k",
+                # Keyframes at every cut, so each fragment (and chapter) starts on one
+                "-sc_threshold", "0",
+                "-force_key_frames", times or f"expr:gte(t,n_forced*{segment_seconds:g})"]
+    cmd += ["-map", "0:a:0?", "-c:a", "aac", "-b:a", f"{rendition.audio_kbps}k", "-ac", "2",
+            "-f", "segment", "-segment_format", "mpegts",
+            "-segment_list", str(output_dir / MEDIA_PLAYLIST), "-segment_list_type", "m3u8"]
+    if times:
+        cmd += ["-segment_times", times]
+    else:
+        cmd += ["-segment_time", f"{segment_seconds:g}"]
+    cmd.append(str(output_dir / "%05d.ts"))
+    return cmd
+
+
+def measure_bandwidth(rendition_dir: Path) -> tuple:
+    """Peak and average bits per second over a rendition's fragments."""
+    peak = total_bits = total_seconds = 0.0
+    duration = None
+    with open(rendition_dir / MEDIA_PLAYLIST, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("#EXTINF:"):
+                duration = float(line[len("#EXTINF:"):].split(",")[0])
+            elif line and not line.startswith("#") and duration:
+                bits = (rendition_dir / line).stat().st_size * 8
+                peak = max(peak, bits / duration)
+                total_bits += bits
+                total_seconds += duration
+                duration = None
+    return int(peak), int(total_bits / total_seconds) if total_seconds else 0
+
+
+def master_playlist(renditions: list, bandwidths: dict, width, height, has_audio: bool = True) -> str:
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3", "#EXT-X-INDEPENDENT-SEGMENTS"]
+    for rendition in renditions:
+        peak, average = bandwidths[rendition.name]
+        attributes = [f"BANDWIDTH={peak}", f"AVERAGE-BANDWIDTH={average}"]
+        # Players skip variants advertising a codec whose stream is missing
+        codecs = [VIDEO_CODEC] if rendition.height else []
+        if has_audio:
+            codecs.append(AUDIO_CODEC)
+        if rendition.height:
+            scaled_width = round(width * rendition.height / height / 2) * 2
+            attributes.append(f"RESOLUTION={scaled_width}x{rendition.height}")
+        attributes.append(f'CODECS="{",".join(codecs)}"')
+        lines.append(f"#EXT-X-STREAM-INF:{','.join(attributes)}")
+        lines.append(f"{rendition.name}/{MEDIA_PLAYLIST}")
+    return "\n".join(lines) + "\n"
+
+
+def package_hls(media_path, output_dir, chapter_starts=(),
+                segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+                workers: int = os.cpu_count() or 1) -> Path:
+    """
+    Transcode media into an HLS ladder with fragments cut at chapter starts.
+
+    Args:
+        media_path: Source audio or video file
+        output_dir: Directory for the HLS tree (replaced if it exists)
+        chapter_starts: Chapter start times in seconds
+        segment_seconds: Target fragment length
+        workers: Renditions transcoded at once
+
+    Returns:
+        Path of the master playlist
+    """
+    media_path, output_dir = Path(media_path), Path(output_dir)
+    info = probe(media_path)
+    renditions = ladder_for(info["height"])
+    cuts = cut_times(info["duration"], list(chapter_starts), segment_seconds)
+
+    # Build next to the old tree and swap it in, so a failure leaves it intact
+    staging = output_dir.with_name(output_dir.name + ".tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    for rendition in renditions:
+        (staging / rendition.name).mkdir(parents=True)
+
+    kind = f"{info['height']}p video" if info["height"] else "audio"
+    print(f"🎞️  Packaging {media_path.name} ({kind}, {info['duration']:.0f}s): "
+          f"{len(renditions)} renditions, {len(cuts) + 1} fragments each")
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(renditions)))) as pool:
+            list(pool.map(lambda r: run_tool(transcode_cmd(media_path, r, cuts, staging / r.name,
+                                                           segment_seconds)), renditions))
+        bandwidths = {r.name: measure_bandwidth(staging / r.name) for r in renditions}
+        with open(staging / MASTER_PLAYLIST, "w", encoding="utf-8") as f:
+            f.write(master_playlist(renditions, bandwidths, info["width"], info["height"],
+                                    info["has_audio"]))
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.replace(staging, output_dir)
+    for rendition in renditions:
+        peak, _ = bandwidths[rendition.name]
+        print(f"   {rendition.name}: {peak / 1000:.0f} kbit/s peak")
+    return output_dir / MASTER_PLAYLIST
+
+
+def chapter_starts_from(transcript_path) -> list:
+    """
+    Chapter start times from a transcript JSON; generated from its segments
+    with generate_chapters() if it has none.
+    """
+    with open(transcript_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    chapters = data.get("chapters")
+    if not chapters:
+        from transcribe import generate_chapters
+        chapters = generate_chapters(data.get("segments", []))
+    return [float(ch["start"]) for ch in chapters]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Package media as HLS aligned to chapters")
+    parser.add_argument("media", help="Audio or video file")
+    parser.add_argument("output_dir", help="Directory for the HLS tree")
+    parser.add_argument("--chapters", "-c",
+                        help="Transcript JSON whose chapter starts become fragment boundaries")
+    parser.add_argument("--segment", "-s", type=float, default=DEFAULT_SEGMENT_SECONDS,
+                        help=f"Target fragment length in seconds (default: {DEFAULT_SEGMENT_SECONDS:g})")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count(),
+                        help="Renditions transcoded at once (default: CPU count)")
+
+    args = parser.parse_args()
+
+    chapter_starts = chapter_starts_from(args.chapters) if args.chapters else []
+    try:
+        master = package_hls(args.media, args.output_dir, chapter_starts, args.segment, args.workers)
+    except PackagingError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"\n✨ Done! → {master}")
+
+
+if __name__ == "__main__":
+    main()
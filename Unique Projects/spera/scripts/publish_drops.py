@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Publish Spera drops end to end: download → transcribe → chapter → codegen → upload.
+
+Drops are declared in drops.json at the project root instead of by editing
+TRANSCRIPT_MAPPING/CHAPTER_INFO in generate_transcript_dart.py:
+
+  {
+    "drops": {
+      "drop_012": {
+        "source": "https://archive.org/download/.../talk.m4a",
+        "title": "The Lindy Effect",
+        "transcript": "The Lindy Effect.json",    (optional, from the source name)
+        "chapters": [{"title": "...", "start": 0, "desc": "..."}]   (optional)
+      }
+    }
+  }
+
+Every drop's stages run as a DAG in one process, so Whisper and the storage
+client are started once per run rather than once per script per drop:
+
+  download ──► transcribe ──► chapter ──┐
+      │                           ┆     ├──► codegen (all drops)
+      │                      (package)  │
+      │                           ┆     │
+      └──────────────────────► upload   │
+                          other drops ──┘
+
+With --hls, a package stage (see package_hls.py) turns each drop's media into
+an HLS bitrate ladder with fragments cut at its chapter starts, and upload
+also publishes that tree; its master playlist URL is saved as "hls_url".
+
+Downloads, chaptering and uploads run concurrently across drops; transcription
+runs one drop at a time on a single warm model. Each stage records the key of
+its inputs in ~/.cache/spera/pipeline.json and is skipped when that key and
+its outputs are unchanged. Chapters missing from drops.json are generated from
+the transcript and written back (marked "auto_chapters", so they follow later
+transcript changes until edited by hand and the flag removed).
+
+Usage:
+  python3 scripts/publish_drops.py                     # every drop in drops.json
+  python3 scripts/publish_drops.py drop_012 drop_013   # selected drops
+  python3 scripts/publish_drops.py --no-upload --model small
+  python3 scripts/publish_drops.py --force             # rerun every stage
+  python3 scripts/publish_drops.py --hls               # also publish HLS
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import textwrap
+import threading
+import urllib.request
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import generate_transcript_dart as codegen
+from drop_catalog import DROPS_CONFIG
+from transcribe_backends import BACKENDS, DEFAULT_BACKEND
+from transcript_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_MB, TranscriptCache
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "spera"
+STATE_PATH = CACHE_DIR / "pipeline.json"
+MEDIA_DIR = CACHE_DIR / "media"
+
+# fn(drop_id), the tasks it runs after, the pool it runs on, and whether it
+# needs those tasks to have succeeded (or merely finished)
+Task = namedtuple("Task", ["fn", "deps", "pool", "require_deps"])
+
+# Stages of one drop, with the stages they depend on
+DROP_STAGES = {
+    "download": [],
+    "transcribe": ["download"],
+    "chapter": ["transcribe"],
+    "package": ["download", "chapter"],
+    "upload": ["download"],
+}
+
+
+def is_url(value: str) -> bool:
+    return value.startswith("http://") or value.startswith("https://")
+
+
+def source_name(source: str) -> str:
+    """File name of a source URL or path."""
+    if is_url(source):
+        return urllib.request.unquote(source.split("?")[0].rstrip("/").split("/")[-1])
+    return Path(source).name
+
+
+def file_key(path: Path, *extra) -> str:
+    """Cheap change key for a local file: size and mtime plus any stage options."""
+    stat = path.stat()
+    payload = json.dumps([str(path), stat.st_size, stat.st_mtime_ns, *extra])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def write_json_atomic(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+class JsonStore:
+    """A small JSON file shared by the stage threads."""
+
+    def __init__(self, path: Path, default: dict):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = default
+
+    def save(self):
+        with self.lock:
+            write_json_atomic(self.path, self.data)
+
+
+class Pipeline:
+    """Stage implementations for one run."""
+
+    def __init__(self, config: JsonStore, args):
+        self.config = config
+        self.args = args
+        self.state = JsonStore(STATE_PATH, {})
+        self.drops = config.data.setdefault("drops", {})
+        self.media = {}
+        self.upload_manifest = None
+
+    def stamp(self, drop_id: str, stage: str) -> str:
+        with self.state.lock:
+            return self.state.data.get(drop_id, {}).get(stage)
+
+    def set_stamp(self, drop_id: str, stage: str, key: str):
+        with self.state.lock:
+            self.state.data.setdefault(drop_id, {})[stage] = key
+        self.state.save()
+
+    def up_to_date(self, drop_id: str, stage: str, key: str, *outputs: Path) -> bool:
+        return (not self.args.force and self.stamp(drop_id, stage) == key
+                and all(path.exists() for path in outputs))
+
+    def transcript_path(self, drop_id: str) -> Path:
+        drop = self.drops[drop_id]
+        if not drop.get("transcript"):
+            with self.config.lock:
+                drop["transcript"] = f"{Path(source_name(drop['source'])).stem}.json"
+            self.config.save()
+        return codegen.TRANSCRIPTS_DIR / drop["transcript"]
+
+    def download(self, drop_id: str) -> str:
+        source = self.drops[drop_id]["source"]
+        if not is_url(source):
+            path = Path(source).expanduser()
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {path}")
+            self.media[drop_id] = path
+            return "local"
+
+        path = MEDIA_DIR / drop_id / source_name(source)
+        self.media[drop_id] = path
+        if self.up_to_date(drop_id, "download", source, path):
+            return "up to date"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".part")
+        print(f"📥 {drop_id}: downloading {source}")
+        urllib.request.urlretrieve(source, partial)
+        os.replace(partial, path)
+        self.set_stamp(drop_id, "download", source)
+        return "done"
+
+    def transcribe(self, drop_id: str) -> str:
+        media = self.media[drop_id]
+        output = self.transcript_path(drop_id)
+        key = file_key(media, self.args.model, self.args.language, self.args.vad, self.args.backend)
+        if self.up_to_date(drop_id, "transcribe", key, output):
+            return "up to date"
+
+        # Imported here so runs with nothing to transcribe never import Whisper;
+        # transcribe() loads the model (once per process) only on a cache miss
+        import transcribe as transcriber
+
+        cache = TranscriptCache(DEFAULT_CACHE_DIR, DEFAULT_MAX_MB * 1024 * 1024)
+        result = transcriber.transcribe(str(media), self.args.model, self.args.language,
+                                        cache=cache, vad=self.args.vad,
+                                        backend=self.args.backend)
+        transcriber.write_outputs(result, output.parent, output.stem, "all")
+        self.set_stamp(drop_id, "transcribe", key)
+        return "done"
+
+    def chapter(self, drop_id: str) -> str:
+        drop = self.drops[drop_id]
+        if drop.get("chapters") and not drop.get("auto_chapters"):
+            return "hand-written"
+
+        transcript = self.transcript_path(drop_id)
+        key = file_key(transcript)
+        if drop.get("chapters") and self.up_to_date(drop_id, "chapter", key):
+            return "up to date"
+
+        with open(transcript, "r", encoding="utf-8") as f:
+            chapters = json.load(f).get("chapters", [])
+        with self.config.lock:
+            drop["chapters"] = [{
+                "title": ch["title"],
+                "start": int(ch["start"]),
+                "desc": textwrap.shorten(ch.get("text_preview", ""), 60, placeholder="…"),
+            } for ch in chapters]
+            drop["auto_chapters"] = True
+            drop.setdefault("title", drop_id)
+        self.config.save()
+        self.set_stamp(drop_id, "chapter", key)
+        return f"{len(chapters)} chapters"
+
+    def hls_dir(self, drop_id: str) -> Path:
+        return MEDIA_DIR / drop_id / "hls"
+
+    def package(self, drop_id: str) -> str:
+        import package_hls
+
+        media = self.media[drop_id]
+        chapter_starts = [ch["start"] for ch in self.drops[drop_id].get("chapters", [])]
+        key = file_key(media, chapter_starts, package_hls.PACKAGER_VERSION)
+        if self.up_to_date(drop_id, "package", key, self.hls_dir(drop_id) / package_hls.MASTER_PLAYLIST):
+            return "up to date"
+
+        package_hls.package_hls(media, self.hls_dir(drop_id), chapter_starts)
+        self.set_stamp(drop_id, "package", key)
+        return "done"
+
+    def upload(self, drop_id: str) -> str:
+        # Imported here so --no-upload runs don't need storage credentials
+        import upload_media
+
+        media = self.media[drop_id]
+        storage_path = upload_media.storage_path_for(media, drop_id=drop_id)
+        # A repackaged HLS tree changes the package stamp, and so this key
+        key = file_key(media, storage_path, self.stamp(drop_id, "package") if self.args.hls else None)
+        drop = self.drops[drop_id]
+        if (self.up_to_date(drop_id, "upload", key) and drop.get("media_url")
+                and (drop.get("hls_url") or not self.args.hls)):
+            return "up to date"
+
+        upload_media.require_service_key()
+        with self.state.lock:
+            if self.upload_manifest is None:
+                self.upload_manifest = upload_media.UploadManifest()
+        url, action = upload_media.dedup_upload(
+            upload_media.get_storage_client(), media, storage_path,
+            self.upload_manifest, state=upload_media.UploadState(),
+        )
+        hls_url = None
+        if self.args.hls:
+            hls_url = upload_media.upload_tree(self.hls_dir(drop_id), f"{drop_id}/hls",
+                                               manifest=self.upload_manifest)
+        with self.config.lock:
+            drop["media_url"] = url
+            if hls_url:
+                drop["hls_url"] = hls_url
+        self.config.save()
+        self.set_stamp(drop_id, "upload", key)
+        return f"{action}, HLS" if hls_url else action
+
+    def generate(self) -> str:
+        # Pick up chapters and transcripts added by this run
+        codegen.merge_drops_config(self.config.path)
+        results = codegen.generate_all(force=self.args.force, jobs=self.args.jobs)
+        return f"{len(results)} regenerated"
+
+
+def build_tasks(pipeline: Pipeline, drop_ids: list, upload: bool, hls: bool = False) -> dict:
+    """
+    The run's DAG, keyed by (drop_id, stage).
+
+    Transcription uses its own single-worker pool so only one drop at a time
+    holds the model; everything else shares the I/O pool. With hls, drops
+    are packaged once chaptered and uploaded once packaged. Codegen waits for
+    every drop's chapters but still runs if some drops failed, so the others
+    are published.
+    """
+    tasks = {}
+    for drop_id in drop_ids:
+        for stage, deps in DROP_STAGES.items():
+            if (stage == "upload" and not upload) or (stage == "package" and not hls):
+                continue
+            if stage == "upload" and hls:
+                deps = deps + ["package"]
+            pool = "model" if stage == "transcribe" else "io"
+            tasks[(drop_id, stage)] = Task(getattr(pipeline, stage),
+                                           [(drop_id, d) for d in deps], pool, True)
+    tasks[("*", "codegen")] = Task(lambda _: pipeline.generate(),
+                                   [(drop_id, "chapter") for drop_id in drop_ids], "io", False)
+    return tasks
+
+
+def run_dag(tasks: dict, pools: dict) -> dict:
+    """
+    Run tasks as soon as their dependencies succeed.
+
+    Returns:
+        Dict of task -> status message ("failed: ..." or "skipped: ..." for
+        tasks that did not complete)
+    """
+    status = {}
+    running = {}
+
+    while len(status) < len(tasks):
+        for task, (fn, deps, pool, require_deps) in tasks.items():
+            if task in status or task in running.values():
+                continue
+            failed = [dep for dep in deps if not status.get(dep, "ok").startswith("ok")]
+            if failed and require_deps:
+                status[task] = f"skipped: {'/'.join(failed[0])} did not finish"
+                print(f"   ⏭️  {task[0]}/{task[1]}: {status[task]}")
+            elif all(dep in status for dep in deps):
+                running[pools[pool].submit(fn, task[0])] = task
+
+        if not running:
+            continue
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            task = running.pop(future)
+            try:
+                status[task] = f"ok: {future.result()}"
+                print(f"   ✅ {task[0]}/{task[1]}: {future.result()}")
+            except Exception as e:
+                status[task] = f"failed: {e}"
+                print(f"   ❌ {task[0]}/{task[1]}: {e}")
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download, transcribe, chapter, generate and upload drops")
+    parser.add_argument("drops", nargs="*", help="Drop IDs to publish (default: all in the config)")
+    parser.add_argument("--config", "-c", default=str(DROPS_CONFIG),
+                        help=f"Drops config (default: {DROPS_CONFIG})")
+    parser.add_argument("--model", "-m", default="medium",
+                        choices=["tiny", "base", "small", "medium", "large"],
+                        help="Whisper model (default: medium)")
+    parser.add_argument("--language", "-l", help="Language code (e.g., 'en')")
+    parser.add_argument("--backend", "-b", default=DEFAULT_BACKEND, choices=list(BACKENDS),
+                        help=f"Inference engine (default: {DEFAULT_BACKEND}; see transcribe.py --backend)")
+    parser.add_argument("--vad", action="store_true",
+                        help="Skip non-speech audio during transcription (see transcribe.py --vad)")
+    parser.add_argument("--jobs", "-j", type=int, default=4,
+                        help="Concurrent downloads/uploads and codegen processes (default: 4)")
+    parser.add_argument("--no-upload", action="store_true", help="Skip the upload stage")
+    parser.add_argument("--hls", action="store_true",
+                        help="Package drops as chapter-aligned HLS and upload that too (see package_hls.py)")
+    parser.add_argument("--force", "-f", action="store_true", help="Rerun every stage")
+
+    args = parser.parse_args()
+    config = JsonStore(Path(args.config), {"drops": {}})
+    pipeline = Pipeline(config, args)
+
+    drop_ids = args.drops or list(pipeline.drops)
+    unknown = [drop_id for drop_id in drop_ids if drop_id not in pipeline.drops]
+    if unknown:
+        parser.error(f"not in {args.config}: {', '.join(unknown)}")
+    missing_source = [drop_id for drop_id in drop_ids if not pipeline.drops[drop_id].get("source")]
+    if missing_source:
+        parser.error(f"no \"source\" for: {', '.join(missing_source)}")
+
+    print(f"🚀 Publishing {len(drop_ids)} drops")
+    pools = {
+        "io": ThreadPoolExecutor(max_workers=max(1, args.jobs)),
+        "model": ThreadPoolExecutor(max_workers=1),
+    }
+    try:
+        status = run_dag(build_tasks(pipeline, drop_ids, not args.no_upload, args.hls), pools)
+    finally:
+        for pool in pools.values():
+            pool.shutdown()
+
+    failed = {task: message for task, message in status.items() if not message.startswith("ok")}
+    print(f"\n✨ {len(status) - len(failed)}/{len(status)} stages finished")
+    for drop_id in drop_ids:
+        url = pipeline.drops[drop_id].get("media_url")
+        if url:
+            print(f"   {drop_id}: contentUrl: '{url}',")
+        if args.hls and pipeline.drops[drop_id].get("hls_url"):
+            print(f"   {drop_id}: contentUrl: '{pipeline.drops[drop_id]['hls_url']}',  (HLS)")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""
+Topic-change detection for automatic chapters.
+
+Every transcript segment is embedded as a unit vector. For each gap between
+segments, the block of segments before it is compared with the block after
+it (TextTiling, with embeddings in place of raw word counts); block sums
+come from one cumulative sum, so the whole similarity curve costs O(n).
+Gaps at the bottom of deep valleys in that curve are where the topic
+changes, and the deepest of them, at least min_chapter seconds apart,
+become chapter starts.
+
+Embedders:
+  hashing   word and bigram counts hashed into 4096 dimensions, weighted by
+            inverse document frequency over the episode; NumPy only, a few
+            milliseconds per episode
+  minilm    sentence-transformers all-MiniLM-L6-v2; catches paraphrase, runs
+            offline on CPU once the model is downloaded (~1 s per episode)
+
+Model embeddings are cached per segment text under ~/.cache/spera/embeddings,
+so re-chaptering an edited transcript only embeds the segments that changed.
+
+Usage:
+  starts, representatives = topic_boundaries(texts, seg_starts, seg_ends)
+"""
+
+import bisect
+import functools
+import hashlib
+import importlib.util
+import os
+import re
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "spera" / "embeddings"
+DEFAULT_EMBEDDER = "hashing"
+
+HASH_DIMENSIONS = 4096
+WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+STOPWORDS = frozenset("""
+    a about above after again against all also am an and any are aren't as at
+    be because been before being below between both but by can can't cannot
+    could couldn't did didn't do does doesn't doing don't down during each even
+    ever every few for from further get gets getting go goes going gonna got
+    had hadn't has hasn't have haven't having he he'd he'll he's her here
+    here's hers herself him himself his how how's i i'd i'll i'm i've if in
+    into is isn't it it's its itself just know kind let's like lot make many
+    may maybe me might more most much must mustn't my myself need no nor not
+    now of off oh okay on once one only or other ought our ours ourselves out
+    over own really right said same say says see shan't she she'd she'll she's
+    should shouldn't so some something such than that that's the their theirs
+    them themselves then there there's these they they'd they'll they're
+    they've thing things think this those through to too um uh under until up
+    us very want was wasn't way we we'd we'll we're we've well were weren't
+    what what's when when's where where's which while who who's whom why why's
+    will with won't would wouldn't yeah yes yet you you'd you'll you're you've
+    your yours yourself yourselves
+""".split())
+
+
+class EmbedderUnavailable(ImportError):
+    """The Python package behind an embedder is not installed."""
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _terms(text: str) -> list:
+    """Content words (plurals folded) and the bigrams between them."""
+    words = []
+    for word in WORD_RE.findall(text.lower()):
+        if len(word) < 3 or word in STOPWORDS:
+            continue
+        if word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+            word = word[:-1]
+        words.append(word)
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class HashingEmbedder:
+    """TF-IDF over hashed words and bigrams."""
+
+    name = "hashing"
+    package = "numpy"
+    install = "pip3 install numpy"
+    # IDF depends on the whole episode, so vectors are not per-segment
+    cacheable = False
+
+    def __init__(self, dimensions: int = HASH_DIMENSIONS):
+        self.dimensions = dimensions
+
+    def embed(self, texts: list) -> np.ndarray:
+        rows, cols = [], []
+        for i, text in enumerate(texts):
+            # crc32 rather than hash(), which is salted per process
+            buckets = [zlib.crc32(term.encode()) % self.dimensions for term in _terms(text)]
+            rows.extend([i] * len(buckets))
+            cols.extend(buckets)
+
+        counts = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        np.add.at(counts, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1.0)
+        document_freq = np.count_nonzero(counts, axis=0)
+        idf = np.log((1 + len(texts)) / (1 + document_freq)) + 1
+        return _normalize(np.log1p(counts) * idf.astype(np.float32))
+
+
+class MiniLMEmbedder:
+    """sentence-transformers all-MiniLM-L6-v2 on CPU."""
+
+    name = "minilm"
+    package = "sentence_transformers"
+    install = "pip3 install sentence-transformers"
+    model_name = "sentence-transformers/all-MiniLM-L6-v2"
+    cacheable = True
+
+    def __init__(self):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(self.model_name, device="cpu")
+
+    def embed(self, texts: list) -> np.ndarray:
+        vectors = self.model.encode(texts, batch_size=64, convert_to_numpy=True,
+                                    normalize_embeddings=True)
+        return vectors.astype(np.float32)
+
+
+EMBEDDERS = {
+    "hashing": HashingEmbedder,
+    "minilm": MiniLMEmbedder,
+}
+
+
+def check_embedder(name: str):
+    """Raise EmbedderUnavailable (with an install hint) if an embedder can't be loaded."""
+    if name not in EMBEDDERS:
+        raise EmbedderUnavailable(f"Unknown embedder {name!r} (choose from {', '.join(EMBEDDERS)})")
+    embedder = EMBEDDERS[name]
+    if importlib.util.find_spec(embedder.package) is None:
+        raise EmbedderUnavailable(f"{name} embedder not installed. Run: {embedder.install}")
+
+
+@functools.lru_cache(maxsize=None)
+def load_embedder(name: str = DEFAULT_EMBEDDER):
+    """Load an embedder once per process so its model is reused across drops."""
+    check_embedder(name)
+    return EMBEDDERS[name]()
+
+
+class EmbeddingCache:
+    """
+    Segment embeddings keyed by the SHA-1 of their text.
+
+    One <cache_dir>/<embedder>.npz per embedder, loaded once and rewritten
+    atomically when new texts are embedded. Concurrent writers may drop each
+    other's additions, which only costs a re-embed later.
+    """
+
+    def __init__(self, cache_dir: Path, name: str):
+        self.path = Path(cache_dir) / f"{name}.npz"
+        self.lock = threading.Lock()
+        self.vectors = {}
+        try:
+            with np.load(self.path) as data:
+                self.vectors = dict(zip(data["keys"].tolist(), data["vectors"]))
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def embed(self, texts: list, embed) -> np.ndarray:
+        """Embeddings of texts, calling embed(missing_texts) for cache misses only."""
+        keys = [hashlib.sha1(text.encode()).hexdigest() for text in texts]
+        with self.lock:
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key not in self.vectors:
+                    missing.setdefault(key, text)
+            if missing:
+                vectors = embed(list(missing.values()))
+                self.vectors.update(zip(missing, vectors))
+                self.save()
+            return np.stack([self.vectors[key] for key in keys])
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, keys=np.array(list(self.vectors)),
+                         vectors=np.stack(list(self.vectors.values())))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+@functools.lru_cache(maxsize=None)
+def _embedding_cache(cache_dir: str, name: str) -> EmbeddingCache:
+    return EmbeddingCache(Path(cache_dir), name)
+
+
+def embed_texts(texts: list, embedder: str = DEFAULT_EMBEDDER,
+                cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> np.ndarray:
+    """Unit-length embeddings of texts, as a (len(texts), dims) float32 array."""
+    model = load_embedder(embedder)
+    if not model.cacheable or cache_dir is None:
+        return model.embed(texts)
+    return _embedding_cache(str(cache_dir), model.name).embed(texts, model.embed)
+
+
+def block_similarity(vectors: np.ndarray, block: int) -> np.ndarray:
+    """
+    Cosine similarity across each gap between consecutive rows.
+
+    Element i compares the sum of the `block` rows before row i + 1 with the
+    sum of the `block` rows from it on (blocks are cut short at the edges).
+    """
+    n = len(vectors)
+    prefix = np.concatenate((np.zeros((1, vectors.shape[1]), dtype=vectors.dtype),
+                             np.cumsum(vectors, axis=0)))
+    gaps = np.arange(1, n)
+    before = prefix[gaps] - prefix[np.maximum(gaps - block, 0)]
+    after = prefix[np.minimum(gaps + block, n)] - prefix[gaps]
+    dot = np.einsum("ij,ij->i", before, after)
+    norms = np.linalg.norm(before, axis=1) * np.linalg.norm(after, axis=1)
+    return dot / np.maximum(norms, 1e-12)
+
+
+def smooth(values: np.ndarray, width: int) -> np.ndarray:
+    """Moving average that stays unbiased at the edges."""
+    if width <= 1 or len(values) < 2:
+        return values
+    kernel = np.ones(width)
+    return (np.convolve(values, kernel, mode="same")
+            / np.convolve(np.ones(len(values)), kernel, mode="same"))
+
+
+def depth_scores(similarity: np.ndarray) -> np.ndarray:
+    """
+    TextTiling depth of every point: how far the curve rises on both sides.
+
+    From each point, climb left (and right) while the curve does not fall;
+    the depth is the sum of the two climbs. Both climbs are found for every
+    point at once with running max/min over "can't climb further" indices.
+    """
+    n = len(similarity)
+    index = np.arange(n)
+    stop_left = np.ones(n, dtype=bool)
+    stop_left[1:] = similarity[:-1] < similarity[1:]
+    stop_right = np.ones(n, dtype=bool)
+    stop_right[:-1] = similarity[1:] < similarity[:-1]
+    left_peak = np.maximum.accumulate(np.where(stop_left, index, 0))
+    right_peak = np.minimum.accumulate(np.where(stop_right, index, n - 1)[::-1])[::-1]
+    return (similarity[left_peak] - similarity) + (similarity[right_peak] - similarity)
+
+
+def topic_boundaries(
+    texts: list,
+    starts,
+    ends,
+    embedder: str = DEFAULT_EMBEDDER,
+    gaps=None,
+    block_seconds: float = 45.0,
+    min_chapter: float = 60.0,
+    target_chapter: float = 180.0,
+    snap: int = 2,
+    vectors: Optional[np.ndarray] = None
+) -> tuple:
+    """
+    Split a transcript into topical chapters.
+
+    Args:
+        texts: Segment texts
+        starts: Segment start times in seconds
+        ends: Segment end times in seconds
+        embedder: Name of the embedder (see EMBEDDERS)
+        gaps: Silence in seconds before each segment (len(texts) values); a
+              boundary moves to the longest one within `snap` segments of
+              its valley. Defaults to the gaps between segment timestamps.
+        block_seconds: Length of the blocks compared across each gap
+        min_chapter: Shortest chapter allowed, in seconds
+        target_chapter: Typical chapter length; caps the number of chapters
+        snap: How many segments a boundary may move to land on a pause
+        vectors: Precomputed segment embeddings (skips the embedder)
+
+    Returns:
+        (chapter_starts, representatives): index of the first segment of
+        each chapter (the first is always 0), and of the segment most
+        typical of each chapter's opening half, for titling
+    """
+    n = len(texts)
+    if n == 0:
+        return [], []
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    if vectors is None:
+        vectors = embed_texts(texts, embedder)
+    if gaps is None:
+        gaps = np.concatenate(([0.0], np.maximum(starts[1:] - ends[:-1], 0.0)))
+    gaps = np.asarray(gaps, dtype=np.float64)
+
+    boundaries = []
+    duration = ends[-1] - starts[0]
+    max_breaks = int(round(duration / target_chapter)) - 1
+    if n >= 4 and max_breaks > 0:
+        typical = max(float(np.median(ends - starts)), 1e-3)
+        block = int(np.clip(round(block_seconds / typical), 2, max(2, n // 4)))
+        similarity = smooth(block_similarity(vectors, block), 3)
+        depth = depth_scores(similarity)
+
+        # Valley bottoms, scored by depth; TextTiling's cutoff is mean - std/2
+        inner = similarity[1:-1]
+        valleys = 1 + np.flatnonzero((inner <= similarity[:-2]) & (inner <= similarity[2:]))
+        if len(valleys):
+            cutoff = depth[valleys].mean() - depth[valleys].std() / 2
+            order = valleys[np.argsort(-depth[valleys], kind="stable")]
+            chosen_times = [starts[0], ends[-1]]
+            for gap in order:
+                if depth[gap] < cutoff or len(boundaries) >= max_breaks:
+                    break
+                # Gap i precedes segment i + 1; snap to the longest nearby pause
+                lo, hi = max(1, gap + 1 - snap), min(n, gap + 2 + snap)
+                segment = lo + int(np.argmax(gaps[lo:hi]))
+                at = bisect.bisect(chosen_times, starts[segment])
+                if (starts[segment] - chosen_times[at - 1] < min_chapter
+                        or chosen_times[at] - starts[segment] < min_chapter):
+                    continue
+                chosen_times.insert(at, starts[segment])
+                boundaries.append(segment)
+
+    chapter_starts = [0] + sorted(boundaries)
+    chapter_ends = chapter_starts[1:] + [n]
+    prefix = np.concatenate((np.zeros((1, vectors.shape[1]), dtype=vectors.dtype),
+                             np.cumsum(vectors, axis=0)))
+    representatives = []
+    for first, last in zip(chapter_starts, chapter_ends):
+        centroid = prefix[last] - prefix[first]
+        opening = np.arange(first, first + max(1, (last - first) // 2))
+        # Prefer segments that read like the start of a sentence
+        sentences = [i for i in opening if texts[i][:1].isupper() and len(texts[i].split()) >= 5]
+        candidates = np.asarray(sentences) if sentences else opening
+        representatives.append(int(candidates[np.argmax(vectors[candidates] @ centroid)]))
+    return chapter_starts, representatives
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+In-memory stand-in for the parts of Supabase Storage upload_media.py uses.
+
+Implements the plain upload endpoint, object listing, copy, and the TUS
+resumable endpoint (create, HEAD, PATCH), with Supabase's 409 for an
+existing object unless x-upsert is true. Objects list with an MD5 eTag, as
+the real server reports for single-part uploads.
+
+For tests, break_patch makes the next PATCH keep only part of its chunk and
+drop the connection without answering, like a network failure mid-chunk.
+Every request is recorded in requests as (method, path), and the
+Upload-Offset of every PATCH in patch_offsets.
+
+Usage:
+  python3 scripts/tests/storage_server.py --port 54321
+  SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_SERVICE_KEY=test \\
+      python3 scripts/upload_media.py talk.m4a --id drop_001
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+OBJECT_PREFIX = "/storage/v1/object/"
+RESUMABLE_PATH = "/storage/v1/upload/resumable"
+
+
+class StorageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "StorageServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload=None, headers: dict = None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str):
+        self._reply(status, {"statusCode": str(status), "error": message, "message": message})
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _authorized(self) -> bool:
+        if self.headers.get("Authorization") != f"Bearer {self.server.key}":
+            self._error(403, "Invalid signature")
+            return False
+        return True
+
+    def _upsert(self) -> bool:
+        return self.headers.get("x-upsert") == "true"
+
+    def _handle(self, method: str):
+        path = urlparse(self.path).path
+        self.server.record(method, path)
+        if not self._authorized():
+            return
+        bucket_prefix = f"{OBJECT_PREFIX}{self.server.bucket}/"
+        if method == "POST" and path == f"{OBJECT_PREFIX}list/{self.server.bucket}":
+            self._list(json.loads(self._body()))
+        elif method == "POST" and path == f"{OBJECT_PREFIX}copy":
+            self._copy(json.loads(self._body()))
+        elif method == "POST" and path.startswith(bucket_prefix):
+            self._upload(unquote(path[len(bucket_prefix):]))
+        elif method == "POST" and path == RESUMABLE_PATH:
+            self._create_upload()
+        elif method in ("HEAD", "PATCH") and path.startswith(RESUMABLE_PATH + "/"):
+            upload_id = path[len(RESUMABLE_PATH) + 1:]
+            if method == "HEAD":
+                self._upload_offset(upload_id)
+            else:
+                self._patch(upload_id)
+        else:
+            self._body()
+            self._error(404, "Not found")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_HEAD(self):
+        self._handle("HEAD")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def _list(self, query: dict):
+        folder = query.get("prefix", "").strip("/")
+        start = f"{folder}/" if folder else ""
+        entries = {}
+        with self.server.lock:
+            for path, (data, mime_type) in self.server.objects.items():
+                if not path.startswith(start):
+                    continue
+                name, _, rest = path[len(start):].partition("/")
+                if rest:
+                    entries.setdefault(name, {"name": name, "id": None, "metadata": None})
+                else:
+                    entries[name] = {"name": name, "id": hashlib.md5(path.encode()).hexdigest(),
+                                     "metadata": {"size": len(data), "mimetype": mime_type,
+                                                  "eTag": f'"{hashlib.md5(data).hexdigest()}"'}}
+        items = [entries[name] for name in sorted(entries)]
+        offset = query.get("offset", 0)
+        self._reply(200, items[offset:offset + query.get("limit", 100)])
+
+    def _copy(self, request: dict):
+        with self.server.lock:
+            source = self.server.objects.get(request["sourceKey"])
+            if source is None:
+                return self._error(404, "Object not found")
+            if request["destinationKey"] in self.server.objects and not self._upsert():
+                return self._error(409, "The resource already exists")
+            self.server.objects[request["destinationKey"]] = source
+        self._reply(200, {"Key": f"{self.server.bucket}/{request['destinationKey']}"})
+
+    def _upload(self, storage_path: str):
+        data = self._body()
+        with self.server.lock:
+            if storage_path in self.server.objects and not self._upsert():
+                return self._error(409, "The resource already exists")
+            self.server.objects[storage_path] = (data, self.headers.get("Content-Type", ""))
+        self._reply(200, {"Key": f"{self.server.bucket}/{storage_path}"})
+
+    def _create_upload(self):
+        self._body()
+        metadata = {}
+        for pair in self.headers.get("Upload-Metadata", "").split(","):
+            key, _, value = pair.strip().partition(" ")
+            metadata[key] = base64.b64decode(value).decode("utf-8")
+        storage_path = metadata["objectName"]
+        with self.server.lock:
+            if storage_path in self.server.objects and not self._upsert():
+                return self._error(409, "The resource already exists")
+            upload_id = uuid.uuid4().hex
+            self.server.uploads[upload_id] = {
+                "path": storage_path,
+                "length": int(self.headers["Upload-Length"]),
+                "mime_type": metadata.get("contentType", ""),
+                "data": bytearray(),
+            }
+        host, port = self.server.server_address[:2]
+        self._reply(201, headers={"Location": f"http://{host}:{port}{RESUMABLE_PATH}/{upload_id}",
+                                  "Tus-Resumable": "1.0.0"})
+
+    def _upload_offset(self, upload_id: str):
+        with self.server.lock:
+            upload = self.server.uploads.get(upload_id)
+        if upload is None:
+            return self._reply(404)
+        self._reply(200, headers={"Upload-Offset": str(len(upload["data"])),
+                                  "Upload-Length": str(upload["length"]),
+                                  "Tus-Resumable": "1.0.0"})
+
+    def _patch(self, upload_id: str):
+        length = int(self.headers.get("Content-Length", 0))
+        with self.server.lock:
+            self.server.patch_offsets.append(int(self.headers["Upload-Offset"]))
+            upload = self.server.uploads.get(upload_id)
+            broken = self.server.break_patch
+            self.server.break_patch = False
+        if upload is None:
+            self.rfile.read(length)
+            return self._error(404, "Upload not found")
+        if int(self.headers["Upload-Offset"]) != len(upload["data"]):
+            self.rfile.read(length)
+            return self._error(409, "Upload-Offset does not match")
+        if broken:
+            # Keep what arrived before the failure, then hang up without a response
+            upload["data"] += self.rfile.read(length // 2)
+            self.close_connection = True
+            return
+        upload["data"] += self.rfile.read(length)
+        if len(upload["data"]) >= upload["length"]:
+            with self.server.lock:
+                self.server.objects[upload["path"]] = (bytes(upload["data"]), upload["mime_type"])
+        self._reply(204, headers={"Upload-Offset": str(len(upload["data"])),
+                                  "Tus-Resumable": "1.0.0"})
+
+
+class StorageServer(ThreadingHTTPServer):
+    """Storage stand-in on a local port; objects maps storage path -> (bytes, MIME type)."""
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), key: str = "test-key", bucket: str = "media"):
+        super().__init__(address, StorageHandler)
+        self.key = key
+        self.bucket = bucket
+        self.lock = threading.Lock()
+        self.objects = {}
+        self.uploads = {}
+        self.requests = []
+        self.patch_offsets = []
+        self.break_patch = False
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, method: str, path: str):
+        with self.lock:
+            self.requests.append((method, path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for Supabase Storage")
+    parser.add_argument("--port", "-p", type=int, default=54321, help="Port (default: 54321)")
+    parser.add_argument("--key", default="test", help="Expected service key (default: test)")
+    args = parser.parse_args()
+
+    server = StorageServer(("127.0.0.1", args.port), key=args.key)
+    print(f"🗄️  Storage stand-in on {server.url} (bucket {server.bucket}, key {args.key})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+generate_all() with drops declared in drops.json and a spawned process pool.
+
+Run: python3 -m pytest scripts/tests
+"""
+
+import functools
+import json
+import multiprocessing
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import drop_catalog
+import generate_transcript_dart as codegen
+
+FIXTURES = Path(__file__).resolve().parent.parent.parent / "transcripts"
+
+CHAPTERS = [
+    {"title": "Opening", "start": 0, "desc": "Where it starts"},
+    {"title": "Second Act", "start": 60, "desc": "Where it goes"},
+]
+
+
+def test_drops_json_survives_spawned_workers(tmp_path, monkeypatch):
+    # Fresh tables, so merging drops.json doesn't leak into other tests
+    mapping, chapter_info = {}, {}
+    for module in (drop_catalog, codegen):
+        monkeypatch.setattr(module, "TRANSCRIPT_MAPPING", mapping)
+        monkeypatch.setattr(module, "CHAPTER_INFO", chapter_info)
+    # Spawned workers re-import the module and see only its built-in tables
+    monkeypatch.setattr(codegen, "ProcessPoolExecutor", functools.partial(
+        ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")))
+
+    transcripts_dir = tmp_path / "transcripts"
+    transcripts_dir.mkdir()
+    sources = sorted(FIXTURES.glob("*.json"))[:2]
+    for source in sources:
+        shutil.copy(source, transcripts_dir)
+    monkeypatch.setattr(codegen, "TRANSCRIPTS_DIR", transcripts_dir)
+
+    config = tmp_path / "drops.json"
+    config.write_text(json.dumps({"drops": {
+        "drop_098": {"transcript": sources[0].name, "title": "Ninety Eight", "chapters": CHAPTERS},
+        "drop_099": {"transcript": sources[1].name, "title": "Ninety Nine", "chapters": CHAPTERS},
+    }}))
+    codegen.merge_drops_config(config)
+
+    output_dir, bundle_dir = tmp_path / "dart", tmp_path / "bundles"
+    results = codegen.generate_all(output_dir, bundle_dir, jobs=2)
+
+    assert sorted(drop_id for drop_id, _, _ in results) == ["drop_098", "drop_099"]
+    assert all(n_chapters == 2 for _, _, n_chapters in results)
+    dart = (output_dir / "drop_099.g.dart").read_text()
+    assert "/// Ninety Nine - drop_099" in dart
+    assert dart.count("AudioChapter(") == 2
+    header = (bundle_dir / "drop_099.sptb").read_bytes()[:codegen.BUNDLE_HEADER.size]
+    assert codegen.BUNDLE_HEADER.unpack(header)[4] == 2
+
+    # What was written matches the recorded hash, so a second run has nothing to do
+    assert codegen.generate_all(output_dir, bundle_dir, jobs=2) == []
@@ -0,0 +1,207 @@
+"""
+StorageClient against the local storage stand-in (storage_server.py).
+
+Run: python3 -m pytest scripts/tests
+"""
+
+import functools
+import hashlib
+import threading
+
+import pytest
+
+import upload_media
+from storage_server import StorageServer
+from upload_media import StorageClient, UploadError, UploadManifest, UploadState
+
+CHUNK_SIZE = 1024
+
+
+@pytest.fixture
+def server():
+    server = StorageServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    # Small chunks keep resumable uploads multi-chunk without megabytes of data
+    monkeypatch.setattr(upload_media, "RESUMABLE_CHUNK_SIZE", CHUNK_SIZE)
+    monkeypatch.setattr(upload_media, "RESUMABLE_THRESHOLD", CHUNK_SIZE)
+    monkeypatch.setattr(upload_media.time, "sleep", lambda seconds: None)
+    return StorageClient(server.url, server.key, server.bucket)
+
+
+def write_file(path, size: int, seed: int = 0):
+    path.write_bytes(bytes((i * 31 + seed) % 251 for i in range(size)))
+    return path
+
+
+def patches(server) -> list:
+    return [path for method, path in server.requests if method == "PATCH"]
+
+
+def test_single_shot_upload(server, client, tmp_path):
+    path = write_file(tmp_path / "talk.m4a", 500)
+
+    url = upload_media.upload_object(client, path, "drop_001/talk.m4a")
+
+    assert server.objects["drop_001/talk.m4a"] == (path.read_bytes(), "audio/mp4")
+    assert url == f"{server.url}/storage/v1/object/public/media/drop_001/talk.m4a"
+    assert [method for method, _ in server.requests] == ["POST"]
+
+
+def test_large_file_uses_resumable_chunks(server, client, tmp_path):
+    path = write_file(tmp_path / "talk.mp4", 3 * CHUNK_SIZE + 100)
+    state = UploadState(tmp_path / "uploads.json")
+
+    upload_media.upload_object(client, path, "drop_001/talk.mp4", state=state)
+
+    assert server.objects["drop_001/talk.mp4"][0] == path.read_bytes()
+    assert len(patches(server)) == 4
+    # Finished uploads leave nothing to resume
+    assert state._load() == {}
+
+
+def test_resumable_upload_recovers_from_interrupted_patch(server, client, tmp_path):
+    path = write_file(tmp_path / "talk.mp4", 3 * CHUNK_SIZE)
+    server.break_patch = True
+
+    client.resumable_upload(path, "drop_001/talk.mp4", "video/mp4")
+
+    # The client re-syncs with HEAD and continues after the half chunk the server kept
+    assert server.objects["drop_001/talk.mp4"][0] == path.read_bytes()
+    assert ("HEAD", patches(server)[0]) in server.requests
+    half = CHUNK_SIZE // 2
+    assert server.patch_offsets == [0, half, half + CHUNK_SIZE, half + 2 * CHUNK_SIZE]
+
+
+def test_resumable_upload_resumes_on_next_run(server, client, tmp_path):
+    path = write_file(tmp_path / "talk.mp4", 4 * CHUNK_SIZE)
+    state = UploadState(tmp_path / "uploads.json")
+
+    class Killed(Exception):
+        pass
+
+    def kill_after_two_chunks(offset, size):
+        if offset >= 2 * CHUNK_SIZE:
+            raise Killed
+
+    with pytest.raises(Killed):
+        client.resumable_upload(path, "drop_001/talk.mp4", "video/mp4", state=state,
+                                progress=kill_after_two_chunks)
+    assert "drop_001/talk.mp4" not in server.objects
+
+    client.resumable_upload(path, "drop_001/talk.mp4", "video/mp4", state=state)
+
+    assert server.objects["drop_001/talk.mp4"][0] == path.read_bytes()
+    assert [method for method, _ in server.requests].count("POST") == 1
+    assert server.patch_offsets == [i * CHUNK_SIZE for i in range(4)]
+
+
+def test_existing_object_conflicts_without_upsert(server, client, tmp_path):
+    first = write_file(tmp_path / "a.m4a", 300)
+    second = write_file(tmp_path / "b.m4a", 300, seed=1)
+    upload_media.upload_object(client, first, "drop_001/talk.m4a")
+
+    with pytest.raises(UploadError) as excinfo:
+        upload_media.upload_object(client, second, "drop_001/talk.m4a")
+
+    assert excinfo.value.status == 409
+    assert not excinfo.value.retryable
+    assert len(server.requests) == 2
+    assert server.objects["drop_001/talk.m4a"][0] == first.read_bytes()
+
+
+def test_upsert_overwrites_existing_object(server, client, tmp_path):
+    first = write_file(tmp_path / "a.mp4", 300)
+    second = write_file(tmp_path / "b.mp4", 2 * CHUNK_SIZE, seed=1)
+    upload_media.upload_object(client, first, "drop_001/talk.mp4")
+
+    with pytest.raises(UploadError) as excinfo:
+        upload_media.upload_object(client, second, "drop_001/talk.mp4")
+    assert excinfo.value.status == 409
+
+    upload_media.upload_object(client, second, "drop_001/talk.mp4", upsert=True)
+    assert server.objects["drop_001/talk.mp4"][0] == second.read_bytes()
+
+
+def test_dedup_upload_skips_and_copies_known_content(server, client, tmp_path):
+    path = write_file(tmp_path / "talk.m4a", 300)
+    manifest = UploadManifest(tmp_path / "manifest.json")
+
+    _, action = upload_media.dedup_upload(client, path, "drop_001/talk.m4a", manifest)
+    assert action == "uploaded"
+    _, action = upload_media.dedup_upload(client, path, "drop_001/talk.m4a", manifest)
+    assert action == "skipped"
+    _, action = upload_media.dedup_upload(client, path, "drop_002/talk.m4a", manifest)
+    assert action == "copied"
+
+    assert server.objects["drop_002/talk.m4a"][0] == path.read_bytes()
+    assert [method for method, _ in server.requests].count("POST") == 2
+
+
+def test_force_overwrites_existing_object(server, client, tmp_path):
+    path = write_file(tmp_path / "talk.m4a", 300)
+    manifest = UploadManifest(tmp_path / "manifest.json")
+    upload_media.dedup_upload(client, path, "drop_001/talk.m4a", manifest)
+
+    _, action = upload_media.dedup_upload(client, path, "drop_001/talk.m4a", manifest, force=True)
+    assert action == "uploaded"
+
+    write_file(path, 300, seed=1)
+    upload_media.dedup_upload(client, path, "drop_001/talk.m4a", manifest, force=True)
+    assert server.objects["drop_001/talk.m4a"][0] == path.read_bytes()
+
+
+def test_upload_file_passes_force_and_upsert(server, client, tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_media, "SUPABASE_SERVICE_KEY", server.key)
+    monkeypatch.setattr(upload_media, "get_storage_client", lambda: client)
+    monkeypatch.setattr(upload_media, "UploadManifest",
+                        functools.partial(UploadManifest, tmp_path / "manifest.json"))
+    monkeypatch.setattr(upload_media, "UploadState",
+                        functools.partial(UploadState, tmp_path / "uploads.json"))
+    path = write_file(tmp_path / "talk.m4a", 300)
+
+    upload_media.upload_file(str(path), drop_id="drop_001")
+    upload_media.upload_file(str(path), drop_id="drop_001")
+    upload_media.upload_file(str(path), drop_id="drop_001", force=True)
+    assert [method for method, _ in server.requests].count("POST") == 2
+
+    # Content the manifest doesn't know, at a path that exists: only --upsert may replace it
+    (tmp_path / "manifest.json").unlink()
+    write_file(path, 300, seed=1)
+    upload_media.upload_file(str(path), drop_id="drop_001", upsert=True)
+    assert server.objects["drop_001/talk.m4a"][0] == path.read_bytes()
+
+
+def test_copy_onto_existing_object_needs_upsert(server, client, tmp_path):
+    upload_media.upload_object(client, write_file(tmp_path / "a.m4a", 300), "drop_001/a.m4a")
+    upload_media.upload_object(client, write_file(tmp_path / "b.m4a", 300, seed=1), "drop_001/b.m4a")
+
+    with pytest.raises(UploadError) as excinfo:
+        client.copy("drop_001/a.m4a", "drop_001/b.m4a")
+    assert excinfo.value.status == 409
+
+    client.copy("drop_001/a.m4a", "drop_001/b.m4a", upsert=True)
+    assert server.objects["drop_001/b.m4a"] == server.objects["drop_001/a.m4a"]
+
+
+def test_list_metadata_walks_folders_and_pages(server, client, tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_media, "LIST_PAGE_SIZE", 2)
+    for name in ("drop_001/a.m4a", "drop_001/b.m4a", "drop_001/c.m4a", "drop_001/hls/index.m3u8"):
+        upload_media.upload_object(client, write_file(tmp_path / "file", 100), name, upsert=True)
+    path = tmp_path / "file"
+
+    listed = client.list_metadata("drop_001")
+
+    assert sorted(listed) == ["drop_001/a.m4a", "drop_001/b.m4a", "drop_001/c.m4a",
+                              "drop_001/hls/index.m3u8"]
+    assert listed["drop_001/a.m4a"]["eTag"] == f'"{hashlib.md5(path.read_bytes()).hexdigest()}"'
+    assert upload_media.same_content(path, listed["drop_001/a.m4a"])
+    assert not upload_media.same_content(write_file(tmp_path / "other", 100, seed=2),
+                                         listed["drop_001/a.m4a"])
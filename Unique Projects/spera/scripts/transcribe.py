@@ -4,39 +4,148 @@ Spera Transcript & Chapter Generator
 Uses OpenAI Whisper for transcription and generates chapter markers.
 
 Usage:
-  python3 scripts/transcribe.py <audio_or_video_url_or_file> [--model medium] [--output json]
+  python3 scripts/transcribe.py <audio_or_video_url_or_file>... [--model medium] [--output json]
+  python3 scripts/transcribe.py --manifest drops.txt [--model medium]
+  python3 scripts/transcribe.py --from-json transcripts/*.json --output srt
 
 Examples:
   python3 scripts/transcribe.py https://archive.org/download/rethinking-rockets/audio.m4a
   python3 scripts/transcribe.py ./my_audio.mp3 --model large
   python3 scripts/transcribe.py ./video.mp4 --output srt
+  python3 scripts/transcribe.py ./drop_001.m4a ./drop_002.m4a ./drop_003.m4a
+  python3 scripts/transcribe.py --manifest drops.txt --prefetch 3
+  python3 scripts/transcribe.py ./drop_004.m4a --model large --cascade base
+
+Batch mode (several inputs or --manifest) loads the Whisper model once and
+reuses it for every file, writing each file's outputs as soon as it finishes.
+Upcoming inputs are downloaded and decoded (ffmpeg, 16 kHz PCM) on a thread
+pool while the current one is transcribed, and output files are written on a
+separate thread so inference never waits on the network or disk.
+transcribe_worker.py runs the same per-input steps as a daemon that keeps
+models loaded and takes jobs from a queue (e.g. from the CMS).
+
+Raw Whisper results are cached on disk by audio content hash, model, language
+and options (see transcript_cache.py), so reruns that only change chaptering or
+output formats skip transcription. Pass --no-cache to force a fresh run.
+
+With --workers N, long files are split at quiet points into overlapping
+chunks that are transcribed in parallel by N worker processes (each loading
+its own model, so budget RAM accordingly) and stitched back together with
+global timestamps. The output schema is unchanged.
+
+With --stream, segments are written as soon as each window of audio is
+decoded: SRT cues are appended to <name>.srt and one JSON record per segment
+to <name>.ndjson, followed by a final record with the chapters. Windows are
+the same quiet-point chunks used by --workers (transcribed in order by the
+single warm model when --workers is 1).
+
+With --checkpoint, each finished chunk and the downloaded media are kept
+under a job directory (see transcript_jobs.py). Re-running the same command
+after a crash resumes from the last committed chunk; the job directory is
+removed once the outputs are written.
+
+Word-level timestamps are written to a compact binary sidecar,
+<name>.words.bin (see word_timings.py), instead of bloating the JSON.
+
+Whenever an input is decoded, the same samples also give <name>.peaks.bin,
+a min/max waveform pyramid for scrubbers (see audio_peaks.py), and
+<name>.fp.bin, an audio fingerprint for spotting re-uploads and re-edits
+(see audio_fingerprint.py). Both are computed on the writer thread on the
+original timeline (before --vad cuts); cache hits are not decoded, so they
+skip them. --output audio writes only these.
+
+With --vad, non-speech audio (intros, outros, long pauses) is detected and
+cut out before inference (see voice_activity.py), and timestamps are mapped
+back to the original timeline. The detected pauses also mark chapter breaks.
+
+Chapters start where the topic changes (see semantic_chapters.py): segments
+are embedded and breaks go in valleys of the similarity between neighbouring
+blocks, snapped to the nearest long pause. --chapters pauses restores the
+pause-only heuristic; --embedder minilm uses sentence-transformers instead of
+the default hashed TF-IDF vectors.
+
+With --cascade MODEL, a draft model smaller than --model (e.g. base)
+transcribes the file first and only its low-confidence segments (by
+avg_logprob, compression ratio and no_speech_prob; see model_cascade.py) are
+transcribed again by --model and spliced back in. Clean narration runs at
+close to draft-model speed, and --model is not even loaded for a file with
+no weak segments.
+The cascade replaces the single whole-file pass, so it can't be combined
+with --workers, --stream or --checkpoint.
+
+--backend picks the inference engine (see transcribe_backends.py): the
+default openai-whisper, or faster-whisper (CTranslate2, int8 on CPU), which
+is several times faster on hosts without a GPU. Results have the same shape
+either way; the backend is part of the cache key.
+
+--from-json re-renders JSON/SRT/TXT from existing transcript JSON files
+(optionally regenerating chapters with --rechapter) without Whisper. Whisper,
+torch and NumPy are only imported on the code paths that need them, so
+--help and --from-json start in a fraction of a second.
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
-import tempfile
-import urllib.request
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
+from urllib.parse import unquote
+
+from transcript_cache import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_MAX_MB,
+    TranscriptCache,
+    hash_file,
+    remote_fingerprint,
+)
+from transcribe_backends import (
+    BACKENDS,
+    DEFAULT_BACKEND,
+    BackendUnavailable,
+    check_backend,
+    load_audio,
+    load_backend,
+)
+from transcript_jobs import DEFAULT_JOBS_DIR, JobCheckpoint, make_job_id
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    import numpy as np
+
+# Decoding options passed to model.transcribe(); part of the cache key
+WHISPER_OPTIONS = {"word_timestamps": True}
+
+SAMPLE_RATE = 16000
 
-try:
-    import whisper
-except ImportError:
-    print("Error: whisper not installed. Run: pip3 install openai-whisper")
-    sys.exit(1)
+# Chapter generators: topic changes in the text, or long pauses only
+CHAPTERERS = ("semantic", "pauses")
+
+# Whisper model sizes, smallest first
+MODEL_SIZES = ["tiny", "base", "small", "medium", "large"]
 
 
 def download_file(url: str, output_dir: str) -> str:
     """Download a file from URL to temp directory."""
     filename = url.split("/")[-1]
     # URL decode the filename
-    filename = urllib.request.unquote(filename)
+    filename = unquote(filename)
     output_path = os.path.join(output_dir, filename)
     
+    if os.path.exists(output_path):
+        print(f"♻️  Reusing download: {output_path}")
+        return output_path
+    
     print(f"📥 Downloading: {filename}")
-    urllib.request.urlretrieve(url, output_path)
+    # Download under a temporary name so an interrupted run never leaves a
+    # truncated file that looks complete
+    import urllib.request
+    urllib.request.urlretrieve(url, output_path + ".part")
+    os.replace(output_path + ".part", output_path)
     print(f"✅ Downloaded to: {output_path}")
     return output_path
 
@@ -61,12 +170,15 @@ def format_srt_timestamp(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
-def generate_chapters(segments: list, min_gap: float = 30.0) -> list:
+def generate_chapters(segments: list, min_gap: float = 30.0,
+                      pauses: Optional["np.ndarray"] = None) -> list:
     """
     Generate chapter markers from transcript segments.
     
     Uses natural pauses (gaps > min_gap seconds) and topic shifts
-    to determine chapter boundaries.
+    to determine chapter boundaries. If VAD pauses ((n, 2) seconds) are
+    given, a pause is measured from the silence itself rather than from
+    segment boundaries, which Whisper often stretches over silence.
     """
     if not segments:
         return []
@@ -74,6 +186,7 @@ def generate_chapters(segments: list, min_gap: float = 30.0) -> list:
     chapters = []
     current_chapter_start = 0
     current_chapter_text = []
+    last_start = 0
     last_end = 0
     
     for i, segment in enumerate(segments):
@@ -83,6 +196,9 @@ def generate_chapters(segments: list, min_gap: float = 30.0) -> list:
         
         # Detect chapter break: significant pause or change in topic
         gap = start - last_end if last_end > 0 else 0
+        if pauses is not None and len(pauses) and last_end > 0:
+            from voice_activity import longest_pause
+            gap = max(gap, longest_pause(pauses, last_start, start))
         
         # Start new chapter on significant gaps or every ~2-3 minutes
         should_break = (
@@ -103,6 +219,7 @@ def generate_chapters(segments: list, min_gap: float = 30.0) -> list:
             current_chapter_text = []
         
         current_chapter_text.append(text)
+        last_start = start
         last_end = end
     
     # Don't forget the last chapter
@@ -122,6 +239,62 @@ def generate_chapters(segments: list, min_gap: float = 30.0) -> list:
     return chapters
 
 
+def generate_semantic_chapters(segments: list, embedder: Optional[str] = None,
+                               pauses: Optional["np.ndarray"] = None) -> list:
+    """
+    Generate chapter markers at topic changes (see semantic_chapters.py).
+    
+    Boundaries sit in valleys of the similarity between neighbouring blocks
+    of segment embeddings, moved onto the longest nearby pause (measured
+    from VAD pauses, if given). Each chapter is titled from the segment most
+    typical of its opening. Same output shape as generate_chapters().
+    """
+    if not segments:
+        return []
+    
+    from semantic_chapters import DEFAULT_EMBEDDER, topic_boundaries
+    
+    texts = [seg["text"].strip() for seg in segments]
+    gaps = [0.0]
+    for prev, seg in zip(segments, segments[1:]):
+        gap = max(seg["start"] - prev["end"], 0.0)
+        if pauses is not None and len(pauses):
+            from voice_activity import longest_pause
+            gap = max(gap, longest_pause(pauses, prev["start"], seg["start"]))
+        gaps.append(gap)
+    
+    starts, representatives = topic_boundaries(
+        texts,
+        [seg["start"] for seg in segments],
+        [seg["end"] for seg in segments],
+        embedder or DEFAULT_EMBEDDER,
+        gaps=gaps
+    )
+    
+    chapters = []
+    for number, (first, last, typical) in enumerate(
+            zip(starts, starts[1:] + [len(segments)], representatives), 1):
+        start = segments[first]["start"] if number > 1 else 0
+        chapters.append({
+            "start": start,
+            "start_formatted": format_timestamp(start),
+            "title": generate_chapter_title(texts[typical:last]),
+            "text_preview": " ".join(texts[first:last][:3])[:200],
+            "number": number
+        })
+    
+    return chapters
+
+
+def chapter_segments(segments: list, chapters: str = "semantic",
+                     embedder: Optional[str] = None,
+                     pauses: Optional["np.ndarray"] = None) -> list:
+    """Chapters from the named chapterer: "semantic" (topics) or "pauses" (gaps only)."""
+    if chapters == "pauses":
+        return generate_chapters(segments, pauses=pauses)
+    return generate_semantic_chapters(segments, embedder, pauses)
+
+
 def generate_chapter_title(texts: list) -> str:
     """Generate a chapter title from the first few sentences."""
     # Take first sentence or first 50 chars
@@ -145,10 +318,57 @@ def generate_chapter_title(texts: list) -> str:
     return combined.strip() or "Introduction"
 
 
+def transcribe_options_for(chunked: bool, chunk_seconds: float, chunk_overlap: float,
+                           vad: bool = False, vad_min_silence: float = 1.0,
+                           backend: str = DEFAULT_BACKEND,
+                           cascade: Optional[str] = None) -> dict:
+    """Options that affect the transcription result (used as the cache key)."""
+    options = dict(WHISPER_OPTIONS)
+    if backend != DEFAULT_BACKEND:
+        options.update(backend=backend)
+    if chunked:
+        options.update(chunk_seconds=chunk_seconds, chunk_overlap=chunk_overlap)
+    if vad:
+        options.update(vad_min_silence=vad_min_silence)
+    if cascade:
+        options.update(cascade=cascade)
+    return options
+
+
+def transcribe_options(args) -> dict:
+    """transcribe_options_for() from parsed command-line arguments."""
+    return transcribe_options_for(args.workers > 1 or args.stream or args.checkpoint,
+                                  args.chunk_seconds, args.chunk_overlap,
+                                  args.vad, args.vad_min_silence, args.backend, args.cascade)
+
+
+@functools.lru_cache(maxsize=None)
+def load_model(model_name: str = "medium", backend: str = DEFAULT_BACKEND):
+    """Load a Whisper model once per process so it is reused across files."""
+    print(f"🎤 Loading Whisper model: {model_name} ({backend})")
+    print("   (First run will download the model, ~1.5GB for medium)")
+    return load_backend(backend, model_name)
+
+
 def transcribe(
     file_path: str,
     model_name: str = "medium",
-    language: Optional[str] = None
+    language: Optional[str] = None,
+    model=None,
+    audio=None,
+    cache: Optional[TranscriptCache] = None,
+    audio_hash: Optional[str] = None,
+    workers: int = 1,
+    chunk_seconds: float = 120.0,
+    chunk_overlap: float = 3.0,
+    on_segment: Optional[Callable[[dict], None]] = None,
+    checkpoint: Optional[JobCheckpoint] = None,
+    vad: bool = False,
+    vad_min_silence: float = 1.0,
+    backend: str = DEFAULT_BACKEND,
+    chapters: str = "semantic",
+    embedder: Optional[str] = None,
+    cascade: Optional[str] = None
 ) -> dict:
     """
     Transcribe audio/video file using Whisper.
@@ -157,26 +377,347 @@ def transcribe(
         file_path: Path to audio/video file
         model_name: Whisper model (tiny, base, small, medium, large)
         language: Optional language code (e.g., 'en')
+        model: Already loaded Whisper model; loaded from model_name if omitted
+        audio: Pre-decoded 16 kHz mono samples of file_path (skips decoding)
+        cache: Transcript cache to read from and store into
+        audio_hash: Content hash of file_path, if already computed
+        workers: Worker processes for chunked transcription (1 disables it)
+        chunk_seconds: Target chunk length when chunking
+        chunk_overlap: Audio shared between neighbouring chunks, in seconds
+        on_segment: Called with each raw segment, in order, as it is decoded
+                    (enables chunking so long files stream window by window)
+        checkpoint: Job to commit finished chunks to and resume from
+                    (enables chunking)
+        vad: Cut non-speech audio before inference (timestamps are mapped back)
+        vad_min_silence: Shortest pause, in seconds, that VAD cuts out
+        backend: Inference engine (see transcribe_backends.BACKENDS)
+        chapters: Chapter generator, "semantic" or "pauses" (see CHAPTERERS)
+        embedder: Embedder for semantic chapters (see semantic_chapters.EMBEDDERS)
+        cascade: Draft model that transcribes first; only its weak segments
+                 are redone with model_name (ignored when chunking)
     
     Returns:
         Dict with transcript, segments, and generated chapters
     """
-    print(f"🎤 Loading Whisper model: {model_name}")
-    print("   (First run will download the model, ~1.5GB for medium)")
-    model = whisper.load_model(model_name)
+    result = None
+    cache_key = None
+    chunked = workers > 1 or on_segment is not None or checkpoint is not None
+    cascade = None if chunked else cascade
+    options = transcribe_options_for(chunked, chunk_seconds, chunk_overlap, vad, vad_min_silence,
+                                     backend, cascade)
+    
+    if cache is not None:
+        cache_key = cache.make_key(audio_hash or hash_file(file_path),
+                                   model_name, language, options)
+        result = cache.get(cache_key)
+        if result is not None:
+            print(f"⚡ Cache hit: {Path(file_path).name}")
+            emit_segments(result["segments"], on_segment)
+    
+    if result is not None:
+        return build_result(result, chapters, embedder)
+    
+    timeline = None
+    if vad:
+        from voice_activity import SpeechTimeline
+        
+        if audio is None:
+            audio = load_audio(file_path)
+        timeline = SpeechTimeline.from_audio(audio, min_silence=vad_min_silence)
+        duration = len(audio) / SAMPLE_RATE
+        print(f"🔇 VAD: keeping {timeline.speech_seconds:.0f}s of speech out of {duration:.0f}s")
+        audio = timeline.compact(audio)
+        if on_segment is not None:
+            stream_segment = on_segment
+            on_segment = lambda seg: stream_segment(timeline.remap_segment(seg))
+    
+    if chunked:
+        if audio is None:
+            audio = load_audio(file_path)
+        if len(audio) > chunk_seconds * 1.5 * SAMPLE_RATE:
+            print(f"📝 Transcribing: {file_path}")
+            if workers > 1:
+                print(f"   Chunked across {workers} worker processes...")
+            else:
+                print(f"   Streaming in ~{chunk_seconds:.0f}s windows...")
+            result = transcribe_chunked(audio, model_name, language, workers,
+                                        chunk_seconds, chunk_overlap,
+                                        on_segment=on_segment, model=model,
+                                        checkpoint=checkpoint, backend=backend)
+    
+    if result is None and cascade:
+        if audio is None:
+            audio = load_audio(file_path)
+        print(f"📝 Transcribing: {file_path}")
+        print(f"   Drafting with {cascade}, escalating weak segments to {model_name}...")
+        result = transcribe_cascade(audio, cascade, model_name, language, model=model,
+                                    backend=backend)
+        emit_segments(result["segments"], on_segment)
+    
+    if result is None:
+        if model is None:
+            model = load_model(model_name, backend)
+        
+        print(f"📝 Transcribing: {file_path}")
+        print("   This may take a few minutes...")
+        
+        result = model.transcribe(
+            file_path if audio is None else audio,
+            language=language,
+            **WHISPER_OPTIONS
+        )
+        emit_segments(result["segments"], on_segment)
+    
+    if timeline is not None:
+        result = timeline.remap_result(result)
+    
+    if cache is not None:
+        cache.put(cache_key, result)
+    
+    return build_result(result, chapters, embedder)
+
+
+def emit_segments(segments: list, on_segment: Optional[Callable[[dict], None]]):
+    """Pass already decoded segments to a streaming callback, if any."""
+    if on_segment is not None:
+        for seg in segments:
+            on_segment(seg)
+
+
+def find_split_points(
+    audio: "np.ndarray",
+    chunk_seconds: float,
+    search_seconds: float = 10.0,
+    frame_seconds: float = 0.1
+) -> list:
+    """
+    Pick chunk boundaries (in seconds) at the quietest frames near each target.
+    
+    Every ~chunk_seconds, the lowest-RMS frame within +/- search_seconds of the
+    target is chosen, so cuts land in pauses rather than mid-word.
+    """
+    import numpy as np
+    
+    frame = int(frame_seconds * SAMPLE_RATE)
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return []
     
-    print(f"📝 Transcribing: {file_path}")
-    print("   This may take a few minutes...")
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    energy = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    duration = n_frames * frame_seconds
     
-    result = model.transcribe(
-        file_path,
+    # Keep the window inside the chunk so every split moves forward
+    search_seconds = min(search_seconds, chunk_seconds / 2)
+    splits = []
+    target = chunk_seconds
+    while target < duration - chunk_seconds / 2:
+        lo = int(max(0.0, target - search_seconds) / frame_seconds)
+        hi = max(lo + 1, int(min(duration, target + search_seconds) / frame_seconds))
+        quietest = lo + int(np.argmin(energy[lo:hi]))
+        split = (quietest + 0.5) * frame_seconds
+        splits.append(split)
+        target = split + chunk_seconds
+    
+    return splits
+
+
+_chunk_pools = {}
+_worker_model = None
+
+
+def _init_chunk_worker(model_name: str, threads: int, backend: str = DEFAULT_BACKEND):
+    """Process-pool initializer: load one model per worker process."""
+    global _worker_model
+    _worker_model = load_backend(backend, model_name, threads)
+
+
+def _transcribe_chunk(audio: "np.ndarray", offset: float, language: Optional[str],
+                      model=None) -> dict:
+    """Transcribe one chunk (in a worker by default) and shift its timestamps by offset."""
+    result = (model or _worker_model).transcribe(
+        audio,
+        language=language,
+        **WHISPER_OPTIONS
+    )
+    for seg in result["segments"]:
+        seg["start"] += offset
+        seg["end"] += offset
+        for word in seg.get("words", []):
+            word["start"] += offset
+            word["end"] += offset
+    return result
+
+
+def transcribe_cascade(
+    audio: "np.ndarray",
+    draft_model_name: str,
+    model_name: str,
+    language: Optional[str],
+    model=None,
+    backend: str = DEFAULT_BACKEND
+) -> dict:
+    """
+    Transcribe with a draft model and redo only its weak regions with model_name.
+    
+    The larger model is loaded only if some region needs it. When most of
+    the audio is weak, it transcribes the whole file instead.
+    
+    Returns:
+        Dict shaped like model.transcribe() output
+    """
+    from model_cascade import MAX_ESCALATED_SHARE, context_window, splice, weak_regions
+    
+    draft = load_model(draft_model_name, backend).transcribe(
+        audio,
         language=language,
-        verbose=False,
-        word_timestamps=True
+        **WHISPER_OPTIONS
     )
+    duration = len(audio) / SAMPLE_RATE
+    regions = weak_regions(draft["segments"], duration)
+    weak_seconds = float((regions[:, 1] - regions[:, 0]).sum())
+    print(f"🪜 Cascade: {len(regions)} weak regions ({weak_seconds:.0f}s of {duration:.0f}s)")
+    if len(regions) == 0:
+        return draft
+    
+    model = model or load_model(model_name, backend)
+    if weak_seconds > MAX_ESCALATED_SHARE * duration:
+        print(f"   Mostly weak, transcribing the whole file with {model_name}")
+        return model.transcribe(audio, language=language, **WHISPER_OPTIONS)
+    
+    # Keep the draft's language so short regions are not re-detected
+    language = language or draft.get("language")
+    redone = []
+    for region in regions:
+        start, end = context_window(region, duration)
+        redone.append(_transcribe_chunk(audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)],
+                                        start, language, model))
+    return splice(draft, regions, redone)
+
+
+def get_chunk_pool(model_name: str, workers: int,
+                   backend: str = DEFAULT_BACKEND) -> "ProcessPoolExecutor":
+    """Worker pool for chunked transcription, kept warm for the whole run."""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    key = (model_name, workers, backend)
+    if key not in _chunk_pools:
+        threads = max(1, (os.cpu_count() or workers) // workers)
+        print(f"🎤 Starting {workers} workers with Whisper model: {model_name} ({backend})")
+        _chunk_pools[key] = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_chunk_worker,
+            initargs=(model_name, threads, backend)
+        )
+    return _chunk_pools[key]
+
+
+def shutdown_chunk_pools():
+    """Stop all chunk worker processes."""
+    for pool in _chunk_pools.values():
+        pool.shutdown()
+    _chunk_pools.clear()
+
+
+def transcribe_chunked(
+    audio: "np.ndarray",
+    model_name: str,
+    language: Optional[str],
+    workers: int,
+    chunk_seconds: float = 120.0,
+    chunk_overlap: float = 3.0,
+    on_segment: Optional[Callable[[dict], None]] = None,
+    model=None,
+    checkpoint: Optional[JobCheckpoint] = None,
+    backend: str = DEFAULT_BACKEND
+) -> dict:
+    """
+    Transcribe long audio as overlapping chunks in parallel worker processes.
+    
+    Each chunk owns the region between two split points and is padded with
+    chunk_overlap seconds of context on both sides. When stitching, a segment
+    is kept only by the chunk whose owned region contains its midpoint, which
+    drops the duplicates decoded in the overlaps.
+    
+    With workers == 1 the chunks are transcribed in order by a single
+    in-process model. Kept segments are passed to on_segment as soon as their
+    chunk and all earlier chunks are done. With a checkpoint, every chunk is
+    committed as soon as it finishes and chunks committed by an earlier,
+    interrupted run are reused instead of transcribed again.
+    
+    Returns:
+        Dict shaped like model.transcribe() output, with global timestamps
+    """
+    duration = len(audio) / SAMPLE_RATE
+    bounds = [0.0] + find_split_points(audio, chunk_seconds) + [duration]
+    regions = list(zip(bounds[:-1], bounds[1:]))
+    
+    chunks = []
+    for own_start, own_end in regions:
+        start = max(0.0, own_start - chunk_overlap)
+        end = min(duration, own_end + chunk_overlap)
+        chunks.append((audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)], start))
+    
+    done = checkpoint.load_chunks(regions) if checkpoint is not None else {}
+    if done:
+        print(f"⏩ Resuming job {checkpoint.job_id}: {len(done)}/{len(regions)} chunks already done")
+    
+    def commit(index: int, result: dict) -> dict:
+        if checkpoint is not None:
+            checkpoint.commit_chunk(index, regions[index], result)
+        return result
     
-    # Generate chapters from segments
-    chapters = generate_chapters(result["segments"])
+    def commit_future(index: int, future):
+        if future.exception() is None:
+            commit(index, future.result())
+    
+    if workers > 1:
+        pool = get_chunk_pool(model_name, workers, backend)
+        futures = {}
+        for i, (chunk, start) in enumerate(chunks):
+            if i in done:
+                continue
+            futures[i] = pool.submit(_transcribe_chunk, chunk, start, language)
+            if checkpoint is not None:
+                # Commit on completion, not in stitch order, so no finished work is lost
+                futures[i].add_done_callback(functools.partial(commit_future, i))
+        results = (done[i] if i in done else futures[i].result() for i in range(len(chunks)))
+    else:
+        if len(done) < len(chunks):
+            model = model or load_model(model_name, backend)
+        results = (done[i] if i in done else commit(i, _transcribe_chunk(chunk, start, language, model))
+                   for i, (chunk, start) in enumerate(chunks))
+    
+    segments = []
+    languages = Counter()
+    for (own_start, own_end), result in zip(regions, results):
+        languages[result.get("language")] += 1
+        for seg in sorted(result["segments"], key=lambda seg: seg["start"]):
+            midpoint = (seg["start"] + seg["end"]) / 2
+            if own_start <= midpoint < own_end:
+                seg["id"] = len(segments)
+                segments.append(seg)
+                if on_segment is not None:
+                    on_segment(seg)
+    
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": language or languages.most_common(1)[0][0],
+    }
+
+
+def build_result(result: dict, chapters: str = "semantic",
+                 embedder: Optional[str] = None) -> dict:
+    """Build the transcript/segments/chapters dict from raw Whisper output."""
+    from word_timings import collect_words
+    
+    # Generate chapters from segments (and VAD pauses, if available)
+    pauses = None
+    if result.get("speech_regions"):
+        from voice_activity import pauses_between
+        pauses = pauses_between(result["speech_regions"])
+    chapter_list = chapter_segments(result["segments"], chapters, embedder, pauses)
     
     # Build full transcript text
     full_text = result["text"].strip()
@@ -198,13 +739,16 @@ def transcribe(
         "duration_formatted": format_timestamp(result["segments"][-1]["end"] if result["segments"] else 0),
         "full_transcript": full_text,
         "segments": timestamped_segments,
-        "chapters": chapters,
-        "word_count": len(full_text.split())
+        "chapters": chapter_list,
+        "word_count": len(full_text.split()),
+        # Columnar word timings for the .words.bin sidecar (not saved in the JSON)
+        "words": collect_words(result["segments"])
     }
 
 
 def output_json(result: dict, output_path: str):
-    """Save result as JSON."""
+    """Save result as JSON (word timings go to the sidecar instead)."""
+    result = {key: value for key, value in result.items() if key != "words"}
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(result, f, indent=2, ensure_ascii=False)
     print(f"📄 JSON saved: {output_path}")
@@ -236,24 +780,408 @@ def output_txt(result: dict, output_path: str):
     print(f"📄 TXT saved: {output_path}")
 
 
-def main():
+class SegmentStream:
+    """
+    Incremental SRT and NDJSON writer for one transcript.
+    
+    Each segment is appended (and flushed) as soon as it is decoded, so the
+    files can be tailed while a long episode is still being transcribed.
+    close() appends a final "chapters" record once all segments are known.
+    """
+    
+    def __init__(self, output_dir: Path, base_name: str, output_format: str):
+        self.count = 0
+        self.srt_path = output_dir / f"{base_name}.srt"
+        self.ndjson_path = output_dir / f"{base_name}.ndjson"
+        self.srt = None
+        if output_format in ["srt", "all"]:
+            self.srt = open(self.srt_path, "w", encoding="utf-8")
+        self.ndjson = open(self.ndjson_path, "w", encoding="utf-8")
+    
+    def write(self, seg: dict):
+        """Append one raw Whisper segment."""
+        self.count += 1
+        text = seg["text"].strip()
+        
+        if self.srt is not None:
+            self.srt.write(f"{self.count}\n")
+            self.srt.write(f"{format_srt_timestamp(seg['start'])} --> {format_srt_timestamp(seg['end'])}\n")
+            self.srt.write(f"{text}\n\n")
+            self.srt.flush()
+        
+        self.ndjson.write(json.dumps({
+            "type": "segment",
+            "index": self.count - 1,
+            "start": seg["start"],
+            "end": seg["end"],
+            "start_formatted": format_timestamp(seg["start"]),
+            "end_formatted": format_timestamp(seg["end"]),
+            "text": text
+        }, ensure_ascii=False) + "\n")
+        self.ndjson.flush()
+    
+    def close(self, result: Optional[dict] = None):
+        """Finalise the stream with chapters and totals (if the run succeeded)."""
+        if result is not None:
+            self.ndjson.write(json.dumps({
+                "type": "chapters",
+                "language": result["language"],
+                "duration_seconds": result["duration_seconds"],
+                "word_count": result["word_count"],
+                "chapters": result["chapters"]
+            }, ensure_ascii=False) + "\n")
+        
+        self.ndjson.close()
+        print(f"📄 NDJSON streamed: {self.ndjson_path}")
+        if self.srt is not None:
+            self.srt.close()
+            print(f"📄 SRT streamed: {self.srt_path}")
+
+
+def output_words(result: dict, output_path: str):
+    """Save word-level timestamps as a columnar binary sidecar."""
+    from word_timings import write_word_sidecar
+    write_word_sidecar(result["words"], output_path)
+    print(f"📄 Word timings saved: {output_path} ({len(result['words']['text'])} words)")
+
+
+def output_audio_sidecars(audio: "np.ndarray", output_dir: Path, base_name: str):
+    """Save waveform peaks and the audio fingerprint of decoded samples."""
+    from audio_fingerprint import compute_fingerprint, write_fingerprint
+    from audio_peaks import compute_peaks, write_peaks
+    peaks_path = output_dir / f"{base_name}.peaks.bin"
+    write_peaks(compute_peaks(audio), peaks_path)
+    print(f"📄 Waveform peaks saved: {peaks_path}")
+    fingerprint_path = output_dir / f"{base_name}.fp.bin"
+    write_fingerprint(compute_fingerprint(audio), fingerprint_path)
+    print(f"📄 Fingerprint saved: {fingerprint_path}")
+
+
+def read_manifest(manifest_path: str) -> list:
+    """Read one URL or file path per line, skipping blanks and # comments."""
+    inputs = []
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                inputs.append(line)
+    return inputs
+
+
+def is_url(value: str) -> bool:
+    """Check whether an input refers to a remote file."""
+    return value.startswith("http://") or value.startswith("https://")
+
+
+def print_summary(result: dict):
+    """Print duration, word count and chapters for a finished transcript."""
+    print("\n" + "="*50)
+    print("✅ TRANSCRIPTION COMPLETE")
+    print("="*50)
+    print(f"📊 Duration: {result['duration_formatted']}")
+    print(f"📝 Word count: {result['word_count']}")
+    print(f"🔤 Language: {result['language']}")
+    print(f"📑 Chapters: {len(result['chapters'])}")
+    
+    print("\n📑 CHAPTERS:")
+    for ch in result["chapters"]:
+        print(f"   [{ch['start_formatted']}] {ch['title']}")
+
+
+def write_outputs(result: dict, output_dir: Path, base_name: str, output_format: str,
+                  streamed: bool = False):
+    """Write the requested JSON/SRT/TXT files for one transcript."""
+    print("\n💾 SAVING FILES:")
+    
+    if output_format in ["json", "all"]:
+        output_json(result, output_dir / f"{base_name}.json")
+    
+    # A streamed SRT is already complete on disk
+    if output_format in ["srt", "all"] and not streamed:
+        output_srt(result, output_dir / f"{base_name}.srt")
+    
+    if output_format in ["txt", "all"]:
+        output_txt(result, output_dir / f"{base_name}.txt")
+    
+    if output_format in ["words", "all"] and result.get("words", {}).get("text"):
+        output_words(result, output_dir / f"{base_name}.words.bin")
+
+
+def load_transcript(json_path: str) -> dict:
+    """Read a transcript JSON written by output_json() back into a result dict."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def render_transcripts(inputs: list, output_dir: Path, output_format: str,
+                       rechapter: bool = False, chapters: str = "semantic",
+                       embedder: Optional[str] = None) -> list:
+    """
+    Re-render outputs from existing transcript JSON files, without Whisper.
+    
+    Args:
+        inputs: Transcript JSON files
+        output_dir: Directory to write the outputs to
+        output_format: json, srt, txt or all (word timings are not in the JSON)
+        rechapter: Regenerate chapters from the segments
+        chapters: Chapter generator used with rechapter (see CHAPTERERS)
+        embedder: Embedder for semantic chapters
+    
+    Returns:
+        List of inputs that failed
+    """
+    failures = []
+    for json_path in inputs:
+        try:
+            result = load_transcript(json_path)
+            if rechapter:
+                result["chapters"] = chapter_segments(result["segments"], chapters, embedder)
+            print(f"\n🔁 Re-rendering: {json_path}")
+            write_outputs(result, output_dir, Path(json_path).stem, output_format)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ Error rendering {json_path}: {e}")
+            failures.append(json_path)
+    return failures
+
+
+def prepare_input(source: str, args, cache: Optional[TranscriptCache] = None) -> dict:
+    """
+    Download (if needed) and decode one input to 16 kHz mono PCM.
+    
+    Runs on the prefetch pool so network and ffmpeg work overlaps with
+    inference on the main thread. With a cache, inputs that are already
+    transcribed are hashed but not decoded, and unchanged URLs are not
+    downloaded at all.
+    """
+    job = {"source": source, "path": source, "temp_dir": None, "audio": None, "hash": None,
+           "checkpoint": None}
+    
+    try:
+        if is_url(source):
+            fingerprint = remote_fingerprint(source) if cache is not None else None
+            if fingerprint:
+                known_hash = cache.lookup_url(source, fingerprint)
+                if known_hash and cache.contains(cache.make_key(
+                        known_hash, args.model, args.language, transcribe_options(args))):
+                    # Only the name is needed to label the outputs
+                    job["path"] = unquote(source.split("/")[-1])
+                    job["hash"] = known_hash
+                    return job
+            
+            if args.checkpoint:
+                # Keep the download with the job so a restart does not re-fetch it
+                job["checkpoint"] = open_checkpoint(source, args)
+                job["path"] = download_file(source, str(job["checkpoint"].media_dir))
+            else:
+                import tempfile
+                job["temp_dir"] = tempfile.mkdtemp()
+                job["path"] = download_file(source, job["temp_dir"])
+            if fingerprint:
+                job["hash"] = hash_file(job["path"])
+                cache.remember_url(source, fingerprint, job["hash"])
+        
+        if not os.path.exists(job["path"]):
+            raise FileNotFoundError(f"File not found: {job['path']}")
+        
+        if args.checkpoint and job["checkpoint"] is None:
+            job["checkpoint"] = open_checkpoint(source, args)
+        
+        if cache is not None:
+            job["hash"] = job["hash"] or hash_file(job["path"])
+            if cache.contains(cache.make_key(job["hash"], args.model, args.language,
+                                             transcribe_options(args))):
+                return job
+        
+        print(f"🎧 Decoding: {Path(job['path']).name}")
+        job["audio"] = load_audio(job["path"])
+    except Exception:
+        cleanup_input(job)
+        raise
+    
+    return job
+
+
+def open_checkpoint(source: str, args) -> JobCheckpoint:
+    """Open (or create) the checkpoint directory for one input."""
+    job_id = make_job_id(source, args.model, args.language, transcribe_options(args))
+    print(f"🧷 Job {job_id}: {source}")
+    return JobCheckpoint(args.jobs_dir, job_id, source)
+
+
+def cleanup_input(job: dict):
+    """Remove the temp download directory of a prepared input."""
+    if job["temp_dir"]:
+        import shutil
+        shutil.rmtree(job["temp_dir"], ignore_errors=True)
+        job["temp_dir"] = None
+
+
+def finish_input(result: dict, job: dict, output_dir: Path, output_format: str,
+                 stream: Optional[SegmentStream] = None):
+    """Print the summary, save outputs and clean up (runs on the writer thread)."""
+    try:
+        if stream is not None:
+            stream.close(result)
+        print_summary(result)
+        write_outputs(result, output_dir, Path(job["path"]).stem, output_format,
+                      streamed=stream is not None)
+        if job["checkpoint"] is not None:
+            job["checkpoint"].finish()
+    finally:
+        cleanup_input(job)
+
+
+def run_pipeline(inputs: list, model, args, output_dir: Path,
+                 cache: Optional[TranscriptCache] = None) -> list:
+    """
+    Transcribe inputs in order, overlapping I/O with inference.
+    
+    Up to args.prefetch inputs are downloaded and decoded ahead of the one
+    being transcribed, and outputs are written by a single writer thread.
+    
+    Returns:
+        List of inputs that failed
+    """
+    window = max(1, args.prefetch)
+    failures = []
+    writes = []
+    sources = iter(inputs)
+    
+    with ThreadPoolExecutor(max_workers=window, thread_name_prefix="prefetch") as prefetch_pool, \
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer") as writer:
+        queue = deque()
+        for source in sources:
+            queue.append((source, prefetch_pool.submit(prepare_input, source, args, cache)))
+            if len(queue) >= window:
+                break
+        
+        index = 0
+        while queue:
+            source, future = queue.popleft()
+            next_source = next(sources, None)
+            if next_source is not None:
+                queue.append((next_source, prefetch_pool.submit(prepare_input, next_source, args, cache)))
+            
+            index += 1
+            if len(inputs) > 1:
+                print(f"\n📦 [{index}/{len(inputs)}] {source}")
+            
+            try:
+                job = future.result()
+            except Exception as e:
+                print(f"❌ Error preparing {source}: {e}")
+                failures.append(source)
+                continue
+            
+            stream = None
+            on_segment = None
+            if args.stream:
+                stream = SegmentStream(output_dir, Path(job["path"]).stem, args.output)
+                # Appends go through the writer thread, in order, off the inference thread
+                on_segment = functools.partial(writer.submit, stream.write)
+            
+            try:
+                result = transcribe(job["path"], args.model, args.language,
+                                    model=model, audio=job["audio"],
+                                    cache=cache, audio_hash=job["hash"],
+                                    workers=args.workers,
+                                    chunk_seconds=args.chunk_seconds,
+                                    chunk_overlap=args.chunk_overlap,
+                                    on_segment=on_segment,
+                                    checkpoint=job["checkpoint"],
+                                    vad=args.vad,
+                                    vad_min_silence=args.vad_min_silence,
+                                    backend=args.backend,
+                                    chapters=args.chapters,
+                                    embedder=args.embedder,
+                                    cascade=args.cascade)
+            except Exception as e:
+                print(f"❌ Transcription error: {e}")
+                if stream is not None:
+                    writer.submit(stream.close)
+                cleanup_input(job)
+                failures.append(source)
+                continue
+            
+            if job["audio"] is not None and args.output in ["audio", "all"]:
+                writes.append((source, writer.submit(output_audio_sidecars, job["audio"],
+                                                     output_dir, Path(job["path"]).stem)))
+            # Release the decoded samples before the next file is transcribed
+            # (the writer drops its reference once the sidecars are saved)
+            job["audio"] = None
+            writes.append((source, writer.submit(finish_input, result, job, output_dir,
+                                                 args.output, stream)))
+        
+        for source, future in writes:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Error saving {source}: {e}")
+                if source not in failures:
+                    failures.append(source)
+    
+    return failures
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options of transcribe.py (also the job options of transcribe_worker.py)."""
     parser = argparse.ArgumentParser(
         description="Transcribe audio/video and generate chapters using Whisper"
     )
     parser.add_argument(
-        "input",
-        help="URL or file path to audio/video"
+        "inputs",
+        nargs="*",
+        metavar="input",
+        help="URLs or file paths to audio/video"
+    )
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help="Text file listing one URL or file path per line"
+    )
+    parser.add_argument(
+        "--from-json",
+        action="store_true",
+        help="Inputs are transcript JSON files; re-render outputs without Whisper"
+    )
+    parser.add_argument(
+        "--rechapter",
+        action="store_true",
+        help="With --from-json, regenerate chapters from the segments"
+    )
+    parser.add_argument(
+        "--chapters",
+        default="semantic",
+        choices=CHAPTERERS,
+        help="Chapter breaks at topic changes (semantic, default) or long pauses only"
+    )
+    parser.add_argument(
+        "--embedder",
+        default=None,
+        help="Segment embedder for semantic chapters: hashing (default, NumPy only) "
+             "or minilm (sentence-transformers)"
     )
     parser.add_argument(
         "--model", "-m",
         default="medium",
-        choices=["tiny", "base", "small", "medium", "large"],
+        choices=MODEL_SIZES,
         help="Whisper model size (default: medium)"
     )
+    parser.add_argument(
+        "--cascade",
+        choices=MODEL_SIZES[:-1],
+        help="Draft with this smaller model and redo only low-confidence segments with --model"
+    )
+    parser.add_argument(
+        "--backend", "-b",
+        default=DEFAULT_BACKEND,
+        choices=list(BACKENDS),
+        help=f"Inference engine (default: {DEFAULT_BACKEND}; faster-whisper is int8 on CPU)"
+    )
     parser.add_argument(
         "--output", "-o",
         default="all",
-        choices=["json", "srt", "txt", "all"],
+        choices=["json", "srt", "txt", "words", "audio", "all"],
         help="Output format (default: all)"
     )
     parser.add_argument(
@@ -266,64 +1194,140 @@ def main():
         default="./transcripts",
         help="Output directory (default: ./transcripts)"
     )
-    
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=2,
+        help="Inputs to download/decode ahead of transcription (default: 2)"
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Transcribe long files as parallel chunks in N processes (default: 1, off)"
+    )
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=120.0,
+        help="Target chunk length for --workers, split at quiet points (default: 120)"
+    )
+    parser.add_argument(
+        "--chunk-overlap",
+        type=float,
+        default=3.0,
+        help="Seconds of audio shared between neighbouring chunks (default: 3)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write SRT cues and NDJSON segment records as they are decoded"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Keep downloads and finished chunks so an interrupted run can resume"
+    )
+    parser.add_argument(
+        "--jobs-dir",
+        default=str(DEFAULT_JOBS_DIR),
+        help=f"Checkpoint directory for --checkpoint (default: {DEFAULT_JOBS_DIR})"
+    )
+    parser.add_argument(
+        "--vad",
+        action="store_true",
+        help="Skip non-speech audio (intros, outros, long pauses) during inference"
+    )
+    parser.add_argument(
+        "--vad-min-silence",
+        type=float,
+        default=1.0,
+        help="Shortest pause in seconds that --vad cuts out (default: 1)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the transcript cache"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Transcript cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_MB,
+        help=f"Maximum cache size in MB before LRU eviction (default: {DEFAULT_MAX_MB})"
+    )
+    return parser
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
     
+    inputs = list(args.inputs)
+    if args.manifest:
+        inputs.extend(read_manifest(args.manifest))
+    if not inputs:
+        parser.error("no inputs given (pass files/URLs or --manifest)")
+    
+    if args.cascade and (args.workers > 1 or args.stream or args.checkpoint):
+        parser.error("--cascade can't be combined with --workers, --stream or --checkpoint")
+    if args.cascade and MODEL_SIZES.index(args.cascade) >= MODEL_SIZES.index(args.model):
+        # The draft would be as slow as --model, and the cascade only adds a pass
+        parser.error(f"--cascade {args.cascade} must be a smaller model than --model {args.model}")
+    
     # Create output directory
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Handle URL or local file
-    input_path = args.input
-    temp_dir = None
+    if args.chapters == "semantic" and args.embedder:
+        from semantic_chapters import EmbedderUnavailable, check_embedder
+        try:
+            check_embedder(args.embedder)
+        except EmbedderUnavailable as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     
-    if input_path.startswith("http://") or input_path.startswith("https://"):
-        temp_dir = tempfile.mkdtemp()
-        input_path = download_file(args.input, temp_dir)
-    
-    if not os.path.exists(input_path):
-        print(f"❌ Error: File not found: {input_path}")
-        sys.exit(1)
+    if args.from_json:
+        failures = render_transcripts(inputs, output_dir, args.output, args.rechapter,
+                                      args.chapters, args.embedder)
+        if failures:
+            sys.exit(1)
+        print("\n✨ Done!")
+        return
     
-    # Transcribe
     try:
-        result = transcribe(input_path, args.model, args.language)
-    except Exception as e:
-        print(f"❌ Transcription error: {e}")
+        check_backend(args.backend)
+    except BackendUnavailable as e:
+        print(f"Error: {e}")
         sys.exit(1)
     
-    # Generate output filename
-    base_name = Path(input_path).stem
-    
-    # Print summary
-    print("\n" + "="*50)
-    print("✅ TRANSCRIPTION COMPLETE")
-    print("="*50)
-    print(f"📊 Duration: {result['duration_formatted']}")
-    print(f"📝 Word count: {result['word_count']}")
-    print(f"🔤 Language: {result['language']}")
-    print(f"📑 Chapters: {len(result['chapters'])}")
-    
-    print("\n📑 CHAPTERS:")
-    for ch in result["chapters"]:
-        print(f"   [{ch['start_formatted']}] {ch['title']}")
-    
-    # Save outputs
-    print("\n💾 SAVING FILES:")
+    # Fail fast on missing local files before paying for the model load
+    missing = [i for i in inputs if not is_url(i) and not os.path.exists(i)]
+    if missing and len(inputs) == 1:
+        print(f"❌ Error: File not found: {missing[0]}")
+        sys.exit(1)
     
-    if args.output in ["json", "all"]:
-        output_json(result, output_dir / f"{base_name}.json")
+    cache = None
+    if not args.no_cache:
+        cache = TranscriptCache(args.cache_dir, args.cache_size * 1024 * 1024)
     
-    if args.output in ["srt", "all"]:
-        output_srt(result, output_dir / f"{base_name}.srt")
+    # The model is loaded lazily (once) by the first input that misses the cache
+    try:
+        failures = run_pipeline(inputs, None, args, output_dir, cache)
+    finally:
+        shutdown_chunk_pools()
     
-    if args.output in ["txt", "all"]:
-        output_txt(result, output_dir / f"{base_name}.txt")
+    if len(inputs) > 1:
+        print(f"\n📦 Batch finished: {len(inputs) - len(failures)}/{len(inputs)} succeeded")
+        for source in failures:
+            print(f"   ❌ {source}")
     
-    # Cleanup temp files
-    if temp_dir:
-        import shutil
-        shutil.rmtree(temp_dir)
+    if failures:
+        sys.exit(1)
     
     print("\n✨ Done!")
 
@@ -0,0 +1,146 @@
+"""
+Inference backends for transcribe.py.
+
+Every backend takes a file path or 16 kHz mono float32 samples and returns
+the dict openai-whisper's model.transcribe() produces ("text", "language" and
+"segments" with start/end/text/avg_logprob/no_speech_prob/compression_ratio
+and per-word timings), so chunking, VAD, caching, chapters and the output
+writers work the same whichever engine decoded the audio.
+
+  whisper          openai-whisper (PyTorch); the reference implementation
+  faster-whisper   CTranslate2 with int8 weights on CPU (float16 on CUDA);
+                   several times faster on GPU-less hosts
+
+Engines (and NumPy) are imported only when a backend is loaded, so a host
+needs just the one it uses and importing this module stays cheap. Audio is decoded with ffmpeg directly, independent of the
+backend.
+"""
+
+import importlib.util
+import os
+import subprocess
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SAMPLE_RATE = 16000
+DEFAULT_BACKEND = "whisper"
+
+
+class BackendUnavailable(ImportError):
+    """The Python package behind a backend is not installed."""
+
+
+def load_audio(file_path: str, sample_rate: int = SAMPLE_RATE) -> "np.ndarray":
+    """Decode any ffmpeg-readable file to mono float32 samples at sample_rate."""
+    import numpy as np
+
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", file_path,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate), "-",
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not found. Install it (e.g. brew install ffmpeg)")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio: {e.stderr.decode(errors='replace')}") from e
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+class WhisperBackend:
+    """openai-whisper."""
+
+    package = "whisper"
+    install = "pip3 install openai-whisper"
+
+    def __init__(self, model_name: str, threads: Optional[int] = None):
+        import whisper
+
+        if threads:
+            try:
+                import torch
+                torch.set_num_threads(threads)
+            except ImportError:
+                pass
+        self.model = whisper.load_model(model_name)
+
+    def transcribe(self, audio, language: Optional[str] = None, **options) -> dict:
+        return self.model.transcribe(audio, language=language, verbose=False, **options)
+
+
+class FasterWhisperBackend:
+    """faster-whisper (CTranslate2), int8-quantised on CPU."""
+
+    package = "faster_whisper"
+    install = "pip3 install faster-whisper"
+
+    def __init__(self, model_name: str, threads: Optional[int] = None):
+        import ctranslate2
+        from faster_whisper import WhisperModel
+
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        self.model = WhisperModel(
+            model_name,
+            device=device,
+            compute_type="float16" if device == "cuda" else "int8",
+            cpu_threads=threads or os.cpu_count() or 4,
+        )
+
+    def transcribe(self, audio, language: Optional[str] = None,
+                   word_timestamps: bool = True, **options) -> dict:
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            word_timestamps=word_timestamps,
+            # Greedy decoding, like openai-whisper's transcribe() default
+            beam_size=1,
+            **options
+        )
+
+        results = []
+        for i, seg in enumerate(segments):
+            results.append({
+                "id": i,
+                "seek": seg.seek,
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "tokens": list(seg.tokens),
+                "temperature": seg.temperature,
+                "avg_logprob": seg.avg_logprob,
+                "compression_ratio": seg.compression_ratio,
+                "no_speech_prob": seg.no_speech_prob,
+                "words": [{
+                    "word": word.word,
+                    "start": word.start,
+                    "end": word.end,
+                    "probability": word.probability,
+                } for word in seg.words or []],
+            })
+
+        return {
+            "text": "".join(seg["text"] for seg in results),
+            "segments": results,
+            "language": info.language,
+        }
+
+
+BACKENDS = {
+    "whisper": WhisperBackend,
+    "faster-whisper": FasterWhisperBackend,
+}
+
+
+def check_backend(name: str):
+    """Raise BackendUnavailable (with an install hint) if a backend can't be loaded."""
+    backend = BACKENDS[name]
+    if importlib.util.find_spec(backend.package) is None:
+        raise BackendUnavailable(f"{name} backend not installed. Run: {backend.install}")
+
+
+def load_backend(name: str, model_name: str, threads: Optional[int] = None):
+    """Load a model with the named backend."""
+    check_backend(name)
+    return BACKENDS[name](model_name, threads)
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Long-running transcription worker with a job queue.
+
+Instead of paying for the torch/Whisper import and the model load on every
+transcribe.py run, the daemon keeps models resident and works through a
+persistent SQLite queue (see transcript_queue.py). Jobs arrive over a local
+HTTP endpoint (how the CMS submits drops as they are created) or straight
+into the queue file with the submit command, and are run highest priority
+first, oldest first.
+
+The daemon runs several jobs at once, one per slot. Each slot is a thread
+with its own model instance (Whisper's decoder is not safe to share between
+threads), so by default there are as many slots as fit both the CPU cores
+(4 inference threads each) and the available RAM (about 1 GB for tiny/base,
+2 for small, 5 for medium and 10 for large, half that with faster-whisper),
+leaving 2 GB spare. Each slot loads --model at start-up and keeps the last
+model it used, so a job asking for another size pays one load.
+
+A job runs like one input of transcribe.py: download, cache lookup,
+transcription, chapters and the requested outputs in --output-dir, named
+after the input or the job's "name". Job options mirror transcribe.py's
+flags: model, language, output, vad, vad_min_silence, chapters, embedder
+and backend. The chunked modes and --cascade are not offered.
+
+  POST   /jobs                {"source": url_or_path, "priority": 0, "options": {...}}
+  GET    /jobs[?status=...]   recent jobs
+  GET    /jobs/<id>           status, timings, error and output paths
+  GET    /jobs/<id>/result    the transcript JSON of a finished job
+  DELETE /jobs/<id>           cancel a queued job
+  GET    /status              slots, resident models and queue counts
+
+The endpoint has no authentication; it listens on 127.0.0.1 unless --host
+says otherwise. Several daemons may share one queue file: each refreshes a
+heartbeat on the jobs it is running, and a job whose heartbeat is older
+than --lease seconds (its daemon stopped or hung) is queued again by any
+live daemon. --embedder is checked at start-up, and a job asking for an
+unavailable embedder is rejected when submitted.
+
+Usage:
+  python3 scripts/transcribe_worker.py serve --model medium
+  python3 scripts/transcribe_worker.py submit https://archive.org/.../audio.m4a --priority 5 --name drop_012
+  python3 scripts/transcribe_worker.py status [job_id]
+  curl -X POST localhost:8765/jobs -d '{"source": "talk.m4a", "options": {"model": "small"}}'
+"""
+
+import argparse
+import copy
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+import transcribe as transcriber
+from semantic_chapters import EmbedderUnavailable, check_embedder
+from transcribe_backends import BackendUnavailable, check_backend, load_backend
+from transcript_cache import TranscriptCache
+from transcript_queue import DEFAULT_LEASE_SECONDS, DEFAULT_QUEUE_DIR, STATUSES, JobQueue
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# transcribe.py options a job may set
+JOB_OPTIONS = ("model", "language", "output", "vad", "vad_min_silence", "chapters", "embedder",
+               "backend")
+
+# Approximate resident size of one model instance (openai-whisper, fp32 on CPU)
+MODEL_RAM_GB = {"tiny": 1, "base": 1, "small": 2, "medium": 5, "large": 10}
+THREADS_PER_JOB = 4
+RAM_HEADROOM_GB = 2
+
+# How often idle slots look for jobs added to the queue file directly
+POLL_SECONDS = 2.0
+# Attempts at recording a job's outcome before leaving it to the lease
+FINISH_ATTEMPTS = 5
+
+OUTPUT_SUFFIXES = {
+    "json": [".json"],
+    "srt": [".srt"],
+    "txt": [".txt"],
+    "words": [".words.bin"],
+    "audio": [".peaks.bin", ".fp.bin"],
+}
+
+
+class JobError(ValueError):
+    """A submitted job has an unknown or invalid option."""
+
+
+def available_memory() -> Optional[int]:
+    """Bytes of RAM available for new processes (total RAM where unknown)."""
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def plan_slots(model_name: str, backend: str) -> int:
+    """Concurrent jobs that fit the CPU cores and the available RAM."""
+    slots = max(1, (os.cpu_count() or 1) // THREADS_PER_JOB)
+    memory = available_memory()
+    if memory is not None:
+        model_gb = MODEL_RAM_GB[model_name] / (2 if backend == "faster-whisper" else 1)
+        fit = int((memory / 1024 ** 3 - RAM_HEADROOM_GB) // model_gb)
+        slots = min(slots, max(1, fit))
+    return slots
+
+
+def job_args(options: dict, defaults: argparse.Namespace,
+             parser: argparse.ArgumentParser) -> argparse.Namespace:
+    """transcribe.py arguments for a job: the daemon's defaults plus the job's options."""
+    unknown = set(options) - set(JOB_OPTIONS) - {"name"}
+    if unknown:
+        raise JobError(f"unknown options: {', '.join(sorted(unknown))} "
+                       f"(allowed: {', '.join(JOB_OPTIONS)}, name)")
+    args = copy.copy(defaults)
+    actions = {action.dest: action for action in parser._actions}
+    for key in JOB_OPTIONS:
+        if key not in options:
+            continue
+        value, action = options[key], actions[key]
+        try:
+            if action.nargs == 0:
+                value = bool(value)
+            elif value is not None and action.type is not None:
+                value = action.type(value)
+        except (TypeError, ValueError):
+            raise JobError(f"invalid {key}: {value!r}")
+        if action.choices and value not in action.choices:
+            raise JobError(f"invalid {key}: {value!r} (choose from {', '.join(map(str, action.choices))})")
+        setattr(args, key, value)
+    if "embedder" in options and args.embedder:
+        try:
+            check_embedder(args.embedder)
+        except EmbedderUnavailable as e:
+            raise JobError(str(e))
+    return args
+
+
+def output_name(job: dict, input_path: str) -> str:
+    # A bare file name, so a job can't write outside the output directory
+    return Path(job["options"].get("name") or Path(input_path).stem).name
+
+
+class Worker:
+    """Slots that claim jobs from the queue and run them on resident models."""
+
+    def __init__(self, queue: JobQueue, defaults: argparse.Namespace,
+                 parser: argparse.ArgumentParser, output_dir: Path,
+                 cache: Optional[TranscriptCache], slots: int,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.queue = queue
+        self.defaults = defaults
+        self.parser = parser
+        self.output_dir = output_dir
+        self.cache = cache
+        self.slots = slots
+        self.threads = max(1, (os.cpu_count() or 1) // slots)
+        self.lease_seconds = lease_seconds
+        # Unique per daemon, so daemons sharing a queue tell their jobs apart
+        self.daemon_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.started_at = time.time()
+        self.resident = {}
+        self.active = {}
+        self._wake = threading.Event()
+
+    def start(self):
+        self._expire_leases()
+        threading.Thread(target=self._run_heartbeat, name="heartbeat", daemon=True).start()
+        for i in range(self.slots):
+            threading.Thread(target=self._run_slot, args=(f"slot{i}",), name=f"slot{i}",
+                             daemon=True).start()
+
+    def _expire_leases(self):
+        requeued = self.queue.requeue_stale(self.lease_seconds)
+        if requeued:
+            print(f"🔁 Requeued {requeued} jobs whose worker stopped sending heartbeats")
+            self.wake()
+
+    def _run_heartbeat(self):
+        while True:
+            time.sleep(self.lease_seconds / 4)
+            try:
+                self.queue.heartbeat(list(self.active.values()))
+                self._expire_leases()
+            except sqlite3.Error as e:
+                print(f"⚠️  Heartbeat failed: {e}")
+
+    def wake(self):
+        """Have idle slots look at the queue now."""
+        self._wake.set()
+
+    def _load(self, name: str, model_name: str, backend: str):
+        print(f"🎤 {name}: loading {model_name} ({backend})")
+        model = load_backend(backend, model_name, self.threads)
+        self.resident[name] = (model_name, backend)
+        return model
+
+    def _run_slot(self, name: str):
+        model_key = (self.defaults.model, self.defaults.backend)
+        try:
+            model = self._load(name, *model_key)
+        except Exception as e:
+            print(f"❌ {name}: could not load {model_key[0]}: {e}")
+            return
+        worker_id = f"{self.daemon_id}/{name}"
+        while True:
+            try:
+                job = self.queue.claim(worker_id)
+            except sqlite3.Error as e:
+                print(f"⚠️  {name}: could not read the queue ({e}), retrying")
+                self._wake.wait(POLL_SECONDS)
+                continue
+            if job is None:
+                self._wake.wait(POLL_SECONDS)
+                self._wake.clear()
+                continue
+            print(f"\n▶️  {name}: job {job['id']} (priority {job['priority']}): {job['source']}")
+            self.active[name] = job["id"]
+            started = time.perf_counter()
+            try:
+                args = job_args(job["options"], self.defaults, self.parser)
+                if (args.model, args.backend) != model_key:
+                    # Drop the old model before loading the next, to stay within the RAM plan
+                    model = model_key = None
+                    self.resident.pop(name, None)
+                    model = self._load(name, args.model, args.backend)
+                    model_key = (args.model, args.backend)
+                result = self.run_job(job, args, model)
+            except Exception as e:
+                traceback.print_exc()
+                self._finish(name, worker_id, job, error=f"{type(e).__name__}: {e}")
+                print(f"❌ {name}: job {job['id']} failed: {e}")
+                continue
+            self._finish(name, worker_id, job, result)
+            print(f"✅ {name}: job {job['id']} done in {time.perf_counter() - started:.1f}s")
+
+    def _finish(self, name: str, worker_id: str, job: dict, result: Optional[dict] = None,
+                error: Optional[str] = None):
+        """Record a job's outcome, retrying while the queue file is busy."""
+        try:
+            for attempt in range(1, FINISH_ATTEMPTS + 1):
+                try:
+                    if not self.queue.finish(job["id"], worker_id, result, error):
+                        print(f"⚠️  {name}: job {job['id']} was requeued while it ran")
+                    return
+                except sqlite3.Error as e:
+                    print(f"⚠️  {name}: could not record job {job['id']} ({e}), "
+                          f"attempt {attempt}/{FINISH_ATTEMPTS}")
+                    time.sleep(POLL_SECONDS * attempt)
+            # No more heartbeats: the lease expires and the job is queued again
+        finally:
+            self.active.pop(name, None)
+
+    def run_job(self, job: dict, args: argparse.Namespace, model) -> dict:
+        """Transcribe one job's input and write its outputs, like transcribe.py does."""
+        prepared = transcriber.prepare_input(job["source"], args, self.cache)
+        try:
+            result = transcriber.transcribe(prepared["path"], args.model, args.language,
+                                            model=model, audio=prepared["audio"],
+                                            cache=self.cache, audio_hash=prepared["hash"],
+                                            vad=args.vad,
+                                            vad_min_silence=args.vad_min_silence,
+                                            backend=args.backend,
+                                            chapters=args.chapters,
+                                            embedder=args.embedder)
+            base_name = output_name(job, prepared["path"])
+            transcriber.write_outputs(result, self.output_dir, base_name, args.output)
+            if prepared["audio"] is not None and args.output in ["audio", "all"]:
+                transcriber.output_audio_sidecars(prepared["audio"], self.output_dir, base_name)
+        finally:
+            transcriber.cleanup_input(prepared)
+
+        formats = list(OUTPUT_SUFFIXES) if args.output == "all" else [args.output]
+        outputs = [self.output_dir / f"{base_name}{suffix}"
+                   for fmt in formats for suffix in OUTPUT_SUFFIXES[fmt]]
+        return {
+            "outputs": [str(path) for path in outputs if path.exists()],
+            "language": result["language"],
+            "duration_seconds": result["duration_seconds"],
+            "word_count": result["word_count"],
+            "chapters": len(result["chapters"]),
+        }
+
+    def status(self) -> dict:
+        return {
+            "daemon": self.daemon_id,
+            "slots": self.slots,
+            "threads_per_slot": self.threads,
+            "resident_models": {name: f"{model} ({backend})"
+                                for name, (model, backend) in sorted(self.resident.items())},
+            "jobs": self.queue.counts(),
+            "uptime_seconds": round(time.time() - self.started_at),
+        }
+
+
+class WorkerHandler(BaseHTTPRequestHandler):
+    """JSON endpoint over the worker's queue."""
+
+    server_version = "spera-worker/1"
+
+    @property
+    def worker(self) -> Worker:
+        return self.server.worker
+
+    def send_json(self, status: int, body):
+        data = json.dumps(body, indent=2, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_error_json(self, status: int, message: str):
+        self.send_json(status, {"error": message})
+
+    def job_or_404(self, job_id: str) -> Optional[dict]:
+        job = self.worker.queue.get(job_id)
+        if job is None:
+            self.send_error_json(404, f"no job {job_id}")
+        return job
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        if parts == ["status"]:
+            self.send_json(200, self.worker.status())
+        elif parts == ["jobs"]:
+            status = parse_qs(url.query).get("status", [None])[0]
+            if status is not None and status not in STATUSES:
+                self.send_error_json(400, f"unknown status {status!r}")
+                return
+            self.send_json(200, self.worker.queue.list(status))
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = self.job_or_404(parts[1])
+            if job is not None:
+                self.send_json(200, job)
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "result":
+            job = self.job_or_404(parts[1])
+            if job is None:
+                return
+            if job["status"] != "done":
+                self.send_error_json(409, f"job {job['id']} is {job['status']}")
+                return
+            transcript = [path for path in job["result"]["outputs"] if path.endswith(".json")]
+            if not transcript:
+                self.send_error_json(404, f"job {job['id']} wrote no JSON transcript")
+                return
+            with open(transcript[0], "r", encoding="utf-8") as f:
+                self.send_json(200, json.load(f))
+        else:
+            self.send_error_json(404, f"no route {url.path}")
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/jobs":
+            self.send_error_json(404, f"no route {self.path}")
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            source = body["source"]
+            options = body.get("options", {})
+            priority = int(body.get("priority", 0))
+            if not isinstance(source, str) or not isinstance(options, dict):
+                raise ValueError("source must be a string and options an object")
+            job_args(options, self.worker.defaults, self.worker.parser)
+        except KeyError:
+            self.send_error_json(400, "missing source")
+            return
+        except ValueError as e:
+            self.send_error_json(400, str(e))
+            return
+        job, created = self.worker.queue.submit(source, options, priority)
+        self.worker.wake()
+        self.send_json(201 if created else 200, job)
+
+    def do_DELETE(self):
+        parts = [part for part in urlparse(self.path).path.split("/") if part]
+        if len(parts) != 2 or parts[0] != "jobs":
+            self.send_error_json(404, f"no route {self.path}")
+            return
+        job = self.job_or_404(parts[1])
+        if job is None:
+            return
+        if not self.worker.queue.cancel(job["id"]):
+            self.send_error_json(409, f"job {job['id']} is {job['status']}")
+            return
+        self.send_json(200, self.worker.queue.get(job["id"]))
+
+
+def serve(args):
+    transcribe_parser = transcriber.build_parser()
+    defaults = transcribe_parser.parse_args([])
+    defaults.model = args.model
+    defaults.backend = args.backend
+    defaults.embedder = args.embedder
+    try:
+        check_backend(args.backend)
+        if args.embedder:
+            check_embedder(args.embedder)
+    except (BackendUnavailable, EmbedderUnavailable) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache = None
+    if not args.no_cache:
+        cache = TranscriptCache(defaults.cache_dir, defaults.cache_size * 1024 * 1024)
+    slots = args.concurrency or plan_slots(args.model, args.backend)
+    worker = Worker(JobQueue(args.queue_dir), defaults, transcribe_parser, output_dir, cache, slots,
+                    args.lease)
+
+    server = ThreadingHTTPServer((args.host, args.port), WorkerHandler)
+    server.worker = worker
+    worker.start()
+    print(f"🛠️  Worker listening on http://{args.host}:{args.port} "
+          f"({slots} slots × {worker.threads} threads, queue {worker.queue.path})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        # Running jobs are requeued once their lease expires
+        print("\n👋 Stopping worker")
+    finally:
+        server.server_close()
+
+
+def submit(args):
+    options = {key: getattr(args, key) for key in ("model", "language", "output", "chapters", "name")
+               if getattr(args, key) is not None}
+    if args.vad:
+        options["vad"] = True
+    queue = JobQueue(args.queue_dir)
+    for source in args.sources:
+        if not transcriber.is_url(source):
+            # The daemon may run from another directory
+            source = str(Path(source).expanduser().resolve())
+        job, created = queue.submit(source, options, args.priority)
+        print(f"{'📥 Queued' if created else '⏳ Already queued'} {job['id']}: {source}")
+
+
+def status(args):
+    queue = JobQueue(args.queue_dir)
+    if args.job_id:
+        job = queue.get(args.job_id)
+        if job is None:
+            print(f"❌ No job {args.job_id}")
+            sys.exit(1)
+        print(json.dumps(job, indent=2, ensure_ascii=False))
+        return
+    counts = queue.counts()
+    print("📊 " + ", ".join(f"{count} {status}" for status, count in counts.items()))
+    for job in queue.list(args.status, args.limit):
+        created = time.strftime("%Y-%m-%d %H:%M", time.localtime(job["created_at"]))
+        print(f"   {job['id']}  {job['status']:<9}  p{job['priority']:<3} {created}  {job['source']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-running transcription worker with a job queue")
+    parser.add_argument("--queue-dir", default=str(DEFAULT_QUEUE_DIR),
+                        help=f"Directory of the job queue (default: {DEFAULT_QUEUE_DIR})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Run the daemon")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to listen on (default: {DEFAULT_HOST})")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    serve_parser.add_argument("--model", "-m", default="medium", choices=list(MODEL_RAM_GB),
+                              help="Model each slot keeps loaded, and the default for jobs (default: medium)")
+    serve_parser.add_argument("--backend", "-b", default=transcriber.DEFAULT_BACKEND,
+                              choices=list(transcriber.BACKENDS),
+                              help=f"Inference engine (default: {transcriber.DEFAULT_BACKEND})")
+    serve_parser.add_argument("--concurrency", "-j", type=int, default=None,
+                              help="Jobs run at once (default: what the cores and RAM fit)")
+    serve_parser.add_argument("--output-dir", "-d", default="./transcripts",
+                              help="Output directory (default: ./transcripts)")
+    serve_parser.add_argument("--embedder", default=None,
+                              help="Default segment embedder for semantic chapters: hashing or minilm")
+    serve_parser.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS,
+                              help="Seconds without a heartbeat before a running job is requeued "
+                                   f"(default: {DEFAULT_LEASE_SECONDS:g})")
+    serve_parser.add_argument("--no-cache", action="store_true",
+                              help="Ignore and do not update the transcript cache")
+    serve_parser.set_defaults(handler=serve)
+
+    submit_parser = commands.add_parser("submit", help="Add jobs to the queue")
+    submit_parser.add_argument("sources", nargs="+", help="URLs or file paths to audio/video")
+    submit_parser.add_argument("--priority", "-p", type=int, default=0,
+                               help="Higher runs first (default: 0)")
+    submit_parser.add_argument("--model", "-m", choices=list(MODEL_RAM_GB),
+                               help="Model size (default: the daemon's)")
+    submit_parser.add_argument("--language", "-l", help="Language code (default: auto-detect)")
+    submit_parser.add_argument("--output", "-o", choices=["json", "srt", "txt", "words", "audio", "all"],
+                               help="Output format (default: all)")
+    submit_parser.add_argument("--chapters", choices=transcriber.CHAPTERERS,
+                               help="Chapter generator (default: semantic)")
+    submit_parser.add_argument("--vad", action="store_true", help="Skip non-speech audio")
+    submit_parser.add_argument("--name", help="Base name of the output files (default: the input's)")
+    submit_parser.set_defaults(handler=submit)
+
+    status_parser = commands.add_parser("status", help="Show queued, running and finished jobs")
+    status_parser.add_argument("job_id", nargs="?", help="Show one job in full")
+    status_parser.add_argument("--status", "-s", choices=STATUSES, help="Only jobs with this status")
+    status_parser.add_argument("--limit", "-n", type=int, default=20, help="Jobs to list (default: 20)")
+    status_parser.set_defaults(handler=status)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
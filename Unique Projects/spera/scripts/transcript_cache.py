@@ -0,0 +1,167 @@
+"""
+Content-addressed cache for Whisper transcription results.
+
+Entries are keyed by the SHA-256 of the audio file plus the model name,
+language and Whisper options, so the same audio is only ever transcribed
+once per configuration. The raw Whisper output is stored (not the final
+chapters/segments) so reruns that only change chaptering or output formats
+still hit the cache.
+
+Layout:
+  <cache_dir>/entries/<key>.json   raw Whisper result
+  <cache_dir>/urls.json            URL -> audio hash, with HTTP validators
+
+The cache is size-bounded; least recently used entries are evicted first
+(an entry's mtime is bumped on every hit).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "spera" / "transcripts"
+DEFAULT_MAX_MB = 512
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: str) -> str:
+    """SHA-256 of a file, read in chunks so large media never sits in memory."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def remote_fingerprint(url: str) -> Optional[str]:
+    """
+    Cheap identity of a remote file from a HEAD request.
+
+    Uses ETag, Last-Modified and Content-Length. Returns None if the server
+    gives none of them (or the request fails), in which case the file must be
+    downloaded and hashed.
+    """
+    import urllib.request
+
+    try:
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=15) as response:
+            headers = response.headers
+            parts = [headers.get(h, "") for h in ("ETag", "Last-Modified", "Content-Length")]
+    except Exception:
+        return None
+
+    if not any(parts):
+        return None
+    return "|".join(parts)
+
+
+class TranscriptCache:
+    """On-disk LRU cache of raw Whisper results."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.entries_dir = self.cache_dir / "entries"
+        self.urls_path = self.cache_dir / "urls.json"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(audio_hash: str, model_name: str, language: Optional[str], options: dict) -> str:
+        """Cache key for one audio file under one transcription configuration."""
+        payload = json.dumps({
+            "audio": audio_hash,
+            "model": model_name,
+            "language": language,
+            "options": options,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.entries_dir / f"{key}.json"
+
+    def contains(self, key: str) -> bool:
+        return self._entry_path(key).exists()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the stored result for key (marking it recently used), or None."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: dict):
+        """Store a result atomically, then evict old entries over the size limit."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.entries_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, default=float)
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits max_bytes."""
+        with self._lock:
+            entries = []
+            for path in self.entries_dir.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    pass
+
+    def _load_urls(self) -> dict:
+        try:
+            with open(self.urls_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def lookup_url(self, url: str, fingerprint: str) -> Optional[str]:
+        """Audio hash previously downloaded from url, if the remote is unchanged."""
+        with self._lock:
+            entry = self._load_urls().get(url)
+        if entry and entry.get("fingerprint") == fingerprint:
+            return entry.get("hash")
+        return None
+
+    def remember_url(self, url: str, fingerprint: str, audio_hash: str):
+        """Record which audio hash a URL resolved to."""
+        with self._lock:
+            urls = self._load_urls()
+            urls[url] = {"fingerprint": fingerprint, "hash": audio_hash}
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(urls, f, indent=2)
+            os.replace(tmp_path, self.urls_path)
@@ -0,0 +1,128 @@
+"""
+Checkpoints for resumable transcription jobs.
+
+A job is one input transcribed under one configuration. Its directory keeps
+the downloaded media and every finished chunk of audio, so a run that is
+killed part-way (OOM, preempted worker) resumes from the last committed chunk
+instead of starting over.
+
+Layout:
+  <jobs_dir>/<job_id>/job.json        source and options, for humans
+  <jobs_dir>/<job_id>/media/          downloaded input
+  <jobs_dir>/<job_id>/chunks.ndjson   one committed chunk result per line
+
+The directory is removed once the job's outputs have been written.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_JOBS_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "spera" / "jobs"
+
+
+def make_job_id(source: str, model_name: str, language: Optional[str], options: dict) -> str:
+    """Stable job ID for one input under one transcription configuration."""
+    if not (source.startswith("http://") or source.startswith("https://")):
+        source = str(Path(source).expanduser().resolve())
+    payload = json.dumps({
+        "source": source,
+        "model": model_name,
+        "language": language,
+        "options": options,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class JobCheckpoint:
+    """Persistent state of one transcription job."""
+
+    def __init__(self, jobs_dir, job_id: str, source: str = ""):
+        self.job_id = job_id
+        self.job_dir = Path(jobs_dir).expanduser() / job_id
+        self.media_dir = self.job_dir / "media"
+        self.chunks_path = self.job_dir / "chunks.ndjson"
+        self._lock = threading.Lock()
+        self.media_dir.mkdir(parents=True, exist_ok=True)
+
+        info_path = self.job_dir / "job.json"
+        if not info_path.exists():
+            with open(info_path, "w", encoding="utf-8") as f:
+                json.dump({"job_id": job_id, "source": source}, f, indent=2)
+        self._drop_torn_tail()
+
+    def _drop_torn_tail(self):
+        """
+        Cut a partial last line left by a run killed mid-write.
+
+        Without this, the next commit would be appended to the fragment and
+        both records would be lost.
+        """
+        try:
+            with open(self.chunks_path, "rb+") as f:
+                size = end = f.seek(0, os.SEEK_END)
+                while end > 0:
+                    start = max(0, end - 4096)
+                    f.seek(start)
+                    newline = f.read(end - start).rfind(b"\n")
+                    if newline >= 0:
+                        end = start + newline + 1
+                        break
+                    end = start
+                if end < size:
+                    f.truncate(end)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except FileNotFoundError:
+            pass
+
+    def load_chunks(self, regions: list) -> dict:
+        """
+        Committed chunk results, by chunk index.
+
+        Chunks are only reused if their boundaries match the current split
+        (the same audio always splits the same way). Only newline-terminated
+        lines were committed; a torn last line from a killed run is skipped.
+        """
+        done = {}
+        try:
+            with open(self.chunks_path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        # Torn final line, never committed
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    index = record["index"]
+                    if index < len(regions) and all(
+                        abs(a - b) < 1e-6 for a, b in zip(record["region"], regions[index])
+                    ):
+                        done[index] = record["result"]
+        except OSError:
+            pass
+        return done
+
+    def commit_chunk(self, index: int, region: tuple, result: dict):
+        """Durably append one finished chunk."""
+        line = json.dumps({
+            "index": index,
+            "region": list(region),
+            "result": result,
+        }, ensure_ascii=False, default=float)
+        with self._lock:
+            with open(self.chunks_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def finish(self):
+        """Delete the job's media and checkpoints after a successful run."""
+        shutil.rmtree(self.job_dir, ignore_errors=True)
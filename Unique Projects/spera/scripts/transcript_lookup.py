@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Time-indexed lookups over Spera transcript JSON files.
+
+Loads a transcript once into sorted start/end arrays and answers "which
+segment/chapter is playing at t" with binary search instead of scanning
+the segment list.
+
+Usage:
+  python3 scripts/transcript_lookup.py <transcript.json> <seconds>...
+  python3 scripts/transcript_lookup.py <transcript.json> --range 60 90
+
+Library:
+  from transcript_lookup import load_timeline
+  timeline = load_timeline("transcripts/Slaying AI Inefficiency.json")
+  timeline.segment_at(93.2)
+  timeline.segments_between(60, 90)
+  timeline.chapter_at(93.2)
+  timeline.segment_indices_at([1.0, 93.2, 200.5])   # batch form
+"""
+
+import argparse
+import functools
+import json
+import os
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    # Batch queries fall back to one bisect per timestamp
+    np = None
+
+
+class TranscriptTimeline:
+    """Sorted segment and chapter boundaries of one transcript."""
+
+    def __init__(self, data: dict):
+        self.segments = sorted(data.get("segments", []), key=lambda seg: seg["start"])
+        self.chapters = sorted(data.get("chapters", []), key=lambda ch: ch["start"])
+
+        self.starts = [seg["start"] for seg in self.segments]
+        self.ends = [seg["end"] for seg in self.segments]
+        # Running maximum keeps end times searchable even if segments overlap
+        self.max_ends = list(accumulate(self.ends, max))
+        self.chapter_starts = [ch["start"] for ch in self.chapters]
+
+        if np is not None:
+            self._starts = np.asarray(self.starts, dtype=np.float64)
+            self._ends = np.asarray(self.ends, dtype=np.float64)
+            self._chapter_starts = np.asarray(self.chapter_starts, dtype=np.float64)
+
+    @classmethod
+    def from_file(cls, path) -> "TranscriptTimeline":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def segment_index_at(self, seconds: float) -> Optional[int]:
+        """Index of the segment playing at a time, or None in a gap."""
+        index = bisect_right(self.starts, seconds) - 1
+        if index >= 0 and seconds < self.ends[index]:
+            return index
+        return None
+
+    def segment_at(self, seconds: float) -> Optional[dict]:
+        """Segment playing at a time, or None in a gap."""
+        index = self.segment_index_at(seconds)
+        return self.segments[index] if index is not None else None
+
+    def segment_range(self, start: float, end: float) -> range:
+        """Indices of segments overlapping [start, end]."""
+        lo = bisect_right(self.max_ends, start)
+        hi = bisect_right(self.starts, end)
+        return range(lo, max(lo, hi))
+
+    def segments_between(self, start: float, end: float) -> list:
+        """Segments overlapping [start, end]."""
+        return [self.segments[i] for i in self.segment_range(start, end)
+                if self.ends[i] > start]
+
+    def chapter_index_at(self, seconds: float) -> Optional[int]:
+        """Index of the chapter containing a time, or None before the first one."""
+        index = bisect_right(self.chapter_starts, seconds) - 1
+        return index if index >= 0 else None
+
+    def chapter_at(self, seconds: float) -> Optional[dict]:
+        """Chapter containing a time."""
+        index = self.chapter_index_at(seconds)
+        return self.chapters[index] if index is not None else None
+
+    def segment_indices_at(self, times: Iterable[float]) -> list:
+        """Batch form of segment_index_at() for many timestamps at once."""
+        if np is None:
+            return [self.segment_index_at(t) for t in times]
+
+        times = np.asarray(list(times), dtype=np.float64)
+        indices = np.searchsorted(self._starts, times, side="right") - 1
+        valid = indices >= 0
+        valid[valid] &= times[valid] < self._ends[indices[valid]]
+        return [int(i) if ok else None for i, ok in zip(indices, valid)]
+
+    def chapter_indices_at(self, times: Iterable[float]) -> list:
+        """Batch form of chapter_index_at() for many timestamps at once."""
+        if np is None:
+            return [self.chapter_index_at(t) for t in times]
+
+        indices = np.searchsorted(self._chapter_starts, np.asarray(list(times), dtype=np.float64),
+                                  side="right") - 1
+        return [int(i) if i >= 0 else None for i in indices]
+
+
+@functools.lru_cache(maxsize=64)
+def _load_timeline(path: str, mtime: float) -> TranscriptTimeline:
+    return TranscriptTimeline.from_file(path)
+
+
+def load_timeline(path) -> TranscriptTimeline:
+    """Load a transcript once; later calls reuse it until the file changes."""
+    path = os.path.abspath(path)
+    return _load_timeline(path, os.path.getmtime(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up transcript segments and chapters by time")
+    parser.add_argument("transcript", help="Transcript JSON file")
+    parser.add_argument("times", nargs="*", type=float, help="Times in seconds")
+    parser.add_argument("--range", "-r", nargs=2, type=float, metavar=("START", "END"),
+                        help="List segments overlapping START..END seconds")
+
+    args = parser.parse_args()
+    timeline = load_timeline(args.transcript)
+
+    for t, index, chapter_index in zip(args.times,
+                                       timeline.segment_indices_at(args.times),
+                                       timeline.chapter_indices_at(args.times)):
+        chapter = timeline.chapters[chapter_index]["title"] if chapter_index is not None else "-"
+        text = timeline.segments[index]["text"] if index is not None else "(silence)"
+        print(f"[{t:8.2f}s] 📑 {chapter}")
+        print(f"            {text}")
+
+    if args.range:
+        start, end = args.range
+        for seg in timeline.segments_between(start, end):
+            print(f"[{seg['start']:8.2f}s] {seg['text']}")
+
+
+if __name__ == "__main__":
+    main()
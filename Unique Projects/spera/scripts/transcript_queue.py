@@ -0,0 +1,219 @@
+"""
+SQLite job queue for transcribe_worker.py.
+
+Jobs are rows in one table, so the daemon and anything that can open the
+file (transcribe_worker.py submit, a cron job, the CMS through the HTTP
+endpoint) share a queue that survives restarts. Workers claim the queued
+job with the highest priority, oldest first, inside an IMMEDIATE
+transaction, so two workers never take the same job.
+
+  queued -> running -> done | failed
+  queued -> cancelled
+
+Each running job names the worker that claimed it and carries a heartbeat
+that its daemon refreshes while the job runs. A running job whose heartbeat
+is older than the lease (its daemon died or hung) is queued again by any
+live daemon. Jobs of other live daemons sharing the file are left alone.
+A job submitted while an identical one (same source and options) is queued
+or running returns that job instead of adding another.
+
+Layout:
+  <queue_dir>/queue.db   jobs table (WAL mode, readable while workers write)
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from transcript_jobs import make_job_id
+
+DEFAULT_QUEUE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "spera" / "worker"
+
+STATUSES = ("queued", "running", "done", "failed", "cancelled")
+
+# A running job without a heartbeat for this long is presumed abandoned
+DEFAULT_LEASE_SECONDS = 120.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    key TEXT NOT NULL,
+    source TEXT NOT NULL,
+    options TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    heartbeat_at REAL,
+    error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_next ON jobs (status, priority DESC, created_at);
+CREATE INDEX IF NOT EXISTS jobs_key ON jobs (key, status);
+"""
+
+
+def _row(row: Optional[sqlite3.Row]) -> Optional[dict]:
+    if row is None:
+        return None
+    job = dict(row)
+    job["options"] = json.loads(job["options"])
+    job["result"] = json.loads(job["result"]) if job["result"] else None
+    del job["key"]
+    return job
+
+
+class JobQueue:
+    """Persistent priority queue of transcription jobs."""
+
+    def __init__(self, queue_dir=DEFAULT_QUEUE_DIR):
+        self.queue_dir = Path(queue_dir).expanduser()
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.queue_dir / "queue.db"
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "heartbeat_at" not in columns:
+                # Queues created before heartbeats existed
+                conn.execute("ALTER TABLE jobs ADD COLUMN heartbeat_at REAL")
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per call, so any thread can use the queue
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Connection holding the write lock until the block ends."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def submit(self, source: str, options: Optional[dict] = None, priority: int = 0) -> tuple:
+        """
+        Queue a job.
+
+        Returns:
+            (job, created): the new job, or the identical job already
+            queued or running and False
+        """
+        options = options or {}
+        key = make_job_id(source, options.get("model", ""), options.get("language"), options)
+        with self._transaction() as conn:
+            existing = conn.execute(
+                "SELECT * FROM jobs WHERE key = ? AND status IN ('queued', 'running')", (key,)
+            ).fetchone()
+            if existing is not None:
+                return _row(existing), False
+            job_id = uuid.uuid4().hex[:16]
+            conn.execute(
+                "INSERT INTO jobs (id, key, source, options, priority, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, key, source, json.dumps(options, sort_keys=True), priority, time.time())
+            )
+        return self.get(job_id), True
+
+    def claim(self, worker: str) -> Optional[dict]:
+        """Mark the next queued job as running and return it (None if idle)."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' "
+                "ORDER BY priority DESC, created_at LIMIT 1"
+            ).fetchone()
+            if row is not None:
+                now = time.time()
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', started_at = ?, heartbeat_at = ?, worker = ? "
+                    "WHERE id = ?",
+                    (now, now, worker, row["id"])
+                )
+        return self.get(row["id"]) if row is not None else None
+
+    def finish(self, job_id: str, worker: str, result: Optional[dict] = None,
+               error: Optional[str] = None) -> bool:
+        """
+        Record the outcome of a job this worker is running.
+
+        Returns False if the job is no longer this worker's (its lease
+        expired and it was queued again).
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, result = ?, error = ? "
+                "WHERE id = ? AND status = 'running' AND worker = ?",
+                ("failed" if error else "done", time.time(),
+                 json.dumps(result) if result is not None else None, error, job_id, worker)
+            )
+            return cursor.rowcount > 0
+
+    def heartbeat(self, job_ids: list):
+        """Extend the lease of running jobs."""
+        if not job_ids:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE jobs SET heartbeat_at = ? WHERE status = 'running' "
+                f"AND id IN ({', '.join('?' * len(job_ids))})",
+                (time.time(), *job_ids)
+            )
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job. Returns False if it has already started."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? "
+                "WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id)
+            )
+            return cursor.rowcount > 0
+
+    def requeue_stale(self, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> int:
+        """Queue again running jobs whose heartbeat is older than the lease."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, heartbeat_at = NULL, "
+                "worker = NULL WHERE status = 'running' AND COALESCE(heartbeat_at, started_at) < ?",
+                (time.time() - lease_seconds,)
+            )
+            return cursor.rowcount
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._connect() as conn:
+            return _row(conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> list:
+        """Most recent jobs first, optionally only those with one status."""
+        query = "SELECT * FROM jobs"
+        params = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._connect() as conn:
+            return [_row(row) for row in conn.execute(query, params + (limit,))]
+
+    def counts(self) -> dict:
+        """Number of jobs in each status."""
+        with self._connect() as conn:
+            found = dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"))
+        return {status: found.get(status, 0) for status in STATUSES}
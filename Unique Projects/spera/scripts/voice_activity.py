@@ -0,0 +1,175 @@
+"""
+Energy-based voice activity detection for Whisper input.
+
+detect_speech() marks 30 ms frames as speech when their RMS level clears an
+adaptive threshold (noise floor + margin, capped relative to the loudest
+frames so continuous speech is never cut), closes pauses shorter than
+min_silence and pads what is left. SpeechTimeline then cuts the non-speech
+audio out before inference and maps times in the cut audio back to the
+original timeline, so segment/word timestamps and chapters stay aligned.
+
+Usage:
+  timeline = SpeechTimeline.from_audio(audio)
+  result = model.transcribe(timeline.compact(audio))
+  result = timeline.remap_result(result)
+"""
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# Short silence left between kept regions so Whisper still hears a pause
+JOIN_SECONDS = 0.5
+
+
+def frame_levels(audio: np.ndarray, frame_samples: int) -> np.ndarray:
+    """RMS level of each whole frame, in dBFS."""
+    n_frames = len(audio) // frame_samples
+    frames = audio[:n_frames * frame_samples].reshape(n_frames, frame_samples)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    return 20 * np.log10(rms + 1e-10)
+
+
+def _runs(mask: np.ndarray) -> tuple:
+    """Start and end (exclusive) indices of the True runs in a boolean array."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _merge_close(starts: np.ndarray, ends: np.ndarray, min_gap) -> tuple:
+    """Merge neighbouring runs separated by less than min_gap."""
+    if len(starts) == 0:
+        return starts, ends
+    keep_gap = starts[1:] - ends[:-1] >= min_gap
+    return (starts[np.concatenate(([True], keep_gap))],
+            ends[np.concatenate((keep_gap, [True]))])
+
+
+def detect_speech(
+    audio: np.ndarray,
+    sample_rate: int = SAMPLE_RATE,
+    frame_seconds: float = 0.03,
+    margin_db: float = 12.0,
+    min_silence: float = 1.0,
+    min_speech: float = 0.25,
+    padding: float = 0.25
+) -> np.ndarray:
+    """
+    Find speech regions in mono audio.
+
+    Args:
+        audio: Mono samples in [-1, 1]
+        sample_rate: Samples per second
+        frame_seconds: Analysis frame length
+        margin_db: How far above the noise floor speech must be
+        min_silence: Pauses shorter than this are kept as part of the speech
+        min_speech: Bursts shorter than this (clicks, breaths) are dropped
+        padding: Audio kept on both sides of every region
+
+    Returns:
+        float64 array of shape (n, 2) with [start, end] seconds, sorted and
+        non-overlapping
+    """
+    frame = max(1, int(frame_seconds * sample_rate))
+    levels = frame_levels(audio, frame)
+    if len(levels) == 0:
+        return np.zeros((0, 2))
+
+    floor, peak = np.percentile(levels, [10, 99])
+    threshold = np.clip(floor + margin_db, -70.0, peak - 30.0)
+
+    starts, ends = _runs(levels > threshold)
+    starts, ends = _merge_close(starts, ends, min_silence / frame_seconds)
+    long_enough = ends - starts >= min_speech / frame_seconds
+    starts, ends = starts[long_enough], ends[long_enough]
+
+    duration = len(audio) / sample_rate
+    regions = np.stack((
+        np.maximum(starts * frame_seconds - padding, 0.0),
+        np.minimum(ends * frame_seconds + padding, duration),
+    ), axis=1) if len(starts) else np.zeros((0, 2))
+    # Padding can make neighbours overlap
+    merged_starts, merged_ends = _merge_close(regions[:, 0], regions[:, 1], 1e-9)
+    return np.stack((merged_starts, merged_ends), axis=1)
+
+
+def pauses_between(regions) -> np.ndarray:
+    """Non-speech gaps between consecutive speech regions, as (n, 2) seconds."""
+    regions = np.asarray(regions, dtype=np.float64).reshape(-1, 2)
+    return np.stack((regions[:-1, 1], regions[1:, 0]), axis=1)
+
+
+def longest_pause(pauses: np.ndarray, start: float, end: float) -> float:
+    """Length of the longest pause overlapping [start, end], clipped to it."""
+    lo = np.searchsorted(pauses[:, 1], start, side="right")
+    hi = np.searchsorted(pauses[:, 0], end, side="left")
+    if hi <= lo:
+        return 0.0
+    window = pauses[lo:hi]
+    return float(np.max(np.minimum(window[:, 1], end) - np.maximum(window[:, 0], start)))
+
+
+class SpeechTimeline:
+    """Mapping between the original audio and its speech-only cut."""
+
+    def __init__(self, regions: np.ndarray, duration: float,
+                 sample_rate: int = SAMPLE_RATE, join_seconds: float = JOIN_SECONDS):
+        self.regions = np.asarray(regions, dtype=np.float64).reshape(-1, 2)
+        self.duration = duration
+        self.sample_rate = sample_rate
+        self.join_seconds = join_seconds
+
+        lengths = self.regions[:, 1] - self.regions[:, 0]
+        # Where each region starts in the cut audio
+        self.cut_starts = np.concatenate(([0.0], np.cumsum(lengths + join_seconds)[:-1]))
+        self.lengths = lengths
+
+    @classmethod
+    def from_audio(cls, audio: np.ndarray, sample_rate: int = SAMPLE_RATE, **options):
+        """Detect speech in audio (options go to detect_speech())."""
+        return cls(detect_speech(audio, sample_rate, **options), len(audio) / sample_rate,
+                   sample_rate)
+
+    @property
+    def speech_seconds(self) -> float:
+        return float(self.lengths.sum())
+
+    def compact(self, audio: np.ndarray) -> np.ndarray:
+        """The speech regions of audio, joined by short silences."""
+        join = np.zeros(int(self.join_seconds * self.sample_rate), dtype=audio.dtype)
+        pieces = []
+        for start, end in self.regions:
+            pieces.append(audio[int(start * self.sample_rate):int(end * self.sample_rate)])
+            pieces.append(join)
+        return np.concatenate(pieces[:-1]) if pieces else audio[:0]
+
+    def to_original(self, seconds):
+        """Map time(s) in the cut audio back to the original timeline."""
+        if len(self.regions) == 0:
+            return seconds
+        t = np.asarray(seconds, dtype=np.float64)
+        index = np.clip(np.searchsorted(self.cut_starts, t, side="right") - 1, 0, None)
+        # Times inside a joining silence snap to the end of the region before it
+        offset = np.clip(t - self.cut_starts[index], 0.0, self.lengths[index])
+        mapped = self.regions[index, 0] + offset
+        return float(mapped) if mapped.ndim == 0 else mapped
+
+    def remap_segment(self, seg: dict) -> dict:
+        """Copy of a Whisper segment with its (and its words') times mapped back."""
+        seg = dict(seg)
+        seg["start"], seg["end"] = (float(t) for t in self.to_original([seg["start"], seg["end"]]))
+        if seg.get("words"):
+            words = [dict(word) for word in seg["words"]]
+            times = self.to_original([[w["start"], w["end"]] for w in words])
+            for word, (start, end) in zip(words, times):
+                word["start"], word["end"] = float(start), float(end)
+            seg["words"] = words
+        return seg
+
+    def remap_result(self, result: dict) -> dict:
+        """Whisper result in original time, with the speech regions attached."""
+        return dict(
+            result,
+            segments=[self.remap_segment(seg) for seg in result["segments"]],
+            speech_regions=self.regions.tolist(),
+        )
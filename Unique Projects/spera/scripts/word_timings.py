@@ -0,0 +1,137 @@
+"""
+Compact columnar sidecar for word-level timestamps.
+
+Whisper's word timings are kept out of the transcript JSON (which is already
+~70 KB for long drops) and written to <name>.words.bin instead:
+
+  header (24 bytes, little-endian)
+    magic "SPWD", version u16, reserved u16,
+    n_words u32, n_segments u32, strings_len u32, reserved u32
+  start            float32[n_words]      seconds
+  end              float32[n_words]      seconds
+  segment_offsets  uint32[n_segments+1]  first word of each JSON segment
+  string_offsets   uint32[n_words+1]     byte offsets into the string table
+  probability      uint8[n_words]        word probability * 255
+  strings          utf-8[strings_len]    concatenated word texts
+
+All arrays are 4-byte aligned, so load_word_sidecar() can memory-map the file
+and expose them as zero-copy NumPy views.
+
+Usage:
+  with load_word_sidecar("transcripts/Slaying AI Inefficiency.words.bin") as words:
+      i = words.index_at(93.2)
+      print(words.word(i), words.start[i], words.end[i])
+"""
+
+import mmap
+import struct
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b"SPWD"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIII")
+
+
+def collect_words(segments: list) -> dict:
+    """
+    Gather word timings from raw Whisper segments into parallel lists.
+
+    segment_offsets[i] is the index of the first word of segments[i], so the
+    words of a segment are words[segment_offsets[i]:segment_offsets[i + 1]].
+    """
+    words = {"text": [], "start": [], "end": [], "probability": [], "segment_offsets": [0]}
+    for seg in segments:
+        for word in seg.get("words") or []:
+            words["text"].append(word["word"].strip())
+            words["start"].append(word["start"])
+            words["end"].append(word["end"])
+            words["probability"].append(word.get("probability", 1.0))
+        words["segment_offsets"].append(len(words["text"]))
+    return words
+
+
+def write_word_sidecar(words: dict, output_path: str):
+    """Write collect_words() output in the columnar sidecar format."""
+    encoded = [text.encode("utf-8") for text in words["text"]]
+    string_offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(b) for b in encoded], out=string_offsets[1:])
+    strings = b"".join(encoded)
+    probability = np.clip(np.round(np.asarray(words["probability"], dtype=np.float32) * 255), 0, 255)
+
+    with open(output_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(encoded),
+                            len(words["segment_offsets"]) - 1, len(strings), 0))
+        f.write(np.asarray(words["start"], dtype="<f4").tobytes())
+        f.write(np.asarray(words["end"], dtype="<f4").tobytes())
+        f.write(np.asarray(words["segment_offsets"], dtype="<u4").tobytes())
+        f.write(string_offsets.tobytes())
+        f.write(probability.astype(np.uint8).tobytes())
+        f.write(strings)
+
+
+class WordTimings:
+    """Memory-mapped view of a word sidecar file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, n_words, n_segments, strings_len, _ = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a word timing sidecar")
+        if version != VERSION:
+            raise ValueError(f"{self.path}: unsupported sidecar version {version}")
+
+        offset = HEADER.size
+
+        def take(dtype, count):
+            nonlocal offset
+            array = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+            offset += array.nbytes
+            return array
+
+        self.start = take("<f4", n_words)
+        self.end = take("<f4", n_words)
+        self.segment_offsets = take("<u4", n_segments + 1)
+        self.string_offsets = take("<u4", n_words + 1)
+        self.probability = take(np.uint8, n_words)
+        self._strings_offset = offset
+        self._strings_len = strings_len
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def word(self, index: int) -> str:
+        """Text of one word."""
+        lo = self._strings_offset + int(self.string_offsets[index])
+        hi = self._strings_offset + int(self.string_offsets[index + 1])
+        return self._mmap[lo:hi].decode("utf-8")
+
+    def segment_words(self, segment_index: int) -> range:
+        """Word indices belonging to one segment of the transcript JSON."""
+        return range(int(self.segment_offsets[segment_index]),
+                     int(self.segment_offsets[segment_index + 1]))
+
+    def index_at(self, seconds: float) -> int:
+        """Index of the word being spoken at a time (last word starting at or before it)."""
+        return max(0, int(np.searchsorted(self.start, seconds, side="right")) - 1)
+
+    def close(self):
+        # Drop the NumPy views first; an mmap cannot close with exports alive
+        self.start = self.end = self.segment_offsets = self.string_offsets = self.probability = None
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_word_sidecar(path) -> WordTimings:
+    """Open a word sidecar written by write_word_sidecar()."""
+    return WordTimings(path)